@@ -0,0 +1,95 @@
+import { analyzeCost, getProgram, lsTreeWalk, types as rtypes } from "@algo-builder/runtime";
+import path from "path";
+
+import { ASSETS_DIR } from "../internal/core/project-structure";
+import { cmpStr } from "../lib/comparators";
+import { pyExt, tealExt } from "../lib/compile";
+import type { RuntimeEnv } from "../types";
+
+export interface TaskArgs {
+	files: string[];
+	signature: boolean;
+	appCalls?: number;
+	methods?: string;
+	loopBounds?: string;
+}
+
+// formats a cost (Infinity for unbounded costs)
+function fmtCost(cost: number, budget: number): string {
+	const value = cost === Infinity ? "unbounded" : String(cost);
+	return cost > budget ? `${value} (exceeds budget)` : value;
+}
+
+/**
+ * Parses loop bounds passed as `label=bound` pairs separated by commas.
+ * @param loopBounds loop bounds, eg. "loop=10,inner=4"
+ */
+export function parseLoopBounds(loopBounds: string | undefined): { [label: string]: number } {
+	const bounds: { [label: string]: number } = {};
+	for (const pair of loopBounds?.split(",") ?? []) {
+		const [label, bound] = pair.split("=").map((s) => s.trim());
+		if (label === "" || bound === undefined || !/^\d+$/.test(bound)) {
+			throw new Error(`invalid loop bound "${pair}", expected <label>=<number of iterations>`);
+		}
+		bounds[label] = Number(bound);
+	}
+	return bounds;
+}
+
+export function printCostReport(file: string, report: rtypes.CostReport): void {
+	const mode = report.mode === rtypes.ExecutionMode.SIGNATURE ? "signature" : "application";
+	console.log(`${file}: TEAL v${report.tealVersion}, ${mode} mode, budget ${report.budget}`);
+	console.log(`  max cost: ${fmtCost(report.maxCost, report.budget)}`);
+	if (report.entryPoints.length) {
+		console.log("  entry points:");
+		for (const e of report.entryPoints) {
+			const kind = e.kind === "method" ? "method" : "on completion";
+			console.log(`    ${kind} ${e.name} (line ${e.line}): ${fmtCost(e.maxCost, report.budget)}`);
+		}
+	}
+	if (report.subroutines.length) {
+		console.log("  subroutines:");
+		for (const s of report.subroutines) {
+			console.log(`    ${s.label} (line ${s.line}): ${fmtCost(s.maxCost, Infinity)}`);
+		}
+	}
+	if (report.loops.length) {
+		console.log("  loops:");
+		for (const l of report.loops) {
+			const bound = l.bound === undefined ? "no bound, add a @loop-bound annotation" : l.bound;
+			console.log(`    ${l.label} (line ${l.line}): ${bound}`);
+		}
+	}
+	for (const u of report.unbounded) {
+		console.log(`  unbounded cost at line ${u.line}: ${u.reason}`);
+	}
+}
+
+/**
+ * Statically computes the worst-case cost of TEAL programs (of all .teal and .py files in
+ * the assets directory by default) and reports the entry points exceeding the budget.
+ */
+export function analyzeCostTask(
+	taskArgs: TaskArgs,
+	_env: RuntimeEnv
+): { [file: string]: rtypes.CostReport } {
+	const files = taskArgs.files.length
+		? taskArgs.files
+		: lsTreeWalk(ASSETS_DIR)
+				.map((p) => path.basename(p))
+				.filter((f) => f.endsWith(tealExt) || f.endsWith(pyExt))
+				.sort(cmpStr);
+	const options: rtypes.CostAnalysisOptions = {
+		mode: taskArgs.signature ? rtypes.ExecutionMode.SIGNATURE : rtypes.ExecutionMode.APPLICATION,
+		appCalls: taskArgs.appCalls,
+		loopBounds: parseLoopBounds(taskArgs.loopBounds),
+		methods: taskArgs.methods?.split(";").map((m) => m.trim()),
+	};
+
+	const reports: { [file: string]: rtypes.CostReport } = {};
+	for (const file of files) {
+		reports[file] = analyzeCost(getProgram(file, ASSETS_DIR, undefined, false), options);
+		printCostReport(file, reports[file]);
+	}
+	return reports;
+}
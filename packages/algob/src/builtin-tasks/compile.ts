@@ -1,27 +1,19 @@
 import { lsTreeWalk } from "@algo-builder/runtime";
 import path from "path";
 
-import { task } from "../internal/core/config/config-env";
 import { assertDir, ASSETS_DIR, CACHE_DIR } from "../internal/core/project-structure";
 import { cmpStr } from "../lib/comparators";
 import { CompileOp, pyExt, tealExt } from "../lib/compile";
 import { createClient } from "../lib/driver";
 import type { RuntimeEnv } from "../types";
-import { TASK_COMPILE } from "./task-names";
 
 const ALGOBPY_DIR = "algobpy";
 
-export default function (): void {
-	task(TASK_COMPILE, "Compile all TEAL smart contracts")
-		.addFlag("force", "recompile even if the source file didn't change")
-		.setAction(compileTask);
-}
-
 export interface TaskArgs {
 	force: boolean;
 }
 
-function compileTask({ force }: TaskArgs, env: RuntimeEnv): Promise<void> {
+export function compileTask({ force }: TaskArgs, env: RuntimeEnv): Promise<void> {
 	const op = new CompileOp(createClient(env.network));
 	return compile(force, op);
 }
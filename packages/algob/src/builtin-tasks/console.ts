@@ -4,20 +4,20 @@ import repl from "repl";
 import { runInNewContext } from "vm";
 
 import * as algob from "../index";
-import { task } from "../internal/core/config/config-env";
 import { DeployerConfig, mkDeployer } from "../internal/deployer_cfg";
 import { isRecoverableError, preprocess } from "../internal/util/console";
 import { createAlgoOperator } from "../lib/algo-operator";
 import { createClient } from "../lib/driver";
 import { loadCheckpointsIntoCPData, lsScriptsDir } from "../lib/script-checkpoints";
 import { Deployer, RuntimeEnv } from "../types";
-import { TASK_CONSOLE } from "./task-names";
 
 function initializeDeployer(runtimeEnv: RuntimeEnv): Deployer {
 	const algoOp = createAlgoOperator(runtimeEnv.network);
 	const deployerCfg = new DeployerConfig(runtimeEnv, algoOp);
 	const scriptsFromScriptsDir: string[] = lsScriptsDir();
-	loadCheckpointsIntoCPData(deployerCfg.cpData, scriptsFromScriptsDir);
+	loadCheckpointsIntoCPData(deployerCfg.cpData, scriptsFromScriptsDir, (s) =>
+		deployerCfg.cpStore.load(s)
+	);
 	return mkDeployer(false, deployerCfg);
 }
 
@@ -65,13 +65,12 @@ async function startConsole(runtimeEnv: RuntimeEnv): Promise<void> {
 	});
 }
 
-export default function (): void {
-	task(TASK_CONSOLE, "Opens algob console")
-		.addFlag("noCompile", "Don't compile before running this task")
-		.setAction(async ({ noCompile }: { noCompile: boolean }, runtimeEnv: RuntimeEnv) => {
-			if (!runtimeEnv.config.paths) {
-				return;
-			}
-			await startConsole(runtimeEnv);
-		});
+export async function consoleTask(
+	{ noCompile }: { noCompile: boolean },
+	runtimeEnv: RuntimeEnv
+): Promise<void> {
+	if (!runtimeEnv.config.paths) {
+		return;
+	}
+	await startConsole(runtimeEnv);
 }
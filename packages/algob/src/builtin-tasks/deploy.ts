@@ -1,35 +1,18 @@
 import { BuilderError, ERRORS } from "@algo-builder/web";
-import fs from "fs";
 
-import { task } from "../internal/core/config/config-env";
 import { loadFilenames } from "../internal/util/files";
 import { AlgoOperator, createAlgoOperator } from "../lib/algo-operator";
+import { mkCheckpointStore } from "../lib/checkpoint-store";
 import { assertDirectDirChildren } from "../lib/files";
-import {
-	persistCheckpoint,
-	scriptsDirectory,
-	toCheckpointFileName,
-} from "../lib/script-checkpoints";
-import { CheckpointRepo, RuntimeEnv } from "../types";
+import { scriptsDirectory } from "../lib/script-checkpoints";
+import { CheckpointRepo, CheckpointStore, RuntimeEnv } from "../types";
 import { runMultipleScripts } from "./run";
-import { TASK_DEPLOY } from "./task-names";
 
 export interface TaskArgs {
 	fileNames: string[];
 	force: boolean;
 }
 
-function clearCheckpointFiles(scriptNames: string[]): void {
-	scriptNames.forEach((scriptName) => {
-		try {
-			// fs.unlink deletes the file
-			fs.unlinkSync(toCheckpointFileName(scriptName));
-		} catch (e) {
-			// ignored
-		}
-	});
-}
-
 export async function executeDeployTask(
 	{ fileNames, force }: TaskArgs,
 	runtimeEnv: RuntimeEnv,
@@ -49,11 +32,15 @@ export async function executeDeployTask(
 	}
 
 	if (force) {
-		clearCheckpointFiles(scriptNames);
+		mkCheckpointStore(runtimeEnv.config, runtimeEnv.network.name).clear(scriptNames);
 	}
 
-	const onSuccessFn = (cpData: CheckpointRepo, relativeScriptPath: string): void => {
-		persistCheckpoint(relativeScriptPath, cpData.strippedCP);
+	const onSuccessFn = (
+		cpData: CheckpointRepo,
+		relativeScriptPath: string,
+		cpStore: CheckpointStore
+	): void => {
+		cpStore.persist(relativeScriptPath, cpData.strippedCP);
 	};
 
 	return await runMultipleScripts(
@@ -68,16 +55,6 @@ export async function executeDeployTask(
 	);
 }
 
-export default function (): void {
-	task(TASK_DEPLOY, "Compiles and runs user-defined scripts from scripts directory")
-		.addFlag(
-			"force",
-			"Run the scripts even if checkpoint state already exist (Danger: it will overwrite them)."
-		)
-		.addOptionalVariadicPositionalParam(
-			"fileNames",
-			"A directory that contains js files to be run within algob's environment",
-			[]
-		)
-		.setAction((input, env) => executeDeployTask(input, env, createAlgoOperator(env.network)));
+export async function deployTask(input: TaskArgs, env: RuntimeEnv): Promise<void> {
+	await executeDeployTask(input, env, createAlgoOperator(env.network));
 }
@@ -0,0 +1,15 @@
+import { LogCheckpointStore } from "../lib/checkpoint-store";
+import type { RuntimeEnv, TaskArguments } from "../types";
+
+export async function exportCheckpointsTask(
+	_: TaskArguments,
+	runtimeEnv: RuntimeEnv
+): Promise<void> {
+	const store = new LogCheckpointStore(runtimeEnv.network.name);
+	const files = store.exportToYaml();
+	if (files.length === 0) {
+		console.log("No checkpoints to export");
+		return;
+	}
+	console.log("Exported checkpoints:\n    %s", files.join("\n    "));
+}
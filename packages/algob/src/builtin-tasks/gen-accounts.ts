@@ -1,29 +1,36 @@
+import type { types as rtypes } from "@algo-builder/runtime";
 import { BuilderError, ERRORS } from "@algo-builder/web";
-import algosdk from "algosdk";
+import algosdk, { SuggestedParams } from "algosdk";
+import { once } from "events";
 import * as _fs from "fs";
+import os from "os";
 import * as path from "path";
 import YAML from "yaml";
 
-import { task } from "../internal/core/config/config-env";
-import * as types from "../internal/core/params/argument-types";
 import { assertAllDirs, ASSETS_DIR } from "../internal/core/project-structure";
-import { MnemonicAccount, RuntimeEnv, TaskArguments } from "../types";
-import { TASK_GEN_ACCOUNTS } from "./task-names";
+import { WorkerPool } from "../internal/util/workers";
+import { genAccounts } from "../lib/account";
+import { AlgoOperatorImpl } from "../lib/algo-operator";
+import { createClient } from "../lib/driver";
+import type { GenAccountsInput } from "../lib/gen-accounts-worker";
+import { MnemonicAccount, RuntimeEnv, TaskArguments, TxnReceipt } from "../types";
+
 const fsp = _fs.promises;
 
-export default function (): void {
-	task(TASK_GEN_ACCOUNTS, "Generates custom accounts (not safe for production use)")
-		.addPositionalParam("n", "number of accounts to generate", undefined, types.int, false)
-		.addFlag("force", "Overwrite generated accounts if the file already exists")
-		.setAction(mkAccounts);
-}
+const DEFAULT_CHUNK_SIZE = 500;
+// below this number of accounts starting workers costs more than it saves
+const MIN_PARALLEL_ACCOUNTS = 2000;
+const FUND_GROUP_SIZE = 16; // max size of a transaction group
+const FUND_MAX_IN_FLIGHT = 8;
+const FUND_PARAMS_REFRESH = 50; // suggested params are refreshed every N groups
 
-export function getFilename(): string {
-	return path.join(ASSETS_DIR, "accounts_generated.yaml");
+export type AccountsFileFormat = "yaml" | "jsonl";
+
+export function getFilename(format: AccountsFileFormat = "yaml"): string {
+	return path.join(ASSETS_DIR, `accounts_generated.${format}`);
 }
 
-export async function mkAccounts(taskArgs: TaskArguments, _env: RuntimeEnv): Promise<void> {
-	const filename = getFilename();
+export async function mkAccounts(taskArgs: TaskArguments, env: RuntimeEnv): Promise<void> {
 	const n = taskArgs.n as number;
 	if (n <= 0) {
 		throw new BuilderError(ERRORS.ARGUMENTS.INVALID_VALUE_FOR_TYPE, {
@@ -31,29 +38,172 @@ export async function mkAccounts(taskArgs: TaskArguments, _env: RuntimeEnv): Pro
 			name: "n",
 		});
 	}
+	const format = (taskArgs.format ?? "yaml") as AccountsFileFormat;
+	if (format !== "yaml" && format !== "jsonl") {
+		throw new BuilderError(ERRORS.ARGUMENTS.INVALID_VALUE_FOR_TYPE, {
+			value: format,
+			name: "format",
+		});
+	}
+	if (taskArgs.fund !== undefined && taskArgs.funder === undefined) {
+		throw new BuilderError(ERRORS.ARGUMENTS.MISSING_TASK_ARGUMENT, { param: "funder" });
+	}
+	const funder =
+		taskArgs.fund === undefined
+			? undefined
+			: new AccountFunder(env, taskArgs.funder as string, Number(taskArgs.fund));
+	const filename = getFilename(format);
+	if (!(await canWriteFile(filename, taskArgs.force as boolean))) {
+		return;
+	}
+
 	console.info("GENERATING", n, "ACCOUNTS to ", filename);
-	const accounts = genAccounts(n);
-	return await writeToFile(YAML.stringify(accounts), taskArgs.force as boolean, filename);
+	const out = _fs.createWriteStream(filename, "utf8");
+	try {
+		for await (const accounts of genAccountsStream(n, taskArgs.workers as number | undefined)) {
+			const data =
+				format === "yaml"
+					? YAML.stringify(accounts)
+					: accounts.map((a) => JSON.stringify(a) + "\n").join("");
+			if (!out.write(data)) {
+				await once(out, "drain");
+			}
+			await funder?.fund(accounts.map((a) => a.addr));
+		}
+		await funder?.flush();
+	} finally {
+		out.end();
+		await once(out, "finish");
+	}
+	console.log(`Data written succesfully to ${filename}`);
 }
 
-export function genAccounts(n: number): MnemonicAccount[] {
-	const accounts: MnemonicAccount[] = [];
-	for (let i = 0; i < n; ++i) {
-		const a = algosdk.generateAccount();
-		accounts.push({
-			name: "gen_" + i.toString(),
-			addr: a.addr,
-			mnemonic: algosdk.secretKeyToMnemonic(a.sk),
-		});
+/**
+ * Generates `n` accounts (same as `genAccounts`) and yields them in chunks, in order.
+ * Key generation is split across worker threads, and only a few chunks per worker are
+ * kept in memory, so the consumer can stream any number of accounts to a file.
+ * @param n number of accounts
+ * @param workers number of worker threads (defaults to the number of CPUs for large `n`).
+ *   With 1 worker accounts are generated in the main thread.
+ * @param chunkSize number of accounts in a chunk
+ */
+export async function* genAccountsStream(
+	n: number,
+	workers?: number,
+	chunkSize = DEFAULT_CHUNK_SIZE
+): AsyncGenerator<MnemonicAccount[]> {
+	const requested = workers ?? (n < MIN_PARALLEL_ACCOUNTS ? 1 : os.cpus().length);
+	const size = Math.max(1, Math.min(requested, Math.ceil(n / chunkSize)));
+	if (size === 1) {
+		for (let start = 0; start < n; start += chunkSize) {
+			yield genAccounts(Math.min(chunkSize, n - start), start);
+		}
+		return;
+	}
+
+	// a few chunks per worker are generated ahead, so workers don't wait for the consumer
+	const pool = new WorkerPool<GenAccountsInput, MnemonicAccount[]>(
+		require.resolve("../lib/gen-accounts-worker"),
+		size
+	);
+	const chunks: Array<Promise<MnemonicAccount[]>> = [];
+	let next = 0; // start index of the next chunk to generate
+	const schedule = (): void => {
+		while (chunks.length < 2 * size && next < n) {
+			const chunk = pool.run({ start: next, count: Math.min(chunkSize, n - next) });
+			chunk.catch(() => undefined); // error is thrown when the chunk is awaited
+			chunks.push(chunk);
+			next += chunkSize;
+		}
+	};
+	try {
+		schedule();
+		while (chunks.length > 0) {
+			const accounts = await (chunks.shift() as Promise<MnemonicAccount[]>);
+			schedule();
+			yield accounts;
+		}
+	} finally {
+		await pool.close();
 	}
-	return accounts;
 }
 
-export async function writeToFile(
-	content: any,
-	force: boolean,
-	fileName: string
-): Promise<void> {
+/**
+ * Funds accounts with payment transactions grouped by 16. Groups are sent without waiting
+ * for confirmation of previous groups (up to `FUND_MAX_IN_FLIGHT` groups are pending).
+ */
+class AccountFunder {
+	private readonly algoOp: AlgoOperatorImpl;
+	private readonly funder: rtypes.Account;
+	private readonly amount: number;
+	private readonly pending: string[] = [];
+	private readonly inFlight: Array<Promise<TxnReceipt>> = [];
+	private params?: SuggestedParams;
+	private sentGroups = 0;
+
+	constructor(env: RuntimeEnv, funderName: string | undefined, amount: number) {
+		if (!Number.isSafeInteger(amount) || amount <= 0) {
+			throw new BuilderError(ERRORS.ARGUMENTS.INVALID_VALUE_FOR_TYPE, {
+				value: amount,
+				name: "fund",
+			});
+		}
+		const funder = env.network.config.accounts.find((a) => a.name === funderName);
+		if (funder === undefined) {
+			throw new BuilderError(ERRORS.BUILTIN_TASKS.ACCOUNT_NOT_FOUND, {
+				assetName: funderName,
+			});
+		}
+		this.algoOp = new AlgoOperatorImpl(createClient(env.network));
+		this.funder = funder;
+		this.amount = amount;
+	}
+
+	async fund(addrs: string[]): Promise<void> {
+		this.pending.push(...addrs);
+		while (this.pending.length >= FUND_GROUP_SIZE) {
+			await this.send(this.pending.splice(0, FUND_GROUP_SIZE));
+		}
+	}
+
+	async flush(): Promise<void> {
+		if (this.pending.length > 0) {
+			await this.send(this.pending.splice(0));
+		}
+		while (this.inFlight.length > 0) {
+			await this.inFlight.shift();
+		}
+		console.info("FUNDED", this.sentGroups, "GROUPS from", this.funder.name);
+	}
+
+	private async send(addrs: string[]): Promise<void> {
+		if (this.inFlight.length >= FUND_MAX_IN_FLIGHT) {
+			await this.inFlight.shift();
+		}
+		if (this.params === undefined || this.sentGroups % FUND_PARAMS_REFRESH === 0) {
+			this.params = await this.algoOp.algodClient.getTransactionParams().do();
+		}
+		const txns = addrs.map((to) =>
+			algosdk.makePaymentTxnWithSuggestedParamsFromObject({
+				from: this.funder.addr,
+				to,
+				amount: this.amount,
+				suggestedParams: this.params as SuggestedParams,
+			})
+		);
+		if (txns.length > 1) {
+			algosdk.assignGroupID(txns);
+		}
+		const signed = txns.map((txn) => txn.signTxn(this.funder.sk));
+		const confirmation = this.algoOp.waitForConfirmation(await this.algoOp.send(signed));
+		confirmation.catch(() => undefined); // error is thrown when the group is awaited
+		this.inFlight.push(confirmation);
+		this.sentGroups++;
+	}
+}
+
+// returns false (and prints an error) if the file exists and `force` is not set
+async function canWriteFile(fileName: string, force: boolean): Promise<boolean> {
 	await assertAllDirs();
 	try {
 		await fsp.access(fileName, _fs.constants.F_OK);
@@ -61,9 +211,20 @@ export async function writeToFile(
 			console.error(
 				`File ${fileName} already exists. Aborting. Use --force flag if you want to overwrite it`
 			);
-			return;
+			return false;
 		}
 	} catch (e) {} // eslint-disable-line no-empty
+	return true;
+}
+
+export async function writeToFile(
+	content: any,
+	force: boolean,
+	fileName: string
+): Promise<void> {
+	if (!(await canWriteFile(fileName, force))) {
+		return;
+	}
 
 	try {
 		await fsp.writeFile(fileName, content, "utf8");
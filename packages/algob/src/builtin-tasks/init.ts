@@ -1,28 +1,16 @@
 import { createProject } from "../internal/cli/project-creation";
-import { task } from "../internal/core/config/config-env";
-import { TASK_INIT } from "./task-names";
+import type { RuntimeEnv } from "../types";
 
-export default function (): void {
-	task(TASK_INIT, "Initializes a new project(JS by default) in the given directory")
-		.addPositionalParam<string>("newProjectLocation", "Location of the new project")
-		.addFlag("javascript", "Initializes a new javascript project in the given directory")
-		.addFlag("typescript", "Initializes a new typescript project in the given directory")
-		.addFlag("infrastructure", "Initializes a new project without infrastructure folder")
-		.addFlag("npm", "Use npm instead for yarn")
-		.setAction(
-			async (
-				{
-					newProjectLocation,
-					typescript,
-					infrastructure,
-					npm,
-				}: {
-					newProjectLocation: string;
-					typescript: boolean;
-					infrastructure: boolean;
-					npm: boolean;
-				},
-				_
-			) => await createProject(newProjectLocation, typescript, infrastructure, npm)
-		);
+export interface TaskArgs {
+	newProjectLocation: string;
+	typescript: boolean;
+	infrastructure: boolean;
+	npm: boolean;
+}
+
+export async function initTask(
+	{ newProjectLocation, typescript, infrastructure, npm }: TaskArgs,
+	_: RuntimeEnv
+): Promise<void> {
+	await createProject(newProjectLocation, typescript, infrastructure, npm);
 }
@@ -1,13 +1,7 @@
-import { task } from "../internal/core/config/config-env";
 import { createClient } from "../lib/driver";
 import { RuntimeEnv, TaskArguments } from "../types";
-import { TASK_NODE_INFO } from "./task-names";
 
-export default function (): void {
-	task(TASK_NODE_INFO, "Prints node info and status").setAction(nodeInfo);
-}
-
-async function nodeInfo(_taskArgs: TaskArguments, env: RuntimeEnv): Promise<void> {
+export async function nodeInfo(_taskArgs: TaskArguments, env: RuntimeEnv): Promise<void> {
 	const n = env.network;
 	const algocl = createClient(n);
 	const st = await algocl.status().do();
@@ -2,7 +2,6 @@ import { BuilderError, ERRORS } from "@algo-builder/web";
 import chalk from "chalk";
 import debug from "debug";
 import fsExtra from "fs-extra";
-import { task } from "../internal/core/config/config-env";
 import { DeployerConfig, mkDeployer } from "../internal/deployer_cfg";
 import { TxWriterImpl } from "../internal/tx-log-writer";
 import { partitionByFn } from "../internal/util/lists";
@@ -11,16 +10,13 @@ import { AlgoOperator, createAlgoOperator } from "../lib/algo-operator";
 import { cmpStr } from "../lib/comparators";
 import { assertDirChildren } from "../lib/files";
 import {
-	loadCheckpoint,
 	loadCheckpointsIntoCPData,
-	loadCheckpointsRecursive,
 	lsScriptsDir,
 	scriptsDirectory,
 } from "../lib/script-checkpoints";
-import { CheckpointRepo, Deployer, RuntimeEnv } from "../types";
-import { TASK_RUN } from "./task-names";
+import { CheckpointRepo, CheckpointStore, Deployer, RuntimeEnv } from "../types";
 
-interface Input {
+export interface Input {
 	script: string;
 	arg: string;
 }
@@ -57,7 +53,11 @@ export async function runMultipleScripts(
 	runtimeEnv: RuntimeEnv,
 	scriptNames: string[],
 	arg: string,
-	onSuccessFn: (cpData: CheckpointRepo, relativeScriptPath: string) => void,
+	onSuccessFn: (
+		cpData: CheckpointRepo,
+		relativeScriptPath: string,
+		cpStore: CheckpointStore
+	) => void,
 	force: boolean,
 	logDebugTag: string,
 	allowWrite: boolean,
@@ -83,36 +83,46 @@ async function runScripts(
 	runtimeEnv: RuntimeEnv,
 	scriptNames: string[],
 	arg: string,
-	onSuccessFn: (cpData: CheckpointRepo, relativeScriptPath: string) => void,
+	onSuccessFn: (
+		cpData: CheckpointRepo,
+		relativeScriptPath: string,
+		cpStore: CheckpointStore
+	) => void,
 	force: boolean,
 	logDebugTag: string,
 	allowWrite: boolean,
 	deployerCfg: DeployerConfig
 ): Promise<void> {
 	const log = debug(logDebugTag);
-	deployerCfg.cpData = loadCheckpointsRecursive();
-	deployerCfg.txWriter = new TxWriterImpl("");
+	const cpStore = deployerCfg.cpStore;
+	deployerCfg.cpData = cpStore.loadAll();
+	deployerCfg.txWriter = new TxWriterImpl("", runtimeEnv.config.txLog);
 	const deployer: Deployer = mkDeployer(allowWrite, deployerCfg);
 
 	const scriptsFromScriptsDir: string[] = lsScriptsDir();
-	for (const relativeScriptPath of scriptNames) {
-		const prevScripts = splitAfter(scriptsFromScriptsDir, relativeScriptPath);
-		loadCheckpointsIntoCPData(deployerCfg.cpData, prevScripts);
-		if (prevScripts[prevScripts.length - 1] !== relativeScriptPath) {
-			deployerCfg.cpData.merge(loadCheckpoint(relativeScriptPath), relativeScriptPath);
-		}
-		if (!force && deployerCfg.cpData.networkExistsInCurrentCP(runtimeEnv.network.name)) {
-			log(`Skipping: Checkpoint exists for script ${relativeScriptPath}`);
-			// '\x1b[33m%s\x1b[0m' this is used for setting the message color to yellow.
-			console.warn(
-				chalk.yellowBright(`Skipping: Checkpoint exists for script ${relativeScriptPath}`)
-			);
-			continue;
+	try {
+		for (const relativeScriptPath of scriptNames) {
+			const prevScripts = splitAfter(scriptsFromScriptsDir, relativeScriptPath);
+			loadCheckpointsIntoCPData(deployerCfg.cpData, prevScripts, (s) => cpStore.load(s));
+			if (prevScripts[prevScripts.length - 1] !== relativeScriptPath) {
+				deployerCfg.cpData.merge(cpStore.load(relativeScriptPath), relativeScriptPath);
+			}
+			if (!force && deployerCfg.cpData.networkExistsInCurrentCP(runtimeEnv.network.name)) {
+				log(`Skipping: Checkpoint exists for script ${relativeScriptPath}`);
+				// '\x1b[33m%s\x1b[0m' this is used for setting the message color to yellow.
+				console.warn(
+					chalk.yellowBright(`Skipping: Checkpoint exists for script ${relativeScriptPath}`)
+				);
+				continue;
+			}
+			deployerCfg.txWriter.setScriptName(relativeScriptPath);
+			log(`Running script ${relativeScriptPath}`);
+			await runScript(relativeScriptPath, arg, runtimeEnv, deployer);
+			onSuccessFn(deployerCfg.cpData, relativeScriptPath, cpStore);
 		}
-		deployerCfg.txWriter.setScriptName(relativeScriptPath);
-		log(`Running script ${relativeScriptPath}`);
-		await runScript(relativeScriptPath, arg, runtimeEnv, deployer);
-		onSuccessFn(deployerCfg.cpData, relativeScriptPath);
+	} finally {
+		// transaction log is flushed even if a script fails
+		await deployerCfg.txWriter.close();
 	}
 }
 
@@ -165,9 +175,6 @@ async function executeRunTask(
 	}
 }
 
-export default function (): void {
-	task(TASK_RUN, `Runs a user-defined script after compiling the project\n\nExample: yarn algob run script.js --arg '{"firstname":"Jesper","surname":"Aaberg"}'`)
-		.addVariadicPositionalParam("script", "A script file to be run within algob's environment.")
-		.addOptionalParam("arg", "Argument in JSON string to be passed in the script.")
-		.setAction((input, env) => executeRunTask(input, env, createAlgoOperator(env.network)));
+export async function runTask(input: Input, env: RuntimeEnv): Promise<void> {
+	await executeRunTask(input, env, createAlgoOperator(env.network));
 }
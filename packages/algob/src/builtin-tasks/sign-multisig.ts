@@ -1,17 +1,26 @@
-import { getPathFromDirRecursive } from "@algo-builder/runtime";
+import { getPathFromDirRecursive, types as rtypes } from "@algo-builder/runtime";
 import { decodeObj, encodeObj, MultisigMetadata } from "algosdk";
+import fs from "fs";
+import glob from "glob";
+import os from "os";
 import path from "path";
 
-import { task } from "../internal/core/config/config-env";
 import { ASSETS_DIR } from "../internal/core/project-structure";
+import { mapConcurrent } from "../internal/util/lists";
+import { WorkerPool } from "../internal/util/workers";
+import { cmpStr } from "../lib/comparators";
 import { loadEncodedTxFromFile } from "../lib/files";
-import { signMultiSig } from "../lib/msig";
+import { MultisigFileSignature, signMultiSig, signMultiSigTxFile } from "../lib/msig";
+import type { MsigWorkerInput } from "../lib/msig-worker";
 import { RuntimeEnv } from "../types";
 import { writeToFile } from "./gen-accounts";
-import { TASK_SIGN_MULTISIG } from "./task-names";
+
+const fsp = fs.promises;
 
 export interface TaskArgs {
-	file: string;
+	file?: string;
+	batch?: string;
+	workers?: number;
 	account: string;
 	out?: string;
 	v?: string;
@@ -21,7 +30,7 @@ export interface TaskArgs {
 	force: boolean;
 }
 
-async function multiSignTx(taskArgs: TaskArgs, runtimeEnv: RuntimeEnv): Promise<void> {
+export async function multiSignTx(taskArgs: TaskArgs, runtimeEnv: RuntimeEnv): Promise<void> {
 	const signerAccount = runtimeEnv.network.config.accounts.find(
 		(acc) => acc.name === taskArgs.account
 	);
@@ -29,6 +38,19 @@ async function multiSignTx(taskArgs: TaskArgs, runtimeEnv: RuntimeEnv): Promise<
 		console.error(`No account with the name "${taskArgs.account}" exists in the config file.`);
 		return;
 	}
+	let mparams: MultisigMetadata | undefined;
+	const { v, thr, addrs } = taskArgs;
+	if (v && thr && addrs) {
+		mparams = { version: Number(v), threshold: Number(thr), addrs: addrs.split(",") };
+	}
+	if (taskArgs.batch !== undefined) {
+		return await multiSignTxBatch(taskArgs, signerAccount, mparams);
+	}
+	if (taskArgs.file === undefined) {
+		console.error("Transaction file is not passed. Use --file or --batch parameter.");
+		return;
+	}
+
 	let rawTxn = loadEncodedTxFromFile(taskArgs.file); // single tx OR tx group
 	if (rawTxn === undefined) {
 		console.error("Error loading transaction from the file.");
@@ -42,11 +64,6 @@ async function multiSignTx(taskArgs: TaskArgs, runtimeEnv: RuntimeEnv): Promise<
 	}
 
 	const sourceFilePath = getPathFromDirRecursive(ASSETS_DIR, taskArgs.file) as string;
-	let mparams: MultisigMetadata | undefined;
-	const { v, thr, addrs } = taskArgs;
-	if (v && thr && addrs) {
-		mparams = { version: Number(v), threshold: Number(thr), addrs: addrs.split(",") };
-	}
 	const signedTxn = signMultiSig(signerAccount, rawTxn as Uint8Array, mparams);
 
 	const [name, ext] = taskArgs.file.split(".");
@@ -63,33 +80,88 @@ async function multiSignTx(taskArgs: TaskArgs, runtimeEnv: RuntimeEnv): Promise<
 	await writeToFile(outData, taskArgs.force, outFilePath);
 }
 
-export default function (): void {
-	task(TASK_SIGN_MULTISIG, "Signs a transaction object from a file using Multi Signature")
-		.addParam(
-			"account",
-			"Name of the account (present in `algob.config.js`) to be used for signing the transaction."
-		)
-		.addParam("file", "Name of the transaction file in assets directory")
-		.addOptionalParam(
-			"out",
-			'Name of the file to be used for resultant transaction file.\n\t\tIf not provided source transaction file\'s name will be appended by "_out"\n'
-		)
-		.addOptionalParam(
-			"v",
-			"Multisig version (required if creating a new signed multisig transaction)"
-		)
-		.addOptionalParam(
-			"thr",
-			"Multisig threshold (required if creating a new signed multisig transaction)"
-		)
-		.addOptionalParam(
-			"addrs",
-			"Comma separated addresses comprising of the multsig (addr1,addr2,..). Order is important. \n\t\t(required if creating a new signed multisig transaction)\n"
-		)
-		.addOptionalParam(
-			"groupIndex",
-			"Index of transaction (0 indexed) to sign if file has an encoded transaction group. Defaults to 0."
-		)
-		.addFlag("force", "Overwrite output transaction file if the file already exists.")
-		.setAction((input, env) => multiSignTx(input, env));
+/**
+ * Returns transaction files matching comma separated globs or directories (relative to the
+ * assets directory). Output files of previous runs (`*_out.*`) are ignored.
+ * @param batch comma separated globs or directories
+ */
+export function batchFiles(batch: string): string[] {
+	const files = new Set<string>();
+	for (const pattern of batch.split(",").map((p) => p.trim())) {
+		if (pattern === "") continue;
+		const dir = path.join(ASSETS_DIR, pattern);
+		const isDir = fs.existsSync(dir) && fs.statSync(dir).isDirectory();
+		const matches = glob.sync(isDir ? path.join(pattern, "**/*") : pattern, {
+			cwd: ASSETS_DIR,
+			nodir: true,
+			absolute: true,
+		});
+		for (const f of matches) {
+			if (!path.parse(f).name.endsWith("_out")) files.add(path.normalize(f));
+		}
+	}
+	return [...files].sort(cmpStr);
+}
+
+/**
+ * Signs all transactions relevant to the signer (see `signMultiSigTxFile`) in the files
+ * matching `taskArgs.batch`, in a pool of worker threads. Output of `<name>.<ext>` is
+ * written to `<name>_out.<ext>`.
+ */
+async function multiSignTxBatch(
+	taskArgs: TaskArgs,
+	signer: rtypes.Account,
+	mparams: MultisigMetadata | undefined
+): Promise<void> {
+	const files = batchFiles(taskArgs.batch as string);
+	if (files.length === 0) {
+		console.error(`No transaction files match "${taskArgs.batch as string}" in ${ASSETS_DIR}`);
+		return;
+	}
+	const workers = Math.min(taskArgs.workers ?? os.cpus().length, files.length);
+	// with 1 worker transactions are signed in the main thread
+	const pool =
+		workers > 1
+			? new WorkerPool<MsigWorkerInput, MultisigFileSignature>(
+					require.resolve("../lib/msig-worker"),
+					workers
+			  )
+			: undefined;
+	const sign = async (input: MsigWorkerInput): Promise<MultisigFileSignature> =>
+		pool === undefined
+			? signMultiSigTxFile(input.signer, input.data, input.mparams)
+			: await pool.run(input);
+
+	const signerKey = { addr: signer.addr, sk: signer.sk }; // copied to workers
+	let [written, skipped, failed] = [0, 0, 0];
+	try {
+		// a few files per worker are read ahead, so workers don't wait for the disk
+		await mapConcurrent(files, 2 * workers, async (file) => {
+			const { dir, name, ext } = path.parse(file);
+			const outFile = path.join(dir, `${name}_out${ext}`);
+			try {
+				if (!taskArgs.force && fs.existsSync(outFile)) {
+					console.warn(`File ${outFile} already exists. Skipping. Use --force to overwrite it`);
+					skipped++;
+					return;
+				}
+				const data = await fsp.readFile(file);
+				const { blob, signed } = await sign({ signer: signerKey, data, mparams });
+				if (signed.length === 0) {
+					console.info(`${file}: no transaction to sign by ${signer.name}`);
+					skipped++;
+					return;
+				}
+				await fsp.writeFile(outFile, blob);
+				console.info(`${file}: signed transactions [${signed.join(", ")}] -> ${outFile}`);
+				written++;
+			} catch (e) {
+				console.error(`${file}: signing failed:`, e instanceof Error ? e.message : e);
+				failed++;
+			}
+		});
+	} finally {
+		await pool?.close();
+	}
+	console.log(`Signed ${written} files, skipped ${skipped}, failed ${failed}`);
 }
@@ -0,0 +1,219 @@
+/* eslint-disable @typescript-eslint/no-var-requires */
+import { task } from "../internal/core/config/config-env";
+import * as types from "../internal/core/params/argument-types";
+import { lazyObject } from "../internal/util/lazy";
+import {
+	TASK_ANALYZE_COST,
+	TASK_CLEAN,
+	TASK_COMPILE,
+	TASK_CONSOLE,
+	TASK_DEPLOY,
+	TASK_EXPORT_CHECKPOINTS,
+	TASK_GEN_ACCOUNTS,
+	TASK_HELP,
+	TASK_INIT,
+	TASK_NODE_INFO,
+	TASK_RUN,
+	TASK_SIGN_LSIG,
+	TASK_SIGN_MULTISIG,
+	TASK_TEST,
+	TASK_UNBOX_TEMPLATE,
+} from "./task-names";
+
+// Task implementations (and their dependencies: algosdk, mocha, the REPL, ...) are
+// required only when the task runs, so registering all tasks stays cheap.
+const analyzeCost = lazyObject(
+	() => require("./analyze-cost") as typeof import("./analyze-cost")
+);
+const clean = lazyObject(() => require("./clean") as typeof import("./clean"));
+const compile = lazyObject(() => require("./compile") as typeof import("./compile"));
+const algobConsole = lazyObject(() => require("./console") as typeof import("./console"));
+const deploy = lazyObject(() => require("./deploy") as typeof import("./deploy"));
+const exportCheckpoints = lazyObject(
+	() => require("./export-checkpoints") as typeof import("./export-checkpoints")
+);
+const genAccounts = lazyObject(
+	() => require("./gen-accounts") as typeof import("./gen-accounts")
+);
+const help = lazyObject(() => require("./help") as typeof import("./help"));
+const init = lazyObject(() => require("./init") as typeof import("./init"));
+const nodeInfo = lazyObject(() => require("./node-info") as typeof import("./node-info"));
+const run = lazyObject(() => require("./run") as typeof import("./run"));
+const signLsig = lazyObject(() => require("./sign-lsig") as typeof import("./sign-lsig"));
+const signMultisig = lazyObject(
+	() => require("./sign-multisig") as typeof import("./sign-multisig")
+);
+const test = lazyObject(() => require("./test") as typeof import("./test"));
+const unboxTemplate = lazyObject(
+	() => require("./unbox-template") as typeof import("./unbox-template")
+);
+
+export default function (): void {
+	task(TASK_ANALYZE_COST, "Computes static worst-case costs of TEAL programs")
+		.addOptionalVariadicPositionalParam(
+			"files",
+			"TEAL or PyTEAL files in assets directory (defaults to all of them)",
+			[]
+		)
+		.addFlag("signature", "Analyze the programs as logic signatures")
+		.addOptionalParam(
+			"appCalls",
+			"Number of application calls pooling their budget. Defaults to 1.",
+			undefined,
+			types.int
+		)
+		.addOptionalParam(
+			"methods",
+			"ABI method signatures separated by ';', used to name the methods entry points"
+		)
+		.addOptionalParam(
+			"loopBounds",
+			"Maximum number of iterations of loops, eg. 'loop=10,inner=4'. Loops can also be\n\t\t" +
+				"annotated in TEAL with a `// @loop-bound <n>` comment on the line of their label.\n"
+		)
+		.setAction(async (input, env) => analyzeCost.analyzeCostTask(input, env));
+
+	task(TASK_CLEAN, "Clears the cache and deletes all artifacts").setAction(
+		async (input, env) => await clean.cleanTask(input, env)
+	);
+
+	task(TASK_COMPILE, "Compile all TEAL smart contracts")
+		.addFlag("force", "recompile even if the source file didn't change")
+		.setAction(async (input, env) => await compile.compileTask(input, env));
+
+	task(TASK_CONSOLE, "Opens algob console")
+		.addFlag("noCompile", "Don't compile before running this task")
+		.setAction(async (input, env) => await algobConsole.consoleTask(input, env));
+
+	task(TASK_DEPLOY, "Compiles and runs user-defined scripts from scripts directory")
+		.addFlag(
+			"force",
+			"Run the scripts even if checkpoint state already exist (Danger: it will overwrite them)."
+		)
+		.addOptionalVariadicPositionalParam(
+			"fileNames",
+			"A directory that contains js files to be run within algob's environment",
+			[]
+		)
+		.setAction(async (input, env) => await deploy.deployTask(input, env));
+
+	task(
+		TASK_EXPORT_CHECKPOINTS,
+		"Exports checkpoints of the append-only checkpoint store as YAML files"
+	).setAction(async (input, env) => await exportCheckpoints.exportCheckpointsTask(input, env));
+
+	task(TASK_GEN_ACCOUNTS, "Generates custom accounts (not safe for production use)")
+		.addPositionalParam("n", "number of accounts to generate", undefined, types.int, false)
+		.addFlag("force", "Overwrite generated accounts if the file already exists")
+		.addOptionalParam("format", "Output file format: yaml or jsonl (JSON Lines)", "yaml")
+		.addOptionalParam(
+			"workers",
+			"Number of worker threads generating keys (defaults to the number of CPUs)",
+			undefined,
+			types.int
+		)
+		.addOptionalParam("fund", "Fund generated accounts with microAlgos", undefined, types.int)
+		.addOptionalParam("funder", "Name of the config account funding generated accounts")
+		.setAction(async (input, env) => await genAccounts.mkAccounts(input, env));
+
+	task(TASK_HELP, "Prints this message")
+		.addOptionalPositionalParam("task", "An optional task to print more info about")
+		.setAction(async (input, env) => await help.help(input, env));
+
+	task(TASK_INIT, "Initializes a new project(JS by default) in the given directory")
+		.addPositionalParam<string>("newProjectLocation", "Location of the new project")
+		.addFlag("javascript", "Initializes a new javascript project in the given directory")
+		.addFlag("typescript", "Initializes a new typescript project in the given directory")
+		.addFlag("infrastructure", "Initializes a new project without infrastructure folder")
+		.addFlag("npm", "Use npm instead for yarn")
+		.setAction(async (input, env) => await init.initTask(input, env));
+
+	task(TASK_NODE_INFO, "Prints node info and status").setAction(
+		async (input, env) => await nodeInfo.nodeInfo(input, env)
+	);
+
+	task(TASK_RUN, `Runs a user-defined script after compiling the project\n\nExample: yarn algob run script.js --arg '{"firstname":"Jesper","surname":"Aaberg"}'`)
+		.addVariadicPositionalParam("script", "A script file to be run within algob's environment.")
+		.addOptionalParam("arg", "Argument in JSON string to be passed in the script.")
+		.setAction(async (input, env) => await run.runTask(input, env));
+
+	task(TASK_SIGN_LSIG, "Signs a LogicSig object from a file.")
+		.addParam(
+			"account",
+			"Name of the account (present in `algob.config.js`) to be used for signing the logic signature."
+		)
+		.addParam("file", "Name of the transaction file in assets directory")
+		.addOptionalParam(
+			"out",
+			'Name of the file to be used for resultant logic signature file.\n\t\t        If not provided source logic signature file\'s name will be appended by "_out"'
+		)
+		.addFlag("force", "Overwrite output lsig file if the file already exists.")
+		.setAction(async (input, env) => await signLsig.multiSignLsig(input, env));
+
+	task(TASK_SIGN_MULTISIG, "Signs a transaction object from a file using Multi Signature")
+		.addParam(
+			"account",
+			"Name of the account (present in `algob.config.js`) to be used for signing the transaction."
+		)
+		.addOptionalParam("file", "Name of the transaction file in assets directory")
+		.addOptionalParam(
+			"batch",
+			"Comma separated globs or directories (relative to assets directory) of transaction files to sign.\n\t\tAll transactions relevant to the account are signed and written to <name>_out.<ext> files.\n"
+		)
+		.addOptionalParam(
+			"workers",
+			"Number of worker threads used with --batch (defaults to the number of CPUs)",
+			undefined,
+			types.int
+		)
+		.addOptionalParam(
+			"out",
+			'Name of the file to be used for resultant transaction file.\n\t\tIf not provided source transaction file\'s name will be appended by "_out"\n'
+		)
+		.addOptionalParam(
+			"v",
+			"Multisig version (required if creating a new signed multisig transaction)"
+		)
+		.addOptionalParam(
+			"thr",
+			"Multisig threshold (required if creating a new signed multisig transaction)"
+		)
+		.addOptionalParam(
+			"addrs",
+			"Comma separated addresses comprising of the multsig (addr1,addr2,..). Order is important. \n\t\t(required if creating a new signed multisig transaction)\n"
+		)
+		.addOptionalParam(
+			"groupIndex",
+			"Index of transaction (0 indexed) to sign if file has an encoded transaction group. Defaults to 0."
+		)
+		.addFlag("force", "Overwrite output transaction file if the file already exists.")
+		.setAction(async (input, env) => await signMultisig.multiSignTx(input, env));
+
+	task(TASK_TEST, "Run tests using mocha in project root")
+		.addOptionalVariadicPositionalParam(
+			"testFiles",
+			"An optional list of file path(s) to test",
+			[]
+		)
+		.setAction(async (config) => await test.runTests(config));
+
+	task(TASK_UNBOX_TEMPLATE, "Unboxes a new dapp template using algo-builder")
+		.addFlag(
+			"force",
+			"Unbox project in the current directory regardless of its " +
+				"state. Be careful, this\n                will overwrite files " +
+				"that exist in the directory."
+		)
+		.addFlag("npm", "Use npm instead for yarn")
+		.addOptionalPositionalParam<string>(
+			"templateName",
+			"Name of the dapp template. If no template is specified, a default " +
+				"template(bare) will be downloaded."
+		)
+		.addOptionalPositionalParam<string>(
+			"destination",
+			"Path to the directory in which you would like to unbox the project files. " +
+				"If destination is\n                not provided, this defaults to the current directory.\n"
+		)
+		.setAction(async (input, env) => await unboxTemplate.unboxTemplateTask(input, env));
+}
@@ -12,3 +12,5 @@ export const TASK_UNBOX_TEMPLATE = "unbox-template";
 export const TASK_TEST = "test";
 export const TASK_SIGN_MULTISIG = "sign-multisig";
 export const TASK_SIGN_LSIG = "sign-lsig";
+export const TASK_EXPORT_CHECKPOINTS = "export-checkpoints";
+export const TASK_ANALYZE_COST = "analyze-cost";
@@ -1,14 +1,12 @@
 import findupSync from "findup-sync";
 import Mocha from "mocha";
 
-import { task } from "../internal/core/config/config-env";
 import { loadFilenames } from "../internal/util/files";
 import { testsDirectory } from "../lib/script-checkpoints";
 import type { TaskTestConfig } from "../types";
-import { TASK_TEST } from "./task-names";
 
 const TEST_DIR = "test";
-async function runTests(config: TaskTestConfig): Promise<void> {
+export async function runTests(config: TaskTestConfig): Promise<void> {
 	try {
 		const tsPath = findupSync("tsconfig.json", { cwd: process.cwd() });
 		if (tsPath) {
@@ -36,13 +34,3 @@ async function runTests(config: TaskTestConfig): Promise<void> {
 		console.error("An unexpected error occurred:", error);
 	}
 }
-
-export default function (): void {
-	task(TASK_TEST, "Run tests using mocha in project root")
-		.addOptionalVariadicPositionalParam(
-			"testFiles",
-			"An optional list of file path(s) to test",
-			[]
-		)
-		.setAction((config) => runTests(config));
-}
@@ -10,30 +10,40 @@ import {
 import { globalZeroAddress } from "./lib/constants";
 import { algodCredentialsFromEnv, KMDCredentialsFromEnv } from "./lib/credentials";
 import { Tealdbg } from "./lib/dryrun";
+import { LocalDryrun } from "./lib/local-dryrun";
 import { signLogicSigMultiSig } from "./lib/lsig";
 import { signMultiSig } from "./lib/msig";
 import {
 	balanceOf,
+	balancesOf,
 	printAssets,
 	printGlobalStateApp,
 	printLocalStateApp,
 	readAppGlobalState,
 	readAppLocalState,
+	readAppLocalStates,
 } from "./lib/status";
-import { executeSignedTxnFromFile, signTransactions } from "./lib/tx";
+import {
+	executeSignedTxnFromFile,
+	executeSignedTxnsFromSource,
+	signTransactions,
+} from "./lib/tx";
 import * as runtime from "./runtime";
 import * as types from "./types";
 
 export {
 	ERRORS,
 	Tealdbg,
+	LocalDryrun,
 	mkAccounts,
 	createMsigAddress,
 	loadAccountsFromFile,
 	loadAccountsFromFileSync,
 	loadAccountsFromEnv,
 	executeSignedTxnFromFile,
+	executeSignedTxnsFromSource,
 	balanceOf,
+	balancesOf,
 	printAssets,
 	algodCredentialsFromEnv,
 	KMDCredentialsFromEnv,
@@ -41,6 +51,7 @@ export {
 	printGlobalStateApp,
 	readAppGlobalState,
 	readAppLocalState,
+	readAppLocalStates,
 	signTransactions,
 	globalZeroAddress,
 	types,
@@ -23,6 +23,7 @@ import { isCwdInsideProject } from "../core/project-structure";
 import { Environment } from "../core/runtime-environment";
 import { isSetupTask } from "../core/tasks/builtin-tasks";
 import { getPackageJson, PackageJson } from "../util/package-info";
+import { markStartup, printStartupProfile } from "../util/startup-profile";
 // import { Analytics } from "./analytics";
 import { ArgumentsParser } from "./arguments-parser";
 
@@ -186,6 +187,7 @@ async function main(): Promise<void> {
 			argumentsParser,
 		} = await gatherArguments();
 		showStackTraces = showStackTracesUpdate;
+		markStartup("arguments parsed");
 
 		// --version is a special case
 		if (runtimeArgs.version) {
@@ -199,6 +201,7 @@ async function main(): Promise<void> {
 			argumentsParser,
 			unparsedCLAs
 		);
+		markStartup("environment created");
 
 		// let [abortAnalytics, hitPromise] = await analytics.sendTaskHit(taskName);
 
@@ -211,6 +214,8 @@ async function main(): Promise<void> {
 				throw e;
 			}
 		}
+		markStartup(`task ${taskName} finished`);
+		printStartupProfile();
 
 		// const tAfterRun = new Date().getTime();
 		// if (tAfterRun - tBeforeRun > ANALYTICS_SLOW_TASK_THRESHOLD) {
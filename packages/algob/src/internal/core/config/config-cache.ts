@@ -0,0 +1,236 @@
+import type { types as rtypes } from "@algo-builder/runtime";
+import type { Kmd } from "algosdk";
+import crypto from "crypto";
+import fs from "fs";
+import path from "path";
+
+import { KMDOperator } from "../../../lib/account";
+import type { Config, KmdCfg } from "../../../types";
+
+const cacheVersion = 2;
+const cipherAlgorithm = "aes-256-gcm";
+
+// cipher keys derived in the process (scrypt is slow), by hash of the KMD secret and salt
+const cipherKeys = new Map<string, Buffer>();
+
+// KMD accounts encrypted with a key derived from the KMD config (token and wallet passwords)
+interface EncryptedAccounts {
+	key: string; // config key
+	walletKeys: string; // hash of the addresses of the keys of the KMD wallets
+	salt: string;
+	iv: string;
+	tag: string;
+	data: string;
+}
+
+interface CacheFile {
+	version: number;
+	validated?: string; // key of the last validated config
+	kmd: { [network: string]: EncryptedAccounts };
+}
+
+// binary data, bigints and functions are not supported by JSON
+function replacer(this: any, key: string, value: unknown): unknown {
+	const orig = this[key];
+	if (orig instanceof Uint8Array) return Buffer.from(orig).toString("base64");
+	if (typeof orig === "bigint") return orig.toString();
+	if (typeof orig === "function") return orig.toString();
+	return value;
+}
+
+function kmdSecret(kmdCfg: KmdCfg): string {
+	return JSON.stringify([kmdCfg.token, kmdCfg.wallets.map((w) => [w.name, w.password])]);
+}
+
+function sha256(data: string): string {
+	return crypto.createHash("sha256").update(data).digest("hex");
+}
+
+/**
+ * Returns the hash of the key listing of KMD wallets, used to detect keys added to or
+ * removed from the wallets after the accounts were cached.
+ * @param walletKeys addresses of the keys of each wallet
+ */
+export function walletKeysHash(walletKeys: { [wallet: string]: string[] }): string {
+	const sorted = Object.keys(walletKeys)
+		.sort()
+		.map((w) => [w, [...walletKeys[w]].sort()]);
+	return sha256(JSON.stringify(sorted));
+}
+
+/**
+ * Cache of the config validation and of the accounts exported from KMD, stored in
+ * `artifacts/cache/config.json`. Entries are valid for one config key: a hash of the
+ * config file and of the evaluated config (so changes in the imported account files or
+ * environment variables invalidate the cache too).
+ * KMD accounts are also invalidated when keys are added to or removed from the KMD wallets.
+ * Secret keys of KMD accounts are encrypted (AES-256-GCM) with a key derived from the KMD
+ * token and wallet passwords of the network config. These credentials are stored in the
+ * same config (or environment) as the cache, so the encryption is only an obfuscation: it
+ * doesn't protect the keys from someone who can read the project files.
+ */
+export class ConfigCache {
+	private readonly file: string;
+	private data?: CacheFile;
+
+	constructor(file: string) {
+		this.file = file;
+	}
+
+	/**
+	 * Returns key of the config.
+	 * @param configPath path of the config file
+	 * @param userConfig config exported by the config file
+	 * @param algobVersion version of algob (validation rules depend on it)
+	 */
+	static key(configPath: string, userConfig: Config, algobVersion: string): string {
+		return crypto
+			.createHash("sha256")
+			.update(algobVersion)
+			.update(fs.readFileSync(configPath))
+			.update(JSON.stringify(userConfig, replacer) ?? "")
+			.digest("hex");
+	}
+
+	isValidated(key: string): boolean {
+		return this.read().validated === key;
+	}
+
+	setValidated(key: string): void {
+		this.read().validated = key;
+		this.write();
+	}
+
+	/**
+	 * Returns cached KMD accounts of the network (undefined if not cached for the config and
+	 * the keys of the KMD wallets).
+	 * @param key config key
+	 * @param network network name
+	 * @param kmdCfg KMD config of the network
+	 * @param walletKeys hash of the key listing of the KMD wallets (see `walletKeysHash`)
+	 */
+	getKMDAccounts(
+		key: string,
+		network: string,
+		kmdCfg: KmdCfg,
+		walletKeys: string
+	): rtypes.Account[] | undefined {
+		const entry = this.read().kmd[network];
+		if (entry?.key !== key) {
+			return undefined;
+		}
+		if (entry.walletKeys !== walletKeys) {
+			console.log(`Keys of the KMD wallets of ${network} changed, exporting accounts again`);
+			return undefined;
+		}
+		try {
+			const decipher = crypto.createDecipheriv(
+				cipherAlgorithm,
+				this.cipherKey(kmdCfg, entry.salt),
+				Buffer.from(entry.iv, "base64")
+			);
+			decipher.setAuthTag(Buffer.from(entry.tag, "base64"));
+			const json = Buffer.concat([
+				decipher.update(Buffer.from(entry.data, "base64")),
+				decipher.final(),
+			]).toString();
+			const accounts = JSON.parse(json) as Array<{ name: string; addr: string; sk: string }>;
+			return accounts.map((a) => ({
+				name: a.name,
+				addr: a.addr,
+				sk: new Uint8Array(Buffer.from(a.sk, "base64")),
+			}));
+		} catch (e) {
+			return undefined; // corrupted entry or KMD credentials changed
+		}
+	}
+
+	setKMDAccounts(
+		key: string,
+		network: string,
+		kmdCfg: KmdCfg,
+		walletKeys: string,
+		accounts: rtypes.Account[]
+	): void {
+		const salt = crypto.randomBytes(16).toString("base64");
+		const iv = crypto.randomBytes(12);
+		const cipher = crypto.createCipheriv(cipherAlgorithm, this.cipherKey(kmdCfg, salt), iv);
+		const json = JSON.stringify(
+			accounts.map((a) => ({
+				name: a.name,
+				addr: a.addr,
+				sk: Buffer.from(a.sk).toString("base64"),
+			}))
+		);
+		const data = Buffer.concat([cipher.update(json), cipher.final()]);
+		this.read().kmd[network] = {
+			key,
+			walletKeys,
+			salt,
+			iv: iv.toString("base64"),
+			tag: cipher.getAuthTag().toString("base64"),
+			data: data.toString("base64"),
+		};
+		this.write();
+	}
+
+	private cipherKey(kmdCfg: KmdCfg, salt: string): Buffer {
+		const secret = kmdSecret(kmdCfg);
+		const id = sha256(JSON.stringify([secret, salt]));
+		let key = cipherKeys.get(id);
+		if (key === undefined) {
+			key = crypto.scryptSync(secret, Buffer.from(salt, "base64"), 32);
+			cipherKeys.set(id, key);
+		}
+		return key;
+	}
+
+	private read(): CacheFile {
+		if (this.data === undefined) {
+			try {
+				const data = JSON.parse(fs.readFileSync(this.file, "utf8")) as CacheFile;
+				this.data = data.version === cacheVersion ? data : undefined;
+			} catch (e) {
+				// no cache yet
+			}
+			this.data ??= { version: cacheVersion, kmd: {} };
+		}
+		return this.data;
+	}
+
+	private write(): void {
+		fs.mkdirSync(path.dirname(this.file), { recursive: true });
+		const tmp = `${this.file}.${process.pid}.tmp`;
+		fs.writeFileSync(tmp, JSON.stringify(this.data), { mode: 0o600 });
+		fs.renameSync(tmp, this.file);
+	}
+}
+
+/**
+ * KMD operator which returns accounts from the config cache and caches exported accounts.
+ * Keys of the KMD wallets are listed on every load, to detect changes of the wallets.
+ */
+export class CachedKMDOperator extends KMDOperator {
+	private readonly cache: ConfigCache;
+	private readonly key: string;
+	private readonly network: string;
+
+	constructor(kmdcl: Kmd, cache: ConfigCache, key: string, network: string) {
+		super(kmdcl);
+		this.cache = cache;
+		this.key = key;
+		this.network = network;
+	}
+
+	async loadKMDAccounts(kcfg: KmdCfg): Promise<rtypes.Account[]> {
+		// listing keys is cheap compared to exporting them
+		const walletKeys = walletKeysHash(await this.listKMDKeys(kcfg));
+		const cached = this.cache.getKMDAccounts(this.key, this.network, kcfg, walletKeys);
+		if (cached !== undefined) {
+			return cached;
+		}
+		const accounts = await super.loadKMDAccounts(kcfg);
+		this.cache.setKMDAccounts(this.key, this.network, kcfg, walletKeys, accounts);
+		return accounts;
+	}
+}
@@ -2,10 +2,18 @@ import path from "path";
 
 import { KMDOperator } from "../../../lib/account";
 import { createKmdClient } from "../../../lib/driver";
-import type { NetworkConfig, ResolvedConfig, RuntimeArgs } from "../../../types";
+import type {
+	HttpNetworkConfig,
+	NetworkConfig,
+	ResolvedConfig,
+	RuntimeArgs,
+} from "../../../types";
 import { BuilderContext } from "../../context";
+import { getPackageJson } from "../../util/package-info";
+import { markStartup } from "../../util/startup-profile";
 import { loadPluginFile } from "../plugins";
-import { getUserConfigPath } from "../project-structure";
+import { CACHE_DIR, getUserConfigPath } from "../project-structure";
+import { CachedKMDOperator, ConfigCache } from "./config-cache";
 import { resolveConfig } from "./config-resolution";
 import { validateConfig } from "./config-validation";
 
@@ -38,9 +46,21 @@ export async function loadConfigAndTasks(
 	Object.entries(configEnv).forEach(([key, value]) => (globalAsAny[key] = value));
 
 	loadPluginFile(path.join(__dirname, "..", "tasks", "builtin-tasks"));
+	markStartup("builtin tasks registered");
 	const defaultConfig = importCsjOrEsModule("./default-config");
 	const userConfig = configPath !== undefined ? importCsjOrEsModule(configPath) : defaultConfig;
-	validateConfig(userConfig);
+
+	// validation and KMD accounts are cached when `configCache` is enabled
+	let cache: ConfigCache | undefined;
+	let cacheKey = "";
+	if (configPath !== undefined && userConfig.configCache === true) {
+		cache = new ConfigCache(path.join(path.dirname(configPath), CACHE_DIR, "config.json"));
+		cacheKey = ConfigCache.key(configPath, userConfig, (await getPackageJson()).version);
+	}
+	if (cache === undefined || !cache.isValidated(cacheKey)) {
+		validateConfig(userConfig);
+		cache?.setValidated(cacheKey);
+	}
 
 	// To avoid bad practices we remove the previously exported stuff
 	Object.keys(configEnv).forEach((key) => (globalAsAny[key] = undefined));
@@ -56,10 +76,16 @@ export async function loadConfigAndTasks(
 	if (netname !== undefined) {
 		const net = cfg.networks[netname];
 		if (net?.kmdCfg !== undefined) {
-			const kmdOp = new KMDOperator(createKmdClient(net.kmdCfg));
+			const transport = (net as HttpNetworkConfig).transport;
+			const kmdcl = createKmdClient(net.kmdCfg, transport);
+			const kmdOp =
+				cache === undefined
+					? new KMDOperator(kmdcl)
+					: new CachedKMDOperator(kmdcl, cache, cacheKey, netname);
 			await loadKMDAccounts(net, kmdOp);
 		}
 	}
+	markStartup("config loaded");
 
 	return cfg;
 }
@@ -41,6 +41,30 @@ const ChainType = z
 
 const HttpHeaders = z.record(z.string());
 
+const TxParamsCache = z
+	.object({
+		rounds: z.number().optional(),
+		ms: z.number().optional(),
+	})
+	.passthrough();
+
+const TxLog = z
+	.object({
+		format: z.enum(["yaml", "jsonl", "msgpack"]).optional(),
+		flushSize: z.number().optional(),
+		flushInterval: z.number().optional(),
+	})
+	.passthrough();
+
+const Transport = z
+	.object({
+		keepAlive: z.boolean().optional(),
+		maxSockets: z.number().optional(),
+		timeout: z.number().optional(),
+		http2: z.boolean().optional(),
+	})
+	.passthrough();
+
 const KmdAccount = z.object({
 	name: z.string(),
 	address: z.string(),
@@ -60,6 +84,7 @@ const KmdCfg = z
 		port: z.union([z.number(), z.string()]),
 		token: z.union([z.string(), KMDTokenHeaderType, CustomTokenHeaderType]),
 		wallets: z.array(KmdWallet),
+		cacheTTL: z.number().optional(),
 	})
 	.passthrough();
 
@@ -83,6 +108,8 @@ const HttpNetworkType = z
 			.nullable()
 			.optional(),
 		httpHeaders: HttpHeaders.optional(),
+		txParamsCache: TxParamsCache.optional(),
+		transport: Transport.optional(),
 		kmdCfg: KmdCfg.optional(),
 		indexerCfg: IndexerCfg.optional(),
 	})
@@ -106,6 +133,9 @@ const Config = z
 	.object({
 		networks: NetworksType.optional(),
 		paths: ProjectPaths.optional(),
+		checkpointStore: z.enum(["yaml", "log"]).optional(),
+		txLog: TxLog.optional(),
+		configCache: z.boolean().optional(),
 	})
 	.passthrough();
 
@@ -1,17 +1,9 @@
-import * as path from "path";
-
 import * as tasks from "../../../builtin-tasks/task-names";
-import { loadPluginFile } from "../plugins";
+import registerBuiltinTasks from "../../../builtin-tasks/task-definitions";
 
+// Registers the builtin tasks. Task implementations are loaded when the task runs.
 export default function (): void {
-	const ts = new Map(Object.entries(tasks));
-	ts.delete("TASK_TEST_EXAMPLE");
-	ts.delete("TASK_TEST_GET_TEST_FILES");
-
-	const basedir = path.join(__dirname, "..", "..", "..", "builtin-tasks");
-	for (const t of ts) {
-		loadPluginFile(path.join(basedir, t[1]));
-	}
+	registerBuiltinTasks();
 }
 
 // checks if the task name is not a setup kind of task
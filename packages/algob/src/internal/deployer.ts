@@ -22,17 +22,23 @@ import { AlgoOperator } from "../lib/algo-operator";
 import { CompileOp } from "../lib/compile";
 import { getDummyLsig, getLsig } from "../lib/lsig";
 import { blsigExt, loadBinaryLsig, readMsigFromFile } from "../lib/msig";
-import { CheckpointFunctionsImpl, persistCheckpoint } from "../lib/script-checkpoints";
-import { executeTx } from "../lib/tx";
+import { CheckpointFunctionsImpl } from "../lib/script-checkpoints";
+import { executeTx, executeTxPipelined } from "../lib/tx";
 import type {
 	AppCache,
 	ASCCache,
+	BulkOptInOptions,
+	BulkOptInResult,
 	CheckpointFunctions,
 	CheckpointRepo,
+	CheckpointStore,
 	Deployer,
+	ExecTxGroup,
 	FundASCFlags,
 	LogicSig,
 	LsigInfo,
+	OptInSigner,
+	PipelinedExecOptions,
 	RuntimeEnv,
 	SCParams,
 	TxnReceipt,
@@ -43,6 +49,7 @@ import { DeployerConfig } from "./deployer_cfg";
 class DeployerBasicMode {
 	protected readonly runtimeEnv: RuntimeEnv;
 	protected readonly cpData: CheckpointRepo;
+	protected readonly cpStore: CheckpointStore;
 	protected readonly loadedAsaDefs: wtypes.ASADefs;
 	protected readonly algoOp: AlgoOperator;
 	protected readonly txWriter: txWriter;
@@ -55,6 +62,7 @@ class DeployerBasicMode {
 	constructor(deployerCfg: DeployerConfig) {
 		this.runtimeEnv = deployerCfg.runtimeEnv;
 		this.cpData = deployerCfg.cpData;
+		this.cpStore = deployerCfg.cpStore;
 		this.loadedAsaDefs = deployerCfg.asaDefs;
 		this.algoOp = deployerCfg.algoOp;
 		this.accounts = deployerCfg.runtimeEnv.network.config.accounts;
@@ -296,15 +304,7 @@ class DeployerBasicMode {
 			assetID: asa,
 			payFlags: {},
 		});
-		let asaId = 0;
-		try {
-			asaId = this.getASAInfo(asa).assetIndex;
-		} catch (error) {
-			if (!Number(asa)) {
-				throw Error("Please provide a valid Number to be used as ASA ID");
-			}
-			asaId = Number(asa);
-		}
+		const asaId = this._getASAIndex(asa);
 		return this.algoOp.optInAccountToASA(asa, asaId, this._getAccount(accountName), flags);
 	}
 
@@ -324,15 +324,7 @@ class DeployerBasicMode {
 			assetID: asa,
 			payFlags: {},
 		});
-		let asaId = 0;
-		try {
-			asaId = this.getASAInfo(asa).assetIndex;
-		} catch (error) {
-			if (!Number(asa)) {
-				throw Error("Please provide a valid Number to be used as ASA ID");
-			}
-			asaId = Number(asa);
-		}
+		const asaId = this._getASAIndex(asa);
 		return this.algoOp.optInLsigToASA(asa, asaId, lsig, flags);
 	}
 
@@ -385,6 +377,57 @@ class DeployerBasicMode {
 		return this.algoOp.optInLsigToApp(appID, lsig, payFlags, flags);
 	}
 
+	/**
+	 * Opt-In to ASA for many accounts at once (opt-ins are packed in atomic groups
+	 * and sent in a pipeline). The opt-in transactions are signed by account secret keys
+	 * @param asa ASA (name/ID) Note: ID can be used for assets not existing in checkpoints.
+	 * @param accountNames names of the accounts
+	 * @param flags Transaction flags
+	 * @param options group size and number of groups waiting for confirmation
+	 */
+	optInAccountsToASA(
+		asa: string,
+		accountNames: string[],
+		flags: wtypes.TxParams,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		const accounts = accountNames.map((name) => this._getAccount(name));
+		this.assertASAExist(asa);
+		return this.algoOp.optInToASABulk(asa, this._getASAIndex(asa), accounts, flags, options);
+	}
+
+	/**
+	 * Opt-In to stateful smart contract (SSC) for many accounts at once (opt-ins are packed
+	 * in atomic groups and sent in a pipeline)
+	 * @param signers accounts (signed by secret key) or contract accounts (signed by lsig)
+	 * @param appID application index
+	 * @param payFlags Transaction flags
+	 * @param flags Optional parameters to SSC (accounts, args..)
+	 * @param options group size and number of groups waiting for confirmation
+	 */
+	optInAccountsToApp(
+		signers: OptInSigner[],
+		appID: number,
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		this.assertAppExist(appID);
+		return this.algoOp.optInToAppBulk(appID, signers, payFlags, flags, options);
+	}
+
+	// returns ASA ID of ASA from checkpoints, or the ASA ID passed as string
+	private _getASAIndex(asa: string): number {
+		try {
+			return this.getASAInfo(asa).assetIndex;
+		} catch (error) {
+			if (!Number(asa)) {
+				throw Error("Please provide a valid Number to be used as ASA ID");
+			}
+			return Number(asa);
+		}
+	}
+
 	/**
 	 * Asserts ASA is defined in a checkpoint by asset id / string,
 	 * First: search for ASAInfo in checkpoints
@@ -660,7 +703,7 @@ export class DeployerDeployMode extends DeployerBasicMode implements Deployer {
 	 * Persist checkpoint till current call.
 	 */
 	persistCP(): void {
-		persistCheckpoint(this.txWriter.scriptName, this.cpData.strippedCP);
+		this.cpStore.persist(this.txWriter.scriptName, this.cpData.strippedCP);
 	}
 
 	/**
@@ -985,6 +1028,13 @@ export class DeployerDeployMode extends DeployerBasicMode implements Deployer {
 	): Promise<TxnReceipt[]> {
 		return await executeTx(this, transactions);
 	}
+
+	executeTxPipelined(
+		groups: Iterable<ExecTxGroup> | AsyncIterable<ExecTxGroup>,
+		options?: PipelinedExecOptions
+	): AsyncGenerator<TxnReceipt[]> {
+		return executeTxPipelined(this, this.algoOp, groups, options);
+	}
 }
 
 /**
@@ -1172,4 +1222,11 @@ export class DeployerRunMode extends DeployerBasicMode implements Deployer {
 	): Promise<TxnReceipt[]> {
 		return await executeTx(this, transactions);
 	}
+
+	executeTxPipelined(
+		groups: Iterable<ExecTxGroup> | AsyncIterable<ExecTxGroup>,
+		options?: PipelinedExecOptions
+	): AsyncGenerator<TxnReceipt[]> {
+		return executeTxPipelined(this, this.algoOp, groups, options);
+	}
 }
@@ -4,9 +4,15 @@ import { Indexer } from "algosdk";
 
 import { mkAccountIndex } from "../lib/account";
 import { AlgoOperator } from "../lib/algo-operator";
+import { mkCheckpointStore } from "../lib/checkpoint-store";
 import { createIndexerClient } from "../lib/driver";
-import { loadCheckpointsRecursive } from "../lib/script-checkpoints";
-import type { CheckpointRepo, Deployer, RuntimeEnv } from "../types";
+import type {
+	CheckpointRepo,
+	CheckpointStore,
+	Deployer,
+	HttpNetworkConfig,
+	RuntimeEnv,
+} from "../types";
 import { DeployerDeployMode, DeployerRunMode } from "./deployer";
 import { txWriter, TxWriterImpl } from "./tx-log-writer";
 
@@ -20,6 +26,7 @@ export function mkDeployer(allowWrite: boolean, deployerCfg: DeployerConfig): De
 // intialize deployer config obj
 export class DeployerConfig {
 	runtimeEnv: RuntimeEnv;
+	cpStore: CheckpointStore;
 	cpData: CheckpointRepo;
 	asaDefs: wtypes.ASADefs;
 	algoOp: AlgoOperator;
@@ -30,13 +37,15 @@ export class DeployerConfig {
 
 	constructor(runtimeEnv: RuntimeEnv, algoOp: AlgoOperator) {
 		this.runtimeEnv = runtimeEnv;
-		this.cpData = loadCheckpointsRecursive();
+		this.cpStore = mkCheckpointStore(runtimeEnv.config, runtimeEnv.network.name);
+		this.cpData = this.cpStore.loadAll();
 		this.algoOp = algoOp;
 		this.accounts = mkAccountIndex(runtimeEnv.network.config.accounts ?? []);
 		const assetpath = runtimeEnv.network.config.paths?.assets;
 		this.assetPath = assetpath ? assetpath : "assets";
-		this.txWriter = new TxWriterImpl("");
+		this.txWriter = new TxWriterImpl("", runtimeEnv.config.txLog);
 		this.asaDefs = loadASAFile(this.accounts);
-		this.indexerClient = createIndexerClient(runtimeEnv.network.config.indexerCfg);
+		const { indexerCfg, transport } = runtimeEnv.network.config as HttpNetworkConfig;
+		this.indexerClient = createIndexerClient(indexerCfg, transport);
 	}
 }
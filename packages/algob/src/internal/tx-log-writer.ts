@@ -1,7 +1,9 @@
+import { encodeObj } from "algosdk";
 import fs from "fs";
 import path from "path";
 import YAML from "yaml";
 
+import type { TxLogCfg } from "../types";
 import { ARTIFACTS_DIR } from "./core/project-structure";
 
 export interface txWriter {
@@ -9,19 +11,91 @@ export interface txWriter {
 	scriptName: string;
 	setScriptName: (scriptName: string) => void;
 	push: (msg: string, obj: any) => void;
+	flush: () => Promise<void>;
+	close: () => Promise<void>;
 	ensureDirectoryExistence: (filePath: string) => void;
 }
 
+const defaultFlushSize = 64 * 1024; // bytes
+const defaultFlushInterval = 1000; // ms
+
+const fileExtensions = { yaml: ".log", jsonl: ".jsonl", msgpack: ".msgpack" };
+
+interface LogFile {
+	fd: number;
+	position: number; // end of the data already assigned to writes
+}
+
+// write of a flushed chunk, positional writes are repeated on process exit if not finished
+interface PendingWrite {
+	file: LogFile;
+	position: number;
+	data: Buffer;
+}
+
+// writers with data not yet written, flushed synchronously on process exit
+const openWriters = new Set<TxWriterImpl>();
+let exitHookRegistered = false;
+
+function registerWriter(writer: TxWriterImpl): void {
+	openWriters.add(writer);
+	if (!exitHookRegistered) {
+		exitHookRegistered = true;
+		process.once("exit", () => openWriters.forEach((w) => w.flushSync()));
+	}
+}
+
+async function writeAt(fd: number, data: Buffer, position: number): Promise<number> {
+	return await new Promise((resolve, reject) =>
+		fs.write(fd, data, 0, data.length, position, (err, bytesWritten) =>
+			err ? reject(err) : resolve(bytesWritten)
+		)
+	);
+}
+
+// binary data and bigints are not supported by JSON
+function jsonReplacer(this: any, key: string, value: unknown): unknown {
+	const orig = this[key];
+	if (orig instanceof Uint8Array) return Buffer.from(orig).toString("base64");
+	if (typeof orig === "bigint") return orig.toString();
+	return value;
+}
+
+/**
+ * Transaction log of a script run: records are buffered and appended asynchronously
+ * to one file per script run (artifacts/<script>.<timestamp>.log). Buffer is flushed
+ * when it exceeds `flushSize` bytes, after `flushInterval` ms, when the script
+ * changes, and (synchronously) on process exit.
+ * Records are written as YAML documents (default), JSON lines (`jsonl`) or
+ * concatenated msgpack objects (`msgpack`).
+ */
 export class TxWriterImpl implements txWriter {
 	timestamp: number;
 	scriptName: string;
-	constructor(scriptName: string) {
+	private readonly cfg: TxLogCfg;
+	private buffer: Buffer[] = [];
+	private bufferedBytes = 0;
+	private file?: LogFile;
+	private readonly pending = new Set<PendingWrite>();
+	private writing: Promise<void> = Promise.resolve();
+	private error?: Error;
+	private timer?: NodeJS.Timeout;
+
+	constructor(scriptName: string, cfg: TxLogCfg = {}) {
 		this.timestamp = +new Date();
 		this.scriptName = scriptName;
+		this.cfg = cfg;
 	}
 
 	setScriptName(scriptName: string): void {
+		if (scriptName === this.scriptName) {
+			return;
+		}
+		// records of the previous script stay in its file
+		void this.flush().catch(() => undefined);
+		this.closeFile();
 		this.scriptName = scriptName;
+		this.timestamp = +new Date();
 	}
 
 	ensureDirectoryExistence(filePath: string): void {
@@ -34,16 +108,135 @@ export class TxWriterImpl implements txWriter {
 	}
 
 	push(msg: string, obj: any): void {
-		this.timestamp = +new Date();
+		const data = this.encode(msg, obj);
+		this.buffer.push(data);
+		this.bufferedBytes += data.length;
+		registerWriter(this);
+		if (this.bufferedBytes >= (this.cfg.flushSize ?? defaultFlushSize)) {
+			void this.flush().catch(() => undefined);
+		} else if (this.timer === undefined) {
+			this.timer = setTimeout(() => {
+				void this.flush().catch(() => undefined);
+			}, this.cfg.flushInterval ?? defaultFlushInterval);
+			this.timer.unref();
+		}
+	}
 
-		const filePath =
-			path.join(ARTIFACTS_DIR, this.scriptName) + "." + this.timestamp.toString() + ".log";
+	/**
+	 * Writes buffered records, resolves when all records pushed so far are written.
+	 * Rejects with the first write error.
+	 */
+	async flush(): Promise<void> {
+		this.clearTimer();
+		if (this.buffer.length !== 0) {
+			const write = this.takeBuffer();
+			this.pending.add(write);
+			this.writing = this.writing
+				.then(async () => await this.write(write))
+				.catch((e) => {
+					this.error = this.error ?? (e as Error);
+				});
+		}
+		await this.writing;
+		if (this.error !== undefined) {
+			throw this.error;
+		}
+	}
 
-		this.ensureDirectoryExistence(filePath);
-		const map = new Map();
-		map.set(msg, obj);
-		YAML.defaultOptions.indent = 4;
-		const file = YAML.stringify(map);
-		fs.appendFileSync(filePath, file);
+	/**
+	 * Flushes buffered records and closes the log file.
+	 */
+	async close(): Promise<void> {
+		try {
+			await this.flush();
+		} finally {
+			this.closeFile();
+			await this.writing;
+			openWriters.delete(this);
+		}
+	}
+
+	/**
+	 * Synchronously writes unfinished writes and buffered records (used on process exit).
+	 */
+	flushSync(): void {
+		this.clearTimer();
+		if (this.buffer.length !== 0) {
+			this.pending.add(this.takeBuffer());
+		}
+		for (const w of this.pending) {
+			try {
+				fs.writeSync(w.file.fd, w.data, 0, w.data.length, w.position);
+			} catch (e) {
+				// file was closed after a failed write
+			}
+		}
+		this.pending.clear();
+	}
+
+	private encode(msg: string, obj: any): Buffer {
+		switch (this.cfg.format) {
+			case "jsonl": {
+				const record = { timestamp: +new Date(), msg, data: obj };
+				return Buffer.from(JSON.stringify(record, jsonReplacer) + "\n");
+			}
+			case "msgpack": {
+				return Buffer.from(encodeObj({ timestamp: +new Date(), msg, data: obj }));
+			}
+			default: {
+				const map = new Map();
+				map.set(msg, obj);
+				return Buffer.from("---\n" + YAML.stringify(map, { indent: 4 }));
+			}
+		}
+	}
+
+	private takeBuffer(): PendingWrite {
+		const file = this.openFile();
+		const data = Buffer.concat(this.buffer);
+		const write = { file, position: file.position, data };
+		file.position += data.length;
+		this.buffer = [];
+		this.bufferedBytes = 0;
+		return write;
+	}
+
+	private async write(w: PendingWrite): Promise<void> {
+		let written = 0;
+		while (written < w.data.length) {
+			written += await writeAt(w.file.fd, w.data.subarray(written), w.position + written);
+		}
+		this.pending.delete(w);
+	}
+
+	private openFile(): LogFile {
+		if (this.file === undefined) {
+			const ext = fileExtensions[this.cfg.format ?? "yaml"];
+			const filePath =
+				path.join(ARTIFACTS_DIR, this.scriptName) + "." + this.timestamp.toString() + ext;
+			this.ensureDirectoryExistence(filePath);
+			// positional writes are ignored in append mode, so the file is opened for update
+			fs.closeSync(fs.openSync(filePath, "a"));
+			const fd = fs.openSync(filePath, "r+");
+			this.file = { fd, position: fs.fstatSync(fd).size };
+		}
+		return this.file;
+	}
+
+	// file is closed after its pending writes
+	private closeFile(): void {
+		const file = this.file;
+		if (file === undefined) {
+			return;
+		}
+		this.file = undefined;
+		this.writing = this.writing.then(() => fs.close(file.fd, () => undefined));
+	}
+
+	private clearTimer(): void {
+		if (this.timer !== undefined) {
+			clearTimeout(this.timer);
+			this.timer = undefined;
+		}
 	}
 }
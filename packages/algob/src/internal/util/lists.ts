@@ -23,3 +23,33 @@ export function partitionByFn<T>(f: (s: T, s1: T) => boolean, input: T[]): T[][]
 	}
 	return out;
 }
+
+// Splits list into chunks of (at most) `size` items
+// `chunk([a, b, c], 2)` would produce `[[a, b], [c]]`
+export function chunk<T>(input: T[], size: number): T[][] {
+	const out: T[][] = [];
+	for (let i = 0; i < input.length; i += size) {
+		out.push(input.slice(i, i + size));
+	}
+	return out;
+}
+
+// Maps list with an async function, with at most `limit` calls pending at once.
+// Results keep the order of the input list.
+export async function mapConcurrent<T, R>(
+	input: T[],
+	limit: number,
+	f: (t: T, index: number) => Promise<R>
+): Promise<R[]> {
+	const out = new Array<R>(input.length);
+	let next = 0;
+	const worker = async (): Promise<void> => {
+		while (next < input.length) {
+			const i = next++;
+			out[i] = await f(input[i], i);
+		}
+	};
+	const workers = Math.min(Math.max(1, limit), input.length);
+	await Promise.all(Array.from({ length: workers }, worker));
+	return out;
+}
@@ -0,0 +1,41 @@
+import { performance } from "perf_hooks";
+
+// phase name, time since process start (ms), number of loaded modules
+const marks: Array<[string, number, number]> = [];
+
+function isEnabled(): boolean {
+	const v = process.env.ALGOB_PROFILE_STARTUP;
+	return v !== undefined && v !== "" && v !== "0" && v !== "false";
+}
+
+/**
+ * Records the end of a startup phase when `ALGOB_PROFILE_STARTUP` is set.
+ * @param phase name of the finished phase
+ */
+export function markStartup(phase: string): void {
+	if (isEnabled()) {
+		marks.push([phase, performance.now(), Object.keys(require.cache).length]);
+	}
+}
+
+/**
+ * Prints (to stderr) duration of the recorded startup phases and the number of
+ * modules loaded so far.
+ */
+export function printStartupProfile(): void {
+	if (!isEnabled() || marks.length === 0) {
+		return;
+	}
+	console.error("algob startup profile:");
+	let prev = 0;
+	for (const [phase, time, modules] of marks) {
+		console.error(
+			"  %s: %sms (at %sms, %d modules loaded)",
+			phase.padEnd(24),
+			(time - prev).toFixed(1),
+			time.toFixed(1),
+			modules
+		);
+		prev = time;
+	}
+}
@@ -0,0 +1,108 @@
+import path from "path";
+import { Worker } from "worker_threads";
+
+// Loads the worker module (with ts-node when algob runs from TypeScript sources) and
+// calls its `handler` for each task.
+const bootstrap = `
+const { parentPort, workerData } = require("worker_threads");
+if (workerData.module.endsWith(".ts")) {
+	require("ts-node").register({ transpileOnly: true, projectSearchDir: workerData.dir });
+}
+const { handler } = require(workerData.module);
+parentPort.on("message", async ({ id, input }) => {
+	try {
+		parentPort.postMessage({ id, result: await handler(input) });
+	} catch (e) {
+		parentPort.postMessage({ id, error: e instanceof Error ? e.message : String(e) });
+	}
+});
+`;
+
+interface Task<T, R> {
+	id: number;
+	input: T;
+	resolve: (r: R) => void;
+	reject: (e: Error) => void;
+}
+
+interface WorkerResponse<R> {
+	id: number;
+	result?: R;
+	error?: string;
+}
+
+/**
+ * Pool of worker threads calling `handler(input)` exported by a module. Tasks are queued
+ * and sent to the first idle worker. Inputs and results are copied between threads
+ * (structured clone), so they must be plain data.
+ */
+export class WorkerPool<T, R> {
+	private readonly workers: Worker[] = [];
+	private readonly idle: Worker[] = [];
+	private readonly queue: Array<Task<T, R>> = [];
+	private readonly running = new Map<Worker, Task<T, R>>();
+	private nextID = 0;
+
+	/**
+	 * @param modulePath resolved path of the module exporting `handler`
+	 * @param size number of worker threads
+	 */
+	constructor(modulePath: string, size: number) {
+		const workerData = { module: modulePath, dir: path.dirname(modulePath) };
+		for (let i = 0; i < Math.max(1, size); ++i) {
+			const w = new Worker(bootstrap, { eval: true, workerData });
+			w.on("message", (res: WorkerResponse<R>) => {
+				const task = this.running.get(w) as Task<T, R>;
+				this.running.delete(w);
+				if (res.error !== undefined) task.reject(new Error(res.error));
+				else task.resolve(res.result as R);
+				this.idle.push(w);
+				this.dispatch();
+			});
+			w.on("error", (e: Error) => this.remove(w, e));
+			w.on("exit", (code: number) => {
+				// workers stopped by `close` are already removed
+				this.remove(w, new Error(`Worker stopped with exit code ${code}`));
+			});
+			this.workers.push(w);
+			this.idle.push(w);
+		}
+	}
+
+	async run(input: T): Promise<R> {
+		if (this.workers.length === 0) {
+			throw new Error("Worker pool is closed");
+		}
+		return await new Promise<R>((resolve, reject) => {
+			this.queue.push({ id: this.nextID++, input, resolve, reject });
+			this.dispatch();
+		});
+	}
+
+	async close(): Promise<void> {
+		const workers = this.workers.splice(0);
+		await Promise.all(workers.map(async (w) => await w.terminate()));
+	}
+
+	// removes a crashed or stopped worker and fails its task, the pool continues with the
+	// remaining workers
+	private remove(w: Worker, e: Error): void {
+		if (!this.workers.includes(w)) return;
+		this.workers.splice(this.workers.indexOf(w), 1);
+		if (this.idle.includes(w)) this.idle.splice(this.idle.indexOf(w), 1);
+		this.running.get(w)?.reject(e);
+		this.running.delete(w);
+		if (this.workers.length === 0) {
+			for (const task of this.queue.splice(0)) task.reject(e);
+		}
+	}
+
+	private dispatch(): void {
+		while (this.idle.length > 0 && this.queue.length > 0) {
+			const w = this.idle.pop() as Worker;
+			const task = this.queue.shift() as Task<T, R>;
+			this.running.set(w, task);
+			w.postMessage({ id: task.id, input: task.input });
+		}
+	}
+}
@@ -2,15 +2,18 @@ import { types as rtypes } from "@algo-builder/runtime";
 import { BuilderError, ERRORS } from "@algo-builder/web";
 import {
 	Account as AccountSDK,
+	generateAccount,
 	Kmd,
 	mnemonicToSecretKey,
 	multisigAddress,
 	MultisigMetadata,
+	secretKeyToMnemonic,
 } from "algosdk";
 import * as fs from "fs";
 import YAML from "yaml";
 
 import CfgErrors, { ErrorPutter } from "../internal/core/config/config-errors";
+import { mapConcurrent } from "../internal/util/lists";
 import type {
 	Account,
 	AccountDef,
@@ -21,6 +24,24 @@ import type {
 	StrMap,
 } from "../types";
 
+/**
+ * Generates `n` accounts named `gen_<i>` (starting at `gen_<start>`).
+ * @param n number of accounts
+ * @param start index of the first account
+ */
+export function genAccounts(n: number, start = 0): MnemonicAccount[] {
+	const accounts: MnemonicAccount[] = [];
+	for (let i = start; i < start + n; ++i) {
+		const a = generateAccount();
+		accounts.push({
+			name: "gen_" + i.toString(),
+			addr: a.addr,
+			mnemonic: secretKeyToMnemonic(a.sk),
+		});
+	}
+	return accounts;
+}
+
 /**
  * Returns an array of SDK accounts (addr, sk) */
 export function mkAccounts(input: AccountDef[]): rtypes.Account[] {
@@ -194,6 +215,18 @@ function validateAccounts(algobAccounts: Account[]): void {
 	}
 }
 
+// maximum number of `exportKey` requests sent to KMD at the same time
+const KMD_EXPORT_CONCURRENCY = 8;
+const DEFAULT_KMD_CACHE_TTL = 60 * 1000; // ms
+
+interface KMDSession {
+	expires: number; // ms timestamp
+	accounts: Promise<rtypes.Account[]>;
+}
+
+// accounts loaded from KMD, shared by all KMD operators of the process (by KMD config)
+const kmdSessionCache = new Map<string, KMDSession>();
+
 export class KMDOperator {
 	kmdcl: Kmd;
 
@@ -209,44 +242,136 @@ export class KMDOperator {
 		return m;
 	}
 
+	/**
+	 * Loads accounts listed in the KMD config from KMD wallets. Keys are exported
+	 * concurrently, and the result is cached in the process for `kcfg.cacheTTL` ms
+	 * (default 60s).
+	 * @param kcfg KMD config
+	 */
 	async loadKMDAccounts(kcfg: KmdCfg): Promise<rtypes.Account[]> {
-		const accounts: rtypes.Account[] = [];
+		const ttl = kcfg.cacheTTL ?? DEFAULT_KMD_CACHE_TTL;
+		const key = JSON.stringify(kcfg);
+		const now = Date.now();
+		let entry = kmdSessionCache.get(key);
+		if (entry === undefined || entry.expires <= now) {
+			const accounts = this.exportKMDAccounts(kcfg);
+			entry = { expires: now + ttl, accounts };
+			if (ttl > 0) {
+				kmdSessionCache.set(key, entry);
+				// failed loads are not cached
+				accounts.catch(() => {
+					if (kmdSessionCache.get(key)?.accounts === accounts) kmdSessionCache.delete(key);
+				});
+			}
+		}
+		return [...(await entry.accounts)];
+	}
+
+	/**
+	 * Returns the addresses of the keys of each wallet of the KMD config (wallets which don't
+	 * exist in KMD are skipped). Keys are not exported.
+	 * @param kcfg KMD config
+	 */
+	async listKMDKeys(kcfg: KmdCfg): Promise<{ [wallet: string]: string[] }> {
+		const handles: string[] = [];
+		try {
+			const keys: { [wallet: string]: string[] } = {};
+			for (const { wallet, addresses } of await this.listWalletKeys(kcfg, handles)) {
+				keys[wallet.name] = addresses;
+			}
+			return keys;
+		} catch (e) {
+			throw kmdError(e);
+		} finally {
+			this.releaseWalletHandles(handles);
+		}
+	}
+
+	private async exportKMDAccounts(kcfg: KmdCfg): Promise<rtypes.Account[]> {
+		const handles: string[] = [];
 		try {
-			const wallets = (await this.kmdcl.listWallets()).wallets;
+			const exports = (await this.listWalletKeys(kcfg, handles)).map(
+				({ wallet, token, addresses }) => {
+					const names = this.kmdWalletAddrNames(wallet);
+					return addresses
+						.filter((addr) => {
+							if (names[addr] === undefined) {
+								console.debug(
+									"KMD account with address:",
+									addr,
+									" not found in wallet:1",
+									wallet.name
+								);
+								return false;
+							}
+							return true;
+						})
+						.map((addr) => ({ token, password: wallet.password, addr, name: names[addr] }));
+				}
+			);
+
+			return await mapConcurrent(exports.flat(), KMD_EXPORT_CONCURRENCY, async (e) => {
+				const k = await this.kmdcl.exportKey(e.token, e.password, e.addr);
+				return { name: e.name, addr: e.addr, sk: new Uint8Array(k.private_key) };
+			});
+		} catch (e) {
+			throw kmdError(e);
+		} finally {
+			this.releaseWalletHandles(handles);
+		}
+	}
+
+	/**
+	 * Opens one handle per wallet of the KMD config (shared by all requests of the wallet)
+	 * and lists the keys of the wallets. Opened handles are added to `handles`. All wallets
+	 * are settled before returning, so a failure of one wallet can't leak the handles of the
+	 * other wallets.
+	 */
+	private async listWalletKeys(
+		kcfg: KmdCfg,
+		handles: string[]
+	): Promise<Array<{ wallet: KmdWallet; token: string; addresses: string[] }>> {
+		const wallets = (await this.kmdcl.listWallets()).wallets;
 
-			const walletIDs: StrMap = {};
-			for (const w of wallets) walletIDs[w.name] = w.id;
+		const walletIDs: StrMap = {};
+		for (const w of wallets) walletIDs[w.name] = w.id;
 
-			for (const w of kcfg.wallets) {
-				const id = walletIDs[w.name];
+		const results = await Promise.allSettled(
+			kcfg.wallets.map(async (wallet) => {
+				const id = walletIDs[wallet.name];
 				if (id === undefined) {
 					console.warn("wallet id=", id, "defined in config but it doesn't exist in KMD");
-					continue;
+					return undefined;
 				}
-				const names = this.kmdWalletAddrNames(w);
-				const token = (await this.kmdcl.initWalletHandle(id, w.password)).wallet_handle_token;
+				const handle = await this.kmdcl.initWalletHandle(id, wallet.password);
+				const token: string = handle.wallet_handle_token;
+				handles.push(token);
 				const keys = await this.kmdcl.listKeys(token);
-				for (const addr of keys.addresses) {
-					const n = names[addr];
-					if (n === undefined) {
-						console.debug("KMD account with address:", addr, " not found in wallet:1", w.name);
-						continue;
-					}
-					// console.debug("Adding KMD account name:", n)
-					const k = await this.kmdcl.exportKey(token, w.password, addr);
-					accounts.push({ name: n, addr: addr, sk: new Uint8Array(k.private_key) });
-				}
-			}
-		} catch (e: any) {
-			if (e.code === "ECONNREFUSED") {
-				throw new BuilderError(ERRORS.KMD.CONNECTION, { ctx: e }, e);
-			}
-			if (e instanceof Error) {
-				throw new BuilderError(ERRORS.KMD.ERROR, { ctx: JSON.stringify(e) }, e);
-			}
-			throw e;
+				return { wallet, token, addresses: keys.addresses as string[] };
+			})
+		);
+		return results
+			.map((r) => {
+				if (r.status === "rejected") throw r.reason;
+				return r.value;
+			})
+			.filter((w): w is { wallet: KmdWallet; token: string; addresses: string[] } => !!w);
+	}
+
+	private releaseWalletHandles(handles: string[]): void {
+		for (const token of handles) {
+			this.kmdcl.releaseWalletHandle(token).catch(() => undefined);
 		}
+	}
+}
 
-		return accounts;
+// converts errors of KMD requests to builder errors
+function kmdError(e: any): unknown {
+	if (e.code === "ECONNREFUSED") {
+		return new BuilderError(ERRORS.KMD.CONNECTION, { ctx: e }, e);
+	}
+	if (e instanceof Error) {
+		return new BuilderError(ERRORS.KMD.ERROR, { ctx: JSON.stringify(e) }, e);
 	}
+	return e;
 }
@@ -1,6 +1,7 @@
 import { types as rtypes } from "@algo-builder/runtime";
 import {
 	BuilderError,
+	confirmationTracker,
 	ERRORS,
 	mkTxParams,
 	tx as webTx,
@@ -16,14 +17,18 @@ import algosdk, {
 } from "algosdk";
 
 import { txWriter } from "../internal/tx-log-writer";
+import { chunk, mapConcurrent } from "../internal/util/lists";
 import { createClient } from "../lib/driver";
 import { getLsig } from "../lib/lsig";
 import type {
 	ASCCache,
+	BulkOptInOptions,
+	BulkOptInResult,
 	ConfirmedTxInfo,
 	FundASCFlags,
 	LsigInfo,
 	Network,
+	OptInSigner,
 	SCParams,
 	TxnReceipt,
 } from "../types";
@@ -35,6 +40,48 @@ const confirmedRound = "confirmed-round";
 export const ALGORAND_MIN_TX_FEE = 1000;
 // Extracted from interaction with Algorand node (100k microAlgos)
 const ALGORAND_ASA_OWNERSHIP_COST = 100000;
+// maximum number of transactions in an atomic group
+const MAX_GROUP_SIZE = 16;
+// maximum number of bulk opt-in groups waiting for confirmation
+const DEFAULT_MAX_IN_FLIGHT = 16;
+// maximum number of concurrent account information requests
+const MAX_CONCURRENT_REQUESTS = 16;
+
+// opt-in transaction with its signer
+interface OptInTxn {
+	txn: Transaction;
+	signer: OptInSigner;
+	name: string; // account name (or address) used in logs and errors
+}
+
+function signOptInTxn({ txn, signer }: OptInTxn): Uint8Array {
+	return signer instanceof LogicSigAccount
+		? algosdk.signLogicSigTransactionObject(txn, signer).blob
+		: txn.signTxn(signer.sk);
+}
+
+function signerAddress(signer: OptInSigner): string {
+	return signer instanceof LogicSigAccount ? signer.address() : signer.addr;
+}
+
+function toError(e: unknown): Error {
+	return e instanceof Error ? e : new Error(String(e));
+}
+
+function signerName(signer: OptInSigner): string {
+	return signer instanceof LogicSigAccount ? signer.address() : signer.name;
+}
+
+function signParams(signer: OptInSigner): wtypes.Sign {
+	if (signer instanceof LogicSigAccount) {
+		return {
+			sign: wtypes.SignType.LogicSignature,
+			fromAccountAddr: signer.address(),
+			lsig: signer,
+		};
+	}
+	return { sign: wtypes.SignType.SecretKey, fromAccount: signer };
+}
 
 export function createAlgoOperator(network: Network): AlgoOperator {
 	return new AlgoOperatorImpl(createClient(network));
@@ -94,6 +141,13 @@ export interface AlgoOperator {
 		accounts: rtypes.AccountMap,
 		assetIndex: number
 	) => Promise<void>;
+	optInToASABulk: (
+		asaName: string,
+		assetIndex: number,
+		signers: OptInSigner[],
+		flags: wtypes.TxParams,
+		options?: BulkOptInOptions
+	) => Promise<BulkOptInResult[]>;
 	optInAccountToApp: (
 		sender: rtypes.Account,
 		appID: number,
@@ -106,6 +160,13 @@ export interface AlgoOperator {
 		payFlags: wtypes.TxParams,
 		flags: rtypes.AppOptionalFlags
 	) => Promise<void>;
+	optInToAppBulk: (
+		appID: number,
+		signers: OptInSigner[],
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options?: BulkOptInOptions
+	) => Promise<BulkOptInResult[]>;
 	ensureCompiled: (
 		name: string,
 		source: string,
@@ -118,6 +179,7 @@ export interface AlgoOperator {
 		scTmplParams?: SCParams
 	) => Promise<wtypes.SourceCompiled>;
 	sendAndWait: (rawTxns: Uint8Array | Uint8Array[], waitRounds: number) => Promise<TxnReceipt>;
+	send: (rawTxns: Uint8Array | Uint8Array[]) => Promise<string>;
 	getReceiptTxns: (txns: Transaction[]) => Promise<TxnReceipt[]>;
 }
 
@@ -139,8 +201,17 @@ export class AlgoOperatorImpl implements AlgoOperator {
 		rawTxns: Uint8Array | Uint8Array[],
 		waitRounds = wtypes.WAIT_ROUNDS
 	): Promise<TxnReceipt> {
+		return await this.waitForConfirmation(await this.send(rawTxns), waitRounds);
+	}
+
+	/**
+	 * Send signed transaction to network without waiting for confirmation
+	 * @param rawTxns Signed Transaction(s)
+	 * @returns ID of the (first) transaction
+	 */
+	async send(rawTxns: Uint8Array | Uint8Array[]): Promise<string> {
 		const txInfo = await this.algodClient.sendRawTransaction(rawTxns).do();
-		return await this.waitForConfirmation(txInfo.txId, waitRounds);
+		return txInfo.txId;
 	}
 
 	/**
@@ -154,7 +225,10 @@ export class AlgoOperatorImpl implements AlgoOperator {
 		txId: string,
 		waitRounds = wtypes.WAIT_ROUNDS
 	): Promise<TxnReceipt> {
-		const pendingInfo = await algosdk.waitForConfirmation(this.algodClient, txId, waitRounds);
+		const pendingInfo = await confirmationTracker(this.algodClient).waitForConfirmation(
+			txId,
+			waitRounds
+		);
 		if (pendingInfo["pool-error"]) {
 			throw new Error(`Transaction Pool Error: ${pendingInfo["pool-error"] as string}`);
 		}
@@ -164,11 +238,15 @@ export class AlgoOperatorImpl implements AlgoOperator {
 		throw new Error("timeout");
 	}
 
-	// Get receipts of group txn
+	// Get receipts of group txn (already confirmed transactions are not queried again)
 	async getReceiptTxns(txns: Transaction[]): Promise<TxnReceipt[]> {
+		const tracker = confirmationTracker(this.algodClient);
 		const confirmedTxInfos = await Promise.all(
-			txns.map((txn) => {
-				return this.algodClient.pendingTransactionInformation(txn.txID()).do();
+			txns.map(async (txn) => {
+				return (
+					tracker.getConfirmed(txn.txID()) ??
+					(await this.algodClient.pendingTransactionInformation(txn.txID()).do())
+				);
 			})
 		);
 
@@ -272,9 +350,184 @@ export class AlgoOperatorImpl implements AlgoOperator {
 			flags.creator,
 			flags
 		);
-		for (const account of optInAccounts) {
-			await this._optInAccountToASA(asaName, assetIndex, account, txParams, flags);
+		const optIns = optInAccounts.map((account) => {
+			console.log(`ASA ${String(account.name)} opt-in for ASA ${String(asaName)}`);
+			const txn = tx.makeASAOptInTx(account.addr, assetIndex, txParams, flags);
+			return { txn, signer: account, name: account.name };
+		});
+		const failed = (await this.sendOptInsBulk(optIns)).find((r) => r.error !== undefined);
+		if (failed !== undefined) throw failed.error;
+	}
+
+	/**
+	 * Opt-In to ASA for many accounts (or contract accounts) at once.
+	 * Balances are checked concurrently before any opt-in is sent, then opt-ins are
+	 * packed in atomic groups and sent in a pipeline (see `sendOptInsBulk`).
+	 * @param asaName ASA name (used in logs and errors)
+	 * @param assetIndex ASA ID
+	 * @param signers accounts (signed by secret key) or contract accounts (signed by lsig)
+	 * @param flags Transaction flags
+	 * @param options group size and number of groups waiting for confirmation
+	 */
+	async optInToASABulk(
+		asaName: string,
+		assetIndex: number,
+		signers: OptInSigner[],
+		flags: wtypes.TxParams,
+		options: BulkOptInOptions = {}
+	): Promise<BulkOptInResult[]> {
+		const txParams = await mkTxParams(this.algodClient, flags);
+		const optIns = signers.map((signer) => {
+			const txn = tx.makeASAOptInTx(signerAddress(signer), assetIndex, txParams, flags);
+			return { txn, signer, name: signerName(signer) };
+		});
+		await this.assertOptInBalances(
+			asaName,
+			optIns.map((o) => ({ name: o.name, addr: signerAddress(o.signer), fee: o.txn.fee }))
+		);
+		optIns.forEach((o) => console.log(`${o.name} opt-in for ASA ${asaName}`));
+		return await this.sendOptInsBulk(optIns, options);
+	}
+
+	/**
+	 * Opt-In to stateful smart contract for many accounts (or contract accounts) at once.
+	 * Opt-ins are packed in atomic groups and sent in a pipeline (see `sendOptInsBulk`).
+	 * @param appID application index
+	 * @param signers accounts (signed by secret key) or contract accounts (signed by lsig)
+	 * @param payFlags Transaction flags
+	 * @param flags Optional parameters to SSC (accounts, args..)
+	 * @param options group size and number of groups waiting for confirmation
+	 */
+	async optInToAppBulk(
+		appID: number,
+		signers: OptInSigner[],
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options: BulkOptInOptions = {}
+	): Promise<BulkOptInResult[]> {
+		const params = await mkTxParams(this.algodClient, payFlags);
+		const optIns = signers.map((signer) => {
+			const execParam: wtypes.ExecParams = {
+				type: wtypes.TransactionType.OptInToApp,
+				...signParams(signer),
+				appID: appID,
+				payFlags: payFlags,
+				appArgs: flags.appArgs,
+				accounts: flags.accounts,
+				foreignApps: flags.foreignApps,
+				foreignAssets: flags.foreignAssets,
+			};
+			const name = signerName(signer);
+			console.log(`${name} opt-in for SSC ID ${appID}`);
+			return { txn: webTx.mkTransaction(execParam, params), signer, name };
+		});
+		return await this.sendOptInsBulk(optIns, options);
+	}
+
+	/**
+	 * Packs opt-in transactions in atomic groups (of up to 16 transactions) and sends the
+	 * groups without waiting for the confirmation of previous groups: up to `maxInFlight`
+	 * groups wait for confirmation at once. A group rejected by the node is sent again as
+	 * single transactions (see `sendOptInGroup`), and still counts as one group in flight.
+	 * Failed opt-ins don't stop the other opt-ins.
+	 * @returns result of each opt-in (in input order): receipt or error
+	 */
+	private async sendOptInsBulk(
+		optIns: OptInTxn[],
+		options: BulkOptInOptions = {}
+	): Promise<BulkOptInResult[]> {
+		const groupSize = Math.min(
+			MAX_GROUP_SIZE,
+			Math.max(1, options.groupSize ?? MAX_GROUP_SIZE)
+		);
+		const maxInFlight = Math.max(1, options.maxInFlight ?? DEFAULT_MAX_IN_FLIGHT);
+		const errors = new Map<OptInTxn, Error>(); // failed opt-ins
+		const inFlight: Array<Promise<void>> = [];
+		for (const group of chunk(optIns, groupSize)) {
+			if (group.length > 1) algosdk.assignGroupID(group.map((o) => o.txn));
+			while (inFlight.length >= maxInFlight) await inFlight.shift();
+
+			const sent = await this.sendOptInGroup(group, errors);
+			const confirmations = sent.map(async ({ txID, optIns: sentOptIns }) => {
+				try {
+					await this.waitForConfirmation(txID);
+				} catch (e) {
+					for (const o of sentOptIns) errors.set(o, toError(e));
+				}
+			});
+			inFlight.push(Promise.all(confirmations).then(() => undefined));
 		}
+		await Promise.all(inFlight);
+
+		const confirmed = optIns.filter((o) => !errors.has(o));
+		const receipts = await this.getReceiptTxns(confirmed.map((o) => o.txn));
+		const receiptOf = new Map(confirmed.map((o, i) => [o, receipts[i]]));
+		return optIns.map((o) => {
+			const result = { name: o.name, address: signerAddress(o.signer) };
+			const error = errors.get(o);
+			return error === undefined
+				? { ...result, receipt: receiptOf.get(o) }
+				: { ...result, error };
+		});
+	}
+
+	/**
+	 * Sends a group of opt-ins. Opt-ins are independent, so when the node rejects the group
+	 * (eg. one account of the group can't opt-in) they are sent again as single transactions:
+	 * one bad account doesn't fail the opt-ins of the other accounts of its group.
+	 * Rejected opt-ins are added to `errors`.
+	 * @returns IDs of the sent transactions (or group) with their opt-ins
+	 */
+	private async sendOptInGroup(
+		group: OptInTxn[],
+		errors: Map<OptInTxn, Error>
+	): Promise<Array<{ txID: string; optIns: OptInTxn[] }>> {
+		try {
+			return [{ txID: await this.send(group.map(signOptInTxn)), optIns: group }];
+		} catch (e) {
+			if (group.length === 1) {
+				errors.set(group[0], toError(e));
+				return [];
+			}
+		}
+		const sent: Array<{ txID: string; optIns: OptInTxn[] }> = [];
+		for (const optIn of group) {
+			optIn.txn.group = undefined;
+			try {
+				sent.push({ txID: await this.send(signOptInTxn(optIn)), optIns: [optIn] });
+			} catch (e) {
+				console.error(`Opt-in of ${optIn.name} rejected`);
+				errors.set(optIn, toError(e));
+			}
+		}
+		return sent;
+	}
+
+	/**
+	 * Fetches balances of opt-in accounts concurrently and throws if an account can't pay
+	 * the opt-in fee and the minimum balance of one more ASA.
+	 */
+	private async assertOptInBalances(
+		asaName: string,
+		accounts: Array<{ name: string; addr: string; fee: number }>
+	): Promise<void> {
+		const accountInfos = await mapConcurrent(
+			accounts,
+			MAX_CONCURRENT_REQUESTS,
+			async (a) => (await this.algodClient.accountInformation(a.addr).do()) as modelsv2.Account
+		);
+		accounts.forEach((account, i) => {
+			const requiredAmount = account.fee + ALGORAND_ASA_OWNERSHIP_COST;
+			const usableAmount = this.getUsableAccBalance(accountInfos[i]);
+			if (usableAmount < requiredAmount) {
+				throw new BuilderError(ERRORS.SCRIPT.ASA_OPT_IN_ACCOUNT_INSUFFICIENT_BALANCE, {
+					accountName: account.name,
+					balance: usableAmount,
+					requiredBalance: requiredAmount,
+					asaName: asaName,
+				});
+			}
+		});
 	}
 
 	async checkBalanceForOptInTx(
@@ -301,20 +554,11 @@ export class AlgoOperatorImpl implements AlgoOperator {
 			if (account.addr === creator.addr) {
 				throw new BuilderError(ERRORS.SCRIPT.ASA_TRIED_TO_OPT_IN_CREATOR);
 			}
-			const accountInfo = (await this.algodClient
-				.accountInformation(account.addr)
-				.do()) as modelsv2.Account;
-			const requiredAmount = optInTxFee + ALGORAND_ASA_OWNERSHIP_COST;
-			const usableAmount = this.getUsableAccBalance(accountInfo);
-			if (usableAmount < requiredAmount) {
-				throw new BuilderError(ERRORS.SCRIPT.ASA_OPT_IN_ACCOUNT_INSUFFICIENT_BALANCE, {
-					accountName: accName,
-					balance: usableAmount,
-					requiredBalance: requiredAmount,
-					asaName: name,
-				});
-			}
 		}
+		await this.assertOptInBalances(
+			name,
+			optInAccs.map((a) => ({ name: a.name, addr: a.addr, fee: optInTxFee }))
+		);
 		return optInAccs;
 	}
 
@@ -0,0 +1,342 @@
+import { types as rtypes } from "@algo-builder/runtime";
+import * as fs from "fs";
+import path from "path";
+
+import type {
+	Checkpoint,
+	CheckpointRepo,
+	Checkpoints,
+	CheckpointStore,
+	Config,
+	LsigInfo,
+	Timestamp,
+} from "../types";
+import {
+	CheckpointImpl,
+	CheckpointRepoImpl,
+	loadCheckpoint,
+	loadCheckpointByCPName,
+	loadCheckpointsRecursive,
+	lsCheckpointFiles,
+	persistCheckpoint,
+	toCheckpointFileName,
+	toScriptFileName,
+} from "./script-checkpoints";
+
+export const checkpointLogDirectory = path.join("artifacts", "checkpoints");
+const indexFileName = "index.json";
+const indexVersion = 1;
+
+/**
+ * Default checkpoint store: one YAML file per script (artifacts/scripts/<script>.cp.yaml),
+ * rewritten after the script runs.
+ */
+export class YamlCheckpointStore implements CheckpointStore {
+	loadAll(): CheckpointRepo {
+		return loadCheckpointsRecursive();
+	}
+
+	load(scriptName: string): Checkpoints {
+		return loadCheckpoint(scriptName);
+	}
+
+	persist(scriptName: string, checkpoints: Checkpoints): void {
+		persistCheckpoint(scriptName, checkpoints);
+	}
+
+	clear(scriptNames: string[]): void {
+		for (const scriptName of scriptNames) {
+			try {
+				fs.unlinkSync(toCheckpointFileName(scriptName));
+			} catch (e) {
+				// ignored
+			}
+		}
+	}
+}
+
+// registration event of a script, stored as a JSON line in the log of a network
+interface CheckpointRecord {
+	s: string; // script name
+	k: "cp" | "meta" | "asa" | "app" | "lsig" | "clear";
+	n?: string; // metadata key or ASA / app / lsig name
+	t?: Timestamp | string; // app version (key of the nested app map)
+	v?: unknown;
+}
+
+interface CheckpointIndex {
+	version: number;
+	networks: { [network: string]: string[] }; // scripts with checkpoints in the network
+}
+
+// checkpoints of a network, loaded from its log
+interface NetworkLog {
+	scripts: Map<string, Checkpoint>;
+	// last persisted record (JSON line) of every ASA, app version, lsig and metadata key
+	persisted: Map<string, Map<string, string>>;
+}
+
+// binary data and bigints are not supported by JSON
+function replacer(this: any, key: string, value: unknown): unknown {
+	const orig = this[key];
+	if (orig instanceof Uint8Array) {
+		return { $bytes: Buffer.from(orig).toString("base64") };
+	}
+	if (typeof orig === "bigint") {
+		return { $bigint: orig.toString() };
+	}
+	return value;
+}
+
+function reviver(_key: string, value: any): unknown {
+	if (value !== null && typeof value === "object") {
+		if (typeof value.$bytes === "string") {
+			return new Uint8Array(Buffer.from(value.$bytes, "base64"));
+		}
+		if (typeof value.$bigint === "string") {
+			return BigInt(value.$bigint);
+		}
+	}
+	return value;
+}
+
+function recordKey(r: CheckpointRecord): string {
+	return [r.k, r.n ?? "", String(r.t ?? "")].join("\0");
+}
+
+function copyCheckpoint(cp: Checkpoint): Checkpoint {
+	return {
+		timestamp: cp.timestamp,
+		metadata: new Map(cp.metadata),
+		asa: new Map(cp.asa),
+		app: new Map([...cp.app].map(([name, versions]) => [name, new Map(versions)])),
+		dLsig: new Map(cp.dLsig),
+	};
+}
+
+function toRecords(scriptName: string, cp: Checkpoint): CheckpointRecord[] {
+	const records: CheckpointRecord[] = [{ s: scriptName, k: "cp", v: cp.timestamp }];
+	cp.metadata.forEach((v, n) => records.push({ s: scriptName, k: "meta", n, v }));
+	cp.asa.forEach((v, n) => records.push({ s: scriptName, k: "asa", n, v }));
+	cp.app.forEach((versions, n) =>
+		versions.forEach((v, t) => records.push({ s: scriptName, k: "app", n, t, v }))
+	);
+	cp.dLsig.forEach((v, n) => records.push({ s: scriptName, k: "lsig", n, v }));
+	return records;
+}
+
+function applyRecord(cp: Checkpoint, r: CheckpointRecord): void {
+	switch (r.k) {
+		case "cp": {
+			cp.timestamp = r.v as number;
+			break;
+		}
+		case "meta": {
+			cp.metadata.set(r.n as string, r.v as string);
+			break;
+		}
+		case "asa": {
+			cp.asa.set(r.n as string, r.v as rtypes.ASAInfo);
+			break;
+		}
+		case "app": {
+			const versions = cp.app.get(r.n as string) ?? new Map<Timestamp, rtypes.AppInfo>();
+			versions.set(r.t as Timestamp, r.v as rtypes.AppInfo);
+			cp.app.set(r.n as string, versions);
+			break;
+		}
+		case "lsig": {
+			cp.dLsig.set(r.n as string, r.v as LsigInfo);
+			break;
+		}
+	}
+}
+
+/**
+ * Append-only checkpoint store. Every registration (ASA, app version, lsig, metadata)
+ * is appended as one JSON line to the log of its network
+ * (artifacts/checkpoints/<network>.log), and a compact index (networks and their
+ * scripts) is kept in artifacts/checkpoints/index.json.
+ * Only the log of the current network is read, and only changed entries are written
+ * when a script checkpoint is persisted. Existing YAML checkpoints are imported
+ * when the store is used for the first time.
+ */
+export class LogCheckpointStore implements CheckpointStore {
+	private readonly networkName: string;
+	private readonly dir: string;
+	private index?: CheckpointIndex;
+	private readonly logs = new Map<string, NetworkLog>();
+
+	/**
+	 * @param networkName network of the checkpoints loaded by `loadAll` and `load`
+	 * @param dir directory of the logs and the index
+	 */
+	constructor(networkName: string, dir = checkpointLogDirectory) {
+		this.networkName = networkName;
+		this.dir = dir;
+	}
+
+	loadAll(): CheckpointRepo {
+		// script of every ASA / app / lsig name is set by the checkpoints of the network
+		const repo = new CheckpointRepoImpl();
+		for (const scriptName of this.getLog(this.networkName).scripts.keys()) {
+			repo.mergeToGlobal(this.load(scriptName), scriptName);
+		}
+		return repo;
+	}
+
+	load(scriptName: string): Checkpoints {
+		const cp = this.getLog(this.networkName).scripts.get(scriptName);
+		return cp === undefined ? {} : { [this.networkName]: copyCheckpoint(cp) };
+	}
+
+	persist(scriptName: string, checkpoints: Checkpoints): void {
+		const index = this.getIndex();
+		let indexChanged = false;
+		for (const [networkName, cp] of Object.entries(checkpoints)) {
+			const log = this.getLog(networkName);
+			const persisted = log.persisted.get(scriptName) ?? new Map<string, string>();
+			const lines: string[] = [];
+			for (const record of toRecords(scriptName, cp)) {
+				const line = JSON.stringify(record, replacer);
+				const key = recordKey(record);
+				if (persisted.get(key) !== line) {
+					persisted.set(key, line);
+					lines.push(line + "\n");
+				}
+			}
+			log.persisted.set(scriptName, persisted);
+			log.scripts.set(scriptName, copyCheckpoint(cp));
+			if (lines.length > 0) {
+				fs.appendFileSync(this.logPath(networkName), lines.join(""));
+			}
+
+			const scripts = index.networks[networkName] ?? [];
+			if (!scripts.includes(scriptName)) {
+				index.networks[networkName] = [...scripts, scriptName];
+				indexChanged = true;
+			}
+		}
+		if (indexChanged) this.writeIndex(index);
+	}
+
+	clear(scriptNames: string[]): void {
+		const index = this.getIndex();
+		const cleared = new Set(scriptNames);
+		for (const [networkName, scripts] of Object.entries(index.networks)) {
+			const toClear = scripts.filter((s) => cleared.has(s));
+			if (toClear.length === 0) continue;
+			const lines = toClear.map((s) => JSON.stringify({ s, k: "clear" }) + "\n");
+			fs.appendFileSync(this.logPath(networkName), lines.join(""));
+			const log = this.logs.get(networkName);
+			for (const s of toClear) {
+				log?.scripts.delete(s);
+				log?.persisted.delete(s);
+			}
+			index.networks[networkName] = scripts.filter((s) => !cleared.has(s));
+		}
+		this.writeIndex(index);
+	}
+
+	/**
+	 * Writes checkpoints of all networks as YAML files (the format of the default store),
+	 * one file per script.
+	 * @returns names of the written files
+	 */
+	exportToYaml(): string[] {
+		const byScript = new Map<string, Checkpoints>();
+		for (const networkName of Object.keys(this.getIndex().networks)) {
+			for (const [scriptName, cp] of this.getLog(networkName).scripts) {
+				const checkpoints = byScript.get(scriptName) ?? {};
+				checkpoints[networkName] = cp;
+				byScript.set(scriptName, checkpoints);
+			}
+		}
+		for (const [scriptName, checkpoints] of byScript) {
+			persistCheckpoint(scriptName, checkpoints);
+		}
+		return [...byScript.keys()].map(toCheckpointFileName);
+	}
+
+	private logPath(networkName: string): string {
+		return path.join(this.dir, encodeURIComponent(networkName) + ".log");
+	}
+
+	private getLog(networkName: string): NetworkLog {
+		let log = this.logs.get(networkName);
+		if (log === undefined) {
+			this.getIndex(); // imports YAML checkpoints on first use
+			log = this.readLog(networkName);
+			this.logs.set(networkName, log);
+		}
+		return log;
+	}
+
+	private readLog(networkName: string): NetworkLog {
+		const log: NetworkLog = { scripts: new Map(), persisted: new Map() };
+		const logPath = this.logPath(networkName);
+		if (!fs.existsSync(logPath)) {
+			return log;
+		}
+		for (const line of fs.readFileSync(logPath, "utf8").split("\n")) {
+			if (line === "") continue;
+			let record: CheckpointRecord;
+			try {
+				record = JSON.parse(line, reviver);
+			} catch (e) {
+				continue; // incomplete line (eg. process was killed while writing)
+			}
+			if (record.k === "clear") {
+				log.scripts.delete(record.s);
+				log.persisted.delete(record.s);
+				continue;
+			}
+			let cp = log.scripts.get(record.s);
+			if (cp === undefined) {
+				cp = new CheckpointImpl();
+				log.scripts.set(record.s, cp);
+			}
+			applyRecord(cp, record);
+			const persisted = log.persisted.get(record.s) ?? new Map<string, string>();
+			persisted.set(recordKey(record), line);
+			log.persisted.set(record.s, persisted);
+		}
+		return log;
+	}
+
+	private getIndex(): CheckpointIndex {
+		if (this.index !== undefined) {
+			return this.index;
+		}
+		const indexPath = path.join(this.dir, indexFileName);
+		if (fs.existsSync(indexPath)) {
+			this.index = JSON.parse(fs.readFileSync(indexPath, "utf8")) as CheckpointIndex;
+			return this.index;
+		}
+		this.index = { version: indexVersion, networks: {} };
+		fs.mkdirSync(this.dir, { recursive: true });
+		for (const filename of lsCheckpointFiles()) {
+			this.persist(toScriptFileName(filename), loadCheckpointByCPName(filename));
+		}
+		this.writeIndex(this.index);
+		return this.index;
+	}
+
+	private writeIndex(index: CheckpointIndex): void {
+		fs.mkdirSync(this.dir, { recursive: true });
+		fs.writeFileSync(path.join(this.dir, indexFileName), JSON.stringify(index));
+	}
+}
+
+/**
+ * Returns checkpoint store configured in `checkpointStore` of the algob config
+ * (default: "yaml").
+ * @param config algob config
+ * @param networkName network of the loaded checkpoints
+ */
+export function mkCheckpointStore(config: Config, networkName: string): CheckpointStore {
+	if (config.checkpointStore === "log") {
+		return new LogCheckpointStore(networkName);
+	}
+	return new YamlCheckpointStore();
+}
@@ -1,9 +1,11 @@
 // This module provides algorand SDK driver
 
+import { suggestedParamsCache } from "@algo-builder/web";
 import algosdk from "algosdk";
 
 import { ALGOB_CHAIN_NAME } from "../internal/constants";
-import { HttpNetworkConfig, IndexerCfg, KmdCfg, Network } from "../types";
+import { HttpNetworkConfig, IndexerCfg, KmdCfg, Network, TransportCfg } from "../types";
+import { PooledHTTPClient } from "./http-client";
 
 // appends https protocol to host if no protocol is added
 function _parseHost(host: string): string {
@@ -13,24 +15,58 @@ function _parseHost(host: string): string {
 	return `https://${host}`;
 }
 
+// token passed as a string is sent in the default header of the service
+function _tokenHeader(
+	token: string | Record<string, string>,
+	headerName: string
+): Record<string, string> {
+	return typeof token === "string" ? { [headerName]: token } : token;
+}
+
+function _pooledClient(
+	cfg: { host: string; port: string | number; token: string | object },
+	headerName: string,
+	transport: TransportCfg
+): PooledHTTPClient {
+	const tokenHeader = _tokenHeader(cfg.token as string | Record<string, string>, headerName);
+	return new PooledHTTPClient(tokenHeader, _parseHost(cfg.host), cfg.port, transport);
+}
+
 // @note: probably in the future we will remove this function and provide our own wrapper
 export function createClient(n: Network): algosdk.Algodv2 {
 	if (n.name !== ALGOB_CHAIN_NAME) {
 		const cfg = n.config as HttpNetworkConfig;
-		const algodv2 = new algosdk.Algodv2(cfg.token, _parseHost(cfg.host), cfg.port);
+		const algodv2 =
+			cfg.transport === undefined
+				? new algosdk.Algodv2(cfg.token, _parseHost(cfg.host), cfg.port)
+				: new algosdk.Algodv2(_pooledClient(cfg, "X-Algo-API-Token", cfg.transport));
 		algodv2.setIntEncoding(algosdk.IntDecoding.MIXED); // to support values > Number.MAX_SAFE_INTEGER
+		// suggested params cache is shared by the deployer and algo operator using this client
+		suggestedParamsCache(algodv2, cfg.txParamsCache);
 		return algodv2;
 	}
 	throw Error("Initializing SDK driver for AlgobChain is not supported yet");
 }
 
-export function createKmdClient(kmdCfg: KmdCfg): algosdk.Kmd {
+export function createKmdClient(kmdCfg: KmdCfg, transport?: TransportCfg): algosdk.Kmd {
+	if (transport !== undefined) {
+		// Kmd typings accept only a token, but the constructor forwards a BaseHTTPClient
+		// the same way as Algodv2 and Indexer
+		// eslint-disable-next-line @typescript-eslint/no-explicit-any
+		return new algosdk.Kmd(_pooledClient(kmdCfg, "X-KMD-API-Token", transport) as any);
+	}
 	return new algosdk.Kmd(kmdCfg.token, _parseHost(kmdCfg.host), kmdCfg.port);
 }
 
-export function createIndexerClient(indexerCfg?: IndexerCfg): algosdk.Indexer | undefined {
+export function createIndexerClient(
+	indexerCfg?: IndexerCfg,
+	transport?: TransportCfg
+): algosdk.Indexer | undefined {
 	if (indexerCfg === undefined) {
 		return;
 	}
+	if (transport !== undefined) {
+		return new algosdk.Indexer(_pooledClient(indexerCfg, "X-Indexer-API-Token", transport));
+	}
 	return new algosdk.Indexer(indexerCfg.token, _parseHost(indexerCfg.host), indexerCfg.port);
 }
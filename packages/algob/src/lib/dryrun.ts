@@ -20,7 +20,14 @@ import * as path from "path";
 import { writeToFile } from "../builtin-tasks/gen-accounts";
 import { ASSETS_DIR, CACHE_DIR } from "../internal/core/project-structure";
 import { timestampNow } from "../lib/time";
-import type { ASCCache, DebuggerContext, Deployer } from "../types";
+import type {
+	ASCCache,
+	DebuggerContext,
+	Deployer,
+	LocalDryrunOptions,
+	LocalDryrunResponse,
+} from "../types";
+import { LocalDryrun } from "./local-dryrun";
 import { makeAndSignTx } from "./tx";
 
 export const tealExt = ".teal";
@@ -75,6 +82,31 @@ export class Tealdbg {
 		return dryRunResponse;
 	}
 
+	/**
+	 * Executes the transaction(s) locally, in the algob runtime, and returns a dryrun-like
+	 * response (see `LocalDryrun`). Programs are not sent to the node.
+	 * @param options local dryrun options (snapshot, app programs)
+	 * @param outFile name of file to dump the response. Dumped in `assets/<file>`
+	 * @param force if true, overwrites an existing response dump
+	 */
+	async simulate(
+		options?: LocalDryrunOptions,
+		outFile?: string,
+		force?: boolean
+	): Promise<LocalDryrunResponse> {
+		const response = await new LocalDryrun(this.deployer, options).simulate(this.execParams);
+		if (outFile) {
+			const outPath = path.join(ASSETS_DIR, outFile);
+			const json = JSON.stringify(
+				response,
+				(_k, v) => (typeof v === "bigint" ? v.toString() : v),
+				2
+			);
+			await writeToFile(json, force ?? false, outPath);
+		}
+		return response;
+	}
+
 	/**
 	 * Start a debugger session using child_process.spawn() using the given args.
 	 * Kills an existing session first (using killall -9 <process>)
@@ -0,0 +1,12 @@
+import type { MnemonicAccount } from "../types";
+import { genAccounts } from "./account";
+
+export interface GenAccountsInput {
+	start: number;
+	count: number;
+}
+
+// worker thread handler used by `algob gen-accounts` (see WorkerPool)
+export function handler(input: GenAccountsInput): MnemonicAccount[] {
+	return genAccounts(input.count, input.start);
+}
@@ -0,0 +1,231 @@
+// HTTP transport for algosdk clients with connection pooling (keep-alive agents or HTTP/2)
+
+import type { BaseHTTPClient, BaseHTTPClientResponse } from "algosdk";
+import http from "http";
+import http2 from "http2";
+import https from "https";
+
+import type { TransportCfg } from "../types";
+
+type Headers = Record<string, string>;
+type Query = Record<string, any>; // eslint-disable-line @typescript-eslint/no-explicit-any
+
+interface Agents {
+	http: http.Agent;
+	https: https.Agent;
+}
+
+// agents are shared by all clients with the same pool settings (pools are per host)
+const agents = new Map<string, Agents>();
+
+function getAgents(cfg: TransportCfg): Agents {
+	const keepAlive = cfg.keepAlive ?? true;
+	const maxSockets = cfg.maxSockets ?? Infinity;
+	const key = `${String(keepAlive)}:${maxSockets}`;
+	let a = agents.get(key);
+	if (a === undefined) {
+		a = {
+			http: new http.Agent({ keepAlive, maxSockets }),
+			https: new https.Agent({ keepAlive, maxSockets }),
+		};
+		agents.set(key, a);
+	}
+	return a;
+}
+
+function normalizeHeaders(headers: http.IncomingHttpHeaders): Headers {
+	const res: Headers = {};
+	for (const [name, value] of Object.entries(headers)) {
+		if (value === undefined || name.startsWith(":")) continue;
+		res[name] = Array.isArray(value) ? value.join(", ") : String(value);
+	}
+	return res;
+}
+
+/**
+ * Throws an error in the format expected by algosdk (error with `response`)
+ * if the request was not successful.
+ */
+function checkHttpError(url: URL, res: BaseHTTPClientResponse): BaseHTTPClientResponse {
+	if (res.status >= 200 && res.status < 300) return res;
+	let message = `Network request error. Received status ${res.status} for ${url.pathname}`;
+	try {
+		const decoded = JSON.parse(Buffer.from(res.body).toString());
+		if (decoded.message) message += `: ${String(decoded.message)}`;
+	} catch (e) {
+		// body is not a JSON
+	}
+	const error = new Error(message) as Error & { response: BaseHTTPClientResponse };
+	error.response = res;
+	throw error;
+}
+
+/**
+ * Implementation of algosdk `BaseHTTPClient` which reuses connections: HTTP/1.1 requests
+ * use keep-alive agents (with optional limit of sockets per host), and with `http2`
+ * all requests to a host are multiplexed over a single HTTP/2 session.
+ */
+export class PooledHTTPClient implements BaseHTTPClient {
+	private readonly baseURL: URL;
+	private readonly defaultHeaders: Headers;
+	private readonly cfg: TransportCfg;
+	private session?: { conn: http2.ClientHttp2Session; activeStreams: number };
+
+	/**
+	 * @param tokenHeader header with the API token (eg. { "X-Algo-API-Token": "..." })
+	 * @param baseServer server URL
+	 * @param port server port
+	 * @param cfg transport configuration
+	 */
+	constructor(
+		tokenHeader: Headers,
+		baseServer: string,
+		port: string | number,
+		cfg: TransportCfg
+	) {
+		this.baseURL = new URL(baseServer);
+		if (port !== "") this.baseURL.port = String(port);
+		if (!this.baseURL.pathname.endsWith("/")) this.baseURL.pathname += "/";
+		this.defaultHeaders = tokenHeader;
+		this.cfg = cfg;
+	}
+
+	async get(
+		relativePath: string,
+		query?: Query,
+		requestHeaders: Headers = {}
+	): Promise<BaseHTTPClientResponse> {
+		return await this.request("GET", relativePath, query, requestHeaders);
+	}
+
+	async post(
+		relativePath: string,
+		data: Uint8Array,
+		query?: Query,
+		requestHeaders: Headers = {}
+	): Promise<BaseHTTPClientResponse> {
+		return await this.request("POST", relativePath, query, requestHeaders, data);
+	}
+
+	async delete(
+		relativePath: string,
+		data: Uint8Array,
+		query?: Query,
+		requestHeaders: Headers = {}
+	): Promise<BaseHTTPClientResponse> {
+		return await this.request("DELETE", relativePath, query, requestHeaders, data);
+	}
+
+	private getURL(relativePath: string, query?: Query): URL {
+		const url = new URL(relativePath.replace(/^\//, ""), this.baseURL);
+		for (const [key, value] of Object.entries(query ?? {})) {
+			if (value !== undefined) url.searchParams.set(key, String(value));
+		}
+		return url;
+	}
+
+	private async request(
+		method: string,
+		relativePath: string,
+		query: Query | undefined,
+		requestHeaders: Headers,
+		body?: Uint8Array
+	): Promise<BaseHTTPClientResponse> {
+		const url = this.getURL(relativePath, query);
+		const headers = { ...this.defaultHeaders, ...requestHeaders };
+		const res =
+			this.cfg.http2 === true
+				? await this.requestHttp2(method, url, headers, body)
+				: await this.requestHttp1(method, url, headers, body);
+		return checkHttpError(url, res);
+	}
+
+	private async requestHttp1(
+		method: string,
+		url: URL,
+		headers: Headers,
+		body?: Uint8Array
+	): Promise<BaseHTTPClientResponse> {
+		const isHttps = url.protocol === "https:";
+		const { http: httpAgent, https: httpsAgent } = getAgents(this.cfg);
+		const options = { method, headers, agent: isHttps ? httpsAgent : httpAgent };
+		return await new Promise((resolve, reject) => {
+			const onResponse = (res: http.IncomingMessage): void => {
+				const chunks: Buffer[] = [];
+				res.on("data", (chunk: Buffer) => chunks.push(chunk));
+				res.on("error", reject);
+				res.on("end", () =>
+					resolve({
+						body: new Uint8Array(Buffer.concat(chunks)),
+						status: res.statusCode ?? 0,
+						headers: normalizeHeaders(res.headers),
+					})
+				);
+			};
+			const req = isHttps
+				? https.request(url, options, onResponse)
+				: http.request(url, options, onResponse);
+			if (this.cfg.timeout !== undefined) {
+				req.setTimeout(this.cfg.timeout, () =>
+					req.destroy(new Error(`Request timeout (${this.cfg.timeout} ms): ${url.pathname}`))
+				);
+			}
+			req.on("error", reject);
+			req.end(body);
+		});
+	}
+
+	// HTTP/2 session is kept open (but doesn't keep the process alive) while idle
+	private getSession(): { conn: http2.ClientHttp2Session; activeStreams: number } {
+		if (this.session === undefined || this.session.conn.closed || this.session.conn.destroyed) {
+			const session = { conn: http2.connect(this.baseURL.origin), activeStreams: 0 };
+			session.conn.on("error", () => {
+				// errors are reported by the streams, next request opens a new session
+				if (this.session === session) this.session = undefined;
+			});
+			session.conn.unref();
+			this.session = session;
+		}
+		return this.session;
+	}
+
+	private async requestHttp2(
+		method: string,
+		url: URL,
+		headers: Headers,
+		body?: Uint8Array
+	): Promise<BaseHTTPClientResponse> {
+		const session = this.getSession();
+		const reqHeaders: http2.OutgoingHttpHeaders = {
+			":method": method,
+			":path": url.pathname + url.search,
+		};
+		for (const [name, value] of Object.entries(headers)) reqHeaders[name.toLowerCase()] = value;
+
+		if (session.activeStreams++ === 0) session.conn.ref();
+		return await new Promise((resolve, reject) => {
+			const stream = session.conn.request(reqHeaders);
+			const chunks: Buffer[] = [];
+			let status = 0;
+			let resHeaders: Headers = {};
+			stream.on("response", (h) => {
+				status = Number(h[":status"]);
+				resHeaders = normalizeHeaders(h);
+			});
+			stream.on("data", (chunk: Buffer) => chunks.push(chunk));
+			stream.on("end", () =>
+				resolve({ body: new Uint8Array(Buffer.concat(chunks)), status, headers: resHeaders })
+			);
+			stream.on("error", reject);
+			stream.on("close", () => {
+				if (--session.activeStreams === 0 && !session.conn.destroyed) session.conn.unref();
+			});
+			if (this.cfg.timeout !== undefined) {
+				stream.setTimeout(this.cfg.timeout, () =>
+					stream.destroy(new Error(`Request timeout (${this.cfg.timeout} ms): ${url.pathname}`))
+				);
+			}
+			stream.end(body);
+		});
+	}
+}
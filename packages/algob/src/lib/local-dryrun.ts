@@ -0,0 +1,389 @@
+import {
+	AccountStore,
+	getProgram,
+	loadFromYamlFileSilent,
+	lsTreeWalk,
+	Runtime,
+	types as rtypes,
+} from "@algo-builder/runtime";
+import { BuilderError, ERRORS, types as wtypes } from "@algo-builder/web";
+import algosdk, {
+	decodeObj,
+	decodeSignedTransaction,
+	encodeAddress,
+	getApplicationAddress,
+	modelsv2,
+	SignedTransaction,
+	Transaction,
+} from "algosdk";
+import * as fs from "fs";
+import * as path from "path";
+
+import { CACHE_DIR } from "../internal/core/project-structure";
+import { mapConcurrent } from "../internal/util/lists";
+import type {
+	ASCCache,
+	Deployer,
+	DryrunStackValue,
+	LocalDryrunOptions,
+	LocalDryrunResponse,
+	LocalDryrunTxnResult,
+} from "../types";
+import { makeAndSignTx } from "./tx";
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+type RawObj = Record<string, any>;
+
+// state of a dryrun request: accounts and apps in the algod (REST API) format
+interface DryrunState {
+	accounts: RawObj[];
+	apps: RawObj[];
+	round: number;
+	"latest-timestamp": number;
+}
+
+const MAX_CONCURRENT_REQUESTS = 16;
+
+// bytes are base64 strings in JSON dumps and Uint8Array in msgpack dumps
+function toBytes(value: string | Uint8Array | undefined): Uint8Array {
+	if (value === undefined) return new Uint8Array(0);
+	return typeof value === "string" ? new Uint8Array(Buffer.from(value, "base64")) : value;
+}
+
+function toBase64(value: string | Uint8Array | undefined): string {
+	return typeof value === "string" ? value : Buffer.from(toBytes(value)).toString("base64");
+}
+
+// converts TEAL key-value store to the runtime format (keys are stringified byte arrays)
+function toStateMap(keyValues: RawObj[] | undefined): Map<string, rtypes.StackElem> {
+	const state = new Map<string, rtypes.StackElem>();
+	for (const kv of keyValues ?? []) {
+		const value = kv.value.type === 1 ? toBytes(kv.value.bytes) : BigInt(kv.value.uint ?? 0);
+		state.set(toBytes(kv.key).toString(), value);
+	}
+	return state;
+}
+
+function toSchema(schema: RawObj | undefined): modelsv2.ApplicationStateSchema {
+	return {
+		numUint: Number(schema?.["num-uint"] ?? 0),
+		numByteSlice: Number(schema?.["num-byte-slice"] ?? 0),
+	} as modelsv2.ApplicationStateSchema;
+}
+
+function toAssetParams(params: RawObj): modelsv2.AssetParams {
+	return {
+		creator: params.creator,
+		total: BigInt(params.total ?? 0),
+		decimals: Number(params.decimals ?? 0),
+		defaultFrozen: params["default-frozen"] ?? false,
+		unitName: params["unit-name"],
+		name: params.name,
+		url: params.url,
+		metadataHash: params["metadata-hash"] && toBytes(params["metadata-hash"]),
+		manager: params.manager,
+		reserve: params.reserve,
+		freeze: params.freeze,
+		clawback: params.clawback,
+	} as modelsv2.AssetParams;
+}
+
+function toStackValue(e: rtypes.StackElem): DryrunStackValue {
+	return typeof e === "bigint"
+		? { type: 2, bytes: "", uint: e }
+		: { type: 1, bytes: Buffer.from(e).toString("base64"), uint: 0 };
+}
+
+function addr(a?: { publicKey: Uint8Array }): string | undefined {
+	return a === undefined ? undefined : encodeAddress(a.publicKey);
+}
+
+// accounts, apps and assets referenced by the transactions
+function references(txns: Transaction[]): [Set<string>, Set<number>, Set<number>] {
+	const accounts = new Set<string>();
+	const apps = new Set<number>();
+	const assets = new Set<number>();
+	for (const t of txns) {
+		for (const a of [t.from, t.to, t.closeRemainderTo, t.assetRevocationTarget]) {
+			const address = addr(a);
+			if (address !== undefined) accounts.add(address);
+		}
+		t.appAccounts?.forEach((a) => accounts.add(encodeAddress(a.publicKey)));
+		if (t.appIndex) apps.add(t.appIndex);
+		t.appForeignApps?.forEach((id) => apps.add(id));
+		if (t.assetIndex) assets.add(t.assetIndex);
+		t.appForeignAssets?.forEach((id) => assets.add(id));
+	}
+	apps.forEach((id) => accounts.add(getApplicationAddress(id)));
+	return [accounts, apps, assets];
+}
+
+/**
+ * Loads TEAL code of the compiled programs from the compilation cache (artifacts/cache),
+ * indexed by the compiled program (base64).
+ */
+export function loadCompiledSources(dir = CACHE_DIR): Map<string, string> {
+	const sources = new Map<string, string>();
+	if (!fs.existsSync(dir)) return sources;
+	for (const file of lsTreeWalk(dir).filter((f) => f.endsWith(".yaml"))) {
+		const a = loadFromYamlFileSilent(file) as ASCCache | undefined;
+		if (a?.compiled && a.tealCode) sources.set(a.compiled, a.tealCode);
+	}
+	return sources;
+}
+
+/**
+ * LocalDryrun executes transactions in the algob runtime (without sending them to the
+ * `/v2/teal/dryrun` endpoint of a node) and returns a dryrun-like response with
+ * app call messages, execution traces, costs and logs.
+ * On-chain state of the accounts, apps and assets used by the transactions is fetched
+ * once (and then only the missing parts) or loaded from a snapshot file.
+ * Runtime executes TEAL source code: sources of the apps are taken from `options.programs`
+ * or found in the compilation cache (by the compiled program).
+ * Logic signatures are not evaluated.
+ */
+export class LocalDryrun {
+	readonly deployer: Deployer;
+	private readonly options: LocalDryrunOptions;
+	private state?: DryrunState;
+	private sources?: Map<string, string>;
+
+	constructor(deployer: Deployer, options: LocalDryrunOptions = {}) {
+		this.deployer = deployer;
+		this.options = options;
+	}
+
+	/**
+	 * Executes the transaction (or group) in a runtime seeded with the loaded state.
+	 * State changes are not kept: every call starts from the same state.
+	 * @param execParams transaction parameters
+	 */
+	async simulate(
+		execParams: wtypes.ExecParams | wtypes.ExecParams[]
+	): Promise<LocalDryrunResponse> {
+		const execParamsArr = Array.isArray(execParams) ? execParams : [execParams];
+		let signed = (await makeAndSignTx(this.deployer, execParams, new Map()))[1];
+		if (!Array.isArray(signed)) signed = [signed];
+		const stxns: SignedTransaction[] = signed.map((s) => decodeSignedTransaction(s));
+		await this.loadState(stxns.map((s) => s.txn));
+
+		const runtime = this.seedRuntime(stxns);
+		const groupTxIDs = new Map(stxns.map((s, i) => [s.txn.txID(), i]));
+		const results: LocalDryrunTxnResult[] = stxns.map(() => ({}));
+		runtime.setTracer((step) => {
+			const i = groupTxIDs.get(step.txID);
+			if (i === undefined) return; // inner transaction
+			(results[i]["app-call-trace"] ??= []).push({
+				line: step.line,
+				opcode: step.opcode,
+				cost: step.cost,
+				stack: [...step.stack].reverse().map(toStackValue),
+			});
+		});
+
+		let error = "";
+		let failed: number | undefined; // index of the rejected transaction
+		try {
+			runtime.executeSignedTxnGroup(
+				stxns,
+				this.appDefinitions(execParamsArr),
+				new Map(),
+				this.options.debugStack
+			);
+		} catch (e) {
+			error = e instanceof Error ? e.message : String(e);
+			failed = runtime.ctx.txIndex;
+		}
+
+		stxns.forEach((s, i) => {
+			if (s.txn.type !== algosdk.TransactionType.appl) return;
+			const receipt = runtime.ctx.state.txReceipts.get(s.txn.txID()) as
+				| rtypes.BaseTxReceipt
+				| undefined;
+			const program =
+				s.txn.appOnComplete === algosdk.OnApplicationComplete.ClearStateOC
+					? "ClearStateProgram"
+					: "ApprovalProgram";
+			// on failure, transactions before the rejected one passed, next ones didn't run
+			if (error === "" || (failed !== undefined && i < failed)) {
+				results[i]["app-call-messages"] = [program, "PASS"];
+			} else if (i === failed) {
+				results[i]["app-call-messages"] = [program, "REJECT", error];
+			}
+			if (receipt?.gas !== undefined) results[i].cost = receipt.gas;
+			if (receipt?.logs?.length) {
+				results[i].logs = receipt.logs.map((l) => Buffer.from(l).toString("base64"));
+			}
+		});
+		return { txns: results, error, "protocol-version": "" };
+	}
+
+	/**
+	 * Writes the loaded state (in the dryrun request format) to a JSON file, which can be
+	 * used as `snapshot` option.
+	 * @param file output file
+	 */
+	saveSnapshot(file: string): void {
+		if (this.state === undefined) {
+			throw new Error("State is not loaded: simulate a transaction first");
+		}
+		fs.mkdirSync(path.dirname(file), { recursive: true });
+		fs.writeFileSync(file, JSON.stringify(this.state, null, 2));
+	}
+
+	// loads accounts, apps and assets used by the transactions which are not loaded yet
+	private async loadState(txns: Transaction[]): Promise<void> {
+		if (this.state === undefined) {
+			this.state = this.options.snapshot
+				? this.readSnapshot(this.options.snapshot)
+				: await this.fetchRound();
+		}
+		if (this.options.snapshot) return; // offline: state comes only from the snapshot
+
+		const state = this.state;
+		const algod = this.deployer.algodClient;
+		const [accounts, apps, assets] = references(txns);
+		const knownApps = new Set(state.apps.map((a) => Number(a.id)));
+		const newApps = await mapConcurrent(
+			[...apps].filter((id) => !knownApps.has(id)),
+			MAX_CONCURRENT_REQUESTS,
+			async (id) => (await algod.getApplicationByID(id).do()) as RawObj
+		);
+		state.apps.push(...newApps);
+		newApps.forEach((a) => accounts.add(a.params.creator));
+		const assetInfos = await mapConcurrent(
+			[...assets],
+			MAX_CONCURRENT_REQUESTS,
+			async (id) => (await algod.getAssetByID(id).do()) as RawObj
+		);
+		assetInfos.forEach((a) => accounts.add(a.params.creator));
+
+		const knownAccounts = new Set(state.accounts.map((a) => a.address as string));
+		const newAccounts = await mapConcurrent(
+			[...accounts].filter((a) => !knownAccounts.has(a)),
+			MAX_CONCURRENT_REQUESTS,
+			async (a) => (await algod.accountInformation(a).do()) as RawObj
+		);
+		state.accounts.push(...newAccounts);
+	}
+
+	private async fetchRound(): Promise<DryrunState> {
+		const status = await this.deployer.algodClient.status().do();
+		return {
+			accounts: [],
+			apps: [],
+			round: Number(status["last-round"]),
+			"latest-timestamp": Math.round(+new Date() / 1000),
+		};
+	}
+
+	// reads dryrun request (or state saved with `saveSnapshot`) from JSON or msgpack file
+	private readSnapshot(file: string): DryrunState {
+		const content = fs.readFileSync(file);
+		const req = (
+			file.endsWith(".json") ? JSON.parse(content.toString()) : decodeObj(content)
+		) as RawObj;
+		return {
+			accounts: req.accounts ?? [],
+			apps: req.apps ?? [],
+			round: Number(req.round ?? 0),
+			"latest-timestamp": Number(req["latest-timestamp"] ?? 0),
+		};
+	}
+
+	// TEAL code of an app: from `programs` option or found in the compilation cache
+	private appSources(appID: number, params: RawObj): [string, string] | undefined {
+		const programs = this.options.programs?.get(appID);
+		if (programs !== undefined) {
+			return [
+				getProgram(programs.approvalProgramFilename, "", programs.scTmplParams, false),
+				getProgram(programs.clearProgramFilename, "", programs.scTmplParams, false),
+			];
+		}
+		this.sources ??= loadCompiledSources();
+		const approval = this.sources.get(toBase64(params["approval-program"]));
+		const clear = this.sources.get(toBase64(params["clear-state-program"]));
+		return approval !== undefined && clear !== undefined ? [approval, clear] : undefined;
+	}
+
+	private seedRuntime(stxns: SignedTransaction[]): Runtime {
+		const state = this.state as DryrunState;
+		const accounts = new Map<string, AccountStore>();
+		const getAccount = (address: string): AccountStore => {
+			let acc = accounts.get(address);
+			if (acc === undefined) {
+				acc = new AccountStore(0, { addr: address, sk: new Uint8Array(0) });
+				accounts.set(address, acc);
+			}
+			return acc;
+		};
+
+		for (const a of state.accounts) {
+			const acc = getAccount(a.address);
+			acc.amount = BigInt(a.amount ?? 0);
+			if (a["min-balance"] !== undefined) acc.minBalance = Number(a["min-balance"]);
+			if (a["auth-addr"]) acc.rekeyTo(a["auth-addr"]);
+			for (const h of a.assets ?? []) {
+				acc.assets.set(h["asset-id"], {
+					amount: BigInt(h.amount ?? 0),
+					"asset-id": h["asset-id"],
+					creator: h.creator ?? "",
+					"is-frozen": h["is-frozen"] ?? false,
+				});
+			}
+			for (const ls of a["apps-local-state"] ?? []) {
+				acc.appsLocalState.set(ls.id, {
+					id: ls.id,
+					"key-value": toStateMap(ls["key-value"]),
+					schema: toSchema(ls.schema),
+				});
+			}
+			for (const asset of a["created-assets"] ?? []) {
+				acc.createdAssets.set(asset.index, toAssetParams(asset.params));
+			}
+		}
+
+		const calledApps = new Set(stxns.map((s) => s.txn.appIndex).filter((id) => id));
+		for (const app of state.apps) {
+			const appID = Number(app.id);
+			const sources = this.appSources(appID, app.params);
+			if (sources === undefined && calledApps.has(appID)) {
+				throw new BuilderError(ERRORS.SCRIPT.DRYRUN_APP_SOURCE_NOT_FOUND, { appID });
+			}
+			// apps which are only referenced (eg. foreign apps) don't need the programs
+			getAccount(app.params.creator).createdApps.set(appID, {
+				"approval-program": sources?.[0] ?? "",
+				"clear-state-program": sources?.[1] ?? "",
+				creator: app.params.creator,
+				"global-state": toStateMap(app.params["global-state"]),
+				"global-state-schema": toSchema(app.params["global-state-schema"]),
+				"local-state-schema": toSchema(app.params["local-state-schema"]),
+			});
+		}
+
+		const runtime = new Runtime([...accounts.values()]);
+		// transactions are valid in rounds after their first round and before their last round,
+		// so the round is moved inside the validity window of the group (as in LedgerReplay)
+		const firstValid = Math.max(...stxns.map((s) => s.txn.firstRound));
+		const lastValid = Math.min(...stxns.map((s) => s.txn.lastRound));
+		const round = Math.min(Math.max(state.round, firstValid + 1), lastValid - 1);
+		const timestamp = state["latest-timestamp"] || Math.round(+new Date() / 1000);
+		runtime.setRoundAndTimestamp(round, timestamp);
+		return runtime;
+	}
+
+	// programs of deployed and updated apps (by index in group)
+	private appDefinitions(
+		execParams: wtypes.ExecParams[]
+	): Map<number, wtypes.AppDefinition | wtypes.SmartContract> {
+		const appDefMap = new Map<number, wtypes.AppDefinition | wtypes.SmartContract>();
+		execParams.forEach((p, i) => {
+			if (p.type === wtypes.TransactionType.DeployApp) {
+				appDefMap.set(i, p.appDefinition);
+			} else if (p.type === wtypes.TransactionType.UpdateApp) {
+				appDefMap.set(i, p.newAppCode);
+			}
+		});
+		return appDefMap;
+	}
+}
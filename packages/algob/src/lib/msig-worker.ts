@@ -0,0 +1,14 @@
+import type { Account, MultisigMetadata } from "algosdk";
+
+import { MultisigFileSignature, signMultiSigTxFile } from "./msig";
+
+export interface MsigWorkerInput {
+	signer: Account;
+	data: Uint8Array;
+	mparams?: MultisigMetadata;
+}
+
+// worker thread handler used by the batch mode of `algob sign-multisig` (see WorkerPool)
+export function handler(input: MsigWorkerInput): MultisigFileSignature {
+	return signMultiSigTxFile(input.signer, input.data, input.mparams);
+}
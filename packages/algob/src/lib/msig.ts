@@ -4,10 +4,12 @@ import {
 	Account,
 	appendSignMultisigTransaction,
 	decodeAddress,
+	decodeObj,
 	decodeSignedTransaction,
 	decodeUnsignedTransaction,
 	encodeAddress,
 	EncodedMultisig,
+	encodeObj,
 	logicSigFromByte,
 	MultisigMetadata,
 	signMultisigTransaction,
@@ -156,3 +158,78 @@ export function signMultiSig(
 	console.log("Msig: %O", decodedSignedTxn.msig);
 	return signedTxn;
 }
+
+export interface MultisigFileSignature {
+	blob: Uint8Array; // encoded transaction (or transaction group) with the new signatures
+	signed: number[]; // indexes of signed transactions (0 for a single transaction)
+}
+
+/**
+ * Signs all transactions of a transaction file (single transaction or group) relevant to
+ * the signer: multisig transactions which include the signer and are not signed by it yet,
+ * and unsigned transactions if `mparams` includes the signer.
+ * @param signerAccount account(addr, sk) to sign the transactions
+ * @param data content of the transaction file
+ * @param mparams multisig metadata. Required to sign unsigned transactions.
+ */
+export function signMultiSigTxFile(
+	signerAccount: Account,
+	data: Uint8Array,
+	mparams?: MultisigMetadata
+): MultisigFileSignature {
+	let decoded;
+	try {
+		decoded = decodeObj(data);
+	} catch (e) {
+		return { blob: data, signed: [] }; // not a transaction file
+	}
+	const isGroup = Array.isArray(decoded);
+	const rawTxns = (isGroup ? decoded : [data]) as Uint8Array[];
+	const signed: number[] = [];
+	const out = rawTxns.map((rawTxn, i) => {
+		if (!isMultisigSigner(signerAccount.addr, rawTxn, mparams)) {
+			return rawTxn;
+		}
+		signed.push(i);
+		return isSignedTx(rawTxn)
+			? appendSignMultisigTransaction(rawTxn, msigMetadata(rawTxn), signerAccount.sk).blob
+			: signMultisigTransaction(
+					decodeUnsignedTransaction(rawTxn),
+					mparams as MultisigMetadata,
+					signerAccount.sk
+			  ).blob;
+	});
+	return { blob: isGroup ? encodeObj(out) : out[0], signed };
+}
+
+// multisig metadata of a multisig signed transaction
+function msigMetadata(rawTxn: Uint8Array): MultisigMetadata {
+	const msig = decodeSignedTransaction(rawTxn).msig as EncodedMultisig;
+	return {
+		version: msig.v,
+		threshold: msig.thr,
+		addrs: msig.subsig.map((sig) => encodeAddress(Uint8Array.from(sig.pk))),
+	};
+}
+
+// returns true if the transaction should be (and still isn't) signed by `addr`
+function isMultisigSigner(
+	addr: string,
+	rawTxn: Uint8Array,
+	mparams?: MultisigMetadata
+): boolean {
+	if (isSignedTx(rawTxn)) {
+		const msig = decodeSignedTransaction(rawTxn).msig;
+		return (
+			msig?.subsig.some(
+				(sig) => sig.s === undefined && encodeAddress(Uint8Array.from(sig.pk)) === addr
+			) ?? false
+		);
+	}
+	try {
+		decodeUnsignedTransaction(rawTxn);
+	} catch (e) {
+		return false; // not a transaction
+	}
+	return mparams?.addrs.includes(addr) ?? false;
+}
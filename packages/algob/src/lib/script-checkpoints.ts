@@ -20,6 +20,7 @@ import {
 	Deployer,
 	LsigInfo,
 	Timestamp,
+	TxnReceipt,
 } from "../types";
 
 export const scriptsDirectory = "scripts";
@@ -85,11 +86,50 @@ export function appendToCheckpoint(
 	return checkpoints;
 }
 
+// returns the last entry of the map (latest registered version of an app)
+function lastValue<K, V>(map: Map<K, V>): V | undefined {
+	let last: V | undefined;
+	for (const value of map.values()) last = value;
+	return last;
+}
+
+// reverse index of app checkpoints: app ID of the latest version -> app name
+interface AppIndex {
+	names: Map<number, string>;
+	latest: Map<string, rtypes.AppInfo>;
+}
+
+function buildASAIndex(asa: Map<string, rtypes.ASAInfo>): Map<number, string> {
+	const names = new Map<number, string>();
+	for (const [name, info] of asa) {
+		if (!names.has(info.assetIndex)) names.set(info.assetIndex, name);
+	}
+	return names;
+}
+
+function buildAppIndex(app: Map<string, Map<Timestamp, rtypes.AppInfo>>): AppIndex {
+	const index: AppIndex = { names: new Map(), latest: new Map() };
+	for (const [name, versions] of app) {
+		const info = lastValue(versions);
+		if (info === undefined) continue;
+		index.latest.set(name, info);
+		if (!index.names.has(info.appID)) index.names.set(info.appID, name);
+	}
+	return index;
+}
+
 export class CheckpointRepoImpl implements CheckpointRepo {
 	strippedCP: Checkpoints = {};
 	precedingCP: Checkpoints = {};
 	allCPs: Checkpoints = {};
 	scriptMap: AssetScriptMap = {};
+	// Reverse indexes of preceding checkpoints, keyed by the indexed maps: they are built
+	// on the first lookup, updated by register* methods and rebuilt when merge replaces the maps.
+	private readonly asaIndexes = new WeakMap<Map<string, rtypes.ASAInfo>, Map<number, string>>();
+	private readonly appIndexes = new WeakMap<
+		Map<string, Map<Timestamp, rtypes.AppInfo>>,
+		AppIndex
+	>();
 
 	private _mergeTo(
 		target: Checkpoints,
@@ -157,7 +197,17 @@ export class CheckpointRepoImpl implements CheckpointRepo {
 	}
 
 	registerASA(networkName: string, name: string, info: rtypes.ASAInfo): CheckpointRepo {
-		this._ensureNet(this.precedingCP, networkName).asa.set(name, info);
+		const asa = this._ensureNet(this.precedingCP, networkName).asa;
+		const index = this.asaIndexes.get(asa);
+		if (index !== undefined) {
+			const prev = asa.get(name);
+			if (prev !== undefined && prev.assetIndex !== info.assetIndex) {
+				this.asaIndexes.delete(asa); // name was re-registered with a new asset index
+			} else if (!index.has(info.assetIndex)) {
+				index.set(info.assetIndex, name);
+			}
+		}
+		asa.set(name, info);
 		this._ensureNet(this.strippedCP, networkName).asa.set(name, info);
 		this._ensureNet(this.allCPs, networkName).asa.set(name, info);
 		return this;
@@ -179,7 +229,19 @@ export class CheckpointRepoImpl implements CheckpointRepo {
 	}
 
 	registerSSC(networkName: string, name: string, info: rtypes.AppInfo): CheckpointRepo {
-		this._ensureRegister(this._ensureNet(this.precedingCP, networkName).app, name, info);
+		const app = this._ensureNet(this.precedingCP, networkName).app;
+		this._ensureRegister(app, name, info);
+		const index = this.appIndexes.get(app);
+		if (index !== undefined) {
+			const prev = index.latest.get(name);
+			const latest = lastValue(app.get(name) as Map<number, rtypes.AppInfo>) as rtypes.AppInfo;
+			if (prev !== undefined && prev.appID !== latest.appID) {
+				this.appIndexes.delete(app); // latest version of the app has a new app ID
+			} else {
+				index.latest.set(name, latest);
+				if (!index.names.has(latest.appID)) index.names.set(latest.appID, name);
+			}
+		}
 		this._ensureRegister(this._ensureNet(this.strippedCP, networkName).app, name, info);
 		this._ensureRegister(this._ensureNet(this.allCPs, networkName).app, name, info);
 		return this;
@@ -192,6 +254,40 @@ export class CheckpointRepoImpl implements CheckpointRepo {
 		return this;
 	}
 
+	getASANameFromIndex(networkName: string, assetIndex: number): string | undefined {
+		const asa = this.precedingCP[networkName]?.asa;
+		if (asa === undefined) {
+			return undefined;
+		}
+		let index = this.asaIndexes.get(asa);
+		if (index === undefined) {
+			index = buildASAIndex(asa);
+			this.asaIndexes.set(asa, index);
+		}
+		return index.get(assetIndex);
+	}
+
+	getAppNameFromIndex(networkName: string, appID: number): string | undefined {
+		return this._getAppIndex(networkName)?.names.get(appID);
+	}
+
+	getLatestAppInfo(networkName: string, name: string): rtypes.AppInfo | undefined {
+		return this._getAppIndex(networkName)?.latest.get(name);
+	}
+
+	private _getAppIndex(networkName: string): AppIndex | undefined {
+		const app = this.precedingCP[networkName]?.app;
+		if (app === undefined) {
+			return undefined;
+		}
+		let index = this.appIndexes.get(app);
+		if (index === undefined) {
+			index = buildAppIndex(app);
+			this.appIndexes.set(app, index);
+		}
+		return index;
+	}
+
 	isDefined(networkName: string, name: string): boolean {
 		const netCP = this.allCPs[networkName];
 		return (
@@ -229,12 +325,19 @@ export async function registerCheckpoints(
 	txns: Transaction[],
 	txIdxMap: Map<number, [string, wtypes.ASADef]>
 ): Promise<void> {
+	// wait for all confirmations at once (confirmed transactions are cached by the deployer)
+	const confirmations = await Promise.all(
+		txns.map(async (txn) =>
+			txn.type === "acfg" || txn.type === "appl"
+				? await deployer.waitForConfirmation(txn.txID())
+				: undefined
+		)
+	);
 	for (const [idx, txn] of txns.entries()) {
-		let txConfirmation;
+		const txConfirmation = confirmations[idx] as TxnReceipt;
 		const res = txIdxMap.get(idx);
 		switch (txn.type) {
 			case "acfg": {
-				txConfirmation = await deployer.waitForConfirmation(txn.txID());
 				const key = deployer.checkpoint.getAssetCheckpointKeyFromIndex(txn.assetIndex);
 				if (key && checkIfAssetDeletionTx(txn)) {
 					const temp: rtypes.ASAInfo = deployer.getASAInfo(key);
@@ -259,7 +362,6 @@ export async function registerCheckpoints(
 				break;
 			}
 			case "appl": {
-				txConfirmation = await deployer.waitForConfirmation(txn.txID());
 				const key = deployer.checkpoint.getAppCheckpointKeyFromIndex(txn.appIndex);
 				if (key) {
 					const temp: rtypes.AppInfo | undefined = deployer.checkpoint.getAppfromCPKey(key);
@@ -368,6 +470,11 @@ function findCheckpointsRecursive(): string[] {
 	);
 }
 
+// returns paths of all YAML checkpoint files
+export function lsCheckpointFiles(): string[] {
+	return findCheckpointsRecursive();
+}
+
 export function lsScriptsDir(): string[] {
 	return lsFiles(scriptsDirectory);
 }
@@ -380,11 +487,12 @@ export function loadCheckpointsRecursive(): CheckpointRepo {
 
 export function loadCheckpointsIntoCPData(
 	cpData: CheckpointRepo,
-	scriptPaths: string[]
+	scriptPaths: string[],
+	load: (scriptName: string) => Checkpoints = loadCheckpoint
 ): CheckpointRepo {
 	let checkpointData = cpData;
 	for (const s of scriptPaths) {
-		checkpointData = cpData.merge(loadCheckpoint(s), s);
+		checkpointData = cpData.merge(load(s), s);
 	}
 	return checkpointData;
 }
@@ -404,13 +512,7 @@ export class CheckpointFunctionsImpl implements CheckpointFunctions {
 	 * with hypen("-") in between (approvalProgramName-clearProgramName)
 	 */
 	getAppfromCPKey(key: string): rtypes.AppInfo | undefined {
-		const resultMap = this.cpData.precedingCP[this.networkName]?.app ?? new Map();
-		const nestedMap: any = resultMap.get(key);
-		if (nestedMap) {
-			return [...nestedMap][nestedMap.size - 1][1];
-		} else {
-			return undefined;
-		}
+		return this.cpData.getLatestAppInfo(this.networkName, key);
 	}
 
 	/**
@@ -419,13 +521,7 @@ export class CheckpointFunctionsImpl implements CheckpointFunctions {
 	 * @param index Application index
 	 */
 	getAppCheckpointKeyFromIndex(index: number): string | undefined {
-		const resultMap = this.cpData.precedingCP[this.networkName]?.app ?? new Map();
-		for (const [key, nestedMap] of resultMap) {
-			if (this.getLatestTimestampValue(nestedMap) === index) {
-				return key;
-			}
-		}
-		return undefined;
+		return this.cpData.getAppNameFromIndex(this.networkName, index);
 	}
 
 	/**
@@ -434,13 +530,7 @@ export class CheckpointFunctionsImpl implements CheckpointFunctions {
 	 * @param index Asset Index
 	 */
 	getAssetCheckpointKeyFromIndex(index: number): string | undefined {
-		const resultMap = this.cpData.precedingCP[this.networkName]?.asa ?? new Map();
-		for (const [key, value] of resultMap) {
-			if (value.assetIndex === index) {
-				return key;
-			}
-		}
-		return undefined;
+		return this.cpData.getASANameFromIndex(this.networkName, index);
 	}
 
 	/**
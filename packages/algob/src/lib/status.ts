@@ -1,4 +1,4 @@
-import { status } from "@algo-builder/web";
+import { stateReader } from "@algo-builder/web";
 
 import { AccountAddress, Deployer, Key, StateValue } from "../types";
 
@@ -14,15 +14,32 @@ export async function balanceOf(
 	accountAddress: AccountAddress,
 	assetID?: number
 ): Promise<number | bigint> {
+	const balances = await balancesOf(deployer, [accountAddress], assetID);
+	return balances.get(accountAddress) as number | bigint;
+}
+
+/**
+ * Returns balances of `assetID` of many accounts (fetched concurrently and cached
+ * for the current round). Balance is 0 if the account has not opt-in to the asset.
+ * @param deployer algob deployer
+ * @param accountAddresses accounts to return balances of
+ * @param assetID asset index. If assetID is undefined algo balances are returned
+ */
+export async function balancesOf(
+	deployer: Deployer,
+	accountAddresses: AccountAddress[],
+	assetID?: number
+): Promise<Map<AccountAddress, number | bigint>> {
+	const reader = stateReader(deployer.algodClient);
 	if (assetID === undefined) {
-		const accountInfo = await deployer.algodClient.accountInformation(accountAddress).do();
-		// amount of account
-		return accountInfo.amount;
+		return await reader.balances(accountAddresses);
 	}
-
-	const a = await status.getAssetHolding(deployer.algodClient, accountAddress, assetID);
-	if (a === undefined) return 0n;
-	return a.amount;
+	const holdings = await reader.assetHoldings(accountAddresses, assetID);
+	const balances = new Map<AccountAddress, number | bigint>();
+	for (const [addr, holding] of holdings) {
+		balances.set(addr, holding === undefined ? 0n : holding.amount);
+	}
+	return balances;
 }
 
 /**
@@ -36,22 +53,7 @@ export async function readAppGlobalState(
 	creator: AccountAddress,
 	appID: number
 ): Promise<Map<Key, StateValue> | undefined> {
-	const accountInfoResponse = await deployer.algodClient.accountInformation(creator).do();
-	for (const app of accountInfoResponse["created-apps"]) {
-		if (app.id === appID) {
-			const globalStateMap = new Map<Key, StateValue>();
-			for (const g of app.params["global-state"]) {
-				const key = Buffer.from(g.key, "base64").toString();
-				if (g.value.type === 1) {
-					globalStateMap.set(key, g.value.bytes);
-				} else {
-					globalStateMap.set(key, g.value.uint);
-				}
-			}
-			return globalStateMap;
-		}
-	}
-	return undefined;
+	return await stateReader(deployer.algodClient).globalState(appID, creator);
 }
 
 /**
@@ -65,22 +67,23 @@ export async function readAppLocalState(
 	account: AccountAddress,
 	appID: number
 ): Promise<Map<Key, StateValue> | undefined> {
-	const accountInfoResponse = await deployer.algodClient.accountInformation(account).do();
-	for (const app of accountInfoResponse["apps-local-state"]) {
-		if (app.id === appID && app["key-value"]) {
-			const localStateMap = new Map<Key, StateValue>();
-			for (const g of app[`key-value`]) {
-				const key = Buffer.from(g.key, "base64").toString();
-				if (g.value.type === 1) {
-					localStateMap.set(key, g.value.bytes);
-				} else {
-					localStateMap.set(key, g.value.uint);
-				}
-			}
-			return localStateMap;
-		}
-	}
-	return undefined;
+	const states = await readAppLocalStates(deployer, [account], appID);
+	return states.get(account);
+}
+
+/**
+ * Reads local states of application of many accounts (fetched concurrently and cached
+ * for the current round).
+ * @param deployer Deployer
+ * @param accounts accounts from which the local state has to be read
+ * @param appID ID of the application
+ */
+export async function readAppLocalStates(
+	deployer: Deployer,
+	accounts: AccountAddress[],
+	appID: number
+): Promise<Map<AccountAddress, Map<Key, StateValue> | undefined>> {
+	return await stateReader(deployer.algodClient).localStates(accounts, appID);
 }
 
 /**
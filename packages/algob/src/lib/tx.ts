@@ -1,15 +1,33 @@
-import { parseASADef, types as rtypes } from "@algo-builder/runtime";
+import { parseASADef, readMsgpackFile, types as rtypes } from "@algo-builder/runtime";
 import {
 	BuilderError,
 	ERRORS,
-	getSuggestedParams,
 	mkTxParams,
 	tx as webTx,
 	types as wtypes,
 } from "@algo-builder/web";
-import algosdk, { decodeSignedTransaction, SuggestedParams, Transaction } from "algosdk";
+import algosdk, {
+	decodeObj,
+	decodeSignedTransaction,
+	SuggestedParams,
+	Transaction,
+} from "algosdk";
+import { once } from "events";
+import fs from "fs";
+import path from "path";
 
-import { Deployer, TxnReceipt } from "../types";
+import {
+	BulkSubmitOptions,
+	BulkSubmitResult,
+	BulkSubmitStatus,
+	BulkSubmitSummary,
+	Deployer,
+	ExecTxGroup,
+	PipelinedExecOptions,
+	TxnReceipt,
+} from "../types";
+import type { AlgoOperator } from "./algo-operator";
+import { cmpStr } from "./comparators";
 import { loadEncodedTxFromFile } from "./files";
 import { registerCheckpoints } from "./script-checkpoints";
 
@@ -207,11 +225,8 @@ async function mkTx(
 		}
 	}
 
-	const suggestedParams = await getSuggestedParams(deployer.algodClient);
-	return webTx.mkTransaction(
-		txn,
-		await mkTxParams(deployer.algodClient, txn.payFlags, Object.assign({}, suggestedParams))
-	);
+	// suggested params are taken from the cache shared by the algod client
+	return webTx.mkTransaction(txn, await mkTxParams(deployer.algodClient, txn.payFlags));
 }
 
 /**
@@ -329,6 +344,106 @@ export async function executeTx(
 	}
 }
 
+const DEFAULT_MAX_IN_FLIGHT = 16;
+
+// transaction group sent to the network, waiting for confirmation
+interface SubmittedGroup {
+	txns: Transaction[];
+	execParams?: wtypes.ExecParams[]; // undefined for SDK transactions
+	txIdxMap: Map<number, [string, wtypes.ASADef]>;
+	confirmation: Promise<TxnReceipt>;
+}
+
+async function submitGroup(
+	deployer: Deployer,
+	algoOp: AlgoOperator,
+	group: ExecTxGroup
+): Promise<SubmittedGroup> {
+	if (group.length === 0) {
+		throw new BuilderError(ERRORS.GENERAL.EXECPARAMS_LENGTH_ERROR);
+	}
+	const txIdxMap = new Map<number, [string, wtypes.ASADef]>();
+	let txns: Transaction[];
+	let signedTxn: Uint8Array | Uint8Array[];
+	let execParams: wtypes.ExecParams[] | undefined;
+	if (wtypes.isSDKTransactionAndSign(group[0])) {
+		signedTxn = signTransactions(group as wtypes.TransactionAndSign[]);
+		txns = (group as wtypes.TransactionAndSign[]).map((txn) => txn.transaction);
+	} else {
+		execParams = group as wtypes.ExecParams[];
+		deployer.assertCPNotDeleted(execParams);
+		[txns, signedTxn] = await makeAndSignTx(deployer, execParams, txIdxMap);
+	}
+	const confirmation = deployer.waitForConfirmation(await algoOp.send(signedTxn));
+	confirmation.catch(() => undefined); // error is thrown when the group is completed
+	return { txns, execParams, txIdxMap, confirmation };
+}
+
+async function completeGroup(deployer: Deployer, group: SubmittedGroup): Promise<TxnReceipt[]> {
+	await group.confirmation;
+	const confirmedTx = await deployer.getReceiptTxns(group.txns);
+	if (group.execParams !== undefined && deployer.isDeployMode) {
+		await registerCheckpoints(deployer, group.execParams, group.txns, group.txIdxMap);
+	}
+	return confirmedTx;
+}
+
+/**
+ * This function should not be used directly.
+ * Pipelined `executeTx`: sends transaction groups in order, without waiting for the
+ * confirmation of previous groups (up to `maxInFlight` groups are waiting at once).
+ * Each group is built and signed just before it's sent, so its validity window starts
+ * when it is sent. Receipts are yielded and checkpoints registered in submission order.
+ * @param deployer Deployer
+ * @param algoOp algo operator used to send transactions
+ * @param groups transaction groups (ExecParams or TransactionAndSign objects)
+ * @param options pipeline options
+ */
+export async function* executeTxPipelined(
+	deployer: Deployer,
+	algoOp: AlgoOperator,
+	groups: Iterable<ExecTxGroup> | AsyncIterable<ExecTxGroup>,
+	options: PipelinedExecOptions = {}
+): AsyncGenerator<TxnReceipt[]> {
+	const maxInFlight = Math.max(1, options.maxInFlight ?? DEFAULT_MAX_IN_FLIGHT);
+	const inFlight: SubmittedGroup[] = [];
+	let failed = false;
+	try {
+		for await (const group of groups) {
+			if (inFlight.length >= maxInFlight) {
+				yield await completeGroup(deployer, inFlight.shift() as SubmittedGroup);
+			}
+			inFlight.push(await submitGroup(deployer, algoOp, group));
+		}
+		while (inFlight.length > 0) {
+			yield await completeGroup(deployer, inFlight.shift() as SubmittedGroup);
+		}
+	} catch (error) {
+		failed = true;
+		throw error;
+	} finally {
+		// groups already sent when an error is thrown or the consumer stops early (`break`,
+		// `return`) are still completed, so checkpoints of the confirmed groups are registered
+		const stopped = failed || inFlight.length > 0;
+		let error: unknown;
+		for (const group of inFlight.splice(0)) {
+			try {
+				await completeGroup(deployer, group);
+			} catch (e) {
+				error ??= e;
+			}
+		}
+		if (stopped && deployer.isDeployMode) {
+			deployer.persistCP();
+		}
+		// an error of a group the consumer didn't wait for is thrown unless another error is
+		// already thrown
+		if (error !== undefined && !failed) {
+			throw error; // eslint-disable-line no-unsafe-finally
+		}
+	}
+}
+
 /**
  * Decode signed txn from file and send to network.
  * probably won't work, because transaction contains fields like
@@ -356,3 +471,177 @@ export async function executeSignedTxnFromFile(
 	console.debug(confirmedTx);
 	return confirmedTx;
 }
+
+type SignedTxn = ReturnType<typeof decodeSignedTransaction>;
+
+// signed transaction group read from a file
+interface SignedGroup {
+	source: string; // <file>#<index of the (first) msgpack object in the file>
+	raw: Uint8Array[]; // encoded signed transactions
+	txns: SignedTxn[];
+	error?: string; // set if the object is not a signed transaction (group)
+}
+
+function isMsgpackArray(obj: Uint8Array): boolean {
+	return (obj[0] & 0xf0) === 0x90 || obj[0] === 0xdc || obj[0] === 0xdd;
+}
+
+/**
+ * Reads signed transaction groups from a directory (files in name order) or a file. Each
+ * msgpack object of a file is either an array of encoded signed transactions (transaction
+ * group, as written by `sign-multisig`) or a signed transaction. Consecutive signed
+ * transactions with the same group ID form a group.
+ */
+async function* readSignedGroups(source: string): AsyncGenerator<SignedGroup> {
+	const files = fs.statSync(source).isDirectory()
+		? fs
+				.readdirSync(source)
+				.sort(cmpStr)
+				.map((f) => path.join(source, f))
+				.filter((f) => fs.statSync(f).isFile())
+		: [source];
+	for (const file of files) {
+		let group: SignedGroup | undefined;
+		let groupID: string | undefined;
+		let index = 0;
+		try {
+			for await (const obj of readMsgpackFile(file)) {
+				const objSource = `${file}#${index++}`;
+				let raw: Uint8Array[];
+				let txns: SignedTxn[];
+				try {
+					raw = isMsgpackArray(obj) ? (decodeObj(obj) as Uint8Array[]) : [obj];
+					txns = raw.map((r) => decodeSignedTransaction(r));
+					if (txns.length === 0) throw new Error("empty transaction group");
+				} catch (e) {
+					if (group !== undefined) yield group;
+					group = undefined;
+					yield { source: objSource, raw: [obj], txns: [], error: errorMessage(e) };
+					continue;
+				}
+				const grp = txns[0].txn.group;
+				const id = grp === undefined ? undefined : Buffer.from(grp).toString("base64");
+				if (raw.length === 1 && group !== undefined && id !== undefined && id === groupID) {
+					group.raw.push(raw[0]);
+					group.txns.push(txns[0]);
+					continue;
+				}
+				if (group !== undefined) yield group;
+				group = { source: objSource, raw, txns };
+				groupID = raw.length === 1 ? id : undefined;
+			}
+		} catch (e) {
+			// invalid msgpack data: rest of the file is skipped
+			if (group !== undefined) yield group;
+			group = undefined;
+			yield { source: `${file}#${index}`, raw: [], txns: [], error: errorMessage(e) };
+		}
+		if (group !== undefined) yield group;
+	}
+}
+
+function errorMessage(e: unknown): string {
+	return e instanceof Error ? e.message : String(e);
+}
+
+// returns the status of a group which can't be confirmed in the round after `lastRound`
+function validityStatus(txns: SignedTxn[], lastRound: number): BulkSubmitStatus | undefined {
+	const next = lastRound + 1;
+	if (txns.some((t) => t.txn.lastRound < next)) return "expired";
+	if (txns.some((t) => t.txn.firstRound > next)) return "not-yet-valid";
+	return undefined;
+}
+
+/**
+ * Sends pre-signed transaction groups from a directory (each file has a signed transaction
+ * or group, eg. outputs of `sign-multisig`) or from a file of concatenated msgpack encoded
+ * signed transactions (consecutive transactions of a group form the group). Files are read
+ * as a stream, and groups are sent in order without waiting for the confirmation of
+ * previous groups (up to `maxInFlight` groups wait for confirmation at once). Groups whose
+ * validity window doesn't include the next round are not sent. Results are written to the
+ * manifest (JSON Lines) in the order of groups.
+ * @param deployer Deployer
+ * @param source path of a directory or a file with signed transactions
+ * @param options bulk submission options
+ * @returns number of groups by status
+ */
+export async function executeSignedTxnsFromSource(
+	deployer: Deployer,
+	source: string,
+	options: BulkSubmitOptions = {}
+): Promise<BulkSubmitSummary> {
+	const maxInFlight = Math.max(1, options.maxInFlight ?? DEFAULT_MAX_IN_FLIGHT);
+	const summary: BulkSubmitSummary = {
+		confirmed: 0,
+		expired: 0,
+		"not-yet-valid": 0,
+		failed: 0,
+	};
+	const algod = deployer.algodClient;
+	const currentRound = async (): Promise<number> =>
+		Number((await algod.status().do())["last-round"]);
+	let lastRound = await currentRound();
+	const inFlight: Array<Promise<BulkSubmitResult>> = [];
+	const manifest =
+		options.manifest === undefined ? undefined : fs.createWriteStream(options.manifest);
+	const complete = async (): Promise<void> => {
+		const result = await (inFlight.shift() as Promise<BulkSubmitResult>);
+		summary[result.status]++;
+		if (manifest !== undefined && !manifest.write(JSON.stringify(result) + "\n")) {
+			await once(manifest, "drain");
+		}
+	};
+
+	try {
+		for await (const group of readSignedGroups(source)) {
+			if (inFlight.length >= maxInFlight) {
+				await complete();
+			}
+			const result: BulkSubmitResult = {
+				source: group.source,
+				txIDs: group.txns.map((t) => t.txn.txID()),
+				status: "failed",
+			};
+			if (group.error !== undefined) {
+				inFlight.push(Promise.resolve({ ...result, error: group.error }));
+				continue;
+			}
+			let status = validityStatus(group.txns, lastRound);
+			if (status !== undefined) {
+				lastRound = await currentRound(); // known round may be stale
+				status = validityStatus(group.txns, lastRound);
+			}
+			if (status !== undefined) {
+				inFlight.push(Promise.resolve({ ...result, status }));
+				continue;
+			}
+
+			let txID: string;
+			try {
+				txID = (await algod.sendRawTransaction(group.raw).do()).txId;
+			} catch (e) {
+				inFlight.push(Promise.resolve({ ...result, error: errorMessage(e) }));
+				continue;
+			}
+			inFlight.push(
+				deployer.waitForConfirmation(txID).then(
+					(receipt): BulkSubmitResult => {
+						const confirmedRound = Number(receipt["confirmed-round"]);
+						lastRound = Math.max(lastRound, confirmedRound);
+						return { ...result, status: "confirmed", confirmedRound };
+					},
+					(e): BulkSubmitResult => ({ ...result, error: errorMessage(e) })
+				)
+			);
+		}
+		while (inFlight.length > 0) {
+			await complete();
+		}
+	} finally {
+		if (manifest !== undefined) {
+			manifest.end();
+			await once(manifest, "finish");
+		}
+	}
+	return summary;
+}
@@ -57,6 +57,17 @@ export interface HttpNetworkConfig extends CommonNetworkConfig {
 	port: string | number;
 	token: string | AlgodTokenHeader | CustomTokenHeader;
 	httpHeaders?: { [name: string]: string };
+	// validity of cached suggested transaction params (default: not cached)
+	txParamsCache?: wtypes.SuggestedParamsCacheOptions;
+	// when provided, algod, indexer and KMD clients reuse connections (see TransportCfg)
+	transport?: TransportCfg;
+}
+
+export interface TransportCfg {
+	keepAlive?: boolean; // reuse sockets between requests (default: true)
+	maxSockets?: number; // max number of sockets per host (default: unlimited)
+	timeout?: number; // request timeout in ms
+	http2?: boolean; // multiplex requests over a single HTTP/2 connection (default: false)
 }
 
 export type NetworkConfig = ChainCfg | HttpNetworkConfig;
@@ -76,6 +87,8 @@ export interface KmdCfg {
 	port: string | number;
 	token: string | KMDTokenHeader | CustomTokenHeader;
 	wallets: KmdWallet[];
+	// time (ms) for which accounts loaded from KMD are reused in the process (default 60s)
+	cacheTTL?: number;
 }
 
 export interface IndexerCfg {
@@ -134,6 +147,22 @@ export interface Config {
 	networks?: Networks;
 	paths?: UserPaths;
 	mocha?: Mocha.MochaOptions;
+	// "yaml" (default): one YAML file per script, "log": append-only log per network
+	checkpointStore?: "yaml" | "log";
+	txLog?: TxLogCfg;
+	// cache config validation and KMD accounts in artifacts/cache/config.json
+	configCache?: boolean;
+}
+
+/**
+ * Transaction log written by scripts (artifacts/<script>.<timestamp>.log).
+ * Records are buffered and flushed when the buffer exceeds `flushSize` bytes
+ * (default 64KB) or after `flushInterval` ms (default 1000).
+ */
+export interface TxLogCfg {
+	format?: "yaml" | "jsonl" | "msgpack";
+	flushSize?: number;
+	flushInterval?: number;
 }
 
 export interface TaskTestConfig extends Config {
@@ -371,10 +400,38 @@ export interface CheckpointRepo {
 	registerSSC: (networkName: string, name: string, info: rtypes.AppInfo) => CheckpointRepo;
 	registerLsig: (networkName: string, name: string, info: LsigInfo) => CheckpointRepo;
 
+	/**
+	 * Returns name of the ASA with the given asset index (from preceding checkpoints).
+	 * Lookups use a reverse index maintained by `registerASA` and `merge`. */
+	getASANameFromIndex: (networkName: string, assetIndex: number) => string | undefined;
+	/**
+	 * Returns name of the app whose latest version has the given application index. */
+	getAppNameFromIndex: (networkName: string, appID: number) => string | undefined;
+	/**
+	 * Returns latest version of the app (from preceding checkpoints). */
+	getLatestAppInfo: (networkName: string, name: string) => rtypes.AppInfo | undefined;
+
 	isDefined: (networkName: string, name: string) => boolean;
 	networkExistsInCurrentCP: (networkName: string) => boolean;
 }
 
+/**
+ * Storage of script checkpoints (see `checkpointStore` in the algob config). */
+export interface CheckpointStore {
+	/**
+	 * Loads checkpoints of all scripts. */
+	loadAll: () => CheckpointRepo;
+	/**
+	 * Loads checkpoints of a script. */
+	load: (scriptName: string) => Checkpoints;
+	/**
+	 * Persists checkpoints of a script (after it runs or fails). */
+	persist: (scriptName: string, checkpoints: Checkpoints) => void;
+	/**
+	 * Removes checkpoints of the scripts (eg. `algob deploy --force`). */
+	clear: (scriptNames: string[]) => void;
+}
+
 export interface Checkpoints {
 	[network: string]: Checkpoint;
 }
@@ -662,6 +719,44 @@ export interface Deployer {
 		flags: rtypes.AppOptionalFlags
 	) => Promise<void>;
 
+	/**
+	 * Opt-In to ASA for many accounts at once. Balances are checked concurrently, opt-ins
+	 * are packed in atomic groups (of up to 16 transactions) and the groups are sent without
+	 * waiting for the confirmation of previous groups. When the node rejects a group, its
+	 * opt-ins are sent again as single transactions.
+	 * @param asa ASA (name/ID) Note: ID can be used for assets not existing in checkpoints.
+	 * @param accountNames names of the accounts (signed by account secret key)
+	 * @param flags Transaction flags
+	 * @param options group size and number of groups waiting for confirmation
+	 * @returns result of each opt-in (receipt or error), in the order of `accountNames`
+	 */
+	optInAccountsToASA: (
+		asa: string,
+		accountNames: string[],
+		flags: wtypes.TxParams,
+		options?: BulkOptInOptions
+	) => Promise<BulkOptInResult[]>;
+
+	/**
+	 * Opt-In to stateful smart contract (SSC) for many accounts at once. Opt-ins are packed
+	 * in atomic groups (of up to 16 transactions) and the groups are sent without waiting
+	 * for the confirmation of previous groups. When the node rejects a group, its opt-ins
+	 * are sent again as single transactions.
+	 * @param signers accounts (signed by secret key) or contract accounts (signed by lsig)
+	 * @param appID application index
+	 * @param payFlags Transaction flags
+	 * @param flags Optional parameters to SSC (accounts, args..)
+	 * @param options group size and number of groups waiting for confirmation
+	 * @returns result of each opt-in (receipt or error), in the order of `signers`
+	 */
+	optInAccountsToApp: (
+		signers: OptInSigner[],
+		appID: number,
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options?: BulkOptInOptions
+	) => Promise<BulkOptInResult[]>;
+
 	/**
 	 * Create an entry in a script log (stored in artifacts/scripts/<script_name>.log) file. */
 	log: (msg: string, obj: any) => void;
@@ -732,8 +827,63 @@ export interface Deployer {
 	executeTx: (
 		transactions: wtypes.ExecParams[] | wtypes.TransactionAndSign[]
 	) => Promise<TxnReceipt[]>;
+
+	/**
+	 * Executes many independent transaction groups without waiting for each group to be
+	 * confirmed before sending the next one. Groups are built, signed and sent in order
+	 * (so their validity windows start when they are sent) and up to `maxInFlight` groups
+	 * wait for confirmation at the same time. Receipts are yielded, and checkpoints
+	 * registered, in submission order.
+	 * @param groups transaction groups (`ExecParams` or `TransactionAndSign` objects)
+	 * @param options pipeline options
+	 */
+	executeTxPipelined: (
+		groups: Iterable<ExecTxGroup> | AsyncIterable<ExecTxGroup>,
+		options?: PipelinedExecOptions
+	) => AsyncGenerator<TxnReceipt[]>;
+}
+
+export type ExecTxGroup = wtypes.ExecParams[] | wtypes.TransactionAndSign[];
+
+export interface PipelinedExecOptions {
+	maxInFlight?: number; // maximum number of groups waiting for confirmation (default: 16)
+}
+
+export interface BulkSubmitOptions {
+	maxInFlight?: number; // maximum number of groups waiting for confirmation (default: 16)
+	manifest?: string; // path of the results manifest (JSON Lines), not written if undefined
+}
+
+// "expired" and "not-yet-valid" groups are not sent (validity window doesn't include the
+// next round), "failed" groups are rejected by the node or not confirmed
+export type BulkSubmitStatus = "confirmed" | "expired" | "not-yet-valid" | "failed";
+
+export interface BulkSubmitResult {
+	source: string; // <file>#<index of the msgpack object in the file>
+	txIDs: string[];
+	status: BulkSubmitStatus;
+	confirmedRound?: number;
+	error?: string;
+}
+
+export type BulkSubmitSummary = Record<BulkSubmitStatus, number>;
+
+export interface BulkOptInOptions {
+	groupSize?: number; // number of opt-ins packed in one atomic group (default and max: 16)
+	maxInFlight?: number; // maximum number of groups waiting for confirmation (default: 16)
+}
+
+// result of one opt-in of a bulk opt-in: receipt of the confirmed transaction or error
+export interface BulkOptInResult {
+	name: string; // account name (address of a contract account)
+	address: string;
+	receipt?: TxnReceipt;
+	error?: Error;
 }
 
+// account (signed by secret key) or contract account (signed by logic signature)
+export type OptInSigner = rtypes.Account | LogicSigAccount;
+
 // ************************
 //     Asset types
 
@@ -784,6 +934,47 @@ export interface DebuggerContext {
 	mode?: rtypes.ExecutionMode;
 }
 
+// TEAL (or PyTEAL) files of a deployed app, used by the local dryrun
+export interface DryrunAppPrograms {
+	approvalProgramFilename: string;
+	clearProgramFilename: string;
+	scTmplParams?: SCParams;
+}
+
+export interface LocalDryrunOptions {
+	// dryrun request dump (.json or .msgp, eg. written by Tealdbg) used instead of the node
+	snapshot?: string;
+	// programs of apps (by app index), by default sources are looked up in the compile cache
+	programs?: Map<number, DryrunAppPrograms>;
+	// print stack of every executed opcode (stack depth)
+	debugStack?: number;
+}
+
+export interface DryrunStackValue {
+	type: number; // 1: bytes, 2: uint
+	bytes: string; // base64
+	uint: number | bigint;
+}
+
+export interface LocalDryrunTxnResult {
+	"app-call-messages"?: string[];
+	"app-call-trace"?: Array<{
+		line: number;
+		opcode: string;
+		cost: number;
+		stack: DryrunStackValue[]; // bottom element first
+	}>;
+	cost?: number;
+	logs?: string[]; // base64
+}
+
+// response in the format of the `/v2/teal/dryrun` endpoint
+export interface LocalDryrunResponse {
+	txns: LocalDryrunTxnResult[];
+	error: string;
+	"protocol-version": string;
+}
+
 // TODO: Remove when this is resolved https://discord.com/channels/491256308461207573/631209194967531559/869677444242739220
 export interface ConfirmedTxInfo {
 	"confirmed-round": number;
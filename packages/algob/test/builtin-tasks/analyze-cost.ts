@@ -0,0 +1,30 @@
+import { assert } from "chai";
+
+import { parseLoopBounds } from "../../src/builtin-tasks/analyze-cost";
+import { TASK_ANALYZE_COST } from "../../src/builtin-tasks/task-names";
+import { useEnvironment } from "../helpers/environment";
+import { useFixtureProject } from "../helpers/project";
+
+describe("Analyze-cost task", function () {
+	useFixtureProject("config-project");
+	useEnvironment();
+
+	it("should report the cost of a TEAL file", async function () {
+		const reports = await this.env.run(TASK_ANALYZE_COST, {
+			files: ["asc-fee-check.teal"],
+			signature: true,
+		});
+		const report = reports["asc-fee-check.teal"];
+		assert.equal(report.tealVersion, 1);
+		assert.equal(report.budget, 20000);
+		assert.equal(report.maxCost, 4);
+		assert.isFalse(report.exceedsBudget);
+	});
+
+	it("should parse loop bounds", function () {
+		assert.deepEqual(parseLoopBounds(undefined), {});
+		assert.deepEqual(parseLoopBounds("loop=10, inner=4"), { loop: 10, inner: 4 });
+		assert.throws(() => parseLoopBounds("loop"), /invalid loop bound "loop"/);
+		assert.throws(() => parseLoopBounds("loop=x"), /invalid loop bound/);
+	});
+});
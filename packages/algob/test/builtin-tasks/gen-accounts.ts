@@ -1,12 +1,23 @@
-import { Account } from "algosdk";
+import { ERRORS } from "@algo-builder/web";
+import algosdk, { Account, decodeSignedTransaction, SignedTransaction } from "algosdk";
 import { assert } from "chai";
 import * as fs from "fs";
+import { SinonStub, stub } from "sinon";
 import YAML from "yaml";
 
-import { genAccounts, getFilename, mkAccounts } from "../../src/builtin-tasks/gen-accounts";
+import {
+	genAccountsStream,
+	getFilename,
+	mkAccounts,
+} from "../../src/builtin-tasks/gen-accounts";
 import { ASSETS_DIR } from "../../src/internal/core/project-structure";
+import { genAccounts } from "../../src/lib/account";
+import { AlgoOperatorImpl } from "../../src/lib/algo-operator";
+import { HttpNetworkConfig } from "../../src/types";
+import { expectBuilderErrorAsync } from "../helpers/errors";
 import { mkEnv } from "../helpers/params";
 import { useFixtureProjectCopy } from "../helpers/project";
+import { mockSuggestedParam } from "../mocks/tx";
 
 describe("Gen-accounts task", function () {
 	useFixtureProjectCopy("default-config-project");
@@ -22,6 +33,20 @@ describe("Gen-accounts task", function () {
 		}
 	});
 
+	it("genAccountsStream should generate accounts in workers in order", async function () {
+		const n = 25;
+		const names: string[] = [];
+		for await (const chunk of genAccountsStream(n, 3, 4)) {
+			assert.isAtMost(chunk.length, 4);
+			for (const a of chunk) {
+				assert.lengthOf(a.addr, 58);
+				assert.lengthOf(a.mnemonic.split(" "), 25);
+				names.push(a.name);
+			}
+		}
+		assert.deepEqual(names, Array.from({ length: n }, (_, i) => `gen_${i}`));
+	});
+
 	describe("accounts_generated.yaml flow", function () {
 		it("Should fail when n is negative or 0", async function () {
 			try {
@@ -69,4 +94,68 @@ describe("Gen-accounts task", function () {
 			assert.notDeepEqual(accounts2, accounts);
 		});
 	});
+
+	it("should write accounts as JSON Lines", async function () {
+		const n = 3;
+		await mkAccounts({ n, format: "jsonl" }, mkEnv());
+
+		const lines = fs.readFileSync(getFilename("jsonl"), "utf8").trimEnd().split("\n");
+		assert.lengthOf(lines, n);
+		assert.deepEqual(lines.map((l) => JSON.parse(l).name), ["gen_0", "gen_1", "gen_2"]);
+	});
+
+	describe("Funding", function () {
+		const funder = { ...algosdk.generateAccount(), name: "funder" };
+		let groups: SignedTransaction[][];
+
+		beforeEach(function () {
+			groups = [];
+			stub(algosdk.Algodv2.prototype, "getTransactionParams").returns({
+				do: async () => mockSuggestedParam,
+			} as any);
+			stub(AlgoOperatorImpl.prototype, "send").callsFake(async (rawTxns) => {
+				groups.push((rawTxns as Uint8Array[]).map((t) => decodeSignedTransaction(t)));
+				return `tx-${groups.length}`;
+			});
+			stub(AlgoOperatorImpl.prototype, "waitForConfirmation").resolves({} as any);
+		});
+
+		afterEach(function () {
+			(algosdk.Algodv2.prototype.getTransactionParams as SinonStub).restore();
+			(AlgoOperatorImpl.prototype.send as SinonStub).restore();
+			(AlgoOperatorImpl.prototype.waitForConfirmation as SinonStub).restore();
+		});
+
+		it("should fund generated accounts in groups of 16", async function () {
+			const env = mkEnv();
+			const config = env.network.config as HttpNetworkConfig;
+			config.host = "http://localhost"; // algod requests are stubbed
+			config.accounts.push(funder);
+			const args = { n: 20, format: "jsonl", force: true, fund: 1000, funder: "funder" };
+			await mkAccounts(args, env);
+
+			const addrs = fs
+				.readFileSync(getFilename("jsonl"), "utf8")
+				.trimEnd()
+				.split("\n")
+				.map((l) => JSON.parse(l).addr);
+			assert.deepEqual(groups.map((g) => g.length), [16, 4]);
+			const txns = groups.flat().map((s) => s.txn);
+			assert.deepEqual(txns.map((t) => algosdk.encodeAddress(t.to.publicKey)), addrs);
+			for (const t of txns) {
+				assert.equal(algosdk.encodeAddress(t.from.publicKey), funder.addr);
+				assert.equal(t.amount, 1000);
+			}
+			assert.isDefined(groups[0][0].txn.group);
+		});
+
+		it("should fail when --fund is set without --funder", async function () {
+			await expectBuilderErrorAsync(
+				async () => await mkAccounts({ n: 2, fund: 1000 }, mkEnv()),
+				ERRORS.ARGUMENTS.MISSING_TASK_ARGUMENT,
+				"funder"
+			);
+			assert.lengthOf(groups, 0);
+		});
+	});
 });
@@ -251,4 +251,56 @@ describe("Sign-Multisig task", function () {
 		assert.isDefined(bobSubsig?.pk);
 		assert.isDefined(bobSubsig?.s); // bob "signature" should be present
 	});
+
+	describe("batch mode", function () {
+		const outFiles = ["multisig-signed_out.txn", "multisig-group_out.tx"].map((f) =>
+			path.join(ASSETS_DIR, f)
+		);
+
+		afterEach(function () {
+			for (const f of outFiles) {
+				if (fs.existsSync(f)) fs.rmSync(f);
+			}
+		});
+
+		const hasBobSignature = (encodedTx: Uint8Array): boolean =>
+			decodeSignedTransaction(encodedTx).msig?.subsig.some(
+				(s) => compareArray(s.pk, bobPk) && s.s !== undefined
+			) ?? false;
+
+		for (const workers of [1, 2]) {
+			it(`Should sign all transactions of bob in matching files (workers: ${workers})`, async function () {
+				await this.env.run(TASK_SIGN_MULTISIG, {
+					batch: "multisig-*",
+					account: bobAcc.name,
+					workers,
+				});
+
+				const [signedOut, groupOut] = outFiles.map((f) => fs.readFileSync(f));
+				assert.isTrue(hasBobSignature(signedOut));
+				const group = decodeObj(groupOut) as Uint8Array[];
+				assert.isTrue(hasBobSignature(group[2]));
+				// unsigned transaction is skipped (multisig metadata is not passed)
+				assert.isFalse(fs.existsSync(path.join(ASSETS_DIR, "multisig-unsigned_out.txn")));
+			});
+		}
+
+		it("Should not overwrite output files without --force flag", async function () {
+			fs.writeFileSync(outFiles[0], "old");
+			await this.env.run(TASK_SIGN_MULTISIG, {
+				batch: "multisig-signed.txn",
+				account: bobAcc.name,
+				workers: 1,
+			});
+			assert.equal(fs.readFileSync(outFiles[0], "utf8"), "old");
+
+			await this.env.run(TASK_SIGN_MULTISIG, {
+				batch: "multisig-signed.txn",
+				account: bobAcc.name,
+				workers: 1,
+				force: true,
+			});
+			assert.isTrue(hasBobSignature(fs.readFileSync(outFiles[0])));
+		});
+	});
 });
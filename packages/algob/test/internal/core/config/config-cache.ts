@@ -0,0 +1,118 @@
+import { types as rtypes } from "@algo-builder/runtime";
+import { generateAccount, Kmd } from "algosdk";
+import { assert } from "chai";
+import * as fs from "fs";
+import path from "path";
+import { stub } from "sinon";
+
+import {
+	CachedKMDOperator,
+	ConfigCache,
+	walletKeysHash,
+} from "../../../../src/internal/core/config/config-cache";
+import { KMDOperator } from "../../../../src/lib/account";
+import { KmdCfg } from "../../../../src/types";
+import { useTmpDir } from "../../../helpers/fs";
+
+const kmdCfg: KmdCfg = {
+	host: "127.0.0.1",
+	port: 7833,
+	token: "kmd-token",
+	wallets: [{ name: "unencrypted-default-wallet", password: "secret", accounts: [] }],
+};
+
+describe("Config cache", function () {
+	useTmpDir("config-cache");
+	let cacheFile: string;
+	let account: rtypes.Account;
+
+	beforeEach(function () {
+		cacheFile = path.join(this.tmpDir, "cache", "config.json");
+		const acc = generateAccount();
+		account = { name: "alice", addr: acc.addr, sk: acc.sk };
+	});
+
+	it("Should change the config key when the config changes", function () {
+		const configPath = path.join(this.tmpDir, "algob.config.js");
+		fs.writeFileSync(configPath, "module.exports = {}");
+		const key = ConfigCache.key(configPath, { networks: {} }, "1.0.0");
+
+		assert.equal(ConfigCache.key(configPath, { networks: {} }, "1.0.0"), key);
+		assert.notEqual(ConfigCache.key(configPath, { configCache: true }, "1.0.0"), key);
+		assert.notEqual(ConfigCache.key(configPath, { networks: {} }, "1.0.1"), key);
+		fs.writeFileSync(configPath, "module.exports = { networks: {} }");
+		assert.notEqual(ConfigCache.key(configPath, { networks: {} }, "1.0.0"), key);
+	});
+
+	it("Should persist validated config key", function () {
+		new ConfigCache(cacheFile).setValidated("key1");
+
+		const cache = new ConfigCache(cacheFile);
+		assert.isTrue(cache.isValidated("key1"));
+		assert.isFalse(cache.isValidated("key2"));
+	});
+
+	it("Should store KMD accounts encrypted", function () {
+		new ConfigCache(cacheFile).setKMDAccounts("key1", "net", kmdCfg, "keys", [account]);
+
+		const content = fs.readFileSync(cacheFile, "utf8");
+		assert.notInclude(content, account.addr);
+		assert.notInclude(content, Buffer.from(account.sk).toString("base64"));
+
+		const cache = new ConfigCache(cacheFile);
+		assert.deepEqual(cache.getKMDAccounts("key1", "net", kmdCfg, "keys"), [account]);
+		assert.isUndefined(cache.getKMDAccounts("key2", "net", kmdCfg, "keys"));
+		assert.isUndefined(cache.getKMDAccounts("key1", "other-net", kmdCfg, "keys"));
+		assert.isUndefined(cache.getKMDAccounts("key1", "net", kmdCfg, "other-keys"));
+		const changedPassword = {
+			...kmdCfg,
+			wallets: [{ ...kmdCfg.wallets[0], password: "other" }],
+		};
+		assert.isUndefined(cache.getKMDAccounts("key1", "net", changedPassword, "keys"));
+	});
+
+	it("Should export KMD accounts only once", async function () {
+		const exportStub = stub(KMDOperator.prototype, "loadKMDAccounts").resolves([account]);
+		const listStub = stub(KMDOperator.prototype, "listKMDKeys").resolves({
+			"unencrypted-default-wallet": [account.addr],
+		});
+		const mkOperator = (): CachedKMDOperator =>
+			new CachedKMDOperator({} as Kmd, new ConfigCache(cacheFile), "key1", "net");
+		try {
+			assert.deepEqual(await mkOperator().loadKMDAccounts(kmdCfg), [account]);
+			assert.deepEqual(await mkOperator().loadKMDAccounts(kmdCfg), [account]);
+		} finally {
+			exportStub.restore();
+			listStub.restore();
+		}
+		assert.equal(exportStub.callCount, 1);
+	});
+
+	it("Should export KMD accounts again when wallet keys change", async function () {
+		const exportStub = stub(KMDOperator.prototype, "loadKMDAccounts").resolves([account]);
+		const keys = ["ADDR1"];
+		const listStub = stub(KMDOperator.prototype, "listKMDKeys").callsFake(async () => ({
+			"unencrypted-default-wallet": [...keys],
+		}));
+		const mkOperator = (): CachedKMDOperator =>
+			new CachedKMDOperator({} as Kmd, new ConfigCache(cacheFile), "key1", "net");
+		try {
+			await mkOperator().loadKMDAccounts(kmdCfg);
+			keys.push("ADDR2");
+			await mkOperator().loadKMDAccounts(kmdCfg);
+			await mkOperator().loadKMDAccounts(kmdCfg);
+		} finally {
+			exportStub.restore();
+			listStub.restore();
+		}
+		assert.equal(exportStub.callCount, 2);
+	});
+
+	it("Should hash wallet keys independently of their order", function () {
+		assert.equal(
+			walletKeysHash({ w1: ["A", "B"], w2: [] }),
+			walletKeysHash({ w2: [], w1: ["B", "A"] })
+		);
+		assert.notEqual(walletKeysHash({ w1: ["A"] }), walletKeysHash({ w1: ["A", "B"] }));
+	});
+});
@@ -10,6 +10,7 @@ import {
 	TASK_CONSOLE,
 	TASK_HELP,
 	TASK_INIT,
+	TASK_NODE_INFO,
 	TASK_RUN,
 	TASK_TEST,
 } from "../../../../src/builtin-tasks/task-names";
@@ -137,6 +138,19 @@ describe("config loading", function () {
 		it("Should load custom tasks", function () {
 			assert.containsAllKeys(this.env.tasks, ["example"]);
 		});
+
+		it("Should not load task implementations when tasks are registered", async function () {
+			const nodeInfoPath = require.resolve("../../../../src/builtin-tasks/node-info");
+			delete require.cache[nodeInfoPath]; // eslint-disable-line @typescript-eslint/no-dynamic-delete
+
+			resetBuilderContext();
+			BuilderContext.createBuilderContext();
+			await loadConfigAndTasks();
+
+			const taskDefinitions = BuilderContext.getBuilderContext().tasksDSL.getTaskDefinitions();
+			assert.containsAllKeys(taskDefinitions, [TASK_NODE_INFO]);
+			assert.notProperty(require.cache, nodeInfoPath);
+		});
 	});
 
 	describe("Config env", function () {
@@ -4,9 +4,9 @@ import { AlgoTransferParam, SignType, TransactionType } from "@algo-builder/web/
 import algosdk, { generateAccount, LogicSigAccount, Transaction } from "algosdk";
 import { assert } from "chai";
 
-import { genAccounts } from "../../src/builtin-tasks/gen-accounts";
 import { DeployerDeployMode } from "../../src/internal/deployer";
 import { DeployerConfig } from "../../src/internal/deployer_cfg";
+import { genAccounts } from "../../src/lib/account";
 import { getDummyLsig } from "../../src/lib/lsig";
 import { CheckpointRepoImpl } from "../../src/lib/script-checkpoints";
 import { Checkpoints, LsigInfo } from "../../src/types";
@@ -1,6 +1,10 @@
 import { assert } from "chai";
+import fs from "fs";
+import path from "path";
+import YAML from "yaml";
 
 import { TxWriterImpl } from "../../src/internal/tx-log-writer";
+import { useTmpDir } from "../helpers/fs";
 
 class TxWriterMock extends TxWriterImpl {
 	writtenContent = [] as any;
@@ -29,3 +33,76 @@ describe("Log Writer", function () {
 		]);
 	});
 });
+
+describe("Buffered log writer", function () {
+	useTmpDir("tx-log-writer");
+	let cwd: string;
+
+	beforeEach(function () {
+		cwd = process.cwd();
+		process.chdir(this.tmpDir);
+	});
+
+	afterEach(function () {
+		process.chdir(cwd);
+	});
+
+	function readLogs(): Map<string, string> {
+		const files = new Map<string, string>();
+		for (const f of fs.readdirSync("artifacts")) {
+			files.set(f, fs.readFileSync(path.join("artifacts", f), "utf8"));
+		}
+		return files;
+	}
+
+	it("Should write records of a script run to one file", async function () {
+		const writer = new TxWriterImpl("", { format: "jsonl" });
+		writer.setScriptName("sc-1.js");
+		writer.push("tx-1", { txID: "a", round: 1n });
+		writer.push("tx-2", { txID: "b", logs: [new Uint8Array([1, 2])] });
+		assert.isFalse(fs.existsSync("artifacts"));
+
+		await writer.close();
+		const logs = readLogs();
+		assert.equal(logs.size, 1);
+		const [name, content] = [...logs][0];
+		assert.match(name, /^sc-1\.js\.\d+\.jsonl$/);
+		const records = content
+			.trim()
+			.split("\n")
+			.map((l) => JSON.parse(l));
+		assert.deepEqual(
+			records.map((r) => [r.msg, r.data]),
+			[
+				["tx-1", { txID: "a", round: "1" }],
+				["tx-2", { txID: "b", logs: ["AQI="] }],
+			]
+		);
+	});
+
+	it("Should flush when buffer exceeds flush size", async function () {
+		const writer = new TxWriterImpl("sc-1.js", { flushSize: 1 });
+		writer.push("tx-1", { txID: "a" });
+		writer.push("tx-2", { txID: "b" });
+		await writer.flush();
+
+		const content = [...readLogs().values()][0];
+		assert.deepEqual(YAML.parseAllDocuments(content).map((d) => d.toJSON()), [
+			{ "tx-1": { txID: "a" } },
+			{ "tx-2": { txID: "b" } },
+		]);
+		await writer.close();
+	});
+
+	it("Should write records of each script to its own file", async function () {
+		const writer = new TxWriterImpl("", { format: "jsonl" });
+		writer.setScriptName("sc-1.js");
+		writer.push("tx-1", {});
+		writer.setScriptName("sc-2.js");
+		writer.push("tx-2", {});
+		await writer.close();
+
+		const names = [...readLogs().keys()].map((n) => n.split(".")[0]).sort();
+		assert.deepEqual(names, ["sc-1", "sc-2"]);
+	});
+});
@@ -1,6 +1,6 @@
 import { assert } from "chai";
 
-import { partitionByFn } from "../../../src/internal/util/lists";
+import { chunk, mapConcurrent, partitionByFn } from "../../../src/internal/util/lists";
 import { cmpStr } from "../../../src/lib/comparators";
 
 describe("partitionByFn", function () {
@@ -38,3 +38,38 @@ describe("partitionByFn", function () {
 		assert.deepEqual(output, [["1", "1", "2", "3"], ["2"]]);
 	});
 });
+
+describe("chunk", function () {
+	it("Should split list into chunks of given size", function () {
+		assert.deepEqual(chunk([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]]);
+		assert.deepEqual(chunk([1, 2], 16), [[1, 2]]);
+		assert.deepEqual(chunk([], 16), []);
+	});
+});
+
+describe("mapConcurrent", function () {
+	it("Should keep order of results and limit pending calls", async function () {
+		let pending = 0;
+		let maxPending = 0;
+		const output = await mapConcurrent([30, 10, 20, 0, 5], 2, async (ms, i) => {
+			maxPending = Math.max(maxPending, ++pending);
+			await new Promise((resolve) => setTimeout(resolve, ms));
+			pending--;
+			return i;
+		});
+		assert.deepEqual(output, [0, 1, 2, 3, 4]);
+		assert.equal(maxPending, 2);
+	});
+
+	it("Should reject when a call fails", async function () {
+		try {
+			await mapConcurrent([1, 2, 3], 2, async (t) => {
+				if (t === 2) throw new Error("failed");
+				return t;
+			});
+			assert.fail("expected an error");
+		} catch (error) {
+			assert.equal((error as Error).message, "failed");
+		}
+	});
+});
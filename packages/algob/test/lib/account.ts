@@ -1,9 +1,11 @@
 import { types as rtypes } from "@algo-builder/runtime";
-import { generateAccount, mnemonicToSecretKey, secretKeyToMnemonic } from "algosdk";
+import { ERRORS } from "@algo-builder/web";
+import { generateAccount, Kmd, mnemonicToSecretKey, secretKeyToMnemonic } from "algosdk";
 import { assert } from "chai";
 
-import { loadAccountsFromEnv, mkAccounts } from "../../src/lib/account";
-import { AccountDef } from "../../src/types";
+import { KMDOperator, loadAccountsFromEnv, mkAccounts } from "../../src/lib/account";
+import { AccountDef, KmdCfg } from "../../src/types";
+import { expectBuilderErrorAsync } from "../helpers/errors";
 
 describe("Loading accounts", function () {
 	const genAccount = generateAccount();
@@ -132,3 +134,127 @@ describe("Loading accounts", function () {
 		assert.throws(() => loadAccountsFromEnv(), errmsg);
 	});
 });
+
+describe("KMD operator", function () {
+	const accounts = Array.from({ length: 20 }, (_, i) => {
+		const acc = generateAccount();
+		return { name: `kmd-${i}`, addr: acc.addr, sk: acc.sk };
+	});
+	let exports: number;
+	let inFlight: number;
+	let maxInFlight: number;
+	let handles: number;
+
+	// fake KMD with two wallets of 10 keys each
+	const fakeKmd = {
+		listWallets: async () => ({
+			wallets: [
+				{ name: "w0", id: "id0" },
+				{ name: "w1", id: "id1" },
+			],
+		}),
+		initWalletHandle: async (id: string) => {
+			handles++;
+			return { wallet_handle_token: `${id}-token` };
+		},
+		releaseWalletHandle: async () => ({}),
+		listKeys: async (token: string) => {
+			const w = token.startsWith("id0") ? 0 : 1;
+			return { addresses: accounts.slice(w * 10, w * 10 + 10).map((a) => a.addr) };
+		},
+		exportKey: async (_token: string, _password: string, addr: string) => {
+			exports++;
+			inFlight++;
+			maxInFlight = Math.max(maxInFlight, inFlight);
+			await new Promise((resolve) => setTimeout(resolve, 1));
+			inFlight--;
+			return { private_key: accounts.find((a) => a.addr === addr)?.sk };
+		},
+	} as unknown as Kmd; // eslint-disable-line @typescript-eslint/consistent-type-assertions
+
+	let port = 7000; // unique KMD config per test (accounts are cached by config)
+	function mkKmdCfg(cacheTTL?: number): KmdCfg {
+		return {
+			host: "127.0.0.1",
+			port: port++,
+			token: "kmd-token",
+			cacheTTL,
+			wallets: [0, 1].map((w) => ({
+				name: `w${w}`,
+				password: "",
+				// the last key of each wallet is not listed in the config
+				accounts: accounts
+					.slice(w * 10, w * 10 + 9)
+					.map((a) => ({ name: a.name, address: a.addr })),
+			})),
+		};
+	}
+
+	beforeEach(function () {
+		exports = 0;
+		inFlight = 0;
+		maxInFlight = 0;
+		handles = 0;
+	});
+
+	it("Should export keys concurrently with one handle per wallet", async function () {
+		const loaded = await new KMDOperator(fakeKmd).loadKMDAccounts(mkKmdCfg());
+
+		const expected = [...accounts.slice(0, 9), ...accounts.slice(10, 19)];
+		assert.deepEqual(loaded, expected);
+		assert.equal(exports, 18);
+		assert.equal(handles, 2);
+		assert.isAbove(maxInFlight, 1);
+		assert.isAtMost(maxInFlight, 8);
+	});
+
+	it("Should reuse exported keys until the cache TTL expires", async function () {
+		const kcfg = mkKmdCfg(50);
+		await new KMDOperator(fakeKmd).loadKMDAccounts(kcfg);
+		await new KMDOperator(fakeKmd).loadKMDAccounts(kcfg);
+		assert.equal(exports, 18);
+
+		await new Promise((resolve) => setTimeout(resolve, 60));
+		await new KMDOperator(fakeKmd).loadKMDAccounts(kcfg);
+		assert.equal(exports, 36);
+	});
+
+	it("Should not cache keys when cache TTL is 0", async function () {
+		const kcfg = mkKmdCfg(0);
+		await new KMDOperator(fakeKmd).loadKMDAccounts(kcfg);
+		await new KMDOperator(fakeKmd).loadKMDAccounts(kcfg);
+		assert.equal(exports, 36);
+	});
+
+	it("Should list keys of the wallets without exporting them", async function () {
+		const keys = await new KMDOperator(fakeKmd).listKMDKeys(mkKmdCfg());
+		assert.deepEqual(keys, {
+			w0: accounts.slice(0, 10).map((a) => a.addr),
+			w1: accounts.slice(10, 20).map((a) => a.addr),
+		});
+		assert.equal(exports, 0);
+	});
+
+	it("Should release all wallet handles when a wallet fails", async function () {
+		const released: string[] = [];
+		const failingKmd = {
+			...fakeKmd,
+			initWalletHandle: async (id: string) => {
+				if (id === "id0") throw new Error("wrong password");
+				// the other wallet is opened after the failure
+				await new Promise((resolve) => setTimeout(resolve, 5));
+				return { wallet_handle_token: `${id}-token` };
+			},
+			releaseWalletHandle: async (token: string) => {
+				released.push(token);
+				return {};
+			},
+		} as unknown as Kmd; // eslint-disable-line @typescript-eslint/consistent-type-assertions
+
+		await expectBuilderErrorAsync(
+			async () => await new KMDOperator(failingKmd).loadKMDAccounts(mkKmdCfg(0)),
+			ERRORS.KMD.ERROR
+		);
+		assert.deepEqual(released, ["id1-token"]);
+	});
+});
@@ -0,0 +1,152 @@
+import { types as rtypes } from "@algo-builder/runtime";
+import { ERRORS } from "@algo-builder/web";
+import algosdk, { decodeSignedTransaction } from "algosdk";
+import { assert } from "chai";
+import { SinonStub, stub } from "sinon";
+
+import { AlgoOperatorImpl } from "../../src/lib/algo-operator";
+import { expectBuilderErrorAsync } from "../helpers/errors";
+import { mockGenesisInfo, mockSuggestedParam } from "../mocks/tx";
+
+function mkAccounts(n: number): rtypes.Account[] {
+	return Array.from({ length: n }, (_, i) => ({
+		...algosdk.generateAccount(),
+		name: `acc-${i}`,
+	}));
+}
+
+describe("Bulk opt-in", function () {
+	let algodClient: algosdk.Algodv2;
+	let algoOp: AlgoOperatorImpl;
+	let sendRawTransaction: SinonStub;
+	let balance: number;
+
+	beforeEach(function () {
+		algodClient = new algosdk.Algodv2("dummyToken", "https://dummyNetwork", 8080);
+		algoOp = new AlgoOperatorImpl(algodClient);
+		balance = 10e6;
+		const response = (value: unknown): any => ({ do: async () => value });
+		stub(algodClient, "getTransactionParams").returns(response(mockSuggestedParam));
+		stub(algodClient, "genesis").returns(response(mockGenesisInfo));
+		stub(algodClient, "accountInformation").callsFake(() => response({ amount: balance }));
+		stub(algodClient, "status").returns(response({ "last-round": 10 }));
+		stub(algodClient, "statusAfterBlock").returns(response({}));
+		stub(algodClient, "pendingTransactionInformation").returns(
+			response({ "confirmed-round": 11, "pool-error": "" })
+		);
+		sendRawTransaction = stub(algodClient, "sendRawTransaction").callsFake((rawTxns) => {
+			const txn = decodeSignedTransaction((rawTxns as Uint8Array[])[0]).txn;
+			return response({ txId: txn.txID() });
+		});
+	});
+
+	it("Should pack ASA opt-ins in groups of 16 transactions", async function () {
+		const accounts = mkAccounts(20);
+		const results = await algoOp.optInToASABulk("gold", 1, accounts, {});
+
+		assert.equal(sendRawTransaction.callCount, 2);
+		const groups = sendRawTransaction.args.map(([raw]) =>
+			(raw as Uint8Array[]).map((t) => decodeSignedTransaction(t).txn)
+		);
+		assert.deepEqual(groups.map((g) => g.length), [16, 4]);
+		for (const group of groups) {
+			const groupIDs = new Set(group.map((t) => (t.group as Buffer).toString("base64")));
+			assert.equal(groupIDs.size, 1);
+		}
+		const txIDs = groups.flat().map((t) => t.txID());
+		assert.deepEqual(results.map((r) => r.receipt?.txID), txIDs);
+		assert.deepEqual(results.map((r) => r.address), accounts.map((a) => a.addr));
+	});
+
+	it("Should use configured group size", async function () {
+		await algoOp.optInToASABulk("gold", 1, mkAccounts(5), {}, { groupSize: 2 });
+		const groupSizes = sendRawTransaction.args.map(([raw]) => (raw as Uint8Array[]).length);
+		assert.deepEqual(groupSizes, [2, 2, 1]);
+	});
+
+	it("Should send opt-ins of a rejected group as single transactions", async function () {
+		const accounts = mkAccounts(3);
+		sendRawTransaction.callsFake((rawTxns) => {
+			const txns = [rawTxns].flat().map((t) => decodeSignedTransaction(t as Uint8Array).txn);
+			if (txns.length > 1) {
+				return { do: async () => Promise.reject(new Error("group rejected")) };
+			}
+			return { do: async () => ({ txId: txns[0].txID() }) };
+		});
+		const results = await algoOp.optInToASABulk("gold", 1, accounts, {});
+
+		assert.equal(sendRawTransaction.callCount, 4);
+		assert.lengthOf(results, 3);
+		for (const result of results) {
+			assert.isDefined(result.receipt);
+			assert.isUndefined(result.error);
+		}
+		for (const [raw] of sendRawTransaction.args.slice(1)) {
+			assert.isUndefined(decodeSignedTransaction(raw as Uint8Array).txn.group);
+		}
+	});
+
+	it("Should return the error of a rejected single opt-in", async function () {
+		const accounts = mkAccounts(3);
+		sendRawTransaction.callsFake((rawTxns) => {
+			const txns = [rawTxns].flat().map((t) => decodeSignedTransaction(t as Uint8Array).txn);
+			const sender = algosdk.encodeAddress(txns[0].from.publicKey);
+			if (txns.length > 1 || sender === accounts[1].addr) {
+				return { do: async () => Promise.reject(new Error("rejected")) };
+			}
+			return { do: async () => ({ txId: txns[0].txID() }) };
+		});
+		const results = await algoOp.optInToASABulk("gold", 1, accounts, {});
+
+		// the other accounts of the group are still opted-in
+		assert.equal(sendRawTransaction.callCount, 4);
+		assert.equal(results[1].name, "acc-1");
+		assert.equal(results[1].error?.message, "rejected");
+		assert.isUndefined(results[1].receipt);
+		assert.isDefined(results[0].receipt);
+		assert.isDefined(results[2].receipt);
+	});
+
+	it("Should count a group sent again as single transactions as one group in flight", async function () {
+		const accounts = mkAccounts(6);
+		sendRawTransaction.callsFake((rawTxns) => {
+			const txns = [rawTxns].flat().map((t) => decodeSignedTransaction(t as Uint8Array).txn);
+			const sender = algosdk.encodeAddress(txns[0].from.publicKey);
+			if (txns.length > 1 && sender === accounts[0].addr) {
+				return { do: async () => Promise.reject(new Error("group rejected")) };
+			}
+			return { do: async () => ({ txId: txns[0].txID() }) };
+		});
+		let confirm = (): void => {};
+		const confirmed = new Promise<void>((resolve) => (confirm = resolve));
+		const waitForConfirmation = stub(algoOp, "waitForConfirmation").callsFake(async () => {
+			await confirmed;
+			return {} as any;
+		});
+		const bulkOptIn = algoOp.optInToASABulk(
+			"gold",
+			1,
+			accounts,
+			{},
+			{ groupSize: 2, maxInFlight: 2 }
+		);
+		await new Promise((resolve) => setTimeout(resolve, 10));
+
+		// rejected group + its 2 single opt-ins, and the second group
+		assert.equal(sendRawTransaction.callCount, 4);
+		confirm();
+		const results = await bulkOptIn;
+		assert.equal(sendRawTransaction.callCount, 5);
+		assert.equal(waitForConfirmation.callCount, 4);
+		assert.lengthOf(results, 6);
+	});
+
+	it("Should check balances before sending opt-ins", async function () {
+		balance = 100000;
+		await expectBuilderErrorAsync(
+			async () => await algoOp.optInToASABulk("gold", 1, mkAccounts(3), {}),
+			ERRORS.SCRIPT.ASA_OPT_IN_ACCOUNT_INSUFFICIENT_BALANCE
+		);
+		assert.equal(sendRawTransaction.callCount, 0);
+	});
+});
@@ -0,0 +1,97 @@
+import { types as rtypes } from "@algo-builder/runtime";
+import { assert } from "chai";
+import * as fs from "fs";
+import path from "path";
+
+import { LogCheckpointStore } from "../../src/lib/checkpoint-store";
+import { CheckpointImpl, CheckpointRepoImpl } from "../../src/lib/script-checkpoints";
+import { Checkpoint } from "../../src/types";
+import { useTmpDir } from "../helpers/fs";
+
+function mkASAInfo(assetIndex: number): rtypes.ASAInfo {
+	return {
+		creator: "addr-1",
+		txID: `tx-${assetIndex}`,
+		confirmedRound: 10,
+		assetIndex,
+		assetDef: {} as rtypes.ASAInfo["assetDef"],
+		deleted: false,
+		logs: [new Uint8Array([1, 2, 3])],
+	};
+}
+
+function mkCheckpoint(): Checkpoint {
+	const cp = new CheckpointImpl();
+	cp.timestamp = 1;
+	cp.metadata.set("key", "value");
+	cp.asa.set("gold", mkASAInfo(1));
+	return cp;
+}
+
+function logLines(dir: string, networkName: string): string[] {
+	return fs
+		.readFileSync(path.join(dir, networkName + ".log"), "utf8")
+		.split("\n")
+		.filter((l) => l !== "");
+}
+
+describe("LogCheckpointStore", function () {
+	useTmpDir("checkpoint-store");
+
+	it("Should load persisted checkpoints of the network", function () {
+		new LogCheckpointStore("net", this.tmpDir).persist("script1.js", { net: mkCheckpoint() });
+
+		const store = new LogCheckpointStore("net", this.tmpDir);
+		const loaded = store.load("script1.js").net;
+		assert.equal(loaded.timestamp, 1);
+		assert.equal(loaded.metadata.get("key"), "value");
+		assert.deepEqual(loaded.asa.get("gold"), mkASAInfo(1));
+		assert.deepEqual(store.load("script2.js"), {});
+		assert.equal(store.loadAll().getASAInfo("gold")?.assetIndex, 1);
+		assert.deepEqual(new LogCheckpointStore("other", this.tmpDir).load("script1.js"), {});
+	});
+
+	it("Should append only changed entries", function () {
+		const store = new LogCheckpointStore("net", this.tmpDir);
+		const cp = mkCheckpoint();
+		store.persist("script1.js", { net: cp });
+		const before = logLines(this.tmpDir, "net");
+
+		store.persist("script1.js", { net: cp });
+		assert.deepEqual(logLines(this.tmpDir, "net"), before);
+
+		cp.asa.set("silver", { ...mkASAInfo(2), confirmedRound: 2n as unknown as number });
+		new LogCheckpointStore("net", this.tmpDir).persist("script1.js", { net: cp });
+		const after = logLines(this.tmpDir, "net");
+		assert.equal(after.length, before.length + 1);
+
+		const silver = new LogCheckpointStore("net", this.tmpDir).load("script1.js").net.asa;
+		assert.equal(silver.get("silver")?.confirmedRound, 2n as unknown as number);
+	});
+
+	it("Should clear checkpoints of scripts", function () {
+		const store = new LogCheckpointStore("net", this.tmpDir);
+		store.persist("script1.js", { net: mkCheckpoint() });
+		store.persist("script2.js", { net: new CheckpointImpl() });
+		store.clear(["script1.js"]);
+
+		assert.deepEqual(store.load("script1.js"), {});
+		const reloaded = new LogCheckpointStore("net", this.tmpDir);
+		assert.deepEqual(reloaded.load("script1.js"), {});
+		assert.isDefined(reloaded.load("script2.js").net);
+		assert.isUndefined(reloaded.loadAll().getASAInfo("gold"));
+	});
+
+	it("Should load names of the assets of the network only", function () {
+		const store = new LogCheckpointStore("net", this.tmpDir);
+		store.persist("script1.js", { net: mkCheckpoint() });
+		store.persist("script2.js", { other: mkCheckpoint() });
+		const silver = new CheckpointImpl();
+		silver.asa.set("silver", mkASAInfo(2));
+		store.persist("script3.js", { net: silver });
+		store.clear(["script3.js"]);
+
+		const repo = new LogCheckpointStore("net", this.tmpDir).loadAll() as CheckpointRepoImpl;
+		assert.deepEqual(repo.scriptMap, { gold: "script1.js" });
+	});
+});
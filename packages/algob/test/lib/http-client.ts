@@ -0,0 +1,91 @@
+import { assert } from "chai";
+import http from "http";
+import { AddressInfo, Socket } from "net";
+
+import { PooledHTTPClient } from "../../src/lib/http-client";
+
+describe("PooledHTTPClient", function () {
+	let server: http.Server;
+	let baseServer: string;
+	let port: number;
+	const sockets = new Set<unknown>();
+	const requests: http.IncomingMessage[] = [];
+	const connections = new Set<Socket>(); // open connections, destroyed when tests end
+
+	before(async function () {
+		server = http.createServer((req, res) => {
+			requests.push(req);
+			sockets.add(req.socket);
+			const chunks: Buffer[] = [];
+			req.on("data", (chunk: Buffer) => chunks.push(chunk));
+			req.on("end", () => {
+				if (req.url?.startsWith("/v2/missing")) {
+					res.writeHead(404, { "Content-Type": "application/json" });
+					res.end(JSON.stringify({ message: "not found" }));
+					return;
+				}
+				res.writeHead(200, { "Content-Type": "application/json" });
+				res.end(JSON.stringify({ url: req.url, body: Buffer.concat(chunks).toString() }));
+			});
+		});
+		server.on("connection", (socket: Socket) => {
+			connections.add(socket);
+			socket.on("close", () => connections.delete(socket));
+		});
+		await new Promise<void>((resolve) => server.listen(0, "127.0.0.1", resolve));
+		baseServer = "http://127.0.0.1";
+		port = (server.address() as AddressInfo).port;
+	});
+
+	after(async function () {
+		// pooled keep-alive connections would keep the server open
+		for (const socket of connections) socket.destroy();
+		await new Promise((resolve) => server.close(resolve));
+	});
+
+	this.beforeEach(function () {
+		sockets.clear();
+		requests.length = 0;
+	});
+
+	it("Should send token header and query params", async function () {
+		const client = new PooledHTTPClient({ "X-Algo-API-Token": "abc" }, baseServer, port, {});
+		const res = await client.get("/v2/status", { format: "json", round: 5 });
+
+		assert.equal(res.status, 200);
+		assert.equal(res.headers["content-type"], "application/json");
+		const body = JSON.parse(Buffer.from(res.body).toString());
+		assert.equal(body.url, "/v2/status?format=json&round=5");
+		assert.equal(requests[0].headers["x-algo-api-token"], "abc");
+	});
+
+	it("Should post request body", async function () {
+		const client = new PooledHTTPClient({}, baseServer, port, {});
+		const res = await client.post("/v2/transactions", new Uint8Array(Buffer.from("txn")));
+
+		assert.equal(JSON.parse(Buffer.from(res.body).toString()).body, "txn");
+	});
+
+	it("Should reuse connections between requests", async function () {
+		const client = new PooledHTTPClient({}, baseServer, port, { maxSockets: 1 });
+		for (let i = 0; i < 5; i++) await client.get("/v2/status");
+
+		assert.equal(requests.length, 5);
+		assert.equal(sockets.size, 1);
+	});
+
+	it("Should throw error with response for unsuccessful requests", async function () {
+		const client = new PooledHTTPClient({}, baseServer, port, {});
+		try {
+			await client.get("/v2/missing");
+			assert.fail("expected an error");
+		} catch (error) {
+			const e = error as Error & { response: { status: number } };
+			assert.equal(
+				e.message,
+				"Network request error. Received status 404 for /v2/missing: not found"
+			);
+			assert.equal(e.response.status, 404);
+		}
+	});
+});
@@ -0,0 +1,159 @@
+import { ERRORS, types } from "@algo-builder/web";
+import algosdk, { generateAccount } from "algosdk";
+import { assert } from "chai";
+import * as fs from "fs";
+import * as os from "os";
+import * as path from "path";
+import { stub } from "sinon";
+import YAML from "yaml";
+
+import { LocalDryrun } from "../../src";
+import { CACHE_DIR } from "../../src/internal/core/project-structure";
+import { DeployerRunMode } from "../../src/internal/deployer";
+import { DeployerConfig } from "../../src/internal/deployer_cfg";
+import { Deployer } from "../../src/types";
+import { expectBuilderErrorAsync } from "../helpers/errors";
+import { mkEnv } from "../helpers/params";
+import { useFixtureProject } from "../helpers/project";
+import { mockGenesisInfo, mockSuggestedParam } from "../mocks/tx";
+import { AlgoOperatorDryRunImpl } from "../stubs/algo-operator";
+
+const appID = 10;
+const approvalProgram = Buffer.from("approval").toString("base64");
+const clearProgram = Buffer.from("clear").toString("base64");
+const cacheFile = path.join(CACHE_DIR, "local-dryrun-test.yaml");
+const clearCacheFile = path.join(CACHE_DIR, "local-dryrun-test-clear.yaml");
+
+describe("Local dryrun", function () {
+	useFixtureProject("config-project");
+	let deployer: Deployer;
+	let snapshot: string;
+	const sender = generateAccount();
+	const creator = generateAccount();
+
+	function cacheProgram(file: string, compiled: string, tealCode: string): void {
+		fs.mkdirSync(CACHE_DIR, { recursive: true });
+		fs.writeFileSync(file, YAML.stringify({ compiled, tealCode }));
+	}
+
+	beforeEach(function () {
+		const algod = new AlgoOperatorDryRunImpl();
+		deployer = new DeployerRunMode(new DeployerConfig(mkEnv("network1"), algod));
+		stub(algod.algodClient, "getTransactionParams").returns({
+			do: async () => mockSuggestedParam,
+		} as ReturnType<algosdk.Algodv2["getTransactionParams"]>);
+		stub(algod.algodClient, "genesis").returns({
+			do: async () => mockGenesisInfo,
+		} as ReturnType<algosdk.Algodv2["genesis"]>);
+
+		snapshot = path.join(fs.mkdtempSync(path.join(os.tmpdir(), "local-dryrun-")), "s.json");
+		fs.writeFileSync(
+			snapshot,
+			JSON.stringify({
+				accounts: [
+					{ address: sender.addr, amount: 10e6 },
+					{ address: creator.addr, amount: 10e6 },
+				],
+				apps: [
+					{
+						id: appID,
+						params: {
+							creator: creator.addr,
+							"approval-program": approvalProgram,
+							"clear-state-program": clearProgram,
+							"global-state-schema": { "num-uint": 1, "num-byte-slice": 0 },
+							"local-state-schema": { "num-uint": 0, "num-byte-slice": 0 },
+						},
+					},
+				],
+				round: 2,
+				"latest-timestamp": 1000,
+			})
+		);
+		cacheProgram(clearCacheFile, clearProgram, "#pragma version 5\nint 1\nreturn");
+	});
+
+	afterEach(function () {
+		fs.rmSync(cacheFile, { force: true });
+		fs.rmSync(clearCacheFile, { force: true });
+		fs.rmSync(path.dirname(snapshot), { recursive: true, force: true });
+	});
+
+	const callApp: types.ExecParams = {
+		type: types.TransactionType.CallApp,
+		sign: types.SignType.SecretKey,
+		fromAccount: sender,
+		appID,
+		payFlags: {},
+	};
+
+	it("Should execute app call and return trace and cost", async function () {
+		cacheProgram(cacheFile, approvalProgram, "#pragma version 5\nint 1\nint 2\n+\nreturn");
+
+		const res = await new LocalDryrun(deployer, { snapshot }).simulate(callApp);
+
+		assert.equal(res.error, "");
+		assert.deepEqual(res.txns[0]["app-call-messages"], ["ApprovalProgram", "PASS"]);
+		const trace = res.txns[0]["app-call-trace"] ?? [];
+		assert.lengthOf(trace, 4);
+		assert.deepEqual(trace[2].stack, [{ type: 2, bytes: "", uint: 3n }]);
+		assert.equal(res.txns[0].cost, 4);
+	});
+
+	it("Should move the round after the first round of the transactions", async function () {
+		// snapshot round (2) is not greater than firstRound of the transaction (2)
+		const program = "#pragma version 5\nglobal Round\nint 3\n==\nreturn";
+		cacheProgram(cacheFile, approvalProgram, program);
+
+		const res = await new LocalDryrun(deployer, { snapshot }).simulate(callApp);
+
+		assert.equal(res.error, "");
+		assert.deepEqual(res.txns[0]["app-call-messages"], ["ApprovalProgram", "PASS"]);
+	});
+
+	it("Should keep the round before the last round of the transactions", async function () {
+		const state = JSON.parse(fs.readFileSync(snapshot, "utf8"));
+		fs.writeFileSync(snapshot, JSON.stringify({ ...state, round: 500 }));
+		const program = "#pragma version 5\nglobal Round\nint 99\n==\nreturn";
+		cacheProgram(cacheFile, approvalProgram, program);
+
+		const res = await new LocalDryrun(deployer, { snapshot }).simulate(callApp);
+
+		assert.equal(res.error, "");
+		assert.deepEqual(res.txns[0]["app-call-messages"], ["ApprovalProgram", "PASS"]);
+	});
+
+	it("Should mark rejected app call", async function () {
+		cacheProgram(cacheFile, approvalProgram, "#pragma version 5\nint 0\nreturn");
+
+		const res = await new LocalDryrun(deployer, { snapshot }).simulate(callApp);
+
+		assert.notEqual(res.error, "");
+		assert.equal(res.txns[0]["app-call-messages"]?.[1], "REJECT");
+	});
+
+	it("Should not reject an app call when a next transaction fails", async function () {
+		cacheProgram(cacheFile, approvalProgram, "#pragma version 5\nint 1\nreturn");
+		const payment: types.ExecParams = {
+			type: types.TransactionType.TransferAlgo,
+			sign: types.SignType.SecretKey,
+			fromAccount: sender,
+			toAccountAddr: creator.addr,
+			amountMicroAlgos: 100e6, // more than the sender balance
+			payFlags: {},
+		};
+
+		const res = await new LocalDryrun(deployer, { snapshot }).simulate([callApp, payment]);
+
+		assert.notEqual(res.error, "");
+		assert.deepEqual(res.txns[0]["app-call-messages"], ["ApprovalProgram", "PASS"]);
+	});
+
+	it("Should throw error if app source is not found", async function () {
+		await expectBuilderErrorAsync(
+			async () => await new LocalDryrun(deployer, { snapshot }).simulate(callApp),
+			ERRORS.SCRIPT.DRYRUN_APP_SOURCE_NOT_FOUND,
+			"TEAL code of the app 10 was not found"
+		);
+	});
+});
@@ -6,6 +6,7 @@ import * as fs from "fs";
 
 import {
 	appendToCheckpoint,
+	CheckpointFunctionsImpl,
 	CheckpointImpl,
 	CheckpointRepoImpl,
 	loadCheckpoint,
@@ -987,4 +988,88 @@ describe("CheckpointRepoImpl", function () {
 	});
 });
 
+describe("CheckpointFunctionsImpl lookups", function () {
+	function mkASAInfo(assetIndex: number): rtypes.ASAInfo {
+		return {
+			creator: "ASA creator",
+			txID: "",
+			assetIndex: assetIndex,
+			confirmedRound: 0,
+			assetDef: {} as wtypes.ASADef,
+			deleted: false,
+		};
+	}
+
+	function mkAppInfo(appID: number, timestamp: number): rtypes.AppInfo {
+		return {
+			creator: "SSC creator",
+			applicationAccount: MOCK_APPLICATION_ADDRESS,
+			txID: "",
+			confirmedRound: 0,
+			appID: appID,
+			timestamp: timestamp,
+			deleted: false,
+			approvalFile: "approval-file.py",
+			clearFile: "clear-file.py",
+		};
+	}
+
+	let cpData: CheckpointRepoImpl;
+	let cpFunctions: CheckpointFunctionsImpl;
+
+	this.beforeEach(function () {
+		const cp = createNetwork(1);
+		cp.asa.set("ASA 1", mkASAInfo(1));
+		cp.app.set("SSC 1", new Map([[1, mkAppInfo(10, 1)]]));
+		cpData = new CheckpointRepoImpl();
+		cpData.merge({ network1: cp }, "script1");
+		cpFunctions = new CheckpointFunctionsImpl(cpData, "network1");
+	});
+
+	it("Should find ASA and app names from indexes", function () {
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(1), "ASA 1");
+		assert.equal(cpFunctions.getAppCheckpointKeyFromIndex(10), "SSC 1");
+		assert.isUndefined(cpFunctions.getAssetCheckpointKeyFromIndex(2));
+		assert.isUndefined(cpFunctions.getAppCheckpointKeyFromIndex(11));
+		assert.isUndefined(new CheckpointFunctionsImpl(cpData, "other").getAppfromCPKey("SSC 1"));
+	});
+
+	it("Should update indexes on register and merge", function () {
+		// build indexes before registering new assets
+		assert.isUndefined(cpFunctions.getAssetCheckpointKeyFromIndex(2));
+		assert.isUndefined(cpFunctions.getAppCheckpointKeyFromIndex(20));
+
+		cpData.registerASA("network1", "ASA 2", mkASAInfo(2));
+		cpData.registerSSC("network1", "SSC 2", mkAppInfo(20, 1));
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(2), "ASA 2");
+		assert.equal(cpFunctions.getAppCheckpointKeyFromIndex(20), "SSC 2");
+
+		const cp = createNetwork(2);
+		cp.asa.set("ASA 3", mkASAInfo(3));
+		cpData.merge({ network1: cp }, "script2");
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(3), "ASA 3");
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(1), "ASA 1");
+	});
+
+	it("Should return the latest app version", function () {
+		assert.equal(cpFunctions.getAppfromCPKey("SSC 1")?.timestamp, 1);
+		cpData.registerSSC("network1", "SSC 1", mkAppInfo(10, 2));
+		assert.equal(cpFunctions.getAppfromCPKey("SSC 1")?.timestamp, 2);
+		assert.equal(cpFunctions.getAppCheckpointKeyFromIndex(10), "SSC 1");
+
+		// app redeployed with a new app ID
+		cpData.registerSSC("network1", "SSC 1", mkAppInfo(11, 3));
+		assert.equal(cpFunctions.getAppfromCPKey("SSC 1")?.appID, 11);
+		assert.equal(cpFunctions.getAppCheckpointKeyFromIndex(11), "SSC 1");
+		assert.isUndefined(cpFunctions.getAppCheckpointKeyFromIndex(10));
+	});
+
+	it("Should update index when ASA is registered with a new asset index", function () {
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(1), "ASA 1");
+		cpData.registerASA("network1", "ASA 1", mkASAInfo(5));
+		assert.equal(cpFunctions.getAssetCheckpointKeyFromIndex(5), "ASA 1");
+		assert.isUndefined(cpFunctions.getAssetCheckpointKeyFromIndex(1));
+	});
+});
+
 //  LocalWords:  cp
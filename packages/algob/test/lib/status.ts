@@ -4,7 +4,7 @@ import sinon from "sinon";
 
 import { DeployerRunMode } from "../../src/internal/deployer";
 import { DeployerConfig } from "../../src/internal/deployer_cfg";
-import { balanceOf } from "../../src/lib/status";
+import { balanceOf, balancesOf } from "../../src/lib/status";
 import { Deployer } from "../../src/types";
 import { mkEnv } from "../helpers/params";
 import { mockAccountInformation } from "../mocks/tx";
@@ -19,13 +19,33 @@ describe("Status package", function () {
 	before(async function () {
 		deployer = new DeployerRunMode(deployerCfg);
 
-		(sinon.stub(algod.algodClient, "accountInformation") as any).returns({
+		const accountInfoRequest = {
+			exclude: () => accountInfoRequest,
 			do: async () => mockAccountInformation,
-		}) as ReturnType<algosdk.Algodv2["accountInformation"]>;
+		};
+		(sinon.stub(algod.algodClient, "accountInformation") as any).returns(
+			accountInfoRequest
+		) as ReturnType<algosdk.Algodv2["accountInformation"]>;
+		(sinon.stub(algod.algodClient, "status") as any).returns({
+			do: async () => ({ "last-round": mockAccountInformation.round }),
+		});
+		(sinon.stub(algod.algodClient, "accountAssetInformation") as any).callsFake(
+			(_addr: string, assetID: number) => ({
+				do: async () => {
+					const holding = mockAccountInformation.assets.find((a) => a["asset-id"] === assetID);
+					if (holding === undefined) {
+						throw Object.assign(new Error("asset not found"), { response: { status: 404 } });
+					}
+					return { round: mockAccountInformation.round, "asset-holding": holding };
+				},
+			})
+		);
 	});
 
 	after(async function () {
 		(algod.algodClient.accountInformation as sinon.SinonStub).restore();
+		(algod.algodClient.status as sinon.SinonStub).restore();
+		(algod.algodClient.accountAssetInformation as sinon.SinonStub).restore();
 	});
 
 	it("balanceOf should return corrent amount when account hold an asset", async function () {
@@ -46,4 +66,12 @@ describe("Status package", function () {
 			mockAccountInformation.amount
 		);
 	});
+
+	it("balancesOf should return balances of many accounts", async function () {
+		const assetID = mockAccountInformation.assets[0]["asset-id"];
+		const balances = await balancesOf(deployer, [mockAccountInformation.address], assetID);
+		expect([...balances]).to.deep.equal([
+			[mockAccountInformation.address, mockAccountInformation.assets[0].amount],
+		]);
+	});
 });
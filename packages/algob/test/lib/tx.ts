@@ -7,13 +7,17 @@ import algosdk, {
 	Transaction,
 } from "algosdk";
 import { assert } from "chai";
-import { SinonStub, stub } from "sinon";
+import * as fs from "fs";
+import path from "path";
+import { SinonStub, spy, stub } from "sinon";
 import { TextEncoder } from "util";
 
 import { DeployerDeployMode, DeployerRunMode } from "../../src/internal/deployer";
 import { DeployerConfig } from "../../src/internal/deployer_cfg";
+import { executeSignedTxnsFromSource } from "../../src/lib/tx";
 import { Deployer, TxnReceipt } from "../../src/types";
 import { expectBuilderError, expectBuilderErrorAsync } from "../helpers/errors";
+import { useTmpDir } from "../helpers/fs";
 import { mkEnv } from "../helpers/params";
 import { useFixtureProject, useFixtureProjectCopy } from "../helpers/project";
 import { aliceAcc, bobAcc } from "../mocks/account";
@@ -141,6 +145,38 @@ describe("Opt-In to ASA", function () {
 
 		assert.deepEqual(res, expected);
 	});
+
+	it("Should execute groups with pipelined submission", async function () {
+		const send = spy(algod, "send");
+		const groups = [[execParams], [execParams], [execParams]];
+		const receipts = deployer.executeTxPipelined(groups, { maxInFlight: 2 });
+
+		// first receipt is returned when 2 groups are in flight
+		assert.deepEqual((await receipts.next()).value, expected);
+		assert.equal(send.callCount, 2);
+		const rest: TxnReceipt[][] = [];
+		for await (const r of receipts) rest.push(r);
+		assert.deepEqual(rest, [expected, expected]);
+		assert.equal(send.callCount, 3);
+		send.restore();
+	});
+
+	it("Should complete groups in flight when the consumer stops early", async function () {
+		const getReceiptTxns = spy(deployer, "getReceiptTxns");
+		const persistCP = stub(deployer, "persistCP");
+		const groups = [[execParams], [execParams], [execParams]];
+		for await (const r of deployer.executeTxPipelined(groups, { maxInFlight: 2 })) {
+			assert.deepEqual(r, expected);
+			break;
+		}
+
+		// the second group was sent before the break: its receipt is fetched (and checkpoints
+		// registered), the third group is not sent
+		assert.equal(getReceiptTxns.callCount, 2);
+		assert.isTrue(persistCP.calledOnce);
+		getReceiptTxns.restore();
+		persistCP.restore();
+	});
 });
 
 describe("ASA modify fields", function () {
@@ -1002,3 +1038,84 @@ describe("SDK Transaction object", function () {
 		assert.equal(res[0]["asset-index"], 1);
 	});
 });
+
+describe("Bulk submission of signed transactions", function () {
+	useFixtureProject("config-project");
+	useTmpDir("bulk-submit");
+
+	let deployer: Deployer;
+	let algod: AlgoOperatorDryRunImpl;
+	let send: SinonStub;
+	let status: SinonStub;
+	beforeEach(function () {
+		algod = new AlgoOperatorDryRunImpl();
+		deployer = new DeployerRunMode(new DeployerConfig(mkEnv("network1"), algod));
+		status = stub(algod.algodClient, "status").returns({
+			do: async () => ({ "last-round": 100 }),
+		} as ReturnType<algosdk.Algodv2["status"]>);
+		send = stub(algod.algodClient, "sendRawTransaction").returns({
+			do: async () => ({ txId: "1" }),
+		} as ReturnType<algosdk.Algodv2["sendRawTransaction"]>);
+	});
+
+	afterEach(function () {
+		status.restore();
+		send.restore();
+	});
+
+	function mkPayment(firstRound: number, lastRound: number): Transaction {
+		return algosdk.makePaymentTxnWithSuggestedParamsFromObject({
+			from: bobAcc.addr,
+			to: aliceAcc.addr,
+			amount: 1,
+			suggestedParams: { ...mockSuggestedParam, firstRound, lastRound },
+		});
+	}
+
+	it("Should send valid groups from a file of concatenated transactions", async function () {
+		const group = algosdk.assignGroupID([mkPayment(90, 110), mkPayment(90, 110)]);
+		const txns = [mkPayment(90, 110), ...group, mkPayment(10, 50), mkPayment(150, 200)];
+		const file = path.join(this.tmpDir, "payouts.msgp");
+		fs.writeFileSync(file, Buffer.concat(txns.map((t) => t.signTxn(bobAcc.sk))));
+		const manifest = path.join(this.tmpDir, "manifest.jsonl");
+
+		const summary = await executeSignedTxnsFromSource(deployer, file, {
+			maxInFlight: 2,
+			manifest,
+		});
+
+		assert.deepEqual(summary, { confirmed: 2, expired: 1, "not-yet-valid": 1, failed: 0 });
+		assert.equal(send.callCount, 2);
+		assert.lengthOf(send.secondCall.args[0], 2); // group is sent at once
+		const results = fs
+			.readFileSync(manifest, "utf8")
+			.trimEnd()
+			.split("\n")
+			.map((l) => JSON.parse(l));
+		assert.deepEqual(
+			results.map((r) => [r.source, r.status]),
+			[
+				[`${file}#0`, "confirmed"],
+				[`${file}#1`, "confirmed"],
+				[`${file}#3`, "expired"],
+				[`${file}#4`, "not-yet-valid"],
+			]
+		);
+		assert.deepEqual(results[1].txIDs, [group[0].txID(), group[1].txID()]);
+	});
+
+	it("Should send transaction groups from files of a directory", async function () {
+		const group = algosdk.assignGroupID([mkPayment(90, 110), mkPayment(90, 110)]);
+		fs.writeFileSync(path.join(this.tmpDir, "a.txn"), mkPayment(90, 110).signTxn(bobAcc.sk));
+		fs.writeFileSync(
+			path.join(this.tmpDir, "b.tx"),
+			algosdk.encodeObj(group.map((t) => t.signTxn(bobAcc.sk)))
+		);
+		fs.writeFileSync(path.join(this.tmpDir, "c.tx"), algosdk.encodeObj({ note: "not a txn" }));
+
+		const summary = await executeSignedTxnsFromSource(deployer, this.tmpDir);
+
+		assert.deepEqual(summary, { confirmed: 2, expired: 0, "not-yet-valid": 0, failed: 1 });
+		assert.lengthOf(send.secondCall.args[0], 2);
+	});
+});
@@ -4,10 +4,15 @@ import algosdk, { Account, LogicSigAccount, modelsv2 } from "algosdk";
 
 import type {
 	ASCCache,
+	BulkOptInOptions,
+	BulkOptInResult,
 	Deployer,
+	ExecTxGroup,
 	FundASCFlags,
 	LogicSig,
 	LsigInfo,
+	OptInSigner,
+	PipelinedExecOptions,
 	SCParams,
 	TxnReceipt,
 } from "../../src/types";
@@ -267,12 +272,38 @@ export class FakeDeployer implements Deployer {
 		throw new Error("not implemented.");
 	}
 
+	optInAccountsToASA(
+		asa: string,
+		accountNames: string[],
+		flags: wtypes.TxParams,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		throw new Error("not implemented.");
+	}
+
+	optInAccountsToApp(
+		signers: OptInSigner[],
+		appID: number,
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		throw new Error("not implemented.");
+	}
+
 	executeTx(
 		transactions: wtypes.ExecParams[] | wtypes.TransactionAndSign[]
 	): Promise<TxnReceipt[]> {
 		throw new Error("Not implemented");
 	}
 
+	executeTxPipelined(
+		groups: Iterable<ExecTxGroup> | AsyncIterable<ExecTxGroup>,
+		options?: PipelinedExecOptions
+	): AsyncGenerator<TxnReceipt[]> {
+		throw new Error("Not implemented");
+	}
+
 	getReceiptTxns(txns: algosdk.Transaction[]): Promise<TxnReceipt[]> {
 		throw new Error("not implemented");
 	}
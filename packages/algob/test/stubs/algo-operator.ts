@@ -4,7 +4,16 @@ import algosdk, { Account, Algodv2, LogicSigAccount, modelsv2, Transaction } fro
 
 import { txWriter } from "../../src/internal/tx-log-writer";
 import { AlgoOperator } from "../../src/lib/algo-operator";
-import { ASCCache, FundASCFlags, LsigInfo, SCParams, TxnReceipt } from "../../src/types";
+import {
+	ASCCache,
+	BulkOptInOptions,
+	BulkOptInResult,
+	FundASCFlags,
+	LsigInfo,
+	OptInSigner,
+	SCParams,
+	TxnReceipt,
+} from "../../src/types";
 import {
 	MOCK_APPLICATION_ADDRESS,
 	mockAlgod,
@@ -30,6 +39,10 @@ export class AlgoOperatorDryRunImpl implements AlgoOperator {
 		});
 	}
 
+	send(rawTxns: Uint8Array | Uint8Array[]): Promise<string> {
+		return Promise.resolve(mockTxnReceipt.txID);
+	}
+
 	waitForConfirmation(_txID: string): Promise<TxnReceipt> {
 		return this.sendAndWait([]);
 	}
@@ -213,4 +226,24 @@ export class AlgoOperatorDryRunImpl implements AlgoOperator {
 	): Promise<void> {
 		return Promise.resolve();
 	}
+
+	optInToASABulk(
+		asaName: string,
+		assetIndex: number,
+		signers: OptInSigner[],
+		flags: wtypes.TxParams,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		return Promise.resolve([]);
+	}
+
+	optInToAppBulk(
+		appID: number,
+		signers: OptInSigner[],
+		payFlags: wtypes.TxParams,
+		flags: rtypes.AppOptionalFlags,
+		options?: BulkOptInOptions
+	): Promise<BulkOptInResult[]> {
+		return Promise.resolve([]);
+	}
 }
@@ -0,0 +1,35 @@
+#!/usr/bin/env node
+/**
+ * Measures the time of importing @algo-builder/runtime (from the build directory) in fresh
+ * node processes, as paid by every test runner process.
+ * Usage: yarn build && yarn bench:import [runs]
+ */
+const { execFileSync } = require("child_process");
+const path = require("path");
+
+const runs = Number(process.argv[2] ?? 20);
+const build = path.join(__dirname, "..", "build");
+
+// time of the first `require` and of the first access to all TEAL version tables
+const probe = `
+const t0 = process.hrtime.bigint();
+require(${JSON.stringify(build)});
+const t1 = process.hrtime.bigint();
+const c = require(${JSON.stringify(path.join(build, "lib", "constants"))});
+for (let v = 1; v <= c.MaxTEALVersion; ++v) c.TxnFields[v].Sender + c.OpGasCost[v].sha256;
+const t2 = process.hrtime.bigint();
+console.log(JSON.stringify({ require: Number(t1 - t0) / 1e6, tables: Number(t2 - t1) / 1e6 }));
+`;
+
+function median(values) {
+	const sorted = [...values].sort((a, b) => a - b);
+	return sorted[Math.floor(sorted.length / 2)];
+}
+
+const results = [];
+for (let i = 0; i < runs; ++i) {
+	results.push(JSON.parse(execFileSync(process.execPath, ["-e", probe], { encoding: "utf8" })));
+}
+console.log(`import of @algo-builder/runtime (median of ${runs} processes):`);
+console.log(`  require:             ${median(results.map((r) => r.require)).toFixed(1)} ms`);
+console.log(`  all version tables:  ${median(results.map((r) => r.tables)).toFixed(2)} ms`);
@@ -1,5 +1,6 @@
 import { types } from "@algo-builder/web";
-import { Account as AccountSDK, Address, generateAccount, modelsv2 } from "algosdk";
+import { Account as AccountSDK, Address, encodeAddress, modelsv2 } from "algosdk";
+import { generateKeyPairSync } from "crypto";
 
 import { RUNTIME_ERRORS } from "./errors/errors-list";
 import { RuntimeError } from "./errors/runtime-errors";
@@ -29,6 +30,21 @@ const globalState = "global-state";
 const localStateSchema = "local-state-schema";
 const globalStateSchema = "global-state-schema";
 
+/**
+ * Generates a new Algorand account. Uses the native ed25519 key generation from node crypto,
+ * which is much faster than the JS implementation used by `algosdk.generateAccount`.
+ */
+export function generateAccount(): AccountSDK {
+	const { publicKey, privateKey } = generateKeyPairSync("ed25519");
+	// raw keys are the last 32 bytes of the DER encoding
+	const pk = publicKey.export({ format: "der", type: "spki" }).subarray(-32);
+	const seed = privateKey.export({ format: "der", type: "pkcs8" }).subarray(-32);
+	const sk = new Uint8Array(64); // algorand secret key is seed || public key
+	sk.set(seed);
+	sk.set(pk, 32);
+	return { addr: encodeAddress(pk), sk };
+}
+
 export class RuntimeAccount implements RuntimeAccountI {
 	readonly sk: Uint8Array; // signing key (private key or lsig)
 	readonly addr: string;
@@ -60,12 +76,13 @@ export class AccountStore implements AccountStoreI {
 	readonly account: RuntimeAccountI;
 	readonly address: string;
 	minBalance: number; // required minimum balance for account
-	assets: Map<number, AssetHoldingM>;
 	amount: bigint;
-	appsLocalState: Map<number, AppLocalStateM>;
-	appsTotalSchema: modelsv2.ApplicationStateSchema;
-	createdApps: Map<number, SSCAttributesM>;
-	createdAssets: Map<number, modelsv2.AssetParams>;
+	// maps are created on first access, so accounts which only hold Algos stay small
+	private _assets?: Map<number, AssetHoldingM>;
+	private _appsLocalState?: Map<number, AppLocalStateM>;
+	private _appsTotalSchema?: modelsv2.ApplicationStateSchema;
+	private _createdApps?: Map<number, SSCAttributesM>;
+	private _createdAssets?: Map<number, modelsv2.AssetParams>;
 
 	/** Creates a new Algorand state account.
 	 * @balance: initial Algo balance (in micro Algo)
@@ -86,13 +103,58 @@ export class AccountStore implements AccountStoreI {
 		}
 
 		this.address = this.account.addr;
-		this.assets = new Map<number, AssetHoldingM>();
 		this.amount = BigInt(balance);
 		this.minBalance = ALGORAND_ACCOUNT_MIN_BALANCE;
-		this.appsLocalState = new Map<number, AppLocalStateM>();
-		this.appsTotalSchema = <modelsv2.ApplicationStateSchema>{};
-		this.createdApps = new Map<number, SSCAttributesM>();
-		this.createdAssets = new Map<number, modelsv2.AssetParams>();
+	}
+
+	get assets(): Map<number, AssetHoldingM> {
+		return (this._assets ??= new Map<number, AssetHoldingM>());
+	}
+
+	set assets(assets: Map<number, AssetHoldingM>) {
+		this._assets = assets;
+	}
+
+	get appsLocalState(): Map<number, AppLocalStateM> {
+		return (this._appsLocalState ??= new Map<number, AppLocalStateM>());
+	}
+
+	set appsLocalState(appsLocalState: Map<number, AppLocalStateM>) {
+		this._appsLocalState = appsLocalState;
+	}
+
+	get appsTotalSchema(): modelsv2.ApplicationStateSchema {
+		return (this._appsTotalSchema ??= <modelsv2.ApplicationStateSchema>{});
+	}
+
+	set appsTotalSchema(schema: modelsv2.ApplicationStateSchema) {
+		this._appsTotalSchema = schema;
+	}
+
+	get createdApps(): Map<number, SSCAttributesM> {
+		return (this._createdApps ??= new Map<number, SSCAttributesM>());
+	}
+
+	set createdApps(createdApps: Map<number, SSCAttributesM>) {
+		this._createdApps = createdApps;
+	}
+
+	get createdAssets(): Map<number, modelsv2.AssetParams> {
+		return (this._createdAssets ??= new Map<number, modelsv2.AssetParams>());
+	}
+
+	set createdAssets(createdAssets: Map<number, modelsv2.AssetParams>) {
+		this._createdAssets = createdAssets;
+	}
+
+	// returns true if the account created apps (without allocating `createdApps`)
+	hasCreatedApps(): boolean {
+		return (this._createdApps?.size ?? 0) > 0;
+	}
+
+	// returns true if the account created assets (without allocating `createdAssets`)
+	hasCreatedAssets(): boolean {
+		return (this._createdAssets?.size ?? 0) > 0;
 	}
 
 	// returns account balance in microAlgos
@@ -117,8 +179,8 @@ export class AccountStore implements AccountStoreI {
 	 * @param key: key to fetch value of from local state
 	 */
 	getLocalState(appID: number, key: Uint8Array | string): StackElem | undefined {
-		const localState = this.appsLocalState;
-		const data = localState.get(appID)?.[StateMap]; // can be undefined (eg. app opted in)
+		// can be undefined (eg. app opted in)
+		const data = this._appsLocalState?.get(appID)?.[StateMap];
 		const localKey = keyToBytes(key);
 		return data?.get(localKey.toString());
 	}
@@ -140,7 +202,7 @@ export class AccountStore implements AccountStoreI {
 		line?: number
 	): AppLocalStateM {
 		const lineNumber = line ?? "unknown";
-		const localState = this.appsLocalState.get(appID);
+		const localState = this._appsLocalState?.get(appID);
 		const localApp = localState?.[StateMap];
 		if (localState && localApp) {
 			const localKey = keyToBytes(key);
@@ -203,7 +265,7 @@ export class AccountStore implements AccountStoreI {
 	 * @param appID application index
 	 */
 	getApp(appID: number): SSCAttributesM | undefined {
-		return this.createdApps.get(appID);
+		return this._createdApps?.get(appID);
 	}
 
 	/**
@@ -212,7 +274,7 @@ export class AccountStore implements AccountStoreI {
 	 * @param appID application index
 	 */
 	getAppFromLocal(appID: number): AppLocalStateM | undefined {
-		return this.appsLocalState.get(appID);
+		return this._appsLocalState?.get(appID);
 	}
 
 	/**
@@ -220,7 +282,7 @@ export class AccountStore implements AccountStoreI {
 	 * @param assetId asset index
 	 */
 	getAssetDef(assetId: number): modelsv2.AssetParams | undefined {
-		return this.createdAssets.get(assetId);
+		return this._createdAssets?.get(assetId);
 	}
 
 	/**
@@ -228,7 +290,7 @@ export class AccountStore implements AccountStoreI {
 	 * @param assetId asset index
 	 */
 	getAssetHolding(assetId: number): AssetHoldingM | undefined {
-		return this.assets.get(assetId);
+		return this._assets?.get(assetId);
 	}
 
 	/**
@@ -277,7 +339,7 @@ export class AccountStore implements AccountStoreI {
 		 * will not be executed if asset holding doesn't exist (as need to empty this.account to closeRemTo
 		 * in runtime via ctx.transferAsset before removing asset holding)
 		 */
-		if (this.assets.has(assetId)) {
+		if (this._assets?.has(assetId)) {
 			this.minBalance -= ASSET_CREATION_FEE;
 			// https://developer.algorand.org/docs/reference/transactions/#asset-transfer-transaction
 			this.assets.delete(assetId); // remove asset holding from account
@@ -290,7 +352,7 @@ export class AccountStore implements AccountStoreI {
 	 * @state new freeze state
 	 */
 	setFreezeState(assetId: number, state: boolean): void {
-		const holding = this.assets.get(assetId);
+		const holding = this.getAssetHolding(assetId);
 		if (holding === undefined) {
 			throw new RuntimeError(RUNTIME_ERRORS.TRANSACTION.ASA_NOT_OPTIN, {
 				address: this.address,
@@ -305,7 +367,7 @@ export class AccountStore implements AccountStoreI {
 	 * @param assetId Asset Index
 	 */
 	destroyAsset(assetId: number): void {
-		const holding = this.assets.get(assetId);
+		const holding = this.getAssetHolding(assetId);
 		const asset = this.getAssetDef(assetId);
 		if (holding === undefined || asset === undefined) {
 			throw new RuntimeError(RUNTIME_ERRORS.ASA.ASSET_NOT_FOUND, { assetId: assetId });
@@ -338,7 +400,7 @@ export class AccountStore implements AccountStoreI {
 
 	// opt in to application
 	optInToApp(appID: number, appParams: SSCAttributesM): void {
-		const localState = this.appsLocalState.get(appID); // fetch local state from account
+		const localState = this.getAppFromLocal(appID); // fetch local state from account
 		if (localState) {
 			throw new Error(`${this.address} is already opted in to app ${appID}`);
 		} else {
@@ -360,7 +422,7 @@ export class AccountStore implements AccountStoreI {
 
 	// opt-in to asset
 	optInToASA(assetIndex: number, assetHolding: AssetHoldingM): void {
-		const accAssetHolding = this.assets.get(assetIndex); // fetch asset holding of account
+		const accAssetHolding = this.getAssetHolding(assetIndex); // fetch asset holding of account
 		if (accAssetHolding) {
 			console.warn(`${this.address} is already opted in to asset ${assetIndex}`);
 		} else {
@@ -371,7 +433,7 @@ export class AccountStore implements AccountStoreI {
 
 	// delete application from account's global state (createdApps)
 	deleteApp(appID: number): void {
-		const app = this.createdApps.get(appID);
+		const app = this.getApp(appID);
 		if (!app) {
 			throw new RuntimeError(RUNTIME_ERRORS.GENERAL.APP_NOT_FOUND, {
 				appID: appID,
@@ -389,7 +451,7 @@ export class AccountStore implements AccountStoreI {
 
 	// close(delete) application from account's local state (appsLocalState)
 	closeApp(appID: number): void {
-		const localApp = this.appsLocalState.get(appID);
+		const localApp = this.getAppFromLocal(appID);
 		if (!localApp) {
 			throw new RuntimeError(RUNTIME_ERRORS.GENERAL.APP_NOT_FOUND, {
 				appID: appID,
@@ -21,16 +21,7 @@ import {
 	ZERO_ADDRESS_STR,
 	MaxAppProgramLen,
 } from "./lib/constants";
-import {
-	calculateFeeCredit,
-	isEncTxApplicationCreate,
-	isEncTxAssetCreate,
-	isEncTxAssetDeletion,
-	isEncTxAssetOptIn,
-	isEncTxAssetReconfigure,
-	isEncTxAssetRevoke,
-	isEncTxAssetTransfer,
-} from "./lib/txn";
+import { calculateFeeCredit, encodeSignedTxn } from "./lib/txn";
 import { mockSuggestedParams } from "./mock/tx";
 import { getProgramVersion } from "./parser/parser";
 import {
@@ -41,7 +32,9 @@ import {
 	ASAInfo,
 	AssetHoldingM,
 	Context,
+	EncodedTxnRecord,
 	EncTx,
+	EncTxKind,
 	ExecutionMode,
 	ID,
 	SCParams,
@@ -73,6 +66,11 @@ export class Ctx implements Context {
 	lastLog: Uint8Array;
 	txnType: TransactionType | undefined; // Determines the transaction type. It is required to
 	// know the transaction type of current transaction in execution.
+	// index (in the top-level group) of the transaction being processed: the index of the
+	// failed transaction when processing throws an error
+	txIndex: number | undefined;
+	// IDs of the receipts set since the last commit (checked by the receipt retention policy)
+	addedReceipts: string[];
 	constructor(
 		state: State,
 		tx: EncTx,
@@ -101,11 +99,23 @@ export class Ctx implements Context {
 		this.remainingTxns = 256;
 		this.budget = MAX_APP_PROGRAM_COST;
 		this.txnType = undefined;
+		this.txIndex = undefined;
+		this.addedReceipts = [];
+	}
+
+	/**
+	 * Sets the receipt of a transaction in the context state.
+	 * @param txID transaction ID
+	 * @param receipt transaction receipt
+	 */
+	setTxReceipt(txID: string, receipt: TxReceipt): void {
+		this.state.txReceipts.set(txID, receipt);
+		this.addedReceipts.push(txID);
 	}
 
 	private setAndGetTxReceipt(): TxReceipt {
 		const info = { txn: this.tx, txID: this.tx.txID };
-		this.state.txReceipts.set(this.tx.txID, info);
+		this.setTxReceipt(this.tx.txID, info);
 		return info;
 	}
 
@@ -326,7 +336,7 @@ export class Ctx implements Context {
 		this.state.assetNameInfo.set(name, asaInfo);
 
 		// set & return transaction receipt
-		this.state.txReceipts.set(this.tx.txID, asaInfo);
+		this.setTxReceipt(this.tx.txID, asaInfo);
 		return asaInfo;
 	}
 
@@ -716,7 +726,7 @@ export class Ctx implements Context {
 		creatorAcc.destroyAsset(assetId);
 		// delete asset holdings from all accounts
 		this.state.accounts.forEach((value, key) => {
-			value.assets.delete(assetId);
+			if (value.getAssetHolding(assetId) !== undefined) value.assets.delete(assetId);
 		});
 		return this.setAndGetTxReceipt();
 	}
@@ -828,21 +838,22 @@ export class Ctx implements Context {
 	 * then it does not affect runtime.store, otherwise we just update
 	 * store with ctx (if all transactions are executed successfully).
 	 * @param txParams Transaction Parameters
+	 * @param encodedTxns transactions encoded by the caller (see `encodeSignedTxn`)
 	 */
 	/* eslint-disable sonarjs/cognitive-complexity */
 	processTransactions(
 		signedTransactions: algosdk.SignedTransaction[],
 		appDefMap?: Map<number, types.AppDefinition | types.SmartContract>,
-		lsigMap?: Map<number, types.Lsig>
+		lsigMap?: Map<number, types.Lsig>,
+		encodedTxns: EncodedTxnRecord[] = signedTransactions.map(encodeSignedTxn)
 	): TxReceipt[] {
 		const txReceipts: TxReceipt[] = [];
 		let r: TxReceipt;
 		this.verifyMinimumFees();
 		this.verifyAndUpdateInnerAppCallStack();
 		signedTransactions.forEach((signedTransaction, idx) => {
-			const fromAccountAddr = webTx.getTxFromAddress(signedTransaction.txn);
-			let payFlags: types.TxParams = {};
-			payFlags = webTx.getTxFlags(signedTransaction.txn);
+			const { from: fromAccountAddr, flags: payFlags, kind } = encodedTxns[idx];
+			if (!this.isInnerTx) this.txIndex = idx;
 			this.txnType = signedTransaction.txn.type;
 			this.deductFee(fromAccountAddr, idx, payFlags);
 			if (lsigMap !== undefined && lsigMap.get(idx) !== undefined) {
@@ -854,7 +865,7 @@ export class Ctx implements Context {
 			} else if (signedTransaction.msig) {
 				this.runtime.validateMultisignature(signedTransaction);
 			} else if (signedTransaction.sgnr || signedTransaction.sig) {
-				this.runtime.validateSecretKeySignature(signedTransaction);
+				this.runtime.validateSecretKeySignature(signedTransaction, fromAccountAddr);
 			}
 			//verify and reduce number remain Txn
 			if (this.remainingTxns > 0) {
@@ -892,9 +903,7 @@ export class Ctx implements Context {
 					switch (signedTransaction.txn.appOnComplete) {
 						case algosdk.OnApplicationComplete.NoOpOC: {
 							//deployApp
-							if (
-								isEncTxApplicationCreate(signedTransaction.txn.get_obj_for_encoding() as EncTx)
-							) {
+							if (kind === EncTxKind.APP_CREATE) {
 								this.tx = this.gtxs[idx]; // update current tx to the requested index
 								if (appDefMap === undefined) {
 									throw new Error("App definition needs to be provided");
@@ -984,7 +993,7 @@ export class Ctx implements Context {
 					break;
 				}
 				case TransactionType.acfg: {
-					if (isEncTxAssetCreate(signedTransaction.txn.get_obj_for_encoding() as EncTx)) {
+					if (kind === EncTxKind.ASSET_CREATE) {
 						this.tx = this.gtxs[idx]; // update current tx to the requested index
 						const senderAcc = this.getAccount(fromAccountAddr);
 						const flags: ASADeploymentFlags = {
@@ -998,9 +1007,7 @@ export class Ctx implements Context {
 							flags
 						);
 						this.knowableID.set(idx, r.assetIndex);
-					} else if (
-						isEncTxAssetReconfigure(signedTransaction.txn.get_obj_for_encoding() as EncTx)
-					) {
+					} else if (kind === EncTxKind.ASSET_RECONFIGURE) {
 						const asset = this.getAssetDef(signedTransaction.txn.assetIndex);
 						if (asset.manager !== fromAccountAddr) {
 							throw new RuntimeError(RUNTIME_ERRORS.ASA.MANAGER_ERROR, {
@@ -1012,9 +1019,7 @@ export class Ctx implements Context {
 							signedTransaction.txn.assetIndex,
 							webTx.getAssetReconfigureFields(signedTransaction.txn)
 						);
-					} else if (
-						isEncTxAssetDeletion(signedTransaction.txn.get_obj_for_encoding() as EncTx)
-					) {
+					} else if (kind === EncTxKind.ASSET_DELETION) {
 						const asset = this.getAssetDef(signedTransaction.txn.assetIndex);
 						if (asset.manager !== fromAccountAddr) {
 							throw new RuntimeError(RUNTIME_ERRORS.ASA.MANAGER_ERROR, {
@@ -1026,11 +1031,9 @@ export class Ctx implements Context {
 					break;
 				}
 				case TransactionType.axfer: {
-					if (isEncTxAssetTransfer(signedTransaction.txn.get_obj_for_encoding() as EncTx)) {
+					if (kind === EncTxKind.ASSET_TRANSFER) {
 						r = this.transferAsset(signedTransaction.txn);
-					} else if (
-						isEncTxAssetRevoke(signedTransaction.txn.get_obj_for_encoding() as EncTx)
-					) {
+					} else if (kind === EncTxKind.ASSET_REVOKE) {
 						const asset = this.getAssetDef(signedTransaction.txn.assetIndex);
 						if (asset.clawback !== fromAccountAddr) {
 							throw new RuntimeError(RUNTIME_ERRORS.ASA.CLAWBACK_ERROR, {
@@ -1046,7 +1049,7 @@ export class Ctx implements Context {
 							webTx.getTxRevokeAddress(signedTransaction.txn),
 							BigInt(signedTransaction.txn.amount)
 						);
-					} else if (isEncTxAssetOptIn(signedTransaction.txn.get_obj_for_encoding() as EncTx)) {
+					} else if (kind === EncTxKind.ASSET_OPT_IN) {
 						r = this.optInToASA(signedTransaction.txn.assetIndex, fromAccountAddr, payFlags);
 					}
 					break;
@@ -670,6 +670,25 @@ const runtimeGeneralErrors = {
 		title: "Invalid network not found in config",
 		description: "Not found network %network% in config",
 	},
+	INVALID_MSGPACK_DATA: {
+		number: 1328,
+		message: "Invalid msgpack type byte 0x%byte% at offset %offset%",
+		title: "Invalid msgpack data",
+		description: "Data could not be parsed as msgpack: unknown type byte 0x%byte%",
+	},
+	INVALID_MSGPACK_FILE: {
+		number: 1329,
+		message: "File %file% ends with an incomplete msgpack value at offset %offset%",
+		title: "Incomplete msgpack file",
+		description: "File %file% is truncated or is not a msgpack encoded file",
+	},
+	UNKNOWN_REPLAY_RECORD: {
+		number: 1330,
+		message: "Record %index% in %file% is neither a signed transaction nor a block",
+		title: "Unknown replay record",
+		description:
+			"Replay files must contain msgpack encoded signed transactions or blocks (with `txns` array)",
+	},
 };
 
 const transactionErrors = {
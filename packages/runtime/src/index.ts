@@ -10,16 +10,19 @@ import {
 	validateASADefs,
 	validateOptInAccNames,
 } from "./lib/asa";
+import { analyzeCost } from "./lib/cost-analyzer";
 import {
 	getPathFromDirRecursive,
 	loadFromYamlFileSilent,
 	loadFromYamlFileSilentWithMessage,
 	lsTreeWalk,
 } from "./lib/files";
+import { msgpackValueEnd, readMsgpackFile } from "./lib/msgpack";
 import { PyCompileOp } from "./lib/pycompile-op";
 import { checkIfAssetDeletionTx } from "./lib/txn";
 import { LogicSigAccount } from "./logicsig";
 import { parser } from "./parser/parser";
+import { LedgerReplay } from "./replay";
 import { Runtime } from "./runtime";
 import * as types from "./types";
 
@@ -29,6 +32,7 @@ export {
 	parseASADef,
 	validateOptInAccNames,
 	Runtime,
+	LedgerReplay,
 	AccountStore,
 	LogicSigAccount,
 	checkIfAssetDeletionTx,
@@ -43,5 +47,8 @@ export {
 	getPathFromDirRecursive,
 	PyCompileOp,
 	getProgram,
+	analyzeCost,
+	msgpackValueEnd,
+	readMsgpackFile,
 	types,
 };
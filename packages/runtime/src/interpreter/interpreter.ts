@@ -604,8 +604,21 @@ export class Interpreter {
 					txReceipt.gas = this.runtime.ctx.pooledApplCost;
 				}
 			}
+			if (this.mode === ExecutionMode.APPLICATION) {
+				// cost of this app call only (`gas` is static or pooled, depending on version)
+				txReceipt.opcodeCost = this.cost;
+			}
 
 			this.printStack(instruction, debugStack);
+			if (this.runtime.tracer !== undefined) {
+				this.runtime.tracer({
+					txID: this.runtime.ctx.tx.txID,
+					line: instruction.line,
+					opcode: instruction.constructor.name,
+					cost: this.cost,
+					stack: this.stack.debug(this.stack.length()),
+				});
+			}
 			this.instructionIndex++;
 		}
 
@@ -67,7 +67,12 @@ import {
 	vrfVerifyFieldTypes,
 	ZERO_ADDRESS,
 } from "../lib/constants";
-import { addInnerTransaction, calculateInnerTxCredit, setInnerTxField } from "../lib/itxn";
+import {
+	addInnerTransaction,
+	calculateInnerTxCredit,
+	ITxnFieldDescriptor,
+	resolveInnerTxField,
+} from "../lib/itxn";
 import { bigintSqrt } from "../lib/math";
 import {
 	assertBase64,
@@ -1502,9 +1507,6 @@ export class Gtxn extends Op {
 	readonly interpreter: Interpreter;
 	readonly line: number;
 	protected txIdx: number;
-	// use to store group txn we want to query
-	// can change it to inner group txn
-	groupTxn: EncTx[];
 	/**
 	 * Sets `field`, `txIdx` values according to the passed arguments.
 	 * @param args Expected arguments: [transaction group index, transaction field]
@@ -1530,19 +1532,25 @@ export class Gtxn extends Op {
 		this.assertTxFieldDefined(argument, interpreter.tealVersion, line);
 		this.txIdx = Number(args[0]); // transaction group index
 		this.field = argument; // field
-		this.groupTxn = interpreter.runtime.ctx.gtxs;
 		this.interpreter = interpreter;
 	}
 
+	// group txn we want to query (read when the opcode is executed, so the program can be
+	// parsed without a context). Overridden to query the last inner group.
+	protected groupTxns(): EncTx[] {
+		return this.interpreter.runtime.ctx.gtxs;
+	}
+
 	execute(stack: TEALStack): number {
 		this.assertUint8(BigInt(this.txIdx), this.line);
-		this.checkIndexBound(this.txIdx, this.groupTxn, this.line);
+		const groupTxn = this.groupTxns();
+		this.checkIndexBound(this.txIdx, groupTxn, this.line);
 		let result;
-		const tx = this.groupTxn[this.txIdx]; // current tx
+		const tx = groupTxn[this.txIdx]; // current tx
 		if (this.txFieldIdx !== undefined) {
 			result = txAppArg(this.field, tx, this.txFieldIdx, this, this.interpreter, this.line);
 		} else {
-			result = txnSpecByField(this.field, tx, this.groupTxn, this.interpreter);
+			result = txnSpecByField(this.field, tx, groupTxn, this.interpreter);
 		}
 		stack.push(result);
 		return this.computeCost();
@@ -1614,7 +1622,6 @@ export class Gtxna extends Op {
 	readonly interpreter: Interpreter;
 	readonly line: number;
 	fieldIdx: number; // array index
-	groupTxn: EncTx[];
 	protected txIdx: number; // transaction group index
 
 	/**
@@ -1639,15 +1646,21 @@ export class Gtxna extends Op {
 		this.txIdx = Number(args[0]); // transaction group index
 		this.field = argument; // field
 		this.fieldIdx = Number(args[2]); // transaction field array index
-		this.groupTxn = interpreter.runtime.ctx.gtxs;
 		this.interpreter = interpreter;
 		this.line = line;
 	}
 
+	// group txn we want to query (read when the opcode is executed, so the program can be
+	// parsed without a context). Overridden to query the last inner group.
+	protected groupTxns(): EncTx[] {
+		return this.interpreter.runtime.ctx.gtxs;
+	}
+
 	execute(stack: TEALStack): number {
 		this.assertUint8(BigInt(this.txIdx), this.line);
-		this.checkIndexBound(this.txIdx, this.groupTxn, this.line);
-		const tx = this.groupTxn[this.txIdx];
+		const groupTxn = this.groupTxns();
+		this.checkIndexBound(this.txIdx, groupTxn, this.line);
+		const tx = groupTxn[this.txIdx];
 		const result = txAppArg(this.field, tx, this.fieldIdx, this, this.interpreter, this.line);
 		stack.push(result);
 		return this.computeCost();
@@ -4253,6 +4266,7 @@ export class ITxnBegin extends Op {
 // push to stack [...stack, none]
 export class ITxnField extends Op {
 	readonly field: string;
+	readonly descriptor: ITxnFieldDescriptor;
 	readonly interpreter: Interpreter;
 	readonly line: number;
 
@@ -4270,6 +4284,7 @@ export class ITxnField extends Op {
 		this.assertTxFieldDefined(argument, interpreter.tealVersion, line);
 		assertLen(args.length, 1, line);
 		this.field = argument; // field
+		this.descriptor = resolveInnerTxField(argument, interpreter.tealVersion);
 		this.interpreter = interpreter;
 	}
 
@@ -4284,9 +4299,8 @@ export class ITxnField extends Op {
 		}
 
 		const lastInnerTxID = this.interpreter.currentInnerTxnGroup.length - 1;
-		const lastInnerTx = setInnerTxField(
+		const lastInnerTx = this.descriptor.set(
 			this.interpreter.currentInnerTxnGroup[lastInnerTxID],
-			this.field,
 			valToSet,
 			this,
 			this.interpreter,
@@ -4939,12 +4953,9 @@ export class Gitxn extends Gtxn {
 		super(args, line, interpreter);
 	}
 
-	execute(stack: TEALStack): number {
-		// change context to last inner txn submitted
-		const lastInnerTxnGroupIndex = this.interpreter.innerTxnGroups.length - 1;
-		const lastInnerTxnGroup = this.interpreter.innerTxnGroups[lastInnerTxnGroupIndex];
-		this.groupTxn = lastInnerTxnGroup;
-		return super.execute(stack);
+	// query the last inner txn group submitted
+	protected groupTxns(): EncTx[] {
+		return this.interpreter.innerTxnGroups[this.interpreter.innerTxnGroups.length - 1];
 	}
 }
 
@@ -4965,12 +4976,9 @@ export class Gitxna extends Gtxna {
 		super(args, line, interpreter);
 	}
 
-	execute(stack: TEALStack): number {
-		// change context to last inner txn submitted
-		const lastInnerTxnGroupIndex = this.interpreter.innerTxnGroups.length - 1;
-		const lastInnerTxnGroup = this.interpreter.innerTxnGroups[lastInnerTxnGroupIndex];
-		this.groupTxn = lastInnerTxnGroup;
-		return super.execute(stack);
+	// query the last inner txn group submitted
+	protected groupTxns(): EncTx[] {
+		return this.interpreter.innerTxnGroups[this.interpreter.innerTxnGroups.length - 1];
 	}
 }
 
@@ -4989,12 +4997,9 @@ export class Gitxnas extends Gtxnas {
 		super(args, line, interpreter);
 	}
 
-	execute(stack: TEALStack): number {
-		// change context to last inner txn submitted
-		const lastInnerTxnGroupIndex = this.interpreter.innerTxnGroups.length - 1;
-		const lastInnerTxnGroup = this.interpreter.innerTxnGroups[lastInnerTxnGroupIndex];
-		this.groupTxn = lastInnerTxnGroup;
-		return super.execute(stack);
+	// query the last inner txn group submitted
+	protected groupTxns(): EncTx[] {
+		return this.interpreter.innerTxnGroups[this.interpreter.innerTxnGroups.length - 1];
 	}
 }
 
@@ -5037,8 +5042,12 @@ export class Base64Decode extends Op {
 		}
 	}
 
-	computeCost(): number {
-		return 1 + Math.ceil(this.length / 16); // cost = 1 + ceil(bytes / 16)
+	computeCost(length = this.length): number {
+		return 1 + Math.ceil(length / 16); // cost = 1 + ceil(bytes / 16)
+	}
+
+	maxCost(): number {
+		return this.computeCost(MAX_CONCAT_SIZE);
 	}
 
 	execute(stack: TEALStack): number {
@@ -5189,8 +5198,12 @@ export class Json_ref extends Op {
 		}
 	}
 
-	computeCost(): number {
-		return 25 + 2 * Math.ceil(this.length / 7); // cost = 25 + ceil(bytes / 7)
+	computeCost(length = this.length): number {
+		return 25 + 2 * Math.ceil(length / 7); // cost = 25 + ceil(bytes / 7)
+	}
+
+	maxCost(): number {
+		return this.computeCost(MAX_CONCAT_SIZE);
 	}
 
 	execute(stack: TEALStack): number {
@@ -34,6 +34,14 @@ export abstract class Op {
 		return 1;
 	}
 
+	/**
+	 * Returns the maximum cost of the opcode, used by the static cost analysis. It's equal
+	 * to `computeCost` for opcodes with a cost independent of the stack values.
+	 */
+	maxCost(): number {
+		return this.computeCost();
+	}
+
 	/**
 	 * assert stack length is atleast minLen
 	 * @param stack TEAL stack
@@ -1,5 +1,6 @@
 import { EncodedAssetParams, EncodedLocalStateSchema, EncodedTransaction } from "algosdk";
-import cloneDeep from "lodash.clonedeep";
+
+import { versionMapTable, versionSetTable } from "./version-table";
 
 export const MIN_UINT64 = 0n;
 export const MAX_UINT64 = 0xffffffffffffffffn;
@@ -71,8 +72,9 @@ type keyOfEncTx =
 	| keyof EncodedLocalStateSchema;
 
 // https://developer.algorand.org/docs/reference/teal/opcodes/#txn
-// transaction fields supported by teal v1
-export const TxnFields: { [key: number]: { [key: string]: keyOfEncTx | null } } = {
+// transaction fields added in each teal version
+const txnFieldsChanges: { [key: number]: { [key: string]: keyOfEncTx | null } } = {
+	// transaction fields supported by teal v1
 	1: {
 		Sender: "snd",
 		Fee: "fee",
@@ -98,126 +100,97 @@ export const TxnFields: { [key: number]: { [key: string]: keyOfEncTx | null } }
 		GroupIndex: null,
 		TxID: null,
 	},
-};
-
-// transaction fields supported by teal v2
-TxnFields[2] = {
-	...TxnFields[1],
-	ApplicationID: "apid",
-	OnCompletion: "apan",
-	ApplicationArgs: "apaa",
-	NumAppArgs: null,
-	Accounts: "apat",
-	NumAccounts: null,
-	ApprovalProgram: "apap",
-	ClearStateProgram: "apsu",
-	RekeyTo: "rekey",
-	ConfigAsset: "caid",
-	ConfigAssetTotal: "t",
-	ConfigAssetDecimals: "dc",
-	ConfigAssetDefaultFrozen: "df",
-	ConfigAssetUnitName: "un",
-	ConfigAssetName: "an",
-	ConfigAssetURL: "au",
-	ConfigAssetMetadataHash: "am",
-	ConfigAssetManager: "m",
-	ConfigAssetReserve: "r",
-	ConfigAssetFreeze: "f",
-	ConfigAssetClawback: "c",
-	FreezeAsset: "faid",
-	FreezeAssetAccount: "fadd",
-	FreezeAssetFrozen: "afrz",
-};
-
-TxnFields[3] = {
-	...TxnFields[2],
-	Assets: "apas",
-	NumAssets: null,
-	Applications: "apfa",
-	NumApplications: null,
-	GlobalNumUint: "nui",
-	GlobalNumByteSlice: "nbs",
-	LocalNumUint: "nui",
-	LocalNumByteSlice: "nbs",
-};
-
-TxnFields[4] = {
-	...TxnFields[3],
-	ExtraProgramPages: "apep",
-};
-
-TxnFields[5] = {
-	...TxnFields[4],
-	CreatedAssetID: null,
-	CreatedApplicationID: null,
-	Nonparticipation: "nonpart",
-};
+	// transaction fields supported by teal v2
+	2: {
+		ApplicationID: "apid",
+		OnCompletion: "apan",
+		ApplicationArgs: "apaa",
+		NumAppArgs: null,
+		Accounts: "apat",
+		NumAccounts: null,
+		ApprovalProgram: "apap",
+		ClearStateProgram: "apsu",
+		RekeyTo: "rekey",
+		ConfigAsset: "caid",
+		ConfigAssetTotal: "t",
+		ConfigAssetDecimals: "dc",
+		ConfigAssetDefaultFrozen: "df",
+		ConfigAssetUnitName: "un",
+		ConfigAssetName: "an",
+		ConfigAssetURL: "au",
+		ConfigAssetMetadataHash: "am",
+		ConfigAssetManager: "m",
+		ConfigAssetReserve: "r",
+		ConfigAssetFreeze: "f",
+		ConfigAssetClawback: "c",
+		FreezeAsset: "faid",
+		FreezeAssetAccount: "fadd",
+		FreezeAssetFrozen: "afrz",
+	},
 
-TxnFields[6] = {
-	...TxnFields[5],
-	LastLog: null,
-	StateProofPK: null,
-};
+	3: {
+		Assets: "apas",
+		NumAssets: null,
+		Applications: "apfa",
+		NumApplications: null,
+		GlobalNumUint: "nui",
+		GlobalNumByteSlice: "nbs",
+		LocalNumUint: "nui",
+		LocalNumByteSlice: "nbs",
+	},
 
-TxnFields[7] = {
-	...TxnFields[6],
-	ApprovalProgramPages: null,
-	ClearStateProgramPages: null,
-	NumApprovalProgramPages: null,
-	NumClearStateProgramPages: null,
-	FirstValidTime: null,
-};
-TxnFields[8] = cloneDeep(TxnFields[7]);
+	4: {
+		ExtraProgramPages: "apep",
+	},
 
-export const ITxnFields: { [key: number]: { [key: string]: keyOfEncTx | null } } = {
-	1: {},
-	2: {},
-	3: {},
-	4: {},
 	5: {
-		Logs: null,
-		NumLogs: null,
 		CreatedAssetID: null,
 		CreatedApplicationID: null,
+		Nonparticipation: "nonpart",
 	},
-};
-
-ITxnFields[6] = {
-	...ITxnFields[5],
-};
 
-ITxnFields[7] = {
-	...ITxnFields[6],
-};
-
-ITxnFields[8] = {
-	...ITxnFields[7],
-};
+	6: {
+		LastLog: null,
+		StateProofPK: null,
+	},
 
-// transaction fields of type array
-export const TxArrFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(["Accounts", "ApplicationArgs"]),
+	7: {
+		ApprovalProgramPages: null,
+		ClearStateProgramPages: null,
+		NumApprovalProgramPages: null,
+		NumClearStateProgramPages: null,
+		FirstValidTime: null,
+	},
 };
-TxArrFields[3] = new Set([...TxArrFields[2], "Assets", "Applications"]);
-TxArrFields[4] = cloneDeep(TxArrFields[3]);
-TxArrFields[5] = new Set([...TxArrFields[4], "Logs"]);
-TxArrFields[6] = cloneDeep(TxArrFields[5]);
-TxArrFields[7] = new Set([...TxArrFields[6], "ApprovalProgramPages", "ClearStateProgramPages"]);
-TxArrFields[8] = cloneDeep(TxArrFields[7]);
+export const TxnFields = versionMapTable(txnFieldsChanges, MaxTEALVersion);
+
+export const ITxnFields = versionMapTable<keyOfEncTx | null>(
+	{
+		1: {},
+		5: {
+			Logs: null,
+			NumLogs: null,
+			CreatedAssetID: null,
+			CreatedApplicationID: null,
+		},
+	},
+	MaxTEALVersion
+);
+
+// transaction fields of type array (added in each teal version)
+export const TxArrFields = versionSetTable<string>(
+	{
+		1: [],
+		2: ["Accounts", "ApplicationArgs"],
+		3: ["Assets", "Applications"],
+		5: ["Logs"],
+		7: ["ApprovalProgramPages", "ClearStateProgramPages"],
+	},
+	MaxTEALVersion
+);
 
 // itxn fields of type array
-export const ITxArrFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set(["Logs"]),
-};
-
-ITxArrFields[6] = cloneDeep(ITxArrFields[5]);
-ITxArrFields[7] = cloneDeep(ITxArrFields[6]);
-ITxArrFields[8] = cloneDeep(ITxArrFields[7]);
+export const ITxArrFields = versionSetTable<string>({ 1: [], 5: ["Logs"] }, MaxTEALVersion);
 
 export const TxFieldDefaults: { [key: string]: any } = {
 	Sender: ZERO_ADDRESS,
@@ -278,34 +251,27 @@ export const TxFieldDefaults: { [key: string]: any } = {
 	Nonparticipation: zeroUint64,
 };
 
-export const AssetParamMap: { [key: number]: { [key: string]: string } } = {
-	1: {
-		AssetTotal: "total", // Total number of units of this asset
-		AssetDecimals: "decimals", // See AssetDef.Decimals
-		AssetDefaultFrozen: "defaultFrozen", // Frozen by default or not
-		AssetUnitName: "unitName", // Asset unit name
-		AssetName: "name", // Asset name
-		AssetURL: "url", // URL with additional info about the asset
-		AssetMetadataHash: "metadataHash", // Arbitrary commitment
-		AssetManager: "manager", // Manager commitment
-		AssetReserve: "reserve", // Reserve address
-		AssetFreeze: "freeze", // Freeze address
-		AssetClawback: "clawback", // Clawback address
+export const AssetParamMap = versionMapTable<string>(
+	{
+		1: {
+			AssetTotal: "total", // Total number of units of this asset
+			AssetDecimals: "decimals", // See AssetDef.Decimals
+			AssetDefaultFrozen: "defaultFrozen", // Frozen by default or not
+			AssetUnitName: "unitName", // Asset unit name
+			AssetName: "name", // Asset name
+			AssetURL: "url", // URL with additional info about the asset
+			AssetMetadataHash: "metadataHash", // Arbitrary commitment
+			AssetManager: "manager", // Manager commitment
+			AssetReserve: "reserve", // Reserve address
+			AssetFreeze: "freeze", // Freeze address
+			AssetClawback: "clawback", // Clawback address
+		},
+		5: {
+			AssetCreator: "creator",
+		},
 	},
-};
-
-AssetParamMap[2] = { ...AssetParamMap[1] };
-AssetParamMap[3] = { ...AssetParamMap[2] };
-AssetParamMap[4] = { ...AssetParamMap[3] };
-
-AssetParamMap[5] = {
-	...AssetParamMap[4],
-	AssetCreator: "creator",
-};
-
-AssetParamMap[6] = { ...AssetParamMap[5] };
-AssetParamMap[7] = { ...AssetParamMap[6] };
-AssetParamMap[8] = { ...AssetParamMap[7] };
+	MaxTEALVersion
+);
 
 // https://developer.algorand.org/docs/get-details/dapps/avm/teal/opcodes/?from_query=opcode#asset_params_get-f
 export enum AssetParamGetField {
@@ -411,27 +377,23 @@ export enum TxnaField {
 }
 
 // app param use for app_params_get opcode
-export const AppParamDefined: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([
-		AppParamField.AppApprovalProgram,
-		AppParamField.AppClearStateProgram,
-		AppParamField.AppGlobalNumUint,
-		AppParamField.AppGlobalNumByteSlice,
-		AppParamField.AppLocalNumUint,
-		AppParamField.AppLocalNumByteSlice,
-		AppParamField.AppExtraProgramPages,
-		AppParamField.AppCreator,
-		AppParamField.AppAddress,
-	]),
-};
-
-AppParamDefined[6] = cloneDeep(AppParamDefined[5]);
-AppParamDefined[7] = cloneDeep(AppParamDefined[6]);
-AppParamDefined[8] = cloneDeep(AppParamDefined[7]);
+export const AppParamDefined = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			AppParamField.AppApprovalProgram,
+			AppParamField.AppClearStateProgram,
+			AppParamField.AppGlobalNumUint,
+			AppParamField.AppGlobalNumByteSlice,
+			AppParamField.AppLocalNumUint,
+			AppParamField.AppLocalNumByteSlice,
+			AppParamField.AppExtraProgramPages,
+			AppParamField.AppCreator,
+			AppParamField.AppAddress,
+		],
+	},
+	MaxTEALVersion
+);
 
 // param use for query acct_params_get opcode
 
@@ -478,8 +440,8 @@ export const reBase32 = /^[A-Z2-7]+=*$/;
 // reference for values: https://github.com/algorand/go-algorand/blob/master/config/consensus.go#L510
 // for fields: https://developer.algorand.org/docs/reference/teal/opcodes/#global
 // global field supported by teal v1
-export const GlobalFields: { [key: number]: { [key: string]: any } } = {
-	// teal version => global field => value
+const globalFieldsChanges: { [key: number]: { [key: string]: any } } = {
+	// teal version => global field => value (added in the version)
 	1: {
 		MinTxnFee: ALGORAND_MIN_TX_FEE,
 		MinBalance: 10000,
@@ -487,56 +449,40 @@ export const GlobalFields: { [key: number]: { [key: string]: any } } = {
 		ZeroAddress: ZERO_ADDRESS,
 		GroupSize: null,
 	},
-};
 
-// global field supported by teal v2
-// Note: Round, LatestTimestamp are dummy values and these are overrided by runtime class's
-// round and timestamp
-GlobalFields[2] = {
-	...GlobalFields[1],
-	LogicSigVersion: MaxTEALVersion,
-	Round: 1,
-	LatestTimestamp: 1,
-	CurrentApplicationID: null,
-};
-
-// global fields supported by tealv3
-GlobalFields[3] = {
-	...GlobalFields[2],
-	CreatorAddress: null,
-};
-
-// global fields supported by tealv4
-GlobalFields[4] = {
-	...GlobalFields[3],
-};
-
-// global fields supported by tealv5
-GlobalFields[5] = {
-	...GlobalFields[4],
-	GroupID: null,
-	CurrentApplicationAddress: null,
-};
+	// global field supported by teal v2
+	// Note: Round, LatestTimestamp are dummy values and these are overrided by runtime class's
+	// round and timestamp
+	2: {
+		LogicSigVersion: MaxTEALVersion,
+		Round: 1,
+		LatestTimestamp: 1,
+		CurrentApplicationID: null,
+	},
 
-// global fields supported in tealv6
-GlobalFields[6] = {
-	...GlobalFields[5],
-	OpcodeBudget: 0,
-	CallerApplicationID: null,
-	CallerApplicationAddress: null,
-};
+	// global fields supported by tealv3
+	3: {
+		CreatorAddress: null,
+	},
 
-GlobalFields[7] = {
-	...GlobalFields[6],
-};
+	// global fields supported by tealv5
+	5: {
+		GroupID: null,
+		CurrentApplicationAddress: null,
+	},
 
-GlobalFields[8] = {
-	...GlobalFields[7],
+	// global fields supported in tealv6
+	6: {
+		OpcodeBudget: 0,
+		CallerApplicationID: null,
+		CallerApplicationAddress: null,
+	},
 };
+export const GlobalFields = versionMapTable(globalFieldsChanges, MaxTEALVersion);
 
 // creating map for opcodes whose cost is other than 1
-export const OpGasCost: { [key: number]: { [key: string]: number } } = {
-	// version => opcode => cost
+const opGasCostChanges: { [key: number]: { [key: string]: number } } = {
+	// version => opcode => cost (added or changed in the version)
 	// v1 opcodes cost
 	1: {
 		sha256: 7,
@@ -544,63 +490,54 @@ export const OpGasCost: { [key: number]: { [key: string]: number } } = {
 		keccak256: 26,
 		ed25519verify: 1900,
 	},
-};
 
-// v2 opcodes cost
-OpGasCost[2] = {
-	...OpGasCost[1], // includes all v1 opcodes
-	sha256: 35,
-	sha512_256: 45,
-	keccak256: 130,
-};
-
-/**
- * In tealv3, cost of crypto opcodes are same as v2.
- * All other opcodes have cost 1
- */
-OpGasCost[3] = { ...OpGasCost[2] };
+	// v2 opcodes cost
+	2: {
+		sha256: 35,
+		sha512_256: 45,
+		keccak256: 130,
+	},
 
-/*
- * tealv4
- */
-OpGasCost[4] = {
-	...OpGasCost[3],
-	"b+": 10,
-	"b-": 10,
-	"b*": 20,
-	"b/": 20,
-	"b%": 20,
-	"b|": 6,
-	"b&": 6,
-	"b^": 6,
-	"b~": 4,
-};
+	// In tealv3, cost of crypto opcodes are same as v2.
+	// All other opcodes have cost 1
+
+	/*
+	 * tealv4
+	 */
+	4: {
+		"b+": 10,
+		"b-": 10,
+		"b*": 20,
+		"b/": 20,
+		"b%": 20,
+		"b|": 6,
+		"b&": 6,
+		"b^": 6,
+		"b~": 4,
+	},
 
-/**
- * teal v5
- */
-OpGasCost[5] = {
-	...OpGasCost[4],
-	ecdsa_verify: 1700,
-	ecdsa_pk_decompress: 650,
-	ecdsa_pk_recover: 2000,
-};
+	/**
+	 * teal v5
+	 */
+	5: {
+		ecdsa_verify: 1700,
+		ecdsa_pk_decompress: 650,
+		ecdsa_pk_recover: 2000,
+	},
 
-OpGasCost[6] = {
-	...OpGasCost[5],
-	bsqrt: 40,
-};
-OpGasCost[7] = {
-	...OpGasCost[6],
-	sha3_256: 130,
-	ed25519verify_bare: 1900,
-	ecdsa_verify: 2500,
-	ecdsa_pk_decompress: 2400,
-	vrf_verify: 5700,
-};
-OpGasCost[8] = {
-	...OpGasCost[7],
+	6: {
+		bsqrt: 40,
+	},
+	7: {
+		sha3_256: 130,
+		ed25519verify_bare: 1900,
+		ecdsa_verify: 2500,
+		ecdsa_pk_decompress: 2400,
+		vrf_verify: 5700,
+	},
 };
+// version => opcode => cost (versions include the opcode costs of the previous versions)
+export const OpGasCost = versionMapTable(opGasCostChanges, MaxTEALVersion);
 
 export const enum MathOp {
 	// arithmetic
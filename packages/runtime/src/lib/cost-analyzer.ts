@@ -0,0 +1,469 @@
+import { ABIMethod } from "algosdk";
+
+import { Interpreter } from "../interpreter/interpreter";
+import { Op } from "../interpreter/opcode";
+import {
+	Branch,
+	BranchIfNotZero,
+	BranchIfZero,
+	Byte,
+	Bytec,
+	Bytecblock,
+	Callsub,
+	Err,
+	Int,
+	Intc,
+	Intcblock,
+	Label,
+	PushBytes,
+	PushInt,
+	Retsub,
+	Return,
+	Switch,
+	Txn,
+	Txna,
+} from "../interpreter/opcode-list";
+import { isAddedBytecblock, isAddIntcblock, parseLines } from "../parser/parser";
+import {
+	CostAnalysisOptions,
+	CostEntryPoint,
+	CostLoop,
+	CostReport,
+	ExecutionMode,
+	TxOnComplete,
+} from "../types";
+import { LOGIC_SIG_MAX_COST, MAX_APP_PROGRAM_COST } from "./constants";
+import { convertToBuffer } from "./parsing";
+
+// worst-case costs of paths by the way they end: subroutine return (retsub), program
+// exit, jump back to the start of the analyzed loop. -Infinity: no such path
+type Costs = [number, number, number];
+const RET = 0;
+const EXIT = 1;
+const BACK = 2;
+const NONE: Costs = [-Infinity, -Infinity, -Infinity];
+const UNBOUNDED: Costs = [Infinity, Infinity, Infinity];
+
+const loopBoundAnnotation = /\/\/\s*@loop-bound\s+(\d+)/;
+
+interface BasicBlock {
+	start: number; // index of the first instruction
+	end: number; // index after the last instruction
+	line: number;
+	label?: string;
+	cost: number;
+	succ: number[]; // successor blocks (for callsub: the block executed after the return)
+	ends: Costs; // 0 for the ways the block can end a path (retsub, return, err, program end)
+	call?: string; // subroutine called by the block
+}
+
+// dispatching branch of an application entry point
+interface Dispatch {
+	kind: CostEntryPoint["kind"];
+	name: string;
+	block: number; // block ending with the branch
+	target: number; // block executed when the entry point is selected
+}
+
+function add(costs: Costs, cost: number): Costs {
+	return costs.map((c) => (c === -Infinity ? c : c + cost)) as Costs;
+}
+
+function max(a: Costs, b: Costs): Costs {
+	return [Math.max(a[0], b[0]), Math.max(a[1], b[1]), Math.max(a[2], b[2])];
+}
+
+// value pushed by a constant opcode (undefined if `op` doesn't push a constant)
+function constantOf(op: Op, intcblock: bigint[], bytecblock: Uint8Array[]): unknown {
+	if (op instanceof Int || op instanceof PushInt) return op.uint64;
+	if (op instanceof Intc) return intcblock[op.index];
+	if (op instanceof Byte || op instanceof PushBytes) {
+		return convertToBuffer(op.str, op.encoding);
+	}
+	if (op instanceof Bytec) return bytecblock[op.index];
+	return undefined;
+}
+
+function isFirstAppArg(op: Op): boolean {
+	return (
+		(op instanceof Txn && op.field === "ApplicationArgs" && op.idx === 0) ||
+		(op instanceof Txna && op.field === "ApplicationArgs" && op.fieldIdx === 0)
+	);
+}
+
+function isOnCompletion(op: Op): boolean {
+	return op instanceof Txn && op.field === "OnCompletion";
+}
+
+/**
+ * Static worst-case cost analysis of a parsed TEAL program. The program is split in basic
+ * blocks and costs are computed on the control-flow graph (branches, switch, callsub/retsub).
+ * Loops are bounded with their annotations, cyclic parts of the graph are analyzed loop by
+ * loop (strongly connected components with a single entry).
+ */
+class CostAnalyzer {
+	readonly blocks: BasicBlock[] = [];
+	readonly loops = new Map<number, CostLoop>(); // by block of the loop start
+	readonly unbounded = new Map<number, string>(); // reasons by line
+	readonly labels = new Map<string, number>(); // block of each label
+	private readonly subroutines = new Map<string, Costs>();
+	private readonly calling = new Set<string>();
+
+	constructor(
+		readonly ops: Op[],
+		private readonly lines: string[],
+		private readonly loopBounds: { [label: string]: number }
+	) {
+		this.splitBlocks();
+	}
+
+	/**
+	 * Returns worst-case costs of the paths starting at block `entry`.
+	 * @param entry first block
+	 * @param inside blocks of the analyzed part of the graph
+	 * @param outside costs of paths starting at a successor which is not `inside`
+	 * @param back start of the analyzed loop: jumps to it end the path with `atBack` costs
+	 * @param atBack costs of a path ending with a jump to `back`
+	 */
+	longest(
+		entry: number,
+		inside: (b: number) => boolean = () => true,
+		outside: (b: number) => Costs = () => NONE,
+		back = -1,
+		atBack: Costs = NONE
+	): Costs {
+		const edges = (b: number): number[] =>
+			this.blocks[b].succ.filter((s) => s !== back && inside(s));
+		const value = new Map<number, Costs>();
+		const costsOf = (s: number): Costs => {
+			if (s === back) return atBack;
+			return inside(s) ? value.get(s) ?? NONE : outside(s);
+		};
+
+		const components = this.components(entry, edges);
+		const loopStarts = this.loopStarts(entry, components, edges);
+		for (const component of components) {
+			const b = component[0];
+			if (component.length === 1 && !edges(b).includes(b)) {
+				value.set(b, this.blockCosts(b, costsOf));
+				continue;
+			}
+			const starts = loopStarts.get(component) as number[];
+			if (starts.length !== 1) {
+				for (const s of starts) {
+					this.unbounded.set(this.blocks[s].line, "loop with several entries");
+					value.set(s, UNBOUNDED);
+				}
+				continue;
+			}
+			const start = starts[0];
+			const loop = new Set(component);
+			const inLoop = (s: number): boolean => loop.has(s);
+			const bound = this.loopBound(start);
+			if (bound === undefined) {
+				this.unbounded.set(this.blocks[start].line, "loop without @loop-bound annotation");
+				value.set(start, UNBOUNDED);
+				continue;
+			}
+			// cost of one iteration and of the path leaving the loop (or ending the program)
+			const atStart: Costs = [-Infinity, -Infinity, 0];
+			const iteration = this.longest(start, inLoop, () => NONE, start, atStart)[BACK];
+			const exit = this.longest(start, inLoop, costsOf, start, NONE);
+			value.set(start, bound > 1 ? add(exit, (bound - 1) * iteration) : exit);
+		}
+		return value.get(entry) ?? NONE;
+	}
+
+	/**
+	 * Returns worst-case costs of a subroutine: to its retsub and to the program exit.
+	 * @param label label of the subroutine
+	 */
+	subroutine(label: string): Costs {
+		let costs = this.subroutines.get(label);
+		if (costs !== undefined) {
+			return costs;
+		}
+		const entry = this.labels.get(label);
+		if (entry === undefined) {
+			return [-Infinity, 0, -Infinity]; // callsub to an unknown label fails
+		}
+		if (this.calling.has(label)) {
+			this.unbounded.set(this.blocks[entry].line, `recursive subroutine ${label}`);
+			return UNBOUNDED;
+		}
+		this.calling.add(label);
+		costs = this.longest(entry);
+		this.calling.delete(label);
+		this.subroutines.set(label, costs);
+		return costs;
+	}
+
+	// returns the worst-case cost of the paths from program start to the start of `block`
+	costBefore(block: number): number {
+		if (block === 0) return 0;
+		return this.longest(0, undefined, undefined, block, [-Infinity, -Infinity, 0])[BACK];
+	}
+
+	/**
+	 * Returns branches dispatching ABI methods (comparison of the first application
+	 * argument with a 4 bytes selector) and on-completion actions (comparison of
+	 * OnCompletion with a constant, or switch on OnCompletion).
+	 */
+	dispatches(methods: Map<string, string>): Dispatch[] {
+		const dispatches: Dispatch[] = [];
+		let intcblock: bigint[] = [];
+		let bytecblock: Uint8Array[] = [];
+		this.blocks.forEach((block, b) => {
+			const ops = this.ops.slice(block.start, block.end);
+			for (const op of ops) {
+				if (op instanceof Intcblock) intcblock = op.intcblock;
+				if (op instanceof Bytecblock) bytecblock = op.bytecblock;
+			}
+			const last = ops[ops.length - 1];
+			if (last instanceof Switch && ops.length > 1 && isOnCompletion(ops[ops.length - 2])) {
+				last.labels.forEach((label, i) => {
+					const target = this.labels.get(label);
+					const name = Object.keys(TxOnComplete)[i];
+					if (target !== undefined && name !== undefined) {
+						dispatches.push({ kind: "onCompletion", name, block: b, target });
+					}
+				});
+				return;
+			}
+			if (!(last instanceof BranchIfZero || last instanceof BranchIfNotZero)) {
+				return;
+			}
+			// bz jumps when the comparison fails
+			const target = last instanceof BranchIfNotZero ? this.labels.get(last.label) : b + 1;
+			if (target === undefined || target >= this.blocks.length) {
+				return;
+			}
+			const constant = (i: number): unknown =>
+				ops[i] === undefined ? undefined : constantOf(ops[i], intcblock, bytecblock);
+			for (let i = 0; i < ops.length - 1; ++i) {
+				const value = constant(i - 1) ?? constant(i + 1);
+				if (isFirstAppArg(ops[i]) && value instanceof Uint8Array && value.length === 4) {
+					const selector = Buffer.from(value).toString("hex");
+					const name = methods.get(selector) ?? `0x${selector}`;
+					dispatches.push({ kind: "method", name, block: b, target });
+					return;
+				}
+				if (isOnCompletion(ops[i]) && typeof value === "bigint") {
+					const name = Object.keys(TxOnComplete)[Number(value)];
+					if (name !== undefined) {
+						dispatches.push({ kind: "onCompletion", name, block: b, target });
+						return;
+					}
+				}
+			}
+		});
+		return dispatches;
+	}
+
+	// worst-case costs of paths starting with block `b`
+	private blockCosts(b: number, costsOf: (s: number) => Costs): Costs {
+		const block = this.blocks[b];
+		let next = block.succ.map(costsOf).reduce(max, NONE);
+		if (block.call !== undefined) {
+			const sub = this.subroutine(block.call);
+			next = max([-Infinity, sub[EXIT], -Infinity], add(next, sub[RET]));
+		}
+		return add(max(block.ends, next), block.cost);
+	}
+
+	// strongly connected components reachable from `entry` (Tarjan), successors first
+	private components(entry: number, edges: (b: number) => number[]): number[][] {
+		const index = new Map<number, number>();
+		const low = new Map<number, number>();
+		const stack: number[] = [];
+		const onStack = new Set<number>();
+		const components: number[][] = [];
+		const visit = (b: number): void => {
+			index.set(b, index.size);
+			low.set(b, index.get(b) as number);
+			stack.push(b);
+			onStack.add(b);
+			for (const s of edges(b)) {
+				if (!index.has(s)) {
+					visit(s);
+					low.set(b, Math.min(low.get(b) as number, low.get(s) as number));
+				} else if (onStack.has(s)) {
+					low.set(b, Math.min(low.get(b) as number, index.get(s) as number));
+				}
+			}
+			if (low.get(b) === index.get(b)) {
+				const component: number[] = [];
+				let s;
+				do {
+					s = stack.pop() as number;
+					onStack.delete(s);
+					component.push(s);
+				} while (s !== b);
+				components.push(component);
+			}
+		};
+		visit(entry);
+		return components;
+	}
+
+	// blocks of each cyclic component entered from outside the component (or the entry)
+	private loopStarts(
+		entry: number,
+		components: number[][],
+		edges: (b: number) => number[]
+	): Map<number[], number[]> {
+		const componentOf = new Map<number, number[]>();
+		for (const component of components) {
+			for (const b of component) componentOf.set(b, component);
+		}
+		const starts = new Map<number[], Set<number>>(components.map((c) => [c, new Set()]));
+		(starts.get(componentOf.get(entry) as number[]) as Set<number>).add(entry);
+		for (const [b, component] of componentOf) {
+			for (const s of edges(b)) {
+				if (componentOf.get(s) !== component) {
+					(starts.get(componentOf.get(s) as number[]) as Set<number>).add(s);
+				}
+			}
+		}
+		return new Map([...starts].map(([c, s]) => [c, [...s]]));
+	}
+
+	// maximum number of iterations of the loop starting with `block`
+	private loopBound(block: number): number | undefined {
+		const { label, line } = this.blocks[block];
+		const annotation = this.lines[line - 1]?.match(loopBoundAnnotation);
+		const bound =
+			(label === undefined ? undefined : this.loopBounds[label]) ??
+			(annotation === null || annotation === undefined ? undefined : Number(annotation[1]));
+		this.loops.set(block, { label: label ?? `line ${line}`, line, bound });
+		return bound;
+	}
+
+	private splitBlocks(): void {
+		const ops = this.ops;
+		const starts = new Set<number>([0]);
+		ops.forEach((op, i) => {
+			if (op instanceof Label) {
+				starts.add(i);
+			} else if (
+				op instanceof Branch ||
+				op instanceof BranchIfZero ||
+				op instanceof BranchIfNotZero ||
+				op instanceof Switch ||
+				op instanceof Callsub ||
+				op instanceof Retsub ||
+				op instanceof Return ||
+				op instanceof Err
+			) {
+				starts.add(i + 1);
+			}
+		});
+		const sorted = [...starts].filter((i) => i < ops.length).sort((a, b) => a - b);
+		sorted.forEach((start, b) => {
+			const end = sorted[b + 1] ?? ops.length;
+			const first = ops[start];
+			const label = first instanceof Label ? first.label : undefined;
+			if (label !== undefined) this.labels.set(label, b);
+			let cost = 0;
+			for (let i = start; i < end; ++i) cost += ops[i].maxCost();
+			this.blocks.push({ start, end, line: first.line, label, cost, succ: [], ends: NONE });
+		});
+
+		this.blocks.forEach((block, b) => {
+			const last = ops[block.end - 1];
+			const next = b + 1 < this.blocks.length ? b + 1 : undefined;
+			let targets: Array<number | undefined> = [next];
+			if (last instanceof Branch) {
+				targets = [this.labels.get(last.label)];
+			} else if (last instanceof BranchIfZero || last instanceof BranchIfNotZero) {
+				targets = [this.labels.get(last.label), next];
+			} else if (last instanceof Switch) {
+				targets = [...last.labels.map((l) => this.labels.get(l)), next];
+			} else if (last instanceof Callsub) {
+				block.call = last.label;
+			} else if (last instanceof Retsub) {
+				targets = [];
+				block.ends = [0, -Infinity, -Infinity];
+			} else if (last instanceof Return || last instanceof Err) {
+				targets = [];
+			}
+			block.succ = targets.filter((t): t is number => t !== undefined);
+			// program ends after return, err, the last instruction or a jump to an unknown label
+			if (targets.length === 0 || targets.includes(undefined)) {
+				if (!(last instanceof Retsub)) block.ends = [-Infinity, 0, -Infinity];
+			}
+		});
+	}
+}
+
+/**
+ * Computes a static worst-case bound of the opcode cost of a TEAL program, for the whole
+ * program, for each subroutine and for each entry point (ABI method or on-completion branch),
+ * and checks it against the (pooled) budget. Costs of loops are bounded with annotations
+ * (`options.loopBounds` or `// @loop-bound <n>` comment on the label line); a loop without
+ * annotation makes the bound of the paths through it unbounded (Infinity).
+ * For TEAL <= 3 the cost is static: all instructions of the program are counted.
+ * @param program TEAL code
+ * @param options analysis options
+ */
+export function analyzeCost(program: string, options: CostAnalysisOptions = {}): CostReport {
+	const mode = options.mode ?? ExecutionMode.APPLICATION;
+	const interpreter = new Interpreter();
+	interpreter.mode = mode;
+	const ops = parseLines(program, mode, interpreter);
+	const tealVersion = interpreter.tealVersion;
+	const budget =
+		options.budget ??
+		(mode === ExecutionMode.SIGNATURE
+			? LOGIC_SIG_MAX_COST
+			: MAX_APP_PROGRAM_COST * (tealVersion <= 3 ? 1 : options.appCalls ?? 1));
+	// intcblock and bytecblock added by the assembler
+	const extra =
+		Number(isAddIntcblock(ops, interpreter)) + Number(isAddedBytecblock(ops, interpreter));
+
+	const analyzer = new CostAnalyzer(ops, program.split("\n"), options.loopBounds ?? {});
+	const worst = (costs: Costs): number => Math.max(costs[RET], costs[EXIT], 0) + extra;
+	const programCost = (costs: Costs): number =>
+		tealVersion <= 3 ? interpreter.gas : worst(costs);
+	const maxCost = ops.length === 0 ? 0 : programCost(analyzer.longest(0));
+
+	const methods = new Map<string, string>();
+	for (const signature of options.methods ?? []) {
+		const selector = ABIMethod.fromSignature(signature).getSelector();
+		methods.set(Buffer.from(selector).toString("hex"), signature);
+	}
+	const entryPoints = analyzer.dispatches(methods).map(({ kind, name, block, target }) => {
+		const before = analyzer.costBefore(block) + analyzer.blocks[block].cost;
+		const cost = programCost(add(analyzer.longest(target), before));
+		return {
+			kind,
+			name,
+			line: analyzer.ops[analyzer.blocks[block].end - 1].line,
+			maxCost: cost,
+			exceedsBudget: cost > budget,
+		};
+	});
+
+	const subroutines = [...new Set(analyzer.blocks.map((b) => b.call))]
+		.filter((label): label is string => label !== undefined)
+		.map((label) => {
+			const entry = analyzer.blocks[analyzer.labels.get(label) ?? -1];
+			return {
+				label,
+				line: entry?.line ?? 0,
+				maxCost: Math.max(...analyzer.subroutine(label).slice(0, 2), 0),
+			};
+		});
+
+	return {
+		tealVersion,
+		mode,
+		budget,
+		maxCost,
+		exceedsBudget: maxCost > budget,
+		entryPoints,
+		subroutines,
+		loops: [...analyzer.loops.values()].sort((a, b) => a.line - b.line),
+		unbounded: [...analyzer.unbounded].map(([line, reason]) => ({ line, reason })),
+	};
+}
@@ -50,9 +50,66 @@ export function lsTreeWalk(directoryName: string): string[] {
 	return fsWalk.walkSync(directoryName).map((f) => f.path);
 }
 
+// basename -> paths index of a directory tree
+interface DirIndex {
+	mtimes: Map<string, bigint>; // modification times of the directory and its subdirectories
+	files: Map<string, string[]>;
+}
+
+// process-wide indexes, by directory (as passed by the caller) and working directory
+const dirIndexes = new Map<string, DirIndex>();
+
+function dirMtime(dir: string): bigint {
+	return fs.statSync(dir, { bigint: true }).mtimeNs;
+}
+
+function buildDirIndex(dir: string): DirIndex {
+	const index: DirIndex = { mtimes: new Map([[dir, dirMtime(dir)]]), files: new Map() };
+	for (const entry of fsWalk.walkSync(dir)) {
+		if (entry.dirent.isDirectory()) {
+			index.mtimes.set(entry.path, dirMtime(entry.path));
+		}
+		const name = path.basename(entry.path);
+		const paths = index.files.get(name);
+		if (paths === undefined) index.files.set(name, [entry.path]);
+		else paths.push(entry.path);
+	}
+	return index;
+}
+
+// index is valid while no file is added, removed or renamed in the tree (which changes
+// the modification time of the parent directory)
+function isIndexValid(index: DirIndex): boolean {
+	for (const [dir, mtime] of index.mtimes) {
+		try {
+			if (dirMtime(dir) !== mtime) return false;
+		} catch (e) {
+			return false;
+		}
+	}
+	return true;
+}
+
+/**
+ * Returns paths of all files and directories named `fileName` in a directory tree.
+ * Paths come from a cached index of the directory, which is rebuilt when the tree changes.
+ * @param dir directory name
+ * @param fileName file name (basename)
+ */
+export function findInDirRecursive(dir: string, fileName: string): string[] {
+	const key = path.resolve(dir) + "\0" + dir;
+	let index = dirIndexes.get(key);
+	if (index === undefined || !isIndexValid(index)) {
+		index = buildDirIndex(dir);
+		dirIndexes.set(key, index);
+	}
+	return index.files.get(fileName) ?? [];
+}
+
 /**
  * Searches recursively and returns path of file in a given directory. Throws error
- * if multiple files with same name are found (in directory or sub-directory)
+ * if multiple files with same name are found (in directory or sub-directory).
+ * Directory tree is walked once and then re-validated by directory modification times.
  * @param dir directory name
  * @param fileName name of file to search in directory
  * @param warnMsg if file does not exist & warning message is passed,
@@ -63,26 +120,17 @@ export function getPathFromDirRecursive(
 	fileName: string,
 	warnMsg?: string
 ): string | undefined {
-	const paths = lsTreeWalk(dir);
-
-	let filePath;
-	for (const p of paths) {
-		const fileNameFromPath = path.basename(p);
-		if (fileNameFromPath === fileName) {
-			if (filePath) {
-				// if file already found previously, throw error
-				throw new RuntimeError(RUNTIME_ERRORS.GENERAL.MULTIPLE_FILES_WITH_SAME_NAME_IN_DIR, {
-					directory: dir,
-					file: fileName,
-					path1: filePath,
-					path2: p,
-				});
-			} else {
-				filePath = p;
-			}
-		}
+	const paths = findInDirRecursive(dir, fileName);
+	if (paths.length > 1) {
+		throw new RuntimeError(RUNTIME_ERRORS.GENERAL.MULTIPLE_FILES_WITH_SAME_NAME_IN_DIR, {
+			directory: dir,
+			file: fileName,
+			path1: paths[0],
+			path2: paths[1],
+		});
 	}
 
+	const filePath = paths[0];
 	if (!filePath) {
 		if (warnMsg !== undefined) {
 			if (warnMsg !== "") console.warn(warnMsg);
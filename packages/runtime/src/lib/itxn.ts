@@ -1,5 +1,4 @@
 import algosdk, { decodeAddress, getApplicationAddress } from "algosdk";
-import cloneDeep from "lodash.clonedeep";
 
 import { Interpreter } from "..";
 import { RUNTIME_ERRORS } from "../errors/errors-list";
@@ -9,6 +8,7 @@ import {
 	ALGORAND_MIN_TX_FEE,
 	MaxAppProgramLen,
 	MaxExtraAppProgramPages,
+	MaxTEALVersion,
 	MaxTxnNoteBytes,
 	TransactionTypeEnum,
 	TxFieldEnum,
@@ -19,6 +19,7 @@ import {
 import { EncTx, StackElem } from "../types";
 import { convertToString } from "./parsing";
 import { assetTxnFields, calculateFeeCredit, CreditFeeType } from "./txn";
+import { VersionTable, versionSetTable } from "./version-table";
 
 // supported types for inner tx (typeEnum -> type mapping)
 // https://developer.algorand.org/docs/get-details/dapps/avm/teal/opcodes/#txn-f
@@ -32,331 +33,308 @@ const TxnTypeMap: { [key: string]: { version: number; field: string | number } }
 };
 
 // requires their type as number
-const numberTxnFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([TxFieldEnum.Fee, TxnRefFields.FreezeAssetFrozen, TxnRefFields.ConfigAssetDecimals, TxnRefFields.ConfigAssetDefaultFrozen]),
-};
-numberTxnFields[6] = cloneDeep(numberTxnFields[5]);
-[TxFieldEnum.VoteFirst, TxFieldEnum.VoteLast, TxFieldEnum.VoteKeyDilution, TxFieldEnum.Nonparticipation, TxFieldEnum.ApplicationID].forEach(
-	(field) => numberTxnFields[6].add(field)
+const numberTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			TxFieldEnum.Fee,
+			TxnRefFields.FreezeAssetFrozen,
+			TxnRefFields.ConfigAssetDecimals,
+			TxnRefFields.ConfigAssetDefaultFrozen,
+		],
+		6: [
+			TxFieldEnum.VoteFirst,
+			TxFieldEnum.VoteLast,
+			TxFieldEnum.VoteKeyDilution,
+			TxFieldEnum.Nonparticipation,
+			TxFieldEnum.ApplicationID,
+		],
+	},
+	MaxTEALVersion
 );
-numberTxnFields[7] = cloneDeep(numberTxnFields[6]);
-numberTxnFields[8] = cloneDeep(numberTxnFields[7]);
 
-const uintTxnFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([TxFieldEnum.Amount, TxFieldEnum.AssetAmount, TxFieldEnum.TypeEnum, TxnRefFields.ConfigAssetTotal]),
-};
-uintTxnFields[6] = cloneDeep(uintTxnFields[5]);
-uintTxnFields[7] = cloneDeep(uintTxnFields[6]);
-uintTxnFields[8] = cloneDeep(uintTxnFields[7]);
+const uintTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			TxFieldEnum.Amount,
+			TxFieldEnum.AssetAmount,
+			TxFieldEnum.TypeEnum,
+			TxnRefFields.ConfigAssetTotal,
+		],
+	},
+	MaxTEALVersion
+);
 
 // these are also uint values, but require that the asset
 // be present in Txn.Assets[] array
-const assetIDFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([TxFieldEnum.XferAsset, TxFieldEnum.FreezeAsset, TxFieldEnum.ConfigAsset]),
-};
-
-assetIDFields[6] = cloneDeep(assetIDFields[5]);
-assetIDFields[7] = cloneDeep(assetIDFields[6]);
-assetIDFields[8] = cloneDeep(assetIDFields[7]);
-
-const byteTxnFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([TxnRefFields.ConfigAssetMetadataHash]),
-};
-
-byteTxnFields[6] = cloneDeep(byteTxnFields[5]);
-[
-	TxFieldEnum.VotePK,
-	TxFieldEnum.SelectionPK,
-	TxFieldEnum.Note,
-	TxnaField.ApplicationArgs,
-	TxFieldEnum.ApprovalProgram,
-	TxFieldEnum.ClearStateProgram,
-].forEach((field) => byteTxnFields[6].add(field));
-byteTxnFields[7] = cloneDeep(byteTxnFields[6]);
-[TxnaField.ApprovalProgramPages, TxnaField.ClearStateProgramPages].forEach((field) =>
-	byteTxnFields[7].add(field)
+const assetIDFields = versionSetTable<string>(
+	{ 1: [], 5: [TxFieldEnum.XferAsset, TxFieldEnum.FreezeAsset, TxFieldEnum.ConfigAsset] },
+	MaxTEALVersion
 );
-byteTxnFields[8] = cloneDeep(byteTxnFields[7]);
-
-const strTxnFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([TxFieldEnum.Type, TxnRefFields.ConfigAssetName, TxnRefFields.ConfigAssetUnitName, TxnRefFields.ConfigAssetURL]),
-};
-
-strTxnFields[6] = cloneDeep(strTxnFields[5]);
-strTxnFields[7] = cloneDeep(strTxnFields[6]);
-strTxnFields[8] = cloneDeep(strTxnFields[7]);
 
-const acfgAddrTxnFields: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set([
-		TxnRefFields.ConfigAssetManager,
-		TxnRefFields.ConfigAssetReserve,
-		TxnRefFields.ConfigAssetFreeze,
-		TxnRefFields.ConfigAssetClawback,
-	]),
-};
+const byteTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [TxnRefFields.ConfigAssetMetadataHash],
+		6: [
+			TxFieldEnum.VotePK,
+			TxFieldEnum.SelectionPK,
+			TxFieldEnum.Note,
+			TxnaField.ApplicationArgs,
+			TxFieldEnum.ApprovalProgram,
+			TxFieldEnum.ClearStateProgram,
+		],
+		7: [TxnaField.ApprovalProgramPages, TxnaField.ClearStateProgramPages],
+	},
+	MaxTEALVersion
+);
 
-acfgAddrTxnFields[6] = cloneDeep(acfgAddrTxnFields[5]);
-acfgAddrTxnFields[7] = cloneDeep(acfgAddrTxnFields[6]);
-acfgAddrTxnFields[8] = cloneDeep(acfgAddrTxnFields[7]);
+const strTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			TxFieldEnum.Type,
+			TxnRefFields.ConfigAssetName,
+			TxnRefFields.ConfigAssetUnitName,
+			TxnRefFields.ConfigAssetURL,
+		],
+	},
+	MaxTEALVersion
+);
 
-const otherAddrTxnFields: { [key: number]: Set<string> } = {
-	5: new Set([
-		TxFieldEnum.Sender,
-		TxFieldEnum.Receiver,
-		TxFieldEnum.CloseRemainderTo,
-		TxFieldEnum.AssetSender,
-		TxFieldEnum.AssetCloseTo,
-		TxFieldEnum.AssetReceiver,
-		TxnRefFields.FreezeAssetAccount,
-	]),
-};
+const acfgAddrTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			TxnRefFields.ConfigAssetManager,
+			TxnRefFields.ConfigAssetReserve,
+			TxnRefFields.ConfigAssetFreeze,
+			TxnRefFields.ConfigAssetClawback,
+		],
+	},
+	MaxTEALVersion
+);
 
-otherAddrTxnFields[6] = cloneDeep(otherAddrTxnFields[5]);
-// add new inner transaction fields support in teal v6.
-[TxFieldEnum.RekeyTo].forEach((field) => otherAddrTxnFields[6].add(field));
-otherAddrTxnFields[7] = cloneDeep(otherAddrTxnFields[6]);
-otherAddrTxnFields[8] = cloneDeep(otherAddrTxnFields[7]);
+const otherAddrTxnFields = versionSetTable<string>(
+	{
+		1: [],
+		5: [
+			TxFieldEnum.Sender,
+			TxFieldEnum.Receiver,
+			TxFieldEnum.CloseRemainderTo,
+			TxFieldEnum.AssetSender,
+			TxFieldEnum.AssetCloseTo,
+			TxFieldEnum.AssetReceiver,
+			TxnRefFields.FreezeAssetAccount,
+		],
+		// add new inner transaction fields support in teal v6.
+		6: [TxFieldEnum.RekeyTo],
+	},
+	MaxTEALVersion
+);
 
-const txTypes: { [key: number]: Set<string> } = {
-	1: new Set(),
-	2: new Set(),
-	3: new Set(),
-	4: new Set(),
-	5: new Set(["pay", "axfer", "acfg", "afrz"]),
-};
+const txTypes = versionSetTable<string>(
+	{
+		1: [],
+		5: ["pay", "axfer", "acfg", "afrz"],
+		// supported keyreg on teal v6
+		6: ["keyreg", "appl"],
+	},
+	MaxTEALVersion
+);
 
-// supported keyreg on teal v6
-txTypes[6] = cloneDeep(txTypes[5]);
-txTypes[6].add("keyreg");
-txTypes[6].add("appl");
-txTypes[7] = cloneDeep(txTypes[6]);
-txTypes[8] = cloneDeep(txTypes[7]);
+type ITxnValue = bigint | number | string | Uint8Array;
 
-/**
- * Sets inner transaction field to subTxn (eg. set assetReceiver('rcv'))
- * https://developer.algorand.org/docs/get-details/dapps/smart-contracts/apps/#setting-transaction-properties
- */
-/* eslint-disable sonarjs/cognitive-complexity */
-export function setInnerTxField(
-	subTxn: EncTx,
-	field: string,
+// asserts and converts a stack value to the value of an inner transaction field
+type ITxnValueConverter = (
 	val: StackElem,
 	op: Op,
 	interpreter: Interpreter,
 	line: number
-): EncTx {
-	let txValue: bigint | number | string | Uint8Array | undefined;
-	const tealVersion = interpreter.tealVersion;
-
-	if (uintTxnFields[tealVersion].has(field)) {
-		txValue = op.assertBigInt(val, line);
-	}
+) => ITxnValue;
 
-	if (numberTxnFields[tealVersion].has(field)) {
-		txValue = Number(op.assertBigInt(val, line));
-	}
-
-	if (assetIDFields[tealVersion].has(field)) {
-		const id = op.assertBigInt(val, line);
-		txValue = interpreter.getAssetIDByReference(Number(id), false, line, op);
-	}
+/**
+ * Inner transaction field resolved for a TEAL version: its value converter, validator and
+ * encoded key are looked up once (when `itxn_field` is parsed), so `set` doesn't classify
+ * the field again on each execution.
+ */
+export interface ITxnFieldDescriptor {
+	field: string;
+	/**
+	 * Converts the stack value, validates it and sets it in the inner transaction.
+	 * @returns updated inner transaction
+	 */
+	set: (subTxn: EncTx, val: StackElem, op: Op, interpreter: Interpreter, line: number) => EncTx;
+}
 
-	if (strTxnFields[tealVersion].has(field)) {
-		const assertedVal = op.assertBytes(val, line);
-		txValue = convertToString(assertedVal);
-	}
+// value converters by field type (field sets are disjoint)
+const fieldConverters: Array<[VersionTable<ReadonlySet<string>>, ITxnValueConverter]> = [
+	[uintTxnFields, (val, op, _interpreter, line) => op.assertBigInt(val, line)],
+	[numberTxnFields, (val, op, _interpreter, line) => Number(op.assertBigInt(val, line))],
+	[
+		assetIDFields,
+		(val, op, interpreter, line) =>
+			interpreter.getAssetIDByReference(Number(op.assertBigInt(val, line)), false, line, op),
+	],
+	[strTxnFields, (val, op, _interpreter, line) => convertToString(op.assertBytes(val, line))],
+	[byteTxnFields, (val, op, _interpreter, line) => op.assertBytes(val, line)],
+	[
+		otherAddrTxnFields,
+		(val, op, interpreter, line) => {
+			const accountState = interpreter.getAccount(op.assertBytes(val, line), line);
+			return Buffer.from(decodeAddress(accountState.address).publicKey);
+		},
+	],
+	// if address use for acfg we only check address is valid
+	[acfgAddrTxnFields, (val, op, _interpreter, line) => op.assertAlgorandAddress(val, line)],
+];
+
+const maxProgramLen = MaxAppProgramLen * (1 + MaxExtraAppProgramPages);
+
+// validators of field values, return an error message if the value is invalid
+const fieldValidators: { [field: string]: (value: ITxnValue) => string | undefined } = {
+	[TxnRefFields.ConfigAssetDecimals]: (v) =>
+		(v as bigint) > 19n || (v as bigint) < 0n
+			? "Decimals must be between 0 (non divisible) and 19"
+			: undefined,
+	[TxnRefFields.ConfigAssetMetadataHash]: (v) =>
+		(v as Uint8Array).length !== 32
+			? "assetMetadataHash must be a 32 byte Uint8Array or string."
+			: undefined,
+	[TxnRefFields.ConfigAssetUnitName]: (v) =>
+		(v as string).length > 8 ? "Unit name must not be longer than 8 bytes" : undefined,
+	[TxnRefFields.ConfigAssetName]: (v) =>
+		(v as string).length > 32 ? "AssetName must not be longer than 8 bytes" : undefined,
+	[TxnRefFields.ConfigAssetURL]: (v) =>
+		(v as string).length > 96 ? "URL must not be longer than 96 bytes" : undefined,
+	[TxFieldEnum.VotePK]: (v) =>
+		(v as Uint8Array).length !== 32 ? "VoteKey must be 32 bytes" : undefined,
+	[TxFieldEnum.SelectionPK]: (v) =>
+		(v as Uint8Array).length !== 32 ? "SelectionPK must be 32 bytes" : undefined,
+	[TxFieldEnum.Note]: (v) =>
+		(v as Uint8Array).length > MaxTxnNoteBytes
+			? `Note must not be longer than ${MaxTxnNoteBytes} bytes`
+			: undefined,
+};
 
-	if (byteTxnFields[tealVersion].has(field)) {
-		txValue = op.assertBytes(val, line);
-	}
+// program pages are appended to the program (encoded field, name used in error messages)
+const programPagesFields: { [field: string]: [string, string] } = {
+	[TxnaField.ApprovalProgramPages]: ["apap", "Approval Program"],
+	[TxnaField.ClearStateProgramPages]: ["apsu", "Clear State Program"],
+};
 
-	if (otherAddrTxnFields[tealVersion].has(field)) {
-		const assertedVal = op.assertBytes(val, line);
-		const accountState = interpreter.getAccount(assertedVal, line);
-		txValue = Buffer.from(decodeAddress(accountState.address).publicKey);
-	}
+// descriptors by TEAL version and field
+const fieldDescriptors: { [key: number]: Map<string, ITxnFieldDescriptor> } = {};
 
-	// if address use for acfg we only check address is valid
-	if (acfgAddrTxnFields[tealVersion].has(field)) {
-		txValue = op.assertAlgorandAddress(val, line);
+/**
+ * Returns descriptor of an inner transaction field (cached per TEAL version).
+ * @param field inner transaction field (eg. Receiver)
+ * @param tealVersion TEAL version of the program
+ */
+export function resolveInnerTxField(field: string, tealVersion: number): ITxnFieldDescriptor {
+	const descriptors = (fieldDescriptors[tealVersion] ??= new Map());
+	let descriptor = descriptors.get(field);
+	if (descriptor === undefined) {
+		descriptor = mkInnerTxFieldDescriptor(field, tealVersion);
+		descriptors.set(field, descriptor);
 	}
+	return descriptor;
+}
 
-	let encodedField = TxnFields[tealVersion][field]; // eg 'rcv'
-
-	// txValue can be undefined for a field with not having TEALv5 support (eg. type 'appl')
-	if (txValue === undefined) {
+/* eslint-disable sonarjs/cognitive-complexity */
+function mkInnerTxFieldDescriptor(field: string, tealVersion: number): ITxnFieldDescriptor {
+	const fail = (msg: string, line: number): never => {
 		throw new RuntimeError(RUNTIME_ERRORS.TEAL.ITXN_FIELD_ERR, {
-			msg: `Field ${field} is invalid`,
+			msg: msg,
 			field: field,
 			line: line,
 			tealV: tealVersion,
 		});
+	};
+	const convert = fieldConverters.find(([fields]) => fields[tealVersion]?.has(field))?.[1];
+	// field without support in the TEAL version (eg. field of type 'appl' in TEALv5)
+	if (convert === undefined) {
+		return {
+			field,
+			set: (_subTxn, _val, _op, _interpreter, line) => fail(`Field ${field} is invalid`, line),
+		};
 	}
 
-	// handle individual cases
-	let errMsg = "";
-	switch (field) {
-		case TxFieldEnum.Type: {
-			const txType = txValue as string;
-			// check if txType is supported in current teal version
-			if (!txTypes[tealVersion].has(txType)) {
-				errMsg = `${txType} is not a valid Type for itxn_field`;
-			}
-			break;
-		}
-		case TxFieldEnum.TypeEnum: {
-			const txType = op.assertBigInt(val, line);
-			if (
-				TxnTypeMap[Number(txType)] === undefined ||
-				TxnTypeMap[Number(txType)].version > interpreter.tealVersion
-			) {
-				errMsg = `TypeEnum ${Number(txType)}does not support`;
-			} else {
-				subTxn.type = String(TxnTypeMap[Number(txType)].field);
-			}
-			break;
-		}
-		case TxnRefFields.ConfigAssetDecimals: {
-			const assetDecimals = txValue as bigint;
-			if (assetDecimals > 19n || assetDecimals < 0n) {
-				errMsg = "Decimals must be between 0 (non divisible) and 19";
-			}
-			break;
-		}
-		case TxnRefFields.ConfigAssetMetadataHash: {
-			const assetMetadataHash = txValue as Uint8Array;
-			if (assetMetadataHash.length !== 32) {
-				errMsg = "assetMetadataHash must be a 32 byte Uint8Array or string.";
-			}
-			break;
-		}
-		case TxnRefFields.ConfigAssetUnitName: {
-			const assetUnitName = txValue as string;
-			if (assetUnitName.length > 8) {
-				errMsg = "Unit name must not be longer than 8 bytes";
-			}
-			break;
-		}
-		case TxnRefFields.ConfigAssetName: {
-			const assetName = txValue as string;
-			if (assetName.length > 32) {
-				errMsg = "AssetName must not be longer than 8 bytes";
-			}
-			break;
-		}
-		case TxnRefFields.ConfigAssetURL: {
-			const assetURL = txValue as string;
-			if (assetURL.length > 96) {
-				errMsg = "URL must not be longer than 96 bytes";
-			}
-			break;
-		}
-
-		case TxFieldEnum.VotePK: {
-			const votePk = txValue as Uint8Array;
-			if (votePk.length !== 32) {
-				errMsg = "VoteKey must be 32 bytes";
-			}
-			break;
-		}
-
-		case TxFieldEnum.SelectionPK: {
-			const selectionPK = txValue as Uint8Array;
-			if (selectionPK.length !== 32) {
-				errMsg = "SelectionPK must be 32 bytes";
-			}
-			break;
-		}
-
-		case TxFieldEnum.Note: {
-			const note = txValue as Uint8Array;
-			if (note.length > MaxTxnNoteBytes) {
-				errMsg = `Note must not be longer than ${MaxTxnNoteBytes} bytes`;
-			}
-			break;
-		}
-		case TxnaField.ApprovalProgramPages: {
-			encodedField = "apap";
-			const approvalProgram = (subTxn as any)[encodedField];
-			const maxPossible = MaxAppProgramLen * (1 + MaxExtraAppProgramPages);
-			if (approvalProgram !== undefined) {
-				//append
-				txValue = new Uint8Array([...approvalProgram, ...(txValue as Uint8Array)]);
-			}
-			if ((txValue as Uint8Array).length > maxPossible) {
-				errMsg = `Approval Program exceeded the maximum allowed length of ${maxPossible} bytes`;
-			}
-			break;
-		}
-		case TxnaField.ClearStateProgramPages: {
-			encodedField = "apsu";
-			const clearStateProgram = (subTxn as any)[encodedField];
-			const maxPossible = MaxAppProgramLen * (1 + MaxExtraAppProgramPages);
-			if (clearStateProgram !== undefined) {
-				//append
-				txValue = new Uint8Array([...clearStateProgram, ...(txValue as Uint8Array)]);
-			}
-			if ((txValue as Uint8Array).length > maxPossible) {
-				errMsg = `Clear State Program exceeded the maximum allowed length of ${maxPossible} bytes`;
-			}
-			break;
-		}
-		default: {
-			break;
-		}
+	if (field === TxFieldEnum.TypeEnum) {
+		return {
+			field,
+			set: (subTxn, val, op, _interpreter, line) => {
+				const txType = Number(op.assertBigInt(val, line));
+				const type = TxnTypeMap[txType];
+				if (type === undefined || type.version > tealVersion) {
+					return fail(`TypeEnum ${txType}does not support`, line);
+				}
+				subTxn.type = String(type.field);
+				return subTxn;
+			},
+		};
 	}
 
-	if (errMsg) {
-		throw new RuntimeError(RUNTIME_ERRORS.TEAL.ITXN_FIELD_ERR, {
-			msg: errMsg,
-			field: field,
-			line: line,
-			tealV: tealVersion,
-		});
+	const pages = programPagesFields[field];
+	if (pages !== undefined) {
+		const [encodedField, name] = pages;
+		return {
+			field,
+			set: (subTxn, val, op, interpreter, line) => {
+				const program = (subTxn as any)[encodedField];
+				let value = convert(val, op, interpreter, line) as Uint8Array;
+				if (program !== undefined) {
+					//append
+					value = new Uint8Array([...program, ...value]);
+				}
+				if (value.length > maxProgramLen) {
+					return fail(
+						`${name} exceeded the maximum allowed length of ${maxProgramLen} bytes`,
+						line
+					);
+				}
+				(subTxn as any)[encodedField] = value;
+				return subTxn;
+			},
+		};
 	}
 
-	// if everything goes well, set the [key, value]
-	if (encodedField === null) {
-		return subTxn; // could be for TxFieldEnum.TypeEnum
-	} else if (assetTxnFields.has(field as TxnRefFields)) {
-		(subTxn as any).apar = (subTxn as any).apar ?? {};
-		(subTxn as any).apar[encodedField] = txValue;
+	const encodedField = TxnFields[tealVersion][field] as string; // eg 'rcv'
+	let validate = fieldValidators[field];
+	if (field === TxFieldEnum.Type) {
+		// check if txType is supported in current teal version
+		validate = (v) =>
+			txTypes[tealVersion].has(v as string)
+				? undefined
+				: `${v as string} is not a valid Type for itxn_field`;
+	}
+	let assign: (subTxn: any, value: ITxnValue) => void;
+	if (assetTxnFields.has(field as TxnRefFields)) {
+		assign = (subTxn, value) => {
+			subTxn.apar = subTxn.apar ?? {};
+			subTxn.apar[encodedField] = value;
+		};
+	} else if (field === TxnRefFields.ApplicationArgs) {
+		assign = (subTxn, value) => {
+			subTxn[encodedField] = subTxn[encodedField] ?? [];
+			subTxn[encodedField].push(value);
+		};
 	} else {
-		if (field === TxnRefFields.ApplicationArgs) {
-			if ((subTxn as any)[encodedField] === undefined) {
-				(subTxn as any)[encodedField] = [];
-			}
-			(subTxn as any)[encodedField].push(txValue);
-		} else {
-			(subTxn as any)[encodedField] = txValue;
-		}
+		assign = (subTxn, value) => {
+			subTxn[encodedField] = value;
+		};
 	}
-
-	return subTxn;
+	return {
+		field,
+		set: (subTxn, val, op, interpreter, line) => {
+			const value = convert(val, op, interpreter, line);
+			const errMsg = validate?.(value);
+			if (errMsg) return fail(errMsg, line);
+			assign(subTxn, value);
+			return subTxn;
+		},
+	};
 }
 
 /**
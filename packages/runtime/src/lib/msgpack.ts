@@ -0,0 +1,138 @@
+import fs from "fs";
+
+import { RUNTIME_ERRORS } from "../errors/errors-list";
+import { RuntimeError } from "../errors/runtime-errors";
+
+// number of bytes used by the header of msgpack types with a fixed size payload
+const fixedSizeTypes: { [key: number]: number } = {
+	0xc0: 1, // nil
+	0xc2: 1, // false
+	0xc3: 1, // true
+	0xca: 5, // float 32
+	0xcb: 9, // float 64
+	0xcc: 2, // uint 8
+	0xcd: 3, // uint 16
+	0xce: 5, // uint 32
+	0xcf: 9, // uint 64
+	0xd0: 2, // int 8
+	0xd1: 3, // int 16
+	0xd2: 5, // int 32
+	0xd3: 9, // int 64
+	0xd4: 3, // fixext 1
+	0xd5: 4, // fixext 2
+	0xd6: 6, // fixext 4
+	0xd7: 10, // fixext 8
+	0xd8: 18, // fixext 16
+};
+
+function readLength(buf: Uint8Array, pos: number, size: number): number {
+	let len = 0;
+	for (let i = 0; i < size; i++) {
+		len = len * 256 + buf[pos + i];
+	}
+	return len;
+}
+
+/**
+ * Computes the end offset of the msgpack value starting at `start` without decoding it.
+ * Returns `undefined` if the buffer does not contain the complete value yet.
+ * Throws an error if an invalid msgpack type byte is found.
+ * @param buf buffer with msgpack data
+ * @param start offset of the first byte of the value
+ */
+export function msgpackValueEnd(buf: Uint8Array, start = 0): number | undefined {
+	let pos = start;
+	let remaining = 1; // number of values left to skip (container items are added)
+	while (remaining > 0) {
+		if (pos >= buf.length) return undefined;
+		const b = buf[pos];
+		remaining--;
+		if (b <= 0x7f || b >= 0xe0) {
+			pos += 1; // positive and negative fixint
+		} else if (b <= 0x8f) {
+			remaining += 2 * (b & 0x0f); // fixmap
+			pos += 1;
+		} else if (b <= 0x9f) {
+			remaining += b & 0x0f; // fixarray
+			pos += 1;
+		} else if (b <= 0xbf) {
+			pos += 1 + (b & 0x1f); // fixstr
+		} else if (fixedSizeTypes[b] !== undefined) {
+			pos += fixedSizeTypes[b];
+		} else {
+			// bin, str, ext, array and map with explicit length
+			let lenSize: number;
+			let headerSize: number;
+			switch (b) {
+				case 0xc4: // bin 8
+				case 0xd9: // str 8
+				case 0xc7: // ext 8
+					lenSize = 1;
+					break;
+				case 0xc5: // bin 16
+				case 0xda: // str 16
+				case 0xc8: // ext 16
+				case 0xdc: // array 16
+				case 0xde: // map 16
+					lenSize = 2;
+					break;
+				case 0xc6: // bin 32
+				case 0xdb: // str 32
+				case 0xc9: // ext 32
+				case 0xdd: // array 32
+				case 0xdf: // map 32
+					lenSize = 4;
+					break;
+				default:
+					throw new RuntimeError(RUNTIME_ERRORS.GENERAL.INVALID_MSGPACK_DATA, {
+						byte: b.toString(16),
+						offset: pos,
+					});
+			}
+			if (pos + 1 + lenSize > buf.length) return undefined;
+			const len = readLength(buf, pos + 1, lenSize);
+			headerSize = 1 + lenSize;
+			if (b === 0xdc || b === 0xdd) {
+				remaining += len;
+				pos += headerSize;
+			} else if (b === 0xde || b === 0xdf) {
+				remaining += 2 * len;
+				pos += headerSize;
+			} else {
+				if (b === 0xc7 || b === 0xc8 || b === 0xc9) headerSize += 1; // ext type byte
+				pos += headerSize + len;
+			}
+		}
+	}
+	return pos > buf.length ? undefined : pos;
+}
+
+/**
+ * Streams a file with concatenated msgpack values (eg. signed transactions written by
+ * `goal clerk send -o` or `algob sign-multisig`) and yields raw bytes of each value.
+ * Only the value currently being read is kept in memory.
+ * @param filePath path to the msgpack file
+ */
+export async function* readMsgpackFile(filePath: string): AsyncGenerator<Uint8Array> {
+	let pending = Buffer.alloc(0);
+	let consumed = 0;
+	for await (const chunk of fs.createReadStream(filePath)) {
+		pending =
+			consumed === pending.length
+				? (chunk as Buffer)
+				: Buffer.concat([pending.subarray(consumed), chunk as Buffer]);
+		consumed = 0;
+		let end = msgpackValueEnd(pending, consumed);
+		while (end !== undefined) {
+			yield new Uint8Array(pending.subarray(consumed, end));
+			consumed = end;
+			end = consumed < pending.length ? msgpackValueEnd(pending, consumed) : undefined;
+		}
+	}
+	if (consumed < pending.length) {
+		throw new RuntimeError(RUNTIME_ERRORS.GENERAL.INVALID_MSGPACK_FILE, {
+			file: filePath,
+			offset: consumed,
+		});
+	}
+}
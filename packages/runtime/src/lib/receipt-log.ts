@@ -0,0 +1,72 @@
+import fs from "fs";
+
+import { TxReceipt } from "../types";
+
+const BYTES = "$bytes";
+const BIGINT = "$bigint";
+
+// JSON doesn't support bytes and bigints (used in encoded txns and asset defs)
+function replacer(this: any, key: string, value: unknown): unknown {
+	const raw = this[key]; // value before `Buffer.toJSON` was applied
+	if (raw instanceof Uint8Array) return { [BYTES]: Buffer.from(raw).toString("base64") };
+	if (typeof raw === "bigint") return { [BIGINT]: raw.toString() };
+	return value;
+}
+
+function reviver(key: string, value: any): unknown {
+	if (value !== null && typeof value === "object") {
+		if (typeof value[BYTES] === "string") return Buffer.from(value[BYTES], "base64");
+		if (typeof value[BIGINT] === "string") return BigInt(value[BIGINT]);
+	}
+	return value;
+}
+
+/**
+ * Append-only log of transaction receipts evicted from the runtime state.
+ * Each receipt is a JSON line, the in memory index only keeps its offset and length.
+ */
+export class ReceiptLog {
+	readonly filePath: string;
+	private readonly fd: number;
+	private size: number;
+	private readonly index: Map<string, [number, number]>; // txID -> [offset, length]
+
+	/**
+	 * Creates a new (empty) receipt log.
+	 * @param filePath path to the log file. Existing file is truncated.
+	 */
+	constructor(filePath: string) {
+		this.filePath = filePath;
+		this.fd = fs.openSync(filePath, "w+");
+		this.size = 0;
+		this.index = new Map<string, [number, number]>();
+	}
+
+	append(txID: string, receipt: TxReceipt): void {
+		const data = Buffer.from(JSON.stringify(receipt, replacer) + "\n");
+		fs.writeSync(this.fd, data, 0, data.length, this.size);
+		this.index.set(txID, [this.size, data.length - 1]);
+		this.size += data.length;
+	}
+
+	has(txID: string): boolean {
+		return this.index.has(txID);
+	}
+
+	/**
+	 * Reads receipt from the log. Returns undefined if receipt was not logged.
+	 * @param txID transaction ID
+	 */
+	get(txID: string): TxReceipt | undefined {
+		const entry = this.index.get(txID);
+		if (entry === undefined) return undefined;
+		const [offset, length] = entry;
+		const data = Buffer.alloc(length);
+		fs.readSync(this.fd, data, 0, length, offset);
+		return JSON.parse(data.toString(), reviver);
+	}
+
+	close(): void {
+		fs.closeSync(this.fd);
+	}
+}
@@ -1,8 +1,9 @@
-import { parsing, types } from "@algo-builder/web";
+import { parsing, tx as webTx, types } from "@algo-builder/web";
 import {
 	encodeAddress,
 	EncodedAssetParams,
 	EncodedGlobalStateSchema,
+	SignedTransaction,
 	Transaction,
 } from "algosdk";
 
@@ -28,7 +29,9 @@ import {
 	AppInfo,
 	ASAInfo,
 	Context,
+	EncodedTxnRecord,
 	EncTx,
+	EncTxKind,
 	RuntimeAccountI,
 	StackElem,
 	TxField,
@@ -422,6 +425,47 @@ export function isEncTxApplicationCall(txn: EncTx): boolean {
 	return txn.type === TransactionTypeEnum.APPLICATION_CALL && txn.apid !== undefined;
 }
 
+/**
+ * Classifies encoded transaction (checks are applied in the same order as in the runtime
+ * before the classification was cached).
+ * @param txn Encoded EncTx Object
+ */
+export function classifyEncTx(txn: EncTx): EncTxKind {
+	switch (txn.type) {
+		case TransactionTypeEnum.APPLICATION_CALL:
+			return isEncTxApplicationCreate(txn) ? EncTxKind.APP_CREATE : EncTxKind.OTHER;
+		case TransactionTypeEnum.ASSET_CONFIG:
+			if (isEncTxAssetCreate(txn)) return EncTxKind.ASSET_CREATE;
+			if (isEncTxAssetReconfigure(txn)) return EncTxKind.ASSET_RECONFIGURE;
+			if (isEncTxAssetDeletion(txn)) return EncTxKind.ASSET_DELETION;
+			break;
+		case TransactionTypeEnum.ASSET_TRANSFER:
+			if (isEncTxAssetTransfer(txn)) return EncTxKind.ASSET_TRANSFER;
+			if (isEncTxAssetRevoke(txn)) return EncTxKind.ASSET_REVOKE;
+			if (isEncTxAssetOptIn(txn)) return EncTxKind.ASSET_OPT_IN;
+			break;
+	}
+	return EncTxKind.OTHER;
+}
+
+/**
+ * Encodes and hashes signed transaction once and derives the data used by the runtime
+ * (sender, flags and kind of the transaction).
+ * @param signedTxn signed transaction
+ */
+export function encodeSignedTxn(signedTxn: SignedTransaction): EncodedTxnRecord {
+	const encTx = signedTxn.txn.get_obj_for_encoding() as EncTx;
+	encTx.txID = signedTxn.txn.txID();
+	return {
+		signedTxn,
+		encTx,
+		txID: encTx.txID,
+		from: webTx.getTxFromAddress(signedTxn.txn),
+		flags: webTx.getTxFlags(signedTxn.txn),
+		kind: classifyEncTx(encTx),
+	};
+}
+
 /**
  *
  * @param txAndSign transaction and sign
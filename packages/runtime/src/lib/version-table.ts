@@ -0,0 +1,105 @@
+/**
+ * Table of values by TEAL version. Values are built on first access (so importing the
+ * runtime doesn't pay for versions which are never used) and can't be modified.
+ */
+export type VersionTable<T> = { readonly [version: number]: T };
+
+/**
+ * Returns a table with versions 1..`lastVersion`. The value of a version is built by `build`
+ * on first access, from the value of the previous version.
+ * @param build builds value of a version (`prev` is undefined for version 1)
+ * @param lastVersion last version of the table
+ */
+export function lazyVersionTable<T>(
+	build: (version: number, prev: T | undefined) => T,
+	lastVersion: number
+): VersionTable<T> {
+	const table: { [version: number]: T } = {};
+	for (let version = 1; version <= lastVersion; ++version) {
+		Object.defineProperty(table, version, {
+			configurable: true,
+			enumerable: true,
+			get: () => {
+				const value = build(version, version > 1 ? table[version - 1] : undefined);
+				// replace the getter by the built (read-only) value
+				Object.defineProperty(table, version, { value, enumerable: true, writable: false });
+				return value;
+			},
+		});
+	}
+	return Object.preventExtensions(table);
+}
+
+/**
+ * Returns a table of maps (by TEAL version) defined by the entries added or replaced in each
+ * version. The map of a version is a frozen overlay of the map of the previous version:
+ * entries of the previous versions are looked up through the prototype chain, not copied.
+ * Versions without changes share the map of the previous version.
+ * @param changes entries added or replaced by each version
+ * @param lastVersion last version of the table
+ */
+export function versionMapTable<V>(
+	changes: { [version: number]: { [key: string]: V } },
+	lastVersion: number
+): VersionTable<{ readonly [key: string]: V }> {
+	return lazyVersionTable((version, prev: { readonly [key: string]: V } | undefined) => {
+		const added = changes[version];
+		if (prev !== undefined && added === undefined) {
+			return prev;
+		}
+		// properties are defined (not assigned), because replaced entries are read-only
+		// properties of the frozen prototype
+		const entries = Object.getOwnPropertyDescriptors(added ?? {});
+		return Object.freeze(Object.create(prev ?? Object.prototype, entries));
+	}, lastVersion);
+}
+
+/**
+ * Returns a table of sets (by TEAL version) defined by the values added in each version.
+ * Versions without changes share the set of the previous version.
+ * @param changes values added by each version
+ * @param lastVersion last version of the table
+ */
+export function versionSetTable<V>(
+	changes: { [version: number]: V[] },
+	lastVersion: number
+): VersionTable<ReadonlySet<V>> {
+	return lazyVersionTable((version, prev: ReadonlySet<V> | undefined) => {
+		const added = changes[version];
+		if (prev !== undefined && added === undefined) {
+			return prev;
+		}
+		return new FrozenSet([...(prev ?? []), ...(added ?? [])]);
+	}, lastVersion);
+}
+
+// set which can't be modified after construction
+class FrozenSet<V> extends Set<V> {
+	private readonly frozen: boolean;
+
+	constructor(values: Iterable<V>) {
+		super(values); // calls `add` before `frozen` is set
+		this.frozen = true;
+	}
+
+	add(value: V): this {
+		this.assertNotFrozen();
+		return super.add(value);
+	}
+
+	delete(value: V): boolean {
+		this.assertNotFrozen();
+		return super.delete(value);
+	}
+
+	clear(): void {
+		this.assertNotFrozen();
+		super.clear();
+	}
+
+	private assertNotFrozen(): void {
+		if (this.frozen) {
+			throw new TypeError("Cannot modify a frozen set");
+		}
+	}
+}
@@ -164,14 +164,17 @@ import {
 	LOGIC_SIG_MAX_COST,
 	LogicSigMaxSize,
 	MAX_APP_PROGRAM_COST,
+	MaxTEALVersion,
 	OpGasCost,
 } from "../lib/constants";
 import { assertLen } from "../lib/parsing";
+import { versionMapTable } from "../lib/version-table";
 import { ExecutionMode } from "../types";
 
-// teal v1 opcodes
-const opCodeMap: { [key: number]: { [key: string]: any } } = {
+// opcodes added in each teal version
+const opCodeChanges: { [key: number]: { [key: string]: any } } = {
 	// tealVersion => opcodeMap
+	// teal v1 opcodes
 	1: {
 		// Pragma
 		"#pragma": Pragma,
@@ -235,196 +238,188 @@ const opCodeMap: { [key: number]: { [key: string]: any } } = {
 		gtxn: Gtxn,
 		global: Global,
 	},
-};
 
-// teal v2 opcodes
-opCodeMap[2] = {
-	...opCodeMap[1], // includes all v1 opcodes
-
-	addw: Addw,
-
-	// txn ops
-	txna: Txna,
-	gtxna: Gtxna,
-
-	// branch opcodes in v2
-	b: Branch,
-	bz: BranchIfZero,
-	return: Return,
-
-	dup2: Dup2,
-	concat: Concat,
-	substring: Substring,
-	substring3: Substring3,
-
-	// Stateful Opcodes
-	app_opted_in: AppOptedIn,
-	app_local_get: AppLocalGet,
-	app_local_get_ex: AppLocalGetEx,
-	app_global_get: AppGlobalGet,
-	app_global_get_ex: AppGlobalGetEx,
-	app_local_put: AppLocalPut,
-	app_global_put: AppGlobalPut,
-	app_local_del: AppLocalDel,
-	app_global_del: AppGlobalDel,
-
-	balance: Balance,
-	asset_holding_get: GetAssetHolding,
-	asset_params_get: GetAssetDef,
-};
+	// teal v2 opcodes
+	2: {
+		addw: Addw,
+
+		// txn ops
+		txna: Txna,
+		gtxna: Gtxna,
+
+		// branch opcodes in v2
+		b: Branch,
+		bz: BranchIfZero,
+		return: Return,
+
+		dup2: Dup2,
+		concat: Concat,
+		substring: Substring,
+		substring3: Substring3,
+
+		// Stateful Opcodes
+		app_opted_in: AppOptedIn,
+		app_local_get: AppLocalGet,
+		app_local_get_ex: AppLocalGetEx,
+		app_global_get: AppGlobalGet,
+		app_global_get_ex: AppGlobalGetEx,
+		app_local_put: AppLocalPut,
+		app_global_put: AppGlobalPut,
+		app_local_del: AppLocalDel,
+		app_global_del: AppGlobalDel,
+
+		balance: Balance,
+		asset_holding_get: GetAssetHolding,
+		asset_params_get: GetAssetDef,
+	},
 
-/**
- * TEALv3 opcodes: https://developer.algorand.org/articles/introducing-teal-version-3/
- */
-opCodeMap[3] = {
-	...opCodeMap[2],
+	/**
+	 * TEALv3 opcodes: https://developer.algorand.org/articles/introducing-teal-version-3/
+	 */
+	3: {
 
-	assert: Assert,
-	swap: Swap,
+		assert: Assert,
+		swap: Swap,
 
-	// optimized opcodes for pushing uint64s and byte slices to the stack
-	pushint: PushInt,
-	pushbytes: PushBytes,
+		// optimized opcodes for pushing uint64s and byte slices to the stack
+		pushint: PushInt,
+		pushbytes: PushBytes,
 
-	// bit & byte opcodes
-	getbit: GetBit,
-	setbit: SetBit,
-	getbyte: GetByte,
-	setbyte: SetByte,
+		// bit & byte opcodes
+		getbit: GetBit,
+		setbit: SetBit,
+		getbyte: GetByte,
+		setbyte: SetByte,
 
-	dig: Dig,
-	select: Select,
+		dig: Dig,
+		select: Select,
 
-	// txn ops in tealv3
-	gtxns: Gtxns,
-	gtxnsa: Gtxnsa,
+		// txn ops in tealv3
+		gtxns: Gtxns,
+		gtxnsa: Gtxnsa,
 
-	// stateful op (mode = application)
-	min_balance: MinBalance,
-};
+		// stateful op (mode = application)
+		min_balance: MinBalance,
+	},
 
-/**
- * TEALv4 opcodes: https://developer.algorand.org/articles/introducing-algorand-virtual-machine-avm-09-release/
- */
-opCodeMap[4] = {
-	...opCodeMap[3],
-
-	gload: Gload,
-	gloads: Gloads,
-
-	callsub: Callsub,
-	retsub: Retsub,
-
-	b: Branchv4,
-	bnz: BranchIfNotZerov4,
-	bz: BranchIfZerov4,
-	// byteslice arithmetic ops
-	"b+": ByteAdd,
-	"b-": ByteSub,
-	"b*": ByteMul,
-	"b/": ByteDiv,
-	"b%": ByteMod,
-	"b<": ByteLessThan,
-	"b>": ByteGreaterThan,
-	"b<=": ByteLessThanEqualTo,
-	"b>=": ByteGreaterThanEqualTo,
-	"b==": ByteEqualTo,
-	"b!=": ByteNotEqualTo,
-	"b|": ByteBitwiseOr,
-	"b&": ByteBitwiseAnd,
-	"b^": ByteBitwiseXor,
-	"b~": ByteBitwiseInvert,
-	bzero: ByteZero,
-
-	divmodw: DivModw,
-	exp: Exp,
-	expw: Expw,
-	shl: Shl,
-	shr: Shr,
-	sqrt: Sqrt,
-	bitlen: BitLen,
-	// Knowable creatable asset
-	gaid: Gaid,
-	gaids: Gaids,
-};
+	/**
+	 * TEALv4 opcodes: https://developer.algorand.org/articles/introducing-algorand-virtual-machine-avm-09-release/
+	 */
+	4: {
+		gload: Gload,
+		gloads: Gloads,
+
+		callsub: Callsub,
+		retsub: Retsub,
+
+		b: Branchv4,
+		bnz: BranchIfNotZerov4,
+		bz: BranchIfZerov4,
+		// byteslice arithmetic ops
+		"b+": ByteAdd,
+		"b-": ByteSub,
+		"b*": ByteMul,
+		"b/": ByteDiv,
+		"b%": ByteMod,
+		"b<": ByteLessThan,
+		"b>": ByteGreaterThan,
+		"b<=": ByteLessThanEqualTo,
+		"b>=": ByteGreaterThanEqualTo,
+		"b==": ByteEqualTo,
+		"b!=": ByteNotEqualTo,
+		"b|": ByteBitwiseOr,
+		"b&": ByteBitwiseAnd,
+		"b^": ByteBitwiseXor,
+		"b~": ByteBitwiseInvert,
+		bzero: ByteZero,
+
+		divmodw: DivModw,
+		exp: Exp,
+		expw: Expw,
+		shl: Shl,
+		shr: Shr,
+		sqrt: Sqrt,
+		bitlen: BitLen,
+		// Knowable creatable asset
+		gaid: Gaid,
+		gaids: Gaids,
+	},
 
-/**
- * TEALv5 opcodes
- */
-opCodeMap[5] = {
-	...opCodeMap[4],
-
-	cover: Cover,
-	uncover: Uncover,
-
-	loads: Loads,
-	stores: Stores,
-	// ECDSA
-	ecdsa_verify: EcdsaVerify,
-	ecdsa_pk_decompress: EcdsaPkDecompress,
-	ecdsa_pk_recover: EcdsaPkRecover,
-
-	// Extract opcodes
-	extract: Extract,
-	extract3: Extract3,
-	extract_uint16: ExtractUint16,
-	extract_uint32: ExtractUint32,
-	extract_uint64: ExtractUint64,
-
-	// Inner Transaction Ops
-	itxn_begin: ITxnBegin,
-	itxn_field: ITxnField,
-	itxn_submit: ITxnSubmit,
-	itxn: ITxn,
-	itxna: ITxna,
-
-	// gtxn, other ops
-	txnas: Txnas,
-	gtxnas: Gtxnas,
-	gtxnsas: Gtxnsas,
-	args: Args,
-	log: Log,
-	app_params_get: AppParamsGet,
-};
+	/**
+	 * TEALv5 opcodes
+	 */
+	5: {
+		cover: Cover,
+		uncover: Uncover,
+
+		loads: Loads,
+		stores: Stores,
+		// ECDSA
+		ecdsa_verify: EcdsaVerify,
+		ecdsa_pk_decompress: EcdsaPkDecompress,
+		ecdsa_pk_recover: EcdsaPkRecover,
+
+		// Extract opcodes
+		extract: Extract,
+		extract3: Extract3,
+		extract_uint16: ExtractUint16,
+		extract_uint32: ExtractUint32,
+		extract_uint64: ExtractUint64,
+
+		// Inner Transaction Ops
+		itxn_begin: ITxnBegin,
+		itxn_field: ITxnField,
+		itxn_submit: ITxnSubmit,
+		itxn: ITxn,
+		itxna: ITxna,
+
+		// gtxn, other ops
+		txnas: Txnas,
+		gtxnas: Gtxnas,
+		gtxnsas: Gtxnsas,
+		args: Args,
+		log: Log,
+		app_params_get: AppParamsGet,
+	},
 
-opCodeMap[6] = {
-	...opCodeMap[5],
-	divw: Divw,
-	bsqrt: Bsqrt,
-	gloadss: Gloadss,
-	acct_params_get: AcctParamsGet,
-	itxn_next: ITxnNext,
-	gitxn: Gitxn,
-	gitxna: Gitxna,
-	gitxnas: Gitxnas,
-	itxnas: ITxnas,
-};
+	6: {
+		divw: Divw,
+		bsqrt: Bsqrt,
+		gloadss: Gloadss,
+		acct_params_get: AcctParamsGet,
+		itxn_next: ITxnNext,
+		gitxn: Gitxn,
+		gitxna: Gitxna,
+		gitxnas: Gitxnas,
+		itxnas: ITxnas,
+	},
 
-/**
- * TEALv7
- */
-opCodeMap[7] = {
-	...opCodeMap[6],
-	base64_decode: Base64Decode,
-	replace2: Replace2,
-	replace3: Replace3,
-	sha3_256: Sha3_256,
-	ed25519verify_bare: Ed25519verify_bare,
-	json_ref: Json_ref,
-	block: Block,
-	vrf_verify: VrfVerify,
-};
-/**
- * TEALv8
- * //TODO: check if the bn254 opcodes has been realased with v8 or v9
- */
-opCodeMap[8] = {
-	...opCodeMap[7],
-	bn254_add: Bn254Add,
-	bn254_scalar_mul: Bn254ScalarMul,
-	bn254_pairing: Bn254Pairing,
-	switch: Switch,
+	/**
+	 * TEALv7
+	 */
+	7: {
+		base64_decode: Base64Decode,
+		replace2: Replace2,
+		replace3: Replace3,
+		sha3_256: Sha3_256,
+		ed25519verify_bare: Ed25519verify_bare,
+		json_ref: Json_ref,
+		block: Block,
+		vrf_verify: VrfVerify,
+	},
+	/**
+	 * TEALv8
+	 * //TODO: check if the bn254 opcodes has been realased with v8 or v9
+	 */
+	8: {
+		bn254_add: Bn254Add,
+		bn254_scalar_mul: Bn254ScalarMul,
+		bn254_pairing: Bn254Pairing,
+		switch: Switch,
+	},
 };
+// opcodes by teal version (versions include the opcodes of the previous versions)
+const opCodeMap = versionMapTable(opCodeChanges, MaxTEALVersion);
 
 // list of opcodes with exactly one parameter.
 const interpreterReqList = new Set([
@@ -884,22 +879,19 @@ function assertLogicMaxLen(lsigProgramArgsSize: number, mode: ExecutionMode): vo
 }
 
 /**
- * Description: Returns a list of Opcodes object after reading text from given TEAL file
+ * Returns a list of Opcodes object after reading text from given TEAL file, without checking
+ * size and cost of the program.
  * @param program : TEAL code as string
  * @param mode : execution mode of TEAL code (Stateless or Application)
  * @param interpreter: interpreter object
  */
-export function parser(program: string, mode: ExecutionMode, interpreter: Interpreter): Op[] {
+export function parseLines(
+	program: string,
+	mode: ExecutionMode,
+	interpreter: Interpreter
+): Op[] {
 	const opCodeList: Op[] = [];
 	let counter = 0;
-	let lsigProgramArgsSize = Buffer.from(program, "base64").length;
-	if (interpreter.runtime.ctx?.args && interpreter.runtime.ctx.args.length) {
-		for (const arg of interpreter.runtime.ctx.args) {
-			lsigProgramArgsSize += arg.length;
-		}
-	}
-	//validate lsig program and arguments size
-	assertLogicMaxLen(lsigProgramArgsSize, mode);
 	const lines = program.split("\n");
 	for (const line of lines) {
 		counter++;
@@ -914,6 +906,25 @@ export function parser(program: string, mode: ExecutionMode, interpreter: Interp
 			opCodeList.push(opcodeFromSentence(words, counter, interpreter, mode));
 		}
 	}
+	return opCodeList;
+}
+
+/**
+ * Description: Returns a list of Opcodes object after reading text from given TEAL file
+ * @param program : TEAL code as string
+ * @param mode : execution mode of TEAL code (Stateless or Application)
+ * @param interpreter: interpreter object
+ */
+export function parser(program: string, mode: ExecutionMode, interpreter: Interpreter): Op[] {
+	let lsigProgramArgsSize = Buffer.from(program, "base64").length;
+	if (interpreter.runtime.ctx?.args && interpreter.runtime.ctx.args.length) {
+		for (const arg of interpreter.runtime.ctx.args) {
+			lsigProgramArgsSize += arg.length;
+		}
+	}
+	//validate lsig program and arguments size
+	assertLogicMaxLen(lsigProgramArgsSize, mode);
+	const opCodeList = parseLines(program, mode, interpreter);
 
 	// for versions <= 3, cost is calculated & evaluated statically
 	if (interpreter.tealVersion <= 3) {
@@ -0,0 +1,216 @@
+import { types } from "@algo-builder/web";
+import algosdk, { EncodedSignedTransaction, SignedTransaction, Transaction } from "algosdk";
+
+import { RUNTIME_ERRORS } from "./errors/errors-list";
+import { RuntimeError } from "./errors/runtime-errors";
+import { TransactionTypeEnum } from "./lib/constants";
+import { readMsgpackFile } from "./lib/msgpack";
+import { Runtime } from "./runtime";
+import { AnyMap, AppReplayCost, ReplayOptions, ReplayReport, TxReceipt } from "./types";
+
+// transaction read from a replay file
+interface ReplayTxn {
+	stxn: SignedTransaction;
+	txID: string;
+	round?: number; // round of the block (only for block files)
+	timestamp?: number;
+	logs?: Uint8Array[]; // logs recorded in the block apply data
+}
+
+/**
+ * Rebuilds SignedTransaction from its msgpack object. Transactions stored in blocks
+ * don't carry genesis id and hash, they are restored from the block header.
+ */
+function toSignedTransaction(stxn: AnyMap, blockHeader?: AnyMap): SignedTransaction {
+	const encTxn = { ...stxn.txn };
+	if (blockHeader !== undefined) {
+		if (stxn.hgi) encTxn.gen = blockHeader.gen;
+		if (encTxn.gh === undefined) encTxn.gh = blockHeader.gh;
+	}
+	const encoded = stxn as EncodedSignedTransaction;
+	return {
+		sig: encoded.sig,
+		sgnr: encoded.sgnr,
+		msig: encoded.msig,
+		lsig: encoded.lsig,
+		txn: Transaction.from_obj_for_encoding(encTxn),
+	};
+}
+
+function groupKey(txn: ReplayTxn): string | undefined {
+	const grp = txn.stxn.txn.group;
+	return grp === undefined ? undefined : Buffer.from(grp).toString("base64");
+}
+
+function sameLogs(recorded: Uint8Array[], logs: Uint8Array[] = []): boolean {
+	if (recorded.length !== logs.length) return false;
+	return recorded.every((log, i) => Buffer.from(log).equals(Buffer.from(logs[i])));
+}
+
+/**
+ * LedgerReplay executes recorded transactions (signed transaction files or exported
+ * blocks) against a seeded `Runtime`. Files are streamed, so only the current
+ * transaction group is kept in memory.
+ */
+export class LedgerReplay {
+	readonly runtime: Runtime;
+	private readonly options: ReplayOptions;
+
+	constructor(runtime: Runtime, options: ReplayOptions = {}) {
+		this.runtime = runtime;
+		this.options = options;
+	}
+
+	/**
+	 * Replays msgpack files in order and returns throughput, opcode cost per app and
+	 * the groups which failed or produced different logs than recorded.
+	 * @param files path (or paths) to files with concatenated signed transactions or blocks
+	 */
+	async replay(files: string | string[]): Promise<ReplayReport> {
+		const paths = typeof files === "string" ? [files] : files;
+		const report: ReplayReport = {
+			files: paths,
+			groups: 0,
+			transactions: 0,
+			failedGroups: 0,
+			elapsedMs: 0,
+			txnsPerSecond: 0,
+			appCosts: new Map<number, AppReplayCost>(),
+			divergences: [],
+		};
+		const start = process.hrtime.bigint();
+		for (const file of paths) {
+			if (!(await this.replayFile(file, report))) break;
+		}
+		report.elapsedMs = Number(process.hrtime.bigint() - start) / 1e6;
+		if (report.elapsedMs > 0) {
+			report.txnsPerSecond = (report.transactions * 1000) / report.elapsedMs;
+		}
+		return report;
+	}
+
+	// returns false if replay should stop
+	private async replayFile(file: string, report: ReplayReport): Promise<boolean> {
+		let group: ReplayTxn[] = [];
+		let index = 0;
+		for await (const record of readMsgpackFile(file)) {
+			for (const txn of this.decodeRecord(record, file, index++)) {
+				const key = groupKey(txn);
+				if (group.length > 0 && (key === undefined || key !== groupKey(group[0]))) {
+					if (!this.executeGroup(group, file, report)) return false;
+					group = [];
+				}
+				group.push(txn);
+			}
+		}
+		return group.length > 0 ? this.executeGroup(group, file, report) : true;
+	}
+
+	private decodeRecord(record: Uint8Array, file: string, index: number): ReplayTxn[] {
+		const obj = algosdk.decodeObj(record) as AnyMap;
+		if (obj.txn !== undefined) {
+			const stxn = toSignedTransaction(obj);
+			return [{ stxn, txID: stxn.txn.txID() }];
+		}
+
+		// algod returns blocks as {block, cert}, empty `txns` are omitted from encoding
+		const block = obj.block ?? obj;
+		if (obj.block === undefined && block.gh === undefined) {
+			throw new RuntimeError(RUNTIME_ERRORS.GENERAL.UNKNOWN_REPLAY_RECORD, {
+				file: file,
+				index: index,
+			});
+		}
+		return ((block.txns ?? []) as AnyMap[]).map((stxnInBlock) => {
+			const stxn = toSignedTransaction(stxnInBlock, block);
+			return {
+				stxn,
+				txID: stxn.txn.txID(),
+				round: Number(block.rnd ?? 0),
+				timestamp: Number(block.ts ?? 0),
+				logs: stxnInBlock.dt?.lg,
+			};
+		});
+	}
+
+	/**
+	 * Moves runtime round inside the validity window of the group
+	 * (recorded transactions are valid for rounds of the recorded network).
+	 */
+	private syncRound(group: ReplayTxn[]): void {
+		if (this.options.syncRound === false) return;
+		const firstValid = Math.max(...group.map((t) => t.stxn.txn.firstRound));
+		const lastValid = Math.min(...group.map((t) => t.stxn.txn.lastRound));
+		const inWindow = (r: number): boolean => r > firstValid && r < lastValid;
+		if (inWindow(this.runtime.getRound())) return;
+
+		const blockRound = group[0].round;
+		const round =
+			blockRound !== undefined && inWindow(blockRound) ? blockRound : firstValid + 1;
+		if (!inWindow(round)) return; // runtime will report the invalid round
+		this.runtime.setRoundAndTimestamp(round, group[0].timestamp || this.runtime.getTimestamp());
+	}
+
+	// returns false if replay should stop
+	private executeGroup(group: ReplayTxn[], file: string, report: ReplayReport): boolean {
+		const txIDs = group.map((t) => t.txID);
+		const appDefMap = new Map<number, types.AppDefinition | types.SmartContract>();
+		group.forEach((t, idx) => {
+			const appDef = this.options.appDefinitions?.get(t.txID);
+			if (appDef !== undefined) appDefMap.set(idx, appDef);
+		});
+
+		this.syncRound(group);
+		let reason: string | undefined;
+		try {
+			const receipts = this.runtime.executeSignedTxnGroup(group.map((t) => t.stxn), appDefMap);
+			report.groups++;
+			report.transactions += group.length;
+			this.recordCosts(txIDs, receipts, report.appCosts);
+			reason = this.compareLogs(group, receipts);
+		} catch (error) {
+			report.failedGroups++;
+			reason = error instanceof Error ? error.message : String(error);
+		}
+
+		if (reason === undefined) return true;
+		report.divergences.push({ file, round: group[0].round, txIDs, reason });
+		return !this.options.stopOnDivergence;
+	}
+
+	/**
+	 * Accumulates opcode cost of app calls: the cost executed by the program of each call,
+	 * inner app calls are not charged to the calling app.
+	 */
+	private recordCosts(
+		txIDs: string[],
+		receipts: TxReceipt[],
+		appCosts: Map<number, AppReplayCost>
+	): void {
+		for (const receipt of receipts as AnyMap[]) {
+			const isAppCall = receipt.txn?.type === TransactionTypeEnum.APPLICATION_CALL;
+			if (receipt.opcodeCost === undefined || !isAppCall) continue;
+
+			const cost = Number(receipt.opcodeCost);
+			const appID =
+				receipt.txn.apid ?? this.runtime.ctx.knowableID.get(txIDs.indexOf(receipt.txID)) ?? 0;
+			const appCost = appCosts.get(appID) ?? { calls: 0, totalCost: 0, maxCost: 0 };
+			appCost.calls++;
+			appCost.totalCost += cost;
+			appCost.maxCost = Math.max(appCost.maxCost, cost);
+			appCosts.set(appID, appCost);
+		}
+	}
+
+	// compares logs of the replay with logs recorded in the block
+	private compareLogs(group: ReplayTxn[], receipts: TxReceipt[]): string | undefined {
+		for (const txn of group) {
+			if (txn.logs === undefined) continue;
+			const receipt = receipts.find((r) => r.txID === txn.txID);
+			if (!sameLogs(txn.logs, receipt?.logs)) {
+				return `logs of transaction ${txn.txID} differ from the recorded ones`;
+			}
+		}
+		return undefined;
+	}
+}
@@ -34,6 +34,8 @@ import {
 	ZERO_ADDRESS_STR,
 } from "./lib/constants";
 import { convertToString } from "./lib/parsing";
+import { ReceiptLog } from "./lib/receipt-log";
+import { encodeSignedTxn } from "./lib/txn";
 import { LogicSigAccount } from "./logicsig";
 import { mockSuggestedParams } from "./mock/tx";
 import {
@@ -45,15 +47,18 @@ import {
 	ASADeploymentFlags,
 	ASAInfo,
 	AssetHoldingM,
+	BaseTxReceipt,
 	Block,
 	Context,
 	EncTx,
 	ExecutionMode,
+	ReceiptRetention,
 	RuntimeAccountI,
 	SCParams,
 	SSCAttributesM,
 	StackElem,
 	State,
+	Tracer,
 	TxnReceipt,
 	TxReceipt,
 } from "./types";
@@ -75,6 +80,10 @@ export class Runtime {
 	private round: number;
 	private timestamp: number;
 	private readonly numberOfInitialBlocks: number;
+	private receiptRetention: ReceiptRetention;
+	private receiptLog?: ReceiptLog;
+	private retainedAppIDs: Set<number>; // app IDs of the "apps" receipt retention policy
+	tracer?: Tracer;
 
 	constructor(accounts: AccountStoreI[]) {
 		// runtime store
@@ -101,6 +110,8 @@ export class Runtime {
 
 		// context for interpreter
 		this.ctx = new Ctx(cloneDeep(this.store), <EncTx>{}, [], [], this);
+		this.receiptRetention = { keep: "all" };
+		this.retainedAppIDs = new Set<number>();
 		this.round = 0;
 		this.numberOfInitialBlocks = 2000;
 		this.produceBlocks(this.numberOfInitialBlocks);
@@ -145,7 +156,77 @@ export class Runtime {
 	 * @param txID transaction ID
 	 */
 	getTxReceipt(txID: string): TxReceipt | undefined {
-		return this.store.txReceipts.get(txID);
+		return this.store.txReceipts.get(txID) ?? this.receiptLog?.get(txID);
+	}
+
+	/**
+	 * Sets which transaction receipts are kept in the runtime state. By default all receipts
+	 * are kept. Evicted receipts can be spilled to an append-only log on disk, and
+	 * `getTxReceipt` will still find them there.
+	 * @param retention receipt retention policy
+	 */
+	setReceiptRetention(retention: ReceiptRetention): void {
+		this.closeReceiptLog();
+		this.receiptLog = retention.spillFile ? new ReceiptLog(retention.spillFile) : undefined;
+		this.receiptRetention = retention;
+		this.retainedAppIDs = new Set(retention.appIDs ?? []);
+		// all stored receipts are checked once, later commits only check their own receipts
+		this.applyReceiptRetention(this.store.txReceipts.keys());
+	}
+
+	/**
+	 * Closes the spill file of the receipt retention policy. Receipts evicted afterwards are
+	 * dropped, and spilled receipts are no longer returned by `getTxReceipt`.
+	 */
+	closeReceiptLog(): void {
+		this.receiptLog?.close();
+		this.receiptLog = undefined;
+	}
+
+	/**
+	 * Sets a function called after every executed opcode (eg. to record execution
+	 * traces). Pass undefined to remove the tracer.
+	 * @param tracer function receiving executed opcodes
+	 */
+	setTracer(tracer?: Tracer): void {
+		this.tracer = tracer;
+	}
+
+	// removes receipts not covered by the retention policy from the store. Stored receipts
+	// which are not in `txIDs` were already checked, so the cost depends only on the number
+	// of new (or evicted) receipts.
+	private applyReceiptRetention(txIDs: Iterable<string>): void {
+		const retention = this.receiptRetention;
+		const receipts = this.store.txReceipts;
+		if (retention.keep === "all") return;
+
+		if (retention.keep === "last") {
+			const limit = retention.limit ?? 0;
+			// map keeps the insertion order, so it's a queue with the oldest receipts first
+			for (const txID of receipts.keys()) {
+				if (receipts.size <= limit) break;
+				this.receiptLog?.append(txID, receipts.get(txID) as TxReceipt);
+				receipts.delete(txID);
+			}
+			return;
+		}
+
+		for (const txID of txIDs) {
+			const receipt = receipts.get(txID);
+			if (receipt === undefined) continue; // already evicted
+			if (retention.keep === "apps") {
+				const appID = (receipt as AppInfo).appID ?? (receipt as BaseTxReceipt).txn?.apid;
+				if (appID !== undefined && this.retainedAppIDs.has(appID)) continue;
+			}
+			this.receiptLog?.append(txID, receipt);
+			receipts.delete(txID);
+		}
+	}
+
+	// updates store with the state of a successfully executed context
+	private commitCtxState(): void {
+		this.store = this.ctx.state;
+		this.applyReceiptRetention(this.ctx.addedReceipts.splice(0));
 	}
 
 	/**
@@ -410,12 +491,17 @@ export class Runtime {
 				this.store.accountNameAddress.set(acc.account.name, acc.account.addr);
 			this.store.accounts.set(acc.address, acc);
 
-			for (const appID of acc.createdApps.keys()) {
-				this.store.globalApps.set(appID, acc.address);
+			// lazy maps of accounts without apps and assets are not allocated
+			if (acc.hasCreatedApps()) {
+				for (const appID of acc.createdApps.keys()) {
+					this.store.globalApps.set(appID, acc.address);
+				}
 			}
 
-			for (const assetId of acc.createdAssets.keys()) {
-				this.store.assetDefs.set(assetId, acc.address);
+			if (acc.hasCreatedAssets()) {
+				for (const assetId of acc.createdAssets.keys()) {
+					this.store.assetDefs.set(assetId, acc.address);
+				}
 			}
 		}
 
@@ -427,6 +513,23 @@ export class Runtime {
 		this.store.accounts.set(feeSink.address, feeSink);
 	}
 
+	/**
+	 * Creates `n` new (unnamed) accounts funded with `balance` microAlgos and adds them
+	 * to the store. Useful for simulations with many asset holders.
+	 * @param n number of accounts to create
+	 * @param balance initial balance of each account (in microAlgos)
+	 * @returns created accounts
+	 */
+	createAccounts(n: number, balance: number | bigint = this.defaultBalance): AccountStore[] {
+		const accounts: AccountStore[] = [];
+		for (let i = 0; i < n; i++) {
+			const acc = new AccountStore(balance);
+			this.store.accounts.set(acc.address, acc);
+			accounts.push(acc);
+		}
+		return accounts;
+	}
+
 	/**
 	 * Add accounts from config file to the Store
 	 * @param network: the network of accounts to add
@@ -538,7 +641,7 @@ export class Runtime {
 	 */
 	deployASA(asa: string, flags: ASADeploymentFlags): ASAInfo {
 		const txReceipt = this.ctx.deployASA(asa, flags.creator.addr, flags);
-		this.store = this.ctx.state;
+		this.commitCtxState();
 
 		this.optInToASAMultiple(this.store.assetCounter, this.loadedAssetsDefs[asa].optInAccNames);
 		return txReceipt;
@@ -551,7 +654,7 @@ export class Runtime {
 	 */
 	deployASADef(asa: string, asaDef: types.ASADef, flags: ASADeploymentFlags): ASAInfo {
 		const txReceipt = this.ctx.deployASADef(asa, asaDef, flags.creator.addr, flags);
-		this.store = this.ctx.state;
+		this.commitCtxState();
 
 		this.optInToASAMultiple(this.store.assetCounter, asaDef.optInAccNames);
 		return txReceipt;
@@ -583,7 +686,7 @@ export class Runtime {
 	optInToASA(assetIndex: number, address: AccountAddress, flags: types.TxParams): TxReceipt {
 		const txReceipt = this.ctx.optInToASA(assetIndex, address, flags);
 
-		this.store = this.ctx.state;
+		this.commitCtxState();
 		return txReceipt;
 	}
 
@@ -655,7 +758,7 @@ export class Runtime {
 		this.ctx.budget = MAX_APP_PROGRAM_COST;
 		this.validateExtraPages(appDefinition?.extraPages);
 		const txReceipt = this.ctx.deployApp(sender.addr, appDefinition, 0, scTmplParams);
-		this.store = this.ctx.state;
+		this.commitCtxState();
 		return txReceipt;
 	}
 
@@ -705,7 +808,7 @@ export class Runtime {
 		this.ctx.budget = MAX_APP_PROGRAM_COST;
 		const txReceipt = this.ctx.optInToApp(accountAddr, appID, 0);
 
-		this.store = this.ctx.state;
+		this.commitCtxState();
 		return txReceipt;
 	}
 
@@ -764,7 +867,7 @@ export class Runtime {
 		const txReceipt = this.ctx.updateApp(appID, newAppCode, 0, scTmplParams);
 
 		// If successful, Update programs and state
-		this.store = this.ctx.state;
+		this.commitCtxState();
 		return txReceipt;
 	}
 
@@ -906,6 +1009,7 @@ export class Runtime {
 	 * This function executes a transaction based on a smart contract logic and updates state afterwards
 	 * Check out {@link https://algobuilder.dev/guide/execute-transaction.html#execute-transaction|execute-transaction}
 	 * for more info.
+	 * Returned receipts are views with hyphenated keys, keys are converted only when accessed.
 	 * @param txnParams : Transaction parameters
 	 * @param debugStack: if passed then TEAL Stack is logged to console after
 	 * each opcode execution (upto depth = debugStack)
@@ -914,6 +1018,21 @@ export class Runtime {
 		txnParams: types.ExecParams[] | algosdk.SignedTransaction[],
 		debugStack?: number
 	): TxnReceipt[] {
+		return this.executeTxRaw(txnParams, debugStack).map((r) => parsing.hyphenatedKeysView(r));
+	}
+
+	/**
+	 * Same as `executeTx`, but returns internal receipts (with camelCase keys) stored in the
+	 * runtime state. Use it in batch workloads which don't read receipts.
+	 * NOTE: the receipts must not be modified.
+	 * @param txnParams : Transaction parameters
+	 * @param debugStack: if passed then TEAL Stack is logged to console after
+	 * each opcode execution (upto depth = debugStack)
+	 */
+	executeTxRaw(
+		txnParams: types.ExecParams[] | algosdk.SignedTransaction[],
+		debugStack?: number
+	): TxReceipt[] {
 		// TODO: union above and create new type in task below:
 		// https://www.pivotaltracker.com/n/projects/2452320/stories/181295625
 		let signedTransactions: algosdk.SignedTransaction[];
@@ -970,7 +1089,26 @@ export class Runtime {
 			});
 		}
 
-		const gtxs = this.getEncodedGroupTxns(signedTransactions);
+		return this.executeSignedTxnGroup(signedTransactions, appDefMap, lsigMap, debugStack);
+	}
+
+	/**
+	 * Executes a group of signed transactions and updates state if all of them pass.
+	 * Returns internal receipts (see `executeTxRaw`).
+	 * @param signedTransactions signed transactions of the group
+	 * @param appDefMap app sources for deploy and update transactions (by index in group)
+	 * @param lsigMap logic signatures (by index in group)
+	 * @param debugStack: if passed then TEAL Stack is logged to console after
+	 * each opcode execution (upto depth = debugStack)
+	 */
+	executeSignedTxnGroup(
+		signedTransactions: algosdk.SignedTransaction[],
+		appDefMap: Map<number, types.AppDefinition | types.SmartContract> = new Map(),
+		lsigMap: Map<number, types.Lsig> = new Map(),
+		debugStack?: number
+	): TxReceipt[] {
+		const encodedTxns = signedTransactions.map(encodeSignedTxn);
+		const gtxs = encodedTxns.map((encodedTxn) => encodedTxn.encTx);
 		const tx = gtxs[0];
 
 		// validate first and last rounds
@@ -988,17 +1126,17 @@ export class Runtime {
 		).length;
 
 		this.ctx.budget = MAX_APP_PROGRAM_COST * applCallTxNumber;
-		const txReceipts = this.ctx.processTransactions(signedTransactions, appDefMap, lsigMap);
-
-		const txnReceipt: TxnReceipt[] = [];
-		for (const txn of txReceipts) {
-			txnReceipt.push(parsing.convertKeysToHyphens(txn));
-		}
+		const txReceipts = this.ctx.processTransactions(
+			signedTransactions,
+			appDefMap,
+			lsigMap,
+			encodedTxns
+		);
 		// update store only if all the transactions are passed
-		this.store = this.ctx.state;
+		this.commitCtxState();
 
 		// return transaction receipt(s)
-		return txnReceipt;
+		return txReceipts;
 	}
 
 	/**
@@ -1022,7 +1160,7 @@ export class Runtime {
 			txn: this.ctx.tx,
 			txID: this.ctx.tx.txID,
 		};
-		this.ctx.state.txReceipts.set(this.ctx.tx.txID, txReceipt);
+		this.ctx.setTxReceipt(this.ctx.tx.txID, txReceipt);
 		// reset pooled opcode cost for single tx, this is to handle singular functions
 		// which don't "initialize" a new ctx (eg. deployApp)
 		if (this.ctx.gtxs.length === 1 && !this.ctx.isInnerTx) {
@@ -1042,13 +1180,7 @@ export class Runtime {
 	 * @returns groupTransactions array of EncTx type
 	 */
 	getEncodedGroupTxns(signedTransactions: SignedTransaction[]): EncTx[] {
-		let gtxs: EncTx[] = [];
-		gtxs = signedTransactions.map((signedTransaction) => {
-			const txn = signedTransaction.txn.get_obj_for_encoding() as EncTx;
-			txn.txID = signedTransaction.txn.txID();
-			return txn;
-		});
-		return gtxs;
+		return signedTransactions.map((stxn) => encodeSignedTxn(stxn).encTx);
 	}
 
 	/**
@@ -1060,11 +1192,12 @@ export class Runtime {
 		//TODO: implement verify signature function
 		//TODO: rename the method to be complatible with algob
 		// this.verifySignature(signedTransaction);
-		const encodedTxnObj = signedTransaction.txn.get_obj_for_encoding() as EncTx;
-		encodedTxnObj.txID = signedTransaction.txn.txID();
-		this.ctx = new Ctx(cloneDeep(this.store), encodedTxnObj, [encodedTxnObj], [], this);
-		const txReceipt = this.ctx.processTransactions([signedTransaction], undefined);
-		this.store = this.ctx.state;
+		const encodedTxn = encodeSignedTxn(signedTransaction);
+		this.ctx = new Ctx(cloneDeep(this.store), encodedTxn.encTx, [encodedTxn.encTx], [], this);
+		const txReceipt = this.ctx.processTransactions([signedTransaction], undefined, undefined, [
+			encodedTxn,
+		]);
+		this.commitCtxState();
 		return txReceipt;
 	}
 
@@ -1073,9 +1206,12 @@ export class Runtime {
 	 * Include check spending account when creating a transaction from Algorand account
 	 * Throw RuntimeError if signature is invalid.
 	 * @param signedTransaction signedTransaction object.
+	 * @param fromAccountAddr sender address (derived from the transaction if not passed)
 	 */
-	validateSecretKeySignature(signedTransaction: SignedTransaction): void {
-		const fromAccountAddr = webTx.getTxFromAddress(signedTransaction.txn);
+	validateSecretKeySignature(
+		signedTransaction: SignedTransaction,
+		fromAccountAddr = webTx.getTxFromAddress(signedTransaction.txn)
+	): void {
 		const fromAccount = this.getAccount(fromAccountAddr);
 		if (signedTransaction.sig !== undefined) {
 			const accountSpendAddr = fromAccount.getSpendAddress();
@@ -1103,7 +1239,6 @@ export class Runtime {
 	 * @param signedTransaction signedTransaction object
 	 */
 	validateMultisignature(signedTransaction: algosdk.SignedTransaction) {
-		this.verifyMultisig(signedTransaction);
 		if (!this.verifyMultisig(signedTransaction)) {
 			throw new RuntimeError(RUNTIME_ERRORS.GENERAL.INVALID_MULTISIG);
 		}
@@ -5,6 +5,7 @@ import algosdk, {
 	Account as AccountSDK,
 	EncodedTransaction,
 	modelsv2,
+	SignedTransaction,
 	Transaction,
 } from "algosdk";
 
@@ -27,6 +28,34 @@ export interface EncTx extends EncodedTransaction {
 
 export type TxField = keyof typeof TxnFields[2];
 
+/**
+ * Kind of transaction, used by the runtime to select how the transaction is executed
+ * (eg. asset config transaction can create, reconfigure or delete an asset).
+ */
+export enum EncTxKind {
+	APP_CREATE = "app-create",
+	ASSET_CREATE = "asset-create",
+	ASSET_RECONFIGURE = "asset-reconfigure",
+	ASSET_DELETION = "asset-deletion",
+	ASSET_TRANSFER = "asset-transfer",
+	ASSET_REVOKE = "asset-revoke",
+	ASSET_OPT_IN = "asset-opt-in",
+	OTHER = "other",
+}
+
+/**
+ * Signed transaction prepared for execution. The transaction is encoded and hashed once,
+ * all stages of the runtime pipeline use this record.
+ */
+export interface EncodedTxnRecord {
+	signedTxn: SignedTransaction;
+	encTx: EncTx; // encoded transaction (with txID)
+	txID: string;
+	from: AccountAddress;
+	flags: types.TxParams;
+	kind: EncTxKind;
+}
+
 export enum TxnType {
 	unknown = "0", // Unknown type. Invalid transaction
 	pay = "1", // Payment
@@ -73,11 +102,40 @@ export interface BaseTxReceipt {
 	txn: EncTx;
 	txID: string;
 	gas?: number;
+	opcodeCost?: number; // executed opcode cost of the app call (without inner app calls)
 	logs?: Uint8Array[];
 }
 
 export type TxReceipt = BaseTxReceipt | AppInfo | ASAInfo;
 
+/**
+ * Which transaction receipts are kept in the runtime state:
+ * + all: every receipt (default)
+ * + last: only the last `limit` receipts
+ * + apps: only receipts of calls to (and deployments of) `appIDs`
+ * + none: no receipts are kept after the transaction group is executed
+ */
+export interface ReceiptRetention {
+	keep: "all" | "last" | "apps" | "none";
+	limit?: number;
+	appIDs?: number[];
+	// if set, evicted receipts are appended to this file and can still be queried
+	spillFile?: string;
+}
+
+/**
+ * Executed opcode reported to the tracer set with `Runtime.setTracer`.
+ */
+export interface TraceStep {
+	txID: string;
+	line: number; // line in the TEAL source
+	opcode: string;
+	cost: number; // opcode cost accumulated by the program so far
+	stack: StackElem[]; // stack after the opcode, top element first
+}
+
+export type Tracer = (step: TraceStep) => void;
+
 export interface State {
 	accounts: Map<string, AccountStoreI>;
 	accountNameAddress: Map<string, AccountAddress>;
@@ -114,6 +172,7 @@ export interface AppInfo extends DeployedAssetInfo {
 	clearFile: string;
 	logs?: Uint8Array[];
 	gas?: number; // used in runtime
+	opcodeCost?: number; // used in runtime
 }
 
 export interface AppDeploymentFlags extends AppOptionalFlags {
@@ -144,6 +203,11 @@ export interface Context {
 	remainingTxns: number; // number txn can execute on current call, include inner txn and normal txn.
 	// remaining fee from pool
 	remainingFee: number;
+	// index (in the top-level group) of the transaction being processed (or of the failed one)
+	txIndex?: number;
+	// IDs of the receipts set since the last commit of the context state
+	addedReceipts: string[];
+	setTxReceipt: (txID: string, receipt: TxReceipt) => void;
 	getAccount: (address: string) => AccountStoreI;
 	getAssetAccount: (assetId: number) => AccountStoreI;
 	getApp: (appID: number, line?: number) => SSCAttributesM;
@@ -257,6 +321,8 @@ export interface AccountStoreI {
 	rekeyTo: (authAccountAddress: types.AccountAddress) => void;
 	getSpendAddress: () => AccountAddress;
 	getApp: (appID: number) => SSCAttributesM | undefined;
+	hasCreatedApps: () => boolean;
+	hasCreatedAssets: () => boolean;
 	getAppFromLocal: (appID: number) => AppLocalStateM | undefined;
 	addApp: (appID: number, appDefinition: types.AppDefinitionFromSource) => CreatedAppM;
 	getAssetDef: (assetId: number) => modelsv2.AssetParams | undefined;
@@ -429,3 +495,94 @@ export interface Block {
 	timestamp: bigint; //uint64
 	seed: Uint8Array; //[]byte
 }
+
+export interface ReplayOptions {
+	/**
+	 * Sources of apps deployed or updated by the recorded transactions, by txID.
+	 * Runtime executes TEAL source code, so the bytecode from the files can't be used.
+	 */
+	appDefinitions?: Map<string, types.AppDefinition | types.SmartContract>;
+	/**
+	 * Move runtime round inside the validity window of each replayed group.
+	 * Default: true
+	 */
+	syncRound?: boolean;
+	// stop replay on the first group which fails or produces different logs.
+	stopOnDivergence?: boolean;
+}
+
+// opcode cost of all replayed calls to an app
+export interface AppReplayCost {
+	calls: number;
+	totalCost: number;
+	maxCost: number;
+}
+
+export interface ReplayDivergence {
+	file: string;
+	round?: number;
+	txIDs: string[];
+	reason: string;
+}
+
+export interface ReplayReport {
+	files: string[];
+	groups: number;
+	transactions: number;
+	failedGroups: number;
+	elapsedMs: number;
+	txnsPerSecond: number;
+	appCosts: Map<number, AppReplayCost>;
+	divergences: ReplayDivergence[];
+}
+
+export interface CostAnalysisOptions {
+	// execution mode of the program. Default: APPLICATION
+	mode?: ExecutionMode;
+	/**
+	 * Number of application calls in the group pooling their budget (an app call adds
+	 * MAX_APP_PROGRAM_COST to the pooled budget). Default: 1
+	 */
+	appCalls?: number;
+	// budget checked by the analysis (overrides the budget computed from mode and `appCalls`)
+	budget?: number;
+	/**
+	 * Maximum number of iterations of loops, by label of the loop start. A loop can also be
+	 * annotated in TEAL with a `// @loop-bound <n>` comment on the line of its label.
+	 */
+	loopBounds?: { [label: string]: number };
+	// ABI method signatures, used to name the entry points of the methods (by selector)
+	methods?: string[];
+}
+
+// entry point of an application: ABI method or on-completion branch
+export interface CostEntryPoint {
+	kind: "method" | "onCompletion";
+	name: string; // method signature (or selector) or on-completion name (eg. OptIn)
+	line: number; // line of the dispatching branch
+	maxCost: number; // worst-case cost of the program through the entry point
+	exceedsBudget: boolean;
+}
+
+export interface CostLoop {
+	label: string; // label of the loop start
+	line: number;
+	bound?: number; // maximum number of iterations (undefined: loop needs an annotation)
+}
+
+export interface CostReport {
+	tealVersion: number;
+	mode: ExecutionMode;
+	budget: number;
+	/**
+	 * Worst-case cost of the program. Infinity when it contains a loop without bound,
+	 * a recursive subroutine or an irreducible loop (with several entries).
+	 */
+	maxCost: number;
+	exceedsBudget: boolean;
+	entryPoints: CostEntryPoint[];
+	subroutines: Array<{ label: string; line: number; maxCost: number }>;
+	loops: CostLoop[];
+	// unbounded control flow (by line): loops without bound, recursion, irreducible loops
+	unbounded: Array<{ line: number; reason: string }>;
+}
@@ -6,7 +6,9 @@ import { AccountStore } from "../../../src/account";
 import { RUNTIME_ERRORS } from "../../../src/errors/errors-list";
 import { getProgram, Runtime } from "../../../src/index";
 import { Interpreter } from "../../../src/interpreter/interpreter";
+import { ITxnField } from "../../../src/interpreter/opcode-list";
 import { ALGORAND_ACCOUNT_MIN_BALANCE, TxFieldEnum, TxnRefFields } from "../../../src/lib/constants";
+import { resolveInnerTxField } from "../../../src/lib/itxn";
 import { AccountAddress, AccountStoreI, ExecutionMode, TxOnComplete } from "../../../src/types";
 import { useFixture } from "../../helpers/integration";
 import { expectRuntimeError } from "../../helpers/runtime-errors";
@@ -1040,6 +1042,34 @@ describe("Inner Transactions", function () {
 		});
 	});
 
+	describe("Field descriptors", function () {
+		it("should resolve field descriptors once per TEAL version", function () {
+			const rekeyTo = resolveInnerTxField(TxFieldEnum.RekeyTo, 6);
+			assert.strictEqual(resolveInnerTxField(TxFieldEnum.RekeyTo, 6), rekeyTo);
+			assert.notStrictEqual(resolveInnerTxField(TxFieldEnum.RekeyTo, 5), rekeyTo);
+		});
+
+		it("should resolve field descriptor when itxn_field is parsed", function () {
+			tealCode = `
+        itxn_begin
+        int 7
+        itxn_field Amount
+        int 8
+        itxn_field Amount
+        int 1
+      `;
+			executeTEAL(tealCode);
+			assert.equal(interpreter.currentInnerTxnGroup[0].amt, 8n);
+
+			const ops = interpreter.instructions.filter(
+				(op) => op instanceof ITxnField
+			) as ITxnField[];
+			assert.lengthOf(ops, 2);
+			assert.strictEqual(ops[0].descriptor, ops[1].descriptor);
+			assert.strictEqual(ops[0].descriptor, resolveInnerTxField(TxFieldEnum.Amount, 5));
+		});
+	});
+
 	describe("TestNumInner", function () {
 		it(`should fail number of inner transactions > 16`, function () {
 			const pay = `
@@ -0,0 +1,196 @@
+import { assert } from "chai";
+
+import { analyzeCost } from "../../../src/lib/cost-analyzer";
+import { ExecutionMode } from "../../../src/types";
+
+describe("Static cost analysis", function () {
+	const loop = (annotation: string): string => `#pragma version 6
+pushint 0
+loop: ${annotation}
+pushint 1
++
+dup
+pushint 10
+<
+bnz loop
+return`;
+
+	it("should take the most expensive branch", function () {
+		const report = analyzeCost(`#pragma version 6
+pushint 1
+bz light
+pushbytes 0x01
+sha256
+pop
+b end
+light:
+pushint 2
+pop
+end:
+pushint 1
+return`);
+		assert.equal(report.tealVersion, 6);
+		assert.equal(report.budget, 700);
+		assert.equal(report.maxCost, 42);
+		assert.isFalse(report.exceedsBudget);
+		assert.deepEqual(report.loops, []);
+		assert.deepEqual(report.unbounded, []);
+	});
+
+	it("should add the cost of subroutines to each call", function () {
+		const report = analyzeCost(`#pragma version 6
+callsub hash
+callsub hash
+pushint 1
+return
+hash:
+pushbytes 0x01
+sha256
+pop
+retsub`);
+		assert.equal(report.maxCost, 80);
+		assert.deepEqual(report.subroutines, [{ label: "hash", line: 6, maxCost: 38 }]);
+	});
+
+	it("should bound loops with annotations", function () {
+		let report = analyzeCost(loop("// @loop-bound 10"));
+		assert.equal(report.maxCost, 62);
+		assert.deepEqual(report.loops, [{ label: "loop", line: 3, bound: 10 }]);
+
+		report = analyzeCost(loop("// @loop-bound 10"), { loopBounds: { loop: 20 } });
+		assert.equal(report.maxCost, 122);
+	});
+
+	it("should report loops without bound", function () {
+		const report = analyzeCost(loop(""));
+		assert.equal(report.maxCost, Infinity);
+		assert.isTrue(report.exceedsBudget);
+		assert.deepEqual(report.loops, [{ label: "loop", line: 3, bound: undefined }]);
+		assert.deepEqual(report.unbounded, [
+			{ line: 3, reason: "loop without @loop-bound annotation" },
+		]);
+	});
+
+	it("should report recursive subroutines", function () {
+		const report = analyzeCost(`#pragma version 6
+callsub f
+return
+f:
+callsub f
+retsub`);
+		assert.equal(report.maxCost, Infinity);
+		assert.deepEqual(report.unbounded, [{ line: 4, reason: "recursive subroutine f" }]);
+	});
+
+	describe("Entry points", function () {
+		const program = `#pragma version 8
+txn OnCompletion
+pushint 1
+==
+bnz opt_in
+txna ApplicationArgs 0
+pushbytes 0x4c3931fa
+==
+bnz hash
+err
+opt_in:
+pushint 1
+return
+hash:
+pushint 0
+loop: // @loop-bound 6
+pushbytes 0x01
+keccak256
+pop
+pushint 1
++
+dup
+pushint 6
+<
+bnz loop
+return`;
+
+		it("should compute the cost of methods and on-completion branches", function () {
+			const report = analyzeCost(program, { methods: ["hash(uint64)void"] });
+			assert.equal(report.maxCost, 838);
+			assert.isTrue(report.exceedsBudget);
+			assert.deepEqual(report.entryPoints, [
+				{ kind: "onCompletion", name: "OptIn", line: 5, maxCost: 6, exceedsBudget: false },
+				{
+					kind: "method",
+					name: "hash(uint64)void",
+					line: 9,
+					maxCost: 838,
+					exceedsBudget: true,
+				},
+			]);
+		});
+
+		it("should use the budget pooled by the application calls", function () {
+			const report = analyzeCost(program, { appCalls: 2 });
+			assert.equal(report.budget, 1400);
+			assert.isFalse(report.exceedsBudget);
+			assert.equal(report.entryPoints[1].name, "0x4c3931fa");
+			assert.isFalse(report.entryPoints[1].exceedsBudget);
+		});
+
+		it("should find on-completion branches of switch", function () {
+			const report = analyzeCost(`#pragma version 8
+txn OnCompletion
+switch noop opt_in
+err
+noop:
+pushint 1
+return
+opt_in:
+pushbytes 0x01
+sha256
+pop
+pushint 1
+return`);
+			assert.equal(report.maxCost, 41);
+			assert.deepEqual(
+				report.entryPoints.map((e) => [e.name, e.maxCost]),
+				[
+					["NoOp", 4],
+					["OptIn", 41],
+				]
+			);
+		});
+	});
+
+	it("should analyze programs with group transaction access", function () {
+		const report = analyzeCost(`#pragma version 6
+gtxn 0 Amount
+pop
+gtxna 1 ApplicationArgs 0
+pop
+pushint 1
+gtxns Fee
+pop
+pushint 1
+return`);
+		assert.equal(report.maxCost, 9);
+		assert.deepEqual(report.unbounded, []);
+	});
+
+	it("should use the static cost for TEAL <= 3", function () {
+		const report = analyzeCost(`#pragma version 2
+int 1
+bz skip
+byte 0x01
+sha256
+pop
+skip:
+int 1`);
+		assert.equal(report.maxCost, 40);
+	});
+
+	it("should use the logic signature budget in signature mode", function () {
+		const report = analyzeCost("#pragma version 6\npushint 1", {
+			mode: ExecutionMode.SIGNATURE,
+		});
+		assert.equal(report.budget, 20000);
+		assert.equal(report.maxCost, 1);
+	});
+});
@@ -1,4 +1,5 @@
 import { assert } from "chai";
+import fs from "fs";
 import path from "path";
 
 import { RUNTIME_ERRORS } from "../../../src/errors/errors-list";
@@ -56,4 +57,19 @@ describe("Load file from assets dir recursive", function () {
 		const execptedPath = path.join(ASSETS_DIR, "folder-1", "asa.yaml");
 		assert.equal(filePath, execptedPath);
 	});
+
+	it("should find files added or removed after the directory was indexed", function () {
+		const newFile = path.join(ASSETS_DIR, "folder-2", "new-file.teal");
+		getPathFromDirRecursive(ASSETS_DIR, "file1.teal"); // builds the index
+		fs.writeFileSync(newFile, "");
+		try {
+			assert.equal(getPathFromDirRecursive(ASSETS_DIR, "new-file.teal"), newFile);
+		} finally {
+			fs.unlinkSync(newFile);
+		}
+		expectRuntimeError(
+			() => getPathFromDirRecursive(ASSETS_DIR, "new-file.teal"),
+			RUNTIME_ERRORS.GENERAL.FILE_NOT_FOUND_IN_DIR
+		);
+	});
 });
@@ -0,0 +1,30 @@
+import { encodeObj } from "algosdk";
+import { assert } from "chai";
+
+import { RUNTIME_ERRORS } from "../../../src/errors/errors-list";
+import { msgpackValueEnd } from "../../../src/lib/msgpack";
+import { expectRuntimeError } from "../../helpers/runtime-errors";
+
+describe("msgpack value boundaries", function () {
+	const value = encodeObj({ a: 1, b: new Uint8Array(300), c: [1, "abc", { d: true }] });
+
+	it("should return end of complete value", function () {
+		assert.equal(msgpackValueEnd(value), value.length);
+
+		const concatenated = new Uint8Array([...value, ...value]);
+		assert.equal(msgpackValueEnd(concatenated, value.length), 2 * value.length);
+	});
+
+	it("should return undefined for incomplete value", function () {
+		for (const len of [0, 1, 5, value.length - 1]) {
+			assert.isUndefined(msgpackValueEnd(value.subarray(0, len)));
+		}
+	});
+
+	it("should throw error on invalid type byte", function () {
+		expectRuntimeError(
+			() => msgpackValueEnd(new Uint8Array([0xc1])),
+			RUNTIME_ERRORS.GENERAL.INVALID_MSGPACK_DATA
+		);
+	});
+});
@@ -4,9 +4,9 @@ import cloneDeep from "lodash.clonedeep";
 import { encodeBase64 } from "tweetnacl-ts";
 
 import { AccountStore } from "../../../src";
-import { encTxToExecParams } from "../../../src/lib/txn";
+import { encodeSignedTxn, encTxToExecParams } from "../../../src/lib/txn";
 import { Runtime } from "../../../src/runtime";
-import { AccountStoreI, EncTx } from "../../../src/types";
+import { AccountStoreI, EncTx, EncTxKind } from "../../../src/types";
 import * as testdata from "../../helpers/data";
 import { useFixture } from "../../helpers/integration";
 
@@ -226,3 +226,72 @@ describe("Convert encoded Txn to ExecParams", function () {
 		});
 	});
 });
+
+describe("Encode signed transaction", function () {
+	let john: AccountStoreI;
+	let smith: AccountStoreI;
+	let runtime: Runtime;
+
+	this.beforeEach(function () {
+		john = new AccountStore(1e9);
+		smith = new AccountStore(1e9);
+		runtime = new Runtime([john, smith]);
+	});
+
+	it("Should encode transaction once with sender, flags and kind", function () {
+		const [stxn] = runtime.createTxnContext([
+			{
+				type: types.TransactionType.TransferAlgo,
+				sign: types.SignType.SecretKey,
+				fromAccount: john.account,
+				toAccountAddr: smith.address,
+				amountMicroAlgos: 100,
+				payFlags: { totalFee: 1000 },
+			},
+		]);
+		const record = encodeSignedTxn(stxn);
+
+		assert.equal(record.txID, stxn.txn.txID());
+		assert.equal(record.encTx.txID, record.txID);
+		assert.deepEqual(record.encTx, { ...stxn.txn.get_obj_for_encoding(), txID: record.txID });
+		assert.equal(record.from, john.address);
+		assert.equal(record.flags.totalFee, 1000);
+		assert.equal(record.kind, EncTxKind.OTHER);
+	});
+
+	it("Should classify asset opt-in transaction", function () {
+		const [stxn] = runtime.createTxnContext([
+			{
+				type: types.TransactionType.OptInASA,
+				sign: types.SignType.SecretKey,
+				fromAccount: john.account,
+				assetID: 7,
+				payFlags: { totalFee: 1000 },
+			},
+		]);
+		// opt-in is a transfer of 0 assets to self
+		assert.equal(encodeSignedTxn(stxn).kind, EncTxKind.ASSET_TRANSFER);
+	});
+
+	it("Should classify app creation transaction", function () {
+		const [stxn] = runtime.createTxnContext([
+			{
+				type: types.TransactionType.DeployApp,
+				sign: types.SignType.SecretKey,
+				fromAccount: john.account,
+				appDefinition: {
+					appName: "app",
+					metaType: types.MetaType.BYTES,
+					approvalProgramBytes: new Uint8Array(32),
+					clearProgramBytes: new Uint8Array(32),
+					globalBytes: 1,
+					globalInts: 1,
+					localBytes: 1,
+					localInts: 1,
+				},
+				payFlags: { totalFee: 1000 },
+			},
+		]);
+		assert.equal(encodeSignedTxn(stxn).kind, EncTxKind.APP_CREATE);
+	});
+});
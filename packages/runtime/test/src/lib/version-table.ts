@@ -0,0 +1,64 @@
+import { assert } from "chai";
+
+import { OpGasCost, TxArrFields, TxnFields } from "../../../src/lib/constants";
+import {
+	lazyVersionTable,
+	versionMapTable,
+	versionSetTable,
+} from "../../../src/lib/version-table";
+
+describe("Version tables", function () {
+	it("should build versions on first access only", function () {
+		const built: number[] = [];
+		const table = lazyVersionTable((version, prev: number[] | undefined) => {
+			built.push(version);
+			return [...(prev ?? []), version];
+		}, 4);
+		assert.deepEqual(built, []);
+
+		assert.deepEqual(table[3], [1, 2, 3]);
+		assert.deepEqual(built, [3, 2, 1]);
+		assert.strictEqual(table[3], table[3]);
+		assert.deepEqual(built, [3, 2, 1]);
+		assert.isUndefined(table[5]);
+	});
+
+	it("should look up entries of previous versions", function () {
+		const table = versionMapTable<number>({ 1: { a: 1, b: 1 }, 3: { b: 3, c: 3 } }, 4);
+		assert.equal(table[1].b, 1);
+		assert.isUndefined(table[1].c);
+		assert.strictEqual(table[2], table[1]);
+		assert.equal(table[3].a, 1);
+		assert.equal(table[3].b, 3);
+		assert.equal(table[3].c, 3);
+		assert.strictEqual(table[4], table[3]);
+		assert.equal(table[1].b, 1);
+	});
+
+	it("should add values of previous versions to sets", function () {
+		const table = versionSetTable({ 1: ["a"], 3: ["b"] }, 3);
+		assert.deepEqual([...table[2]], ["a"]);
+		assert.deepEqual([...table[3]], ["a", "b"]);
+	});
+
+	it("should not allow modifications", function () {
+		const maps = versionMapTable<number>({ 1: { a: 1 } }, 2);
+		const sets = versionSetTable({ 1: ["a"] }, 2);
+		assert.throws(() => ((maps[2] as { [key: string]: number }).a = 2));
+		assert.throws(() => (sets[1] as Set<string>).add("b"));
+		assert.throws(() => (sets[1] as Set<string>).delete("a"));
+		assert.throws(() => ((maps as { [version: number]: unknown })[3] = {}));
+		assert.equal(maps[2].a, 1);
+		assert.isTrue(sets[2].has("a"));
+	});
+
+	it("should define runtime tables for all TEAL versions", function () {
+		assert.equal(TxnFields[1].Sender, "snd");
+		assert.equal(TxnFields[8].ApplicationID, "apid");
+		assert.isUndefined(TxnFields[1].ApplicationID);
+		assert.equal(OpGasCost[5].ecdsa_verify, 1700);
+		assert.equal(OpGasCost[8].ecdsa_verify, 2500);
+		assert.isTrue(TxArrFields[8].has("Accounts"));
+		assert.isFalse(TxArrFields[4].has("Logs"));
+	});
+});
@@ -0,0 +1,140 @@
+import { types } from "@algo-builder/web";
+import algosdk from "algosdk";
+import { assert } from "chai";
+import fs from "fs";
+import os from "os";
+import path from "path";
+
+import { AccountStore } from "../../src/account";
+import { mockSuggestedParams } from "../../src/mock/tx";
+import { LedgerReplay } from "../../src/replay";
+import { Runtime } from "../../src/runtime";
+import { AccountStoreI } from "../../src/types";
+
+describe("Ledger replay", function () {
+	const fee = 1000;
+	let alice: AccountStoreI;
+	let bob: AccountStoreI;
+	let runtime: Runtime;
+	let filePath: string;
+
+	function signedPayment(from: AccountStoreI, to: string, amount: number): Uint8Array {
+		const txn = algosdk.makePaymentTxnWithSuggestedParams(
+			from.address,
+			to,
+			amount,
+			undefined,
+			undefined,
+			mockSuggestedParams({ totalFee: fee }, runtime.getRound())
+		);
+		return txn.signTxn(from.account.sk);
+	}
+
+	this.beforeEach(function () {
+		alice = new AccountStore(100e6);
+		bob = new AccountStore(100e6);
+		runtime = new Runtime([alice, bob]);
+		filePath = path.join(os.tmpdir(), `replay-${Date.now()}.txn`);
+	});
+
+	this.afterEach(function () {
+		fs.rmSync(filePath, { force: true });
+	});
+
+	it("should replay signed transactions streamed from a file", async function () {
+		fs.writeFileSync(
+			filePath,
+			Buffer.concat([
+				signedPayment(alice, bob.address, 1e6),
+				signedPayment(bob, alice.address, 2e6),
+				signedPayment(alice, bob.address, 3e6),
+			])
+		);
+
+		const report = await new LedgerReplay(runtime).replay(filePath);
+
+		assert.equal(report.groups, 3);
+		assert.equal(report.transactions, 3);
+		assert.equal(report.failedGroups, 0);
+		assert.isEmpty(report.divergences);
+		assert.equal(runtime.getAccount(bob.address).balance(), BigInt(100e6 + 2e6 - fee));
+		assert.equal(runtime.getAccount(alice.address).balance(), BigInt(100e6 - 2e6 - 2 * fee));
+	});
+
+	it("should report divergence when recorded transaction fails", async function () {
+		const unknown = new AccountStore(100e6); // not part of the seeded ledger
+		fs.writeFileSync(
+			filePath,
+			Buffer.concat([
+				signedPayment(unknown, bob.address, 1e6),
+				signedPayment(alice, bob.address, 1e6),
+			])
+		);
+
+		const report = await new LedgerReplay(runtime).replay(filePath);
+		assert.equal(report.transactions, 1);
+		assert.equal(report.failedGroups, 1);
+		assert.lengthOf(report.divergences, 1);
+
+		const stopped = await new LedgerReplay(runtime, { stopOnDivergence: true }).replay(filePath);
+		assert.equal(stopped.transactions, 0);
+	});
+
+	it("should record the cost of each app call without its inner app calls", async function () {
+		const deploy = (approvalProgramCode: string): number =>
+			runtime.deployApp(
+				alice.account,
+				{
+					appName: `app-${approvalProgramCode.length}`,
+					metaType: types.MetaType.SOURCE_CODE,
+					approvalProgramCode,
+					clearProgramCode: "#pragma version 6\npushint 1\nreturn",
+					globalBytes: 0,
+					globalInts: 0,
+					localBytes: 0,
+					localInts: 0,
+				},
+				{}
+			).appID;
+		// cost: 6
+		const innerAppID = deploy(`#pragma version 6
+pushint 1
+pushint 2
++
+pop
+pushint 1
+return`);
+		// cost: 8
+		const appID = deploy(`#pragma version 6
+itxn_begin
+pushint 6
+itxn_field TypeEnum
+txna Applications 1
+itxn_field ApplicationID
+itxn_submit
+pushint 1
+return`);
+		runtime.fundLsig(alice.account, algosdk.getApplicationAddress(appID), 1e6);
+
+		const txns = [alice, bob].map((from) =>
+			algosdk.makeApplicationNoOpTxn(
+				from.address,
+				mockSuggestedParams({ totalFee: 2 * fee }, runtime.getRound()),
+				appID,
+				undefined,
+				undefined,
+				[innerAppID]
+			)
+		);
+		algosdk.assignGroupID(txns);
+		fs.writeFileSync(
+			filePath,
+			Buffer.concat([txns[0].signTxn(alice.account.sk), txns[1].signTxn(bob.account.sk)])
+		);
+
+		const report = await new LedgerReplay(runtime).replay(filePath);
+
+		assert.isEmpty(report.divergences);
+		assert.deepEqual(report.appCosts.get(appID), { calls: 2, totalCost: 16, maxCost: 8 });
+	});
+});
@@ -1,6 +1,9 @@
-import { types } from "@algo-builder/web";
+import { parsing, types } from "@algo-builder/web";
 import algosdk, { LogicSigAccount, Transaction } from "algosdk";
 import { assert, expect } from "chai";
+import fs from "fs";
+import os from "os";
+import path from "path";
 import sinon from "sinon";
 
 import { getProgram } from "../../src";
@@ -9,7 +12,7 @@ import { RUNTIME_ERRORS } from "../../src/errors/errors-list";
 import { ASSET_CREATION_FEE, BlockFinalisationTime } from "../../src/lib/constants";
 import { mockSuggestedParams } from "../../src/mock/tx";
 import { Runtime } from "../../src/runtime";
-import { AccountStoreI } from "../../src/types";
+import { AccountStoreI, BaseTxReceipt } from "../../src/types";
 import { useFixture } from "../helpers/integration";
 import { expectRuntimeError } from "../helpers/runtime-errors";
 import { elonMuskAccount } from "../mocks/account";
@@ -1249,6 +1252,157 @@ describe("Deafult Accounts", function () {
 	});
 });
 
+describe("Bulk account creation", function () {
+	let runtime: Runtime;
+
+	this.beforeEach(function () {
+		runtime = new Runtime([]);
+	});
+
+	it("Should create funded accounts which can sign transactions", function () {
+		const [alice, bob] = runtime.createAccounts(100, minBalance);
+		assert.equal(runtime.getAccount(alice.address).balance(), minBalance);
+		assert.isTrue(algosdk.isValidAddress(alice.address));
+		assert.deepEqual(
+			algosdk.mnemonicToSecretKey(algosdk.secretKeyToMnemonic(alice.account.sk)).addr,
+			alice.address
+		);
+
+		runtime.executeTx([
+			{
+				type: types.TransactionType.TransferAlgo,
+				sign: types.SignType.SecretKey,
+				fromAccount: alice.account,
+				toAccountAddr: bob.address,
+				amountMicroAlgos: 1e6,
+				payFlags: { totalFee: 1000 },
+			},
+		]);
+		assert.equal(runtime.getAccount(bob.address).balance(), minBalance + BigInt(1e6));
+	});
+
+	it("Should not allocate asset and app maps until they are used", function () {
+		const [alice] = runtime.createAccounts(1);
+		assert.isUndefined(alice.getAssetHolding(1));
+		assert.isUndefined(alice.getApp(1));
+		assert.notProperty(alice, "_assets");
+		assert.notProperty(alice, "_createdApps");
+		assert.equal(alice.assets.size, 0);
+	});
+
+	it("Should not allocate created app and asset maps of initial accounts", function () {
+		const bob = new AccountStore(minBalance);
+		runtime = new Runtime([bob]);
+		assert.isFalse(bob.hasCreatedApps());
+		assert.isFalse(bob.hasCreatedAssets());
+		assert.notProperty(bob, "_createdApps");
+		assert.notProperty(bob, "_createdAssets");
+	});
+});
+
+describe("Transaction receipt retention", function () {
+	let runtime: Runtime;
+	let alice: AccountStoreI;
+	let bob: AccountStoreI;
+	const spillFile = path.join(os.tmpdir(), "runtime-receipts.log");
+
+	function pay(amount: number): string {
+		const [receipt] = runtime.executeTx([
+			{
+				type: types.TransactionType.TransferAlgo,
+				sign: types.SignType.SecretKey,
+				fromAccount: alice.account,
+				toAccountAddr: bob.address,
+				amountMicroAlgos: amount,
+				payFlags: { totalFee: 1000 },
+			},
+		]);
+		return receipt.txID;
+	}
+
+	this.beforeEach(function () {
+		[alice, bob] = [new AccountStore(minBalance), new AccountStore(minBalance)];
+		runtime = new Runtime([alice, bob]);
+	});
+
+	this.afterEach(function () {
+		runtime.closeReceiptLog();
+		fs.rmSync(spillFile, { force: true });
+	});
+
+	it("Should keep only the last receipts", function () {
+		runtime.setReceiptRetention({ keep: "last", limit: 1 });
+		const first = pay(1);
+		const second = pay(2);
+		assert.isUndefined(runtime.getTxReceipt(first));
+		assert.equal(runtime.getTxReceipt(second)?.txID, second);
+	});
+
+	it("Should evict the oldest receipts when the policy is set", function () {
+		const txIDs = [pay(1), pay(2), pay(3)];
+		runtime.setReceiptRetention({ keep: "last", limit: 2 });
+		assert.isUndefined(runtime.getTxReceipt(txIDs[0]));
+		txIDs.push(pay(4));
+		assert.isUndefined(runtime.getTxReceipt(txIDs[1]));
+		assert.deepEqual(
+			txIDs.slice(2).map((txID) => runtime.getTxReceipt(txID)?.txID),
+			txIDs.slice(2)
+		);
+	});
+
+	it("Should not keep receipts with `none` policy", function () {
+		runtime.setReceiptRetention({ keep: "none" });
+		assert.isUndefined(runtime.getTxReceipt(pay(1)));
+	});
+
+	it("Should query evicted receipts from spill file", function () {
+		runtime.setReceiptRetention({ keep: "none", spillFile });
+		const txID = pay(1);
+		const receipt = runtime.getTxReceipt(txID) as BaseTxReceipt;
+		assert.equal(receipt.txID, txID);
+		assert.equal(receipt.txn.amt, 1);
+		assert.deepEqual(algosdk.encodeAddress(receipt.txn.snd), alice.address);
+	});
+
+	it("Should not query spilled receipts after the spill file is closed", function () {
+		runtime.setReceiptRetention({ keep: "none", spillFile });
+		const txID = pay(1);
+		runtime.closeReceiptLog();
+		assert.isUndefined(runtime.getTxReceipt(txID));
+		assert.isUndefined(runtime.getTxReceipt(pay(2)));
+	});
+
+describe("Transaction receipts returned by executeTx", function () {
+	let runtime: Runtime;
+	let alice: AccountStoreI;
+	let bob: AccountStoreI;
+	let txParams: types.ExecParams;
+
+	this.beforeEach(function () {
+		[alice, bob] = [new AccountStore(minBalance), new AccountStore(minBalance)];
+		runtime = new Runtime([alice, bob]);
+		txParams = {
+			type: types.TransactionType.TransferAlgo,
+			sign: types.SignType.SecretKey,
+			fromAccount: alice.account,
+			toAccountAddr: bob.address,
+			amountMicroAlgos: 1,
+			payFlags: { totalFee: 1000 },
+		};
+	});
+
+	it("Should return receipts with hyphenated keys", function () {
+		const [receipt] = runtime.executeTx([txParams]);
+		const stored = runtime.getTxReceipt(receipt.txID) as BaseTxReceipt;
+		assert.deepEqual(receipt, parsing.convertKeysToHyphens(stored));
+	});
+
+	it("Should return internal receipts from executeTxRaw", function () {
+		const [receipt] = runtime.executeTxRaw([txParams]);
+		assert.deepEqual(receipt, runtime.getTxReceipt(receipt.txID));
+	});
+});
+
 describe("Algo transfer using sendSignedTransaction", function () {
 	let alice: AccountStore;
 	let bob: AccountStore;
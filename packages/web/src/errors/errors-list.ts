@@ -813,6 +813,13 @@ Please transfer more funds`,
 		description: `Account with name '%accountName%' is the creator of ASA. It's automatically opt-in.
 Remove the account from the optInAccNames in asa.yaml`,
 	},
+	DRYRUN_APP_SOURCE_NOT_FOUND: {
+		number: 903,
+		message: `TEAL code of the app %appID% was not found.`,
+		title: "App source not found",
+		description: `TEAL code of the app %appID% was not found in the compilation cache (artifacts/cache).
+Please provide the program files of the app in the "programs" option of the local dryrun.`,
+	},
 };
 
 export const pyTealErrors = {
@@ -10,7 +10,14 @@ export { ERRORS, ErrorDescriptor, ERROR_RANGES } from "./errors/errors-list";
 export { WebMode } from "./lib/web-mode";
 export { WallectConnectSession } from "./lib/wallectconnect-mode";
 export { MyAlgoWalletSession } from "./lib/myalgowallet-mode";
-export { getSuggestedParams, mkTxParams } from "./lib/api";
+export {
+	getSuggestedParams,
+	mkTxParams,
+	SuggestedParamsCache,
+	suggestedParamsCache,
+} from "./lib/api";
+export { ConfirmationTracker, confirmationTracker } from "./lib/confirmation";
+export { decodeState, StateReader, stateReader } from "./lib/state-reader";
 export {
 	mainnetURL,
 	testnetURL,
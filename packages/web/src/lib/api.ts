@@ -1,24 +1,109 @@
 import algosdk, { Algodv2, ALGORAND_MIN_TX_FEE, SuggestedParams } from "algosdk";
 
-import { HttpNetworkConfig, TxParams } from "../types";
+import { HttpNetworkConfig, SuggestedParamsCacheOptions, TxParams } from "../types";
 
 export function algoexplorerAlgod(walletURL: HttpNetworkConfig): algosdk.Algodv2 {
 	return new Algodv2(walletURL.token, walletURL.server, walletURL.port);
 }
 
+// average block time, used to convert cache validity from rounds to milliseconds
+const ROUND_TIME_MS = 3300;
+
 /**
- * Returns blockchain transaction suggested parameters (firstRound, lastRound, fee..)
+ * SuggestedParamsCache keeps suggested transaction params for a number of rounds
+ * or milliseconds (whichever expires first). Caching is opt-in: without options params
+ * are fetched for every request (concurrent requests still share one fetch).
+ * Returned params are copies, so callers can modify them.
+ */
+export class SuggestedParamsCache<T extends object = SuggestedParams> {
+	private readonly fetchParams: () => Promise<T>;
+	private readonly maxAgeMs: number;
+	private params?: T;
+	private fetchedAt = 0;
+	private pending?: Promise<T>;
+
+	/**
+	 * @param fetchParams function fetching the params from the node
+	 * @param options cache validity. Default: params are not cached
+	 */
+	constructor(fetchParams: () => Promise<T>, options: SuggestedParamsCacheOptions = {}) {
+		this.fetchParams = fetchParams;
+		const { rounds, ms } = options;
+		const maxAge = [rounds === undefined ? undefined : rounds * ROUND_TIME_MS, ms].filter(
+			(v): v is number => v !== undefined
+		);
+		this.maxAgeMs = maxAge.length > 0 ? Math.min(...maxAge) : 0;
+	}
+
+	async get(): Promise<T> {
+		if (this.params !== undefined && Date.now() - this.fetchedAt < this.maxAgeMs) {
+			return { ...this.params };
+		}
+		this.pending ??= this.fetchParams()
+			.then((params) => {
+				this.params = params;
+				this.fetchedAt = Date.now();
+				return params;
+			})
+			.finally(() => {
+				this.pending = undefined;
+			});
+		return { ...(await this.pending) };
+	}
+
+	// drops cached params, next `get` fetches them from the node
+	invalidate(): void {
+		this.params = undefined;
+	}
+}
+
+const clientCaches = new WeakMap<Algodv2, SuggestedParamsCache>();
+
+/**
+ * Returns the suggested params cache shared by all users of the Algorand client.
+ * Genesis information is cached forever, transaction params according to `options`
+ * (options are used only when the cache is created).
  * @param algocl an Algorand client, instance of Algodv2, used to communicate with a blockchain node.
+ * @param options cache validity
  */
-export async function getSuggestedParams(algocl: Algodv2): Promise<SuggestedParams> {
-	const params = await algocl.getTransactionParams().do();
-	const genesisInfo = await algocl.genesis().do();
+export function suggestedParamsCache(
+	algocl: Algodv2,
+	options?: SuggestedParamsCacheOptions
+): SuggestedParamsCache {
+	let cache = clientCaches.get(algocl);
+	if (cache === undefined) {
+		let genesis: { devmode?: boolean } | undefined; // cached forever
+		cache = new SuggestedParamsCache(async () => {
+			const [params, genesisInfo] = await Promise.all([
+				algocl.getTransactionParams().do(),
+				genesis ?? algocl.genesis().do(),
+			]);
+			genesis = genesisInfo;
+			assertRoundProgresses(params, Boolean(genesisInfo.devmode));
+			return params;
+		}, options);
+		clientCaches.set(algocl, cache);
+	}
+	return cache;
+}
+
+function assertRoundProgresses(params: SuggestedParams, devmode: boolean): void {
 	// Private chains may have an issue with firstRound
-	if (!genesisInfo.devmode && params.firstRound === 0) {
+	if (!devmode && params.firstRound === 0) {
 		throw new Error(
 			"Suggested params returned 0 as firstRound. Ensure that your node progresses."
 		);
 	}
+}
+
+/**
+ * Returns blockchain transaction suggested parameters (firstRound, lastRound, fee..)
+ * @param algocl an Algorand client, instance of Algodv2, used to communicate with a blockchain node.
+ */
+export async function getSuggestedParams(algocl: Algodv2): Promise<SuggestedParams> {
+	const params = await algocl.getTransactionParams().do();
+	const genesisInfo = await algocl.genesis().do();
+	assertRoundProgresses(params, Boolean(genesisInfo.devmode));
 	return params;
 }
 
@@ -26,7 +111,7 @@ export async function getSuggestedParams(algocl: Algodv2): Promise<SuggestedPara
  * Returns a union object of custom transaction params and suggested params.
  * @param algocl an Algorand client, instance of Algodv2, used to communicate with a blockchain node.
  * @param userParams a dict containing custom params defined by the user
- * @param s suggested transaction params
+ * @param s suggested transaction params (by default taken from the shared cache of `algocl`)
  */
 export async function mkTxParams(
 	algocl: Algodv2,
@@ -34,7 +119,7 @@ export async function mkTxParams(
 	s?: SuggestedParams
 ): Promise<SuggestedParams> {
 	if (s === undefined) {
-		s = await getSuggestedParams(algocl);
+		s = await suggestedParamsCache(algocl).get();
 	}
 
 	if (userParams.flatFee === undefined) {
@@ -0,0 +1,164 @@
+import { Algodv2 } from "algosdk";
+
+import { WAIT_ROUNDS } from "./constants";
+import { stateReader } from "./state-reader";
+
+const CONFIRMED_ROUND = "confirmed-round";
+const LAST_ROUND = "last-round";
+const POOL_ERROR = "pool-error";
+const MAX_CACHED_CONFIRMATIONS = 10000;
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+type PendingTxInfo = Record<string, any>;
+
+/**
+ * Node endpoints used by the confirmation tracker.
+ */
+export interface ConfirmationSource {
+	status: () => Promise<PendingTxInfo>;
+	statusAfterBlock: (round: number) => Promise<unknown>;
+	pendingTransactionInformation: (txID: string) => Promise<PendingTxInfo>;
+}
+
+interface Waiter {
+	waitRounds: number;
+	lastRound?: number; // set when the tracker checks the transaction for the first time
+	resolve: (info: PendingTxInfo) => void;
+	reject: (error: Error) => void;
+}
+
+/**
+ * ConfirmationTracker waits for confirmations of many transactions at once: it follows
+ * new rounds once (one `status/wait-for-block-after` request per round for all waiting
+ * transactions) and checks every pending transaction after each round.
+ * Confirmed transactions are cached, so asking again for a known confirmation
+ * doesn't query the node.
+ */
+export class ConfirmationTracker {
+	private readonly source: ConfirmationSource;
+	private readonly confirmed = new Map<string, PendingTxInfo>();
+	private readonly waiters = new Map<string, Waiter[]>();
+	private running = false;
+
+	constructor(source: ConfirmationSource) {
+		this.source = source;
+	}
+
+	/**
+	 * Returns pending transaction information of the confirmed transaction.
+	 * Rejects if transaction was rejected by the pool or not confirmed in `waitRounds`.
+	 * @param txID transaction ID
+	 * @param waitRounds number of rounds to wait for transaction to be confirmed - default is 10
+	 */
+	waitForConfirmation(txID: string, waitRounds = WAIT_ROUNDS): Promise<PendingTxInfo> {
+		const info = this.confirmed.get(txID);
+		if (info !== undefined) return Promise.resolve(info);
+
+		return new Promise((resolve, reject) => {
+			const waiters = this.waiters.get(txID) ?? [];
+			waiters.push({ waitRounds, resolve, reject });
+			this.waiters.set(txID, waiters);
+			if (!this.running) void this.run();
+		});
+	}
+
+	/**
+	 * Returns cached information of the confirmed transaction (without querying the node).
+	 * @param txID transaction ID
+	 */
+	getConfirmed(txID: string): PendingTxInfo | undefined {
+		return this.confirmed.get(txID);
+	}
+
+	private async run(): Promise<void> {
+		this.running = true;
+		try {
+			let round = Number((await this.source.status())[LAST_ROUND]) + 1;
+			while (this.waiters.size > 0) {
+				await this.checkPending(round);
+				if (this.waiters.size === 0) break;
+				await this.source.statusAfterBlock(round);
+				round++;
+			}
+		} catch (error) {
+			for (const txID of [...this.waiters.keys()]) {
+				this.settle(txID, (w) => w.reject(error as Error));
+			}
+		} finally {
+			this.running = false;
+		}
+	}
+
+	private async checkPending(round: number): Promise<void> {
+		for (const [txID, waiters] of this.waiters) {
+			for (const w of waiters) {
+				w.lastRound ??= round + w.waitRounds;
+				if (round >= w.lastRound) {
+					w.reject(new Error(`Transaction not confirmed after ${w.waitRounds} rounds!`));
+				}
+			}
+			const remaining = waiters.filter((w) => round < (w.lastRound as number));
+			if (remaining.length === 0) this.waiters.delete(txID);
+			else this.waiters.set(txID, remaining);
+		}
+
+		await Promise.all([...this.waiters.keys()].map(async (txID) => await this.check(txID)));
+	}
+
+	private async check(txID: string): Promise<void> {
+		let info: PendingTxInfo;
+		try {
+			info = await this.source.pendingTransactionInformation(txID);
+		} catch (error) {
+			// node may not know the transaction yet (eg. algod behind a load balancer)
+			return;
+		}
+		if (info[CONFIRMED_ROUND]) {
+			this.cache(txID, info);
+			this.settle(txID, (w) => w.resolve(info));
+		} else if (info[POOL_ERROR]) {
+			const error = new Error(`Transaction Rejected: ${info[POOL_ERROR] as string}`);
+			this.settle(txID, (w) => w.reject(error));
+		}
+	}
+
+	private settle(txID: string, fn: (w: Waiter) => void): void {
+		const waiters = this.waiters.get(txID) ?? [];
+		this.waiters.delete(txID);
+		waiters.forEach(fn);
+	}
+
+	private cache(txID: string, info: PendingTxInfo): void {
+		if (this.confirmed.size >= MAX_CACHED_CONFIRMATIONS) {
+			// maps keep insertion order: remove the oldest confirmation
+			this.confirmed.delete(this.confirmed.keys().next().value);
+		}
+		this.confirmed.set(txID, info);
+	}
+}
+
+const clientTrackers = new WeakMap<Algodv2, ConfirmationTracker>();
+
+/**
+ * Returns the confirmation tracker shared by all users of the Algorand client.
+ * @param algocl an Algorand client, instance of Algodv2, used to communicate with a blockchain node.
+ */
+export function confirmationTracker(algocl: Algodv2): ConfirmationTracker {
+	let tracker = clientTrackers.get(algocl);
+	if (tracker === undefined) {
+		tracker = new ConfirmationTracker({
+			status: async () => await algocl.status().do(),
+			statusAfterBlock: async (round) => await algocl.statusAfterBlock(round).do(),
+			pendingTransactionInformation: async (txID) => {
+				const info = await algocl.pendingTransactionInformation(txID).do();
+				// reads of the client state must see the confirmed transaction
+				if (info[CONFIRMED_ROUND]) {
+					stateReader(algocl).observeRound(Number(info[CONFIRMED_ROUND]));
+				}
+				return info;
+			},
+		});
+		clientTrackers.set(algocl, tracker);
+	}
+	return tracker;
+}
@@ -21,6 +21,7 @@ import {
 	TxnReceipt,
 } from "../types";
 import { algoexplorerAlgod } from "./api";
+import { confirmationTracker } from "./confirmation";
 import { WAIT_ROUNDS } from "./constants";
 import { error, log } from "./logger";
 import { mkTransaction } from "./txn";
@@ -218,7 +219,10 @@ export class MyAlgoWalletSession {
 	 */
 	async waitForConfirmation(txId: string, waitRounds = WAIT_ROUNDS): Promise<TxnReceipt> {
 		try {
-			const pendingInfo = await algosdk.waitForConfirmation(this.algodClient, txId, waitRounds);
+			const pendingInfo = await confirmationTracker(this.algodClient).waitForConfirmation(
+				txId,
+				waitRounds
+			);
 			if (pendingInfo["pool-error"]) {
 				throw new Error(`Transaction Pool Error: ${pendingInfo["pool-error"] as string}`);
 			}
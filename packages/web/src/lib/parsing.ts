@@ -122,3 +122,58 @@ export function convertKeysToHyphens(object: any) {
 	});
 	return newObject;
 }
+
+/**
+ * Returns a view of the object with keys converted from camelCase to hypenCase, same as
+ * `convertKeysToHyphens`, but without copying the object: keys are converted when the view
+ * is accessed. The first write to the view copies the object, so the view never modifies it.
+ * @param object
+ * @returns view of the object with keys from fooBar to foo-bar
+ */
+export function hyphenatedKeysView(object: any): any {
+	let keys: Map<string, string> | undefined; // hypenCase key -> object key
+	let copy: any; // created on the first write
+	const objectKeys = (): Map<string, string> => {
+		if (keys === undefined) {
+			keys = new Map<string, string>();
+			for (const key of Object.keys(object)) {
+				keys.set(key === "txID" ? key : convertCapitalToHyphens(key), key);
+			}
+		}
+		return keys;
+	};
+	const isOwn = (prop: string | symbol): boolean =>
+		Object.prototype.hasOwnProperty.call(object, prop);
+	const materialize = (): any => (copy ??= convertKeysToHyphens(object));
+
+	return new Proxy(object, {
+		get(target, prop) {
+			if (copy !== undefined) return copy[prop];
+			const key = typeof prop === "string" ? objectKeys().get(prop) : undefined;
+			if (key !== undefined) return target[key];
+			return isOwn(prop) ? undefined : Reflect.get(target, prop); // eg. prototype methods
+		},
+		has(target, prop) {
+			if (copy !== undefined) return prop in copy;
+			if (typeof prop === "string" && objectKeys().has(prop)) return true;
+			return !isOwn(prop) && prop in target;
+		},
+		ownKeys() {
+			return copy !== undefined ? Reflect.ownKeys(copy) : [...objectKeys().keys()];
+		},
+		getOwnPropertyDescriptor(target, prop) {
+			if (copy !== undefined) return Reflect.getOwnPropertyDescriptor(copy, prop);
+			const key = typeof prop === "string" ? objectKeys().get(prop) : undefined;
+			if (key === undefined) return undefined;
+			return { value: target[key], writable: true, enumerable: true, configurable: true };
+		},
+		set(_target, prop, value) {
+			materialize()[prop] = value;
+			return true;
+		},
+		deleteProperty(_target, prop) {
+			delete materialize()[prop];
+			return true;
+		},
+	});
+}
@@ -0,0 +1,281 @@
+import type { Algodv2, modelsv2 } from "algosdk";
+
+const LAST_ROUND = "last-round";
+const DEFAULT_MAX_CONCURRENCY = 16;
+const DEFAULT_ROUND_MAX_AGE_MS = 1000;
+
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+type NodeResponse = Record<string, any>;
+
+export type StateKey = string;
+export type StateValue = string | number | bigint;
+
+/**
+ * Node endpoints used by the state reader.
+ */
+export interface StateSource {
+	status: () => Promise<NodeResponse>;
+	// account information without assets and apps (only balance and account fields)
+	accountInformation: (address: string) => Promise<NodeResponse>;
+	accountAssetInformation: (address: string, assetID: number) => Promise<NodeResponse>;
+	accountApplicationInformation: (address: string, appID: number) => Promise<NodeResponse>;
+	getApplicationByID: (appID: number) => Promise<NodeResponse>;
+}
+
+export interface StateReaderOptions {
+	// maximum number of requests sent at the same time (default 16)
+	maxConcurrency?: number;
+	// time (ms) during which the last known round is used without querying the node
+	// status (default 1000, 0: status is queried by every read)
+	roundMaxAgeMs?: number;
+}
+
+// "not found" response means that the account is not opted-in (or app doesn't exist)
+function isNotFound(error: unknown): boolean {
+	const e = error as { status?: number; response?: { status?: number } };
+	return e?.status === 404 || e?.response?.status === 404;
+}
+
+// cached values are copied, so callers can modify the returned results
+function copyOf<T>(value: T): T {
+	if (value instanceof Map) return new Map(value) as unknown as T;
+	if (typeof value === "object" && value !== null) return { ...value };
+	return value;
+}
+
+/**
+ * Decodes TEAL key-value store (global or local state) returned by algod.
+ * Keys are decoded to strings, byte values are kept base64 encoded.
+ * @param keyValues TEAL key-value store
+ */
+export function decodeState(keyValues: NodeResponse[]): Map<StateKey, StateValue> {
+	const state = new Map<StateKey, StateValue>();
+	for (const g of keyValues) {
+		const key = Buffer.from(g.key, "base64").toString();
+		state.set(key, g.value.type === 1 ? g.value.bytes : g.value.uint);
+	}
+	return state;
+}
+
+/**
+ * StateReader reads balances, asset holdings and app states of many accounts using
+ * the per-asset and per-app account endpoints (instead of fetching the full account
+ * information), with at most `maxConcurrency` requests in flight.
+ * Results are cached for the current round and returned as copies. The round is queried
+ * once for all concurrent reads and reused for `roundMaxAgeMs`, cached results are dropped
+ * when the round changes.
+ */
+export class StateReader {
+	private readonly source: StateSource;
+	private readonly maxConcurrency: number;
+	private readonly roundMaxAgeMs: number;
+	private round?: number;
+	private roundCheckedAt = 0;
+	private roundRequest?: Promise<number>;
+	private readonly cache = new Map<string, Promise<unknown>>();
+	private active = 0;
+	private readonly queue: Array<() => void> = [];
+
+	constructor(source: StateSource, options: StateReaderOptions = {}) {
+		this.source = source;
+		this.maxConcurrency = options.maxConcurrency ?? DEFAULT_MAX_CONCURRENCY;
+		this.roundMaxAgeMs = options.roundMaxAgeMs ?? DEFAULT_ROUND_MAX_AGE_MS;
+	}
+
+	/**
+	 * Returns ALGO balances (in microalgos) of the accounts.
+	 * @param addresses account addresses
+	 */
+	async balances(addresses: string[]): Promise<Map<string, number | bigint>> {
+		return await this.readMany(addresses, "balance", async (addr) => {
+			const info = await this.source.accountInformation(addr);
+			return info.amount as number | bigint;
+		});
+	}
+
+	/**
+	 * Returns holdings of `assetID` of the accounts (undefined if the account is not
+	 * opted-in to the asset).
+	 * @param addresses account addresses
+	 * @param assetID asset index
+	 */
+	async assetHoldings(
+		addresses: string[],
+		assetID: number
+	): Promise<Map<string, modelsv2.AssetHolding | undefined>> {
+		return await this.readMany(addresses, `asset:${assetID}`, async (addr) => {
+			try {
+				const info = await this.source.accountAssetInformation(addr, assetID);
+				return info["asset-holding"] as modelsv2.AssetHolding;
+			} catch (e) {
+				if (isNotFound(e)) return undefined;
+				throw e;
+			}
+		});
+	}
+
+	/**
+	 * Returns local states of `appID` of the accounts (undefined if the account is not
+	 * opted-in to the app or has no local state).
+	 * @param addresses account addresses
+	 * @param appID application index
+	 */
+	async localStates(
+		addresses: string[],
+		appID: number
+	): Promise<Map<string, Map<StateKey, StateValue> | undefined>> {
+		return await this.readMany(addresses, `app:${appID}`, async (addr) => {
+			try {
+				const info = await this.source.accountApplicationInformation(addr, appID);
+				const keyValues = info["app-local-state"]?.["key-value"];
+				return keyValues ? decodeState(keyValues) : undefined;
+			} catch (e) {
+				if (isNotFound(e)) return undefined;
+				throw e;
+			}
+		});
+	}
+
+	/**
+	 * Returns global state of the app (undefined if the app doesn't exist or,
+	 * when `creator` is given, the app was not created by `creator`).
+	 * @param appID application index
+	 * @param creator expected creator of the app
+	 */
+	async globalState(
+		appID: number,
+		creator?: string
+	): Promise<Map<StateKey, StateValue> | undefined> {
+		await this.syncRound();
+		const app = (await this.cached(`global:${appID}`, async () => {
+			try {
+				return await this.limit(async () => await this.source.getApplicationByID(appID));
+			} catch (e) {
+				if (isNotFound(e)) return undefined;
+				throw e;
+			}
+		})) as NodeResponse | undefined;
+		if (app === undefined || (creator !== undefined && app.params.creator !== creator)) {
+			return undefined;
+		}
+		return decodeState(app.params["global-state"] ?? []);
+	}
+
+	/**
+	 * Sets the round known from another source (eg. the confirmed round of a transaction):
+	 * results cached for an older round are dropped.
+	 * @param round round reached by the node
+	 */
+	observeRound(round: number): void {
+		if (this.round !== undefined && round <= this.round) return;
+		this.cache.clear();
+		this.round = round;
+		this.roundCheckedAt = Date.now();
+	}
+
+	/**
+	 * Drops all cached results.
+	 */
+	clear(): void {
+		this.cache.clear();
+		this.round = undefined;
+	}
+
+	// reads value of every address (requests of the same key and round are shared)
+	private async readMany<T>(
+		addresses: string[],
+		kind: string,
+		read: (address: string) => Promise<T>
+	): Promise<Map<string, T>> {
+		await this.syncRound();
+		const values = await Promise.all(
+			addresses.map(async (addr) =>
+				copyOf(
+					(await this.cached(
+						`${kind}:${addr}`,
+						async () => await this.limit(async () => await read(addr))
+					)) as T
+				)
+			)
+		);
+		return new Map(addresses.map((addr, i) => [addr, values[i]]));
+	}
+
+	private async cached(key: string, fetch: () => Promise<unknown>): Promise<unknown> {
+		let value = this.cache.get(key);
+		if (value === undefined) {
+			value = fetch();
+			// failed requests are not cached
+			const request = value;
+			request.catch(() => {
+				if (this.cache.get(key) === request) this.cache.delete(key);
+			});
+			this.cache.set(key, value);
+		}
+		return await value;
+	}
+
+	// queries the current round once for all reads started at the same time, the known
+	// round is reused for `roundMaxAgeMs`
+	private async syncRound(): Promise<void> {
+		if (this.round !== undefined && Date.now() - this.roundCheckedAt < this.roundMaxAgeMs) {
+			return;
+		}
+		if (this.roundRequest === undefined) {
+			this.roundRequest = this.source
+				.status()
+				.then((s) => {
+					this.roundCheckedAt = Date.now();
+					return Number(s[LAST_ROUND]);
+				})
+				.finally(() => {
+					this.roundRequest = undefined;
+				});
+		}
+		const round = await this.roundRequest;
+		if (round !== this.round) {
+			this.cache.clear();
+			this.round = round;
+		}
+	}
+
+	private async limit<T>(fn: () => Promise<T>): Promise<T> {
+		if (this.active >= this.maxConcurrency) {
+			// slot is handed over by the finished request
+			await new Promise<void>((resolve) => this.queue.push(resolve));
+		} else {
+			this.active++;
+		}
+		try {
+			return await fn();
+		} finally {
+			const next = this.queue.shift();
+			if (next !== undefined) next();
+			else this.active--;
+		}
+	}
+}
+
+const clientReaders = new WeakMap<Algodv2, StateReader>();
+
+/**
+ * Returns the state reader shared by all users of the Algorand client.
+ * @param algocl an Algorand client, instance of Algodv2, used to communicate with a blockchain node.
+ */
+export function stateReader(algocl: Algodv2): StateReader {
+	let reader = clientReaders.get(algocl);
+	if (reader === undefined) {
+		reader = new StateReader({
+			status: async () => await algocl.status().do(),
+			accountInformation: async (addr) =>
+				await algocl.accountInformation(addr).exclude("all").do(),
+			accountAssetInformation: async (addr, assetID) =>
+				await algocl.accountAssetInformation(addr, assetID).do(),
+			accountApplicationInformation: async (addr, appID) =>
+				await algocl.accountApplicationInformation(addr, appID).do(),
+			getApplicationByID: async (appID) => await algocl.getApplicationByID(appID).do(),
+		});
+		clientReaders.set(algocl, reader);
+	}
+	return reader;
+}
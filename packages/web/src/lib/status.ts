@@ -1,5 +1,7 @@
 import type { Algodv2, modelsv2 } from "algosdk";
 
+import { stateReader } from "./state-reader";
+
 /**
  * Returns `account` balance of `assetID`. Returns 0 if the account is not
  * opted-in to the given asset id.
@@ -12,11 +14,6 @@ export async function getAssetHolding(
 	accountAddress: string,
 	assetID: number
 ): Promise<modelsv2.AssetHolding | undefined> {
-	const accountInfo = await algodClient.accountInformation(accountAddress).do();
-	for (const asset of accountInfo.assets) {
-		if (asset["asset-id"] === assetID) {
-			return asset;
-		}
-	}
-	return undefined;
+	const holdings = await stateReader(algodClient).assetHoldings([accountAddress], assetID);
+	return holdings.get(accountAddress);
 }
@@ -19,6 +19,7 @@ import {
 	TxnReceipt,
 } from "../types";
 import { algoexplorerAlgod, mkTxParams } from "./api";
+import { confirmationTracker } from "./confirmation";
 import { ALGORAND_SIGN_TRANSACTION_REQUEST, WAIT_ROUNDS } from "./constants";
 import { error, log, warn } from "./logger";
 import { mkTransaction } from "./txn";
@@ -256,7 +257,10 @@ export class WallectConnectSession {
 	 */
 	async waitForConfirmation(txId: string, waitRounds = WAIT_ROUNDS): Promise<TxnReceipt> {
 		try {
-			const pendingInfo = await algosdk.waitForConfirmation(this.algodClient, txId, waitRounds);
+			const pendingInfo = await confirmationTracker(this.algodClient).waitForConfirmation(
+				txId,
+				waitRounds
+			);
 			if (pendingInfo["pool-error"]) {
 				throw new Error(`Transaction Pool Error: ${pendingInfo["pool-error"] as string}`);
 			}
@@ -15,23 +15,58 @@ import {
 	SignType,
 	SignWithMultisig,
 	TransactionAndSign,
+	SuggestedParamsCacheOptions,
 	TxnReceipt,
 	TxParams,
 } from "../types";
+import { SuggestedParamsCache } from "./api";
+import { ConfirmationTracker } from "./confirmation";
 import { WAIT_ROUNDS } from "./constants";
 import { error, log } from "./logger";
 import { mkTransaction } from "./txn";
 
-const CONFIRMED_ROUND = "confirmed-round";
 const LAST_ROUND = "last-round";
 
 export class WebMode {
 	algoSigner: AlgoSigner;
 	chainName: string;
+	private readonly txParamsCache: SuggestedParamsCache<JsonPayload>;
+	// shared by all transactions waiting for confirmation
+	private readonly confirmations: ConfirmationTracker;
 
-	constructor(algoSigner: AlgoSigner, chainName: string) {
+	/**
+	 * @param algoSigner AlgoSigner instance
+	 * @param chainName ledger name (eg. TestNet)
+	 * @param txParamsCache validity of cached transaction params (default: not cached)
+	 */
+	constructor(
+		algoSigner: AlgoSigner,
+		chainName: string,
+		txParamsCache?: SuggestedParamsCacheOptions
+	) {
 		this.algoSigner = algoSigner;
 		this.chainName = chainName;
+		this.txParamsCache = new SuggestedParamsCache(
+			async () =>
+				await this.algoSigner.algod({
+					ledger: this.chainName,
+					path: "/v2/transactions/params",
+				}),
+			txParamsCache
+		);
+		const algod = async (path: string): Promise<JsonPayload> =>
+			await this.algoSigner.algod({ ledger: this.chainName, path });
+		this.confirmations = new ConfirmationTracker({
+			status: async () => {
+				const response = await algod("/v2/status");
+				log(response);
+				return response;
+			},
+			statusAfterBlock: async (round) =>
+				await algod(`/v2/status/wait-for-block-after/${round}`),
+			pendingTransactionInformation: async (txID) =>
+				await algod(`/v2/transactions/pending/${txID}`),
+		});
 	}
 
 	/**
@@ -45,34 +80,9 @@ export class WebMode {
 		waitRounds: number = WAIT_ROUNDS
 	): Promise<TxnReceipt> {
 		try {
-			const response = await this.algoSigner.algod({
-				ledger: this.chainName,
-				path: "/v2/status",
-			});
-			log(response);
-			const startRound = response[LAST_ROUND] as number;
-			let currentRound = startRound;
-			// eslint-disable-next-line no-constant-condition
-			while (currentRound < startRound + waitRounds) {
-				const pendingInfo = await this.algoSigner.algod({
-					ledger: this.chainName,
-					path: `/v2/transactions/pending/${txId}`,
-				});
-				if (
-					pendingInfo[CONFIRMED_ROUND] !== null &&
-					(pendingInfo[CONFIRMED_ROUND] as number) > 0
-				) {
-					const txnReceipt = { txID: txId, ...pendingInfo };
-					return txnReceipt as TxnReceipt;
-				}
-				// TODO: maybe we should use "sleep" instead of pinging a node again?
-				currentRound += 1;
-				await this.algoSigner.algod({
-					ledger: this.chainName,
-					path: `/v2/status/wait-for-block-after/${currentRound}`, // eslint-disable-line @typescript-eslint/restrict-template-expressions
-				});
-			}
-			throw new Error(`Transaction not confirmed after ${waitRounds} rounds`);
+			const pendingInfo = await this.confirmations.waitForConfirmation(txId, waitRounds);
+			const txnReceipt = { txID: txId, ...pendingInfo };
+			return txnReceipt as TxnReceipt;
 		} catch (err) {
 			error(err);
 			throw err;
@@ -149,14 +159,12 @@ export class WebMode {
 
 	/**
 	 * Returns suggested transaction parameters using algosigner
+	 * (node params are cached, see `txParamsCache` constructor option)
 	 * @param userParams Transaction parameters
 	 */
 	async getSuggestedParams(userParams: TxParams): Promise<SuggestedParams> {
 		try {
-			const txParams = await this.algoSigner.algod({
-				ledger: this.chainName,
-				path: "/v2/transactions/params",
-			});
+			const txParams = await this.txParamsCache.get();
 			const s: SuggestedParams = {
 				fee: txParams.fee as number,
 				genesisHash: txParams["genesis-hash"] as string,
@@ -438,6 +438,16 @@ export interface CustomTokenHeader {
 	[headerName: string]: string;
 }
 
+/**
+ * Validity of cached suggested transaction params. When both are set,
+ * params expire with the first limit reached. Validity is measured in time, so params
+ * shouldn't be cached on networks where rounds don't follow the clock (eg. dev mode).
+ */
+export interface SuggestedParamsCacheOptions {
+	rounds?: number; // number of rounds (converted to time using average block time)
+	ms?: number;
+}
+
 export interface HttpNetworkConfig {
 	server: string; // with optional http o https prefix
 	port: string | number;
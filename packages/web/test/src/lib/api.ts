@@ -0,0 +1,80 @@
+import { SuggestedParamsCache } from "@algo-builder/web";
+import { SuggestedParams } from "algosdk";
+import { assert } from "chai";
+import sinon from "sinon";
+
+describe("SuggestedParamsCache", function () {
+	const params: SuggestedParams = {
+		fee: 1000,
+		firstRound: 10,
+		lastRound: 1010,
+		genesisID: "testnet-v1.0",
+		genesisHash: "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+	};
+	let clock: sinon.SinonFakeTimers;
+	let fetchParams: sinon.SinonStub;
+
+	this.beforeEach(function () {
+		clock = sinon.useFakeTimers();
+		fetchParams = sinon.stub().resolves(params);
+	});
+
+	this.afterEach(function () {
+		clock.restore();
+	});
+
+	it("Should share a single fetch between concurrent requests", async function () {
+		const cache = new SuggestedParamsCache(fetchParams);
+		const [p1, p2] = await Promise.all([cache.get(), cache.get()]);
+		assert.deepEqual(p1, params);
+		assert.deepEqual(p2, params);
+		assert.equal(fetchParams.callCount, 1);
+	});
+
+	it("Should return copies of cached params", async function () {
+		const cache = new SuggestedParamsCache(fetchParams, { rounds: 1 });
+		const p1 = await cache.get();
+		p1.fee = 5000;
+		assert.equal((await cache.get()).fee, 1000);
+		assert.equal(fetchParams.callCount, 1);
+	});
+
+	it("Should not cache params by default", async function () {
+		const cache = new SuggestedParamsCache(fetchParams);
+		await cache.get();
+		await cache.get();
+		assert.equal(fetchParams.callCount, 2);
+	});
+
+	it("Should fetch params again after they expire", async function () {
+		const cache = new SuggestedParamsCache(fetchParams, { ms: 1000 });
+		await cache.get();
+		clock.tick(999);
+		await cache.get();
+		assert.equal(fetchParams.callCount, 1);
+
+		clock.tick(1);
+		await cache.get();
+		assert.equal(fetchParams.callCount, 2);
+	});
+
+	it("Should use the first limit reached", async function () {
+		const cache = new SuggestedParamsCache(fetchParams, { rounds: 100, ms: 10 });
+		await cache.get();
+		clock.tick(10);
+		await cache.get();
+		assert.equal(fetchParams.callCount, 2);
+	});
+
+	it("Should not cache failed requests", async function () {
+		fetchParams.onFirstCall().rejects(new Error("node unavailable"));
+		const cache = new SuggestedParamsCache(fetchParams);
+		try {
+			await cache.get();
+			assert.fail("expected an error");
+		} catch (error) {
+			assert.equal((error as Error).message, "node unavailable");
+		}
+		assert.deepEqual(await cache.get(), params);
+	});
+});
@@ -0,0 +1,89 @@
+import { ConfirmationTracker } from "@algo-builder/web";
+import { assert } from "chai";
+
+// fake node: transactions are confirmed in the given rounds
+class FakeNode {
+	round = 10;
+	statusAfterBlockCalls = 0;
+	pendingInfoCalls = 0;
+	confirmRounds = new Map<string, number>();
+	poolErrors = new Map<string, string>();
+
+	async status(): Promise<Record<string, number>> {
+		return { "last-round": this.round };
+	}
+
+	async statusAfterBlock(round: number): Promise<void> {
+		this.statusAfterBlockCalls++;
+		this.round = Math.max(this.round, round + 1);
+	}
+
+	async pendingTransactionInformation(txID: string): Promise<Record<string, unknown>> {
+		this.pendingInfoCalls++;
+		const confirmedRound = this.confirmRounds.get(txID);
+		if (confirmedRound !== undefined && confirmedRound <= this.round) {
+			return { "confirmed-round": confirmedRound, "pool-error": "" };
+		}
+		return { "confirmed-round": 0, "pool-error": this.poolErrors.get(txID) ?? "" };
+	}
+}
+
+describe("ConfirmationTracker", function () {
+	let node: FakeNode;
+	let tracker: ConfirmationTracker;
+
+	this.beforeEach(function () {
+		node = new FakeNode();
+		tracker = new ConfirmationTracker({
+			status: async () => await node.status(),
+			statusAfterBlock: async (round) => await node.statusAfterBlock(round),
+			pendingTransactionInformation: async (txID) =>
+				await node.pendingTransactionInformation(txID),
+		});
+	});
+
+	it("Should follow rounds once for all pending transactions", async function () {
+		node.confirmRounds.set("A", 12).set("B", 13).set("C", 13);
+		const infos = await Promise.all(["A", "B", "C"].map((t) => tracker.waitForConfirmation(t)));
+
+		assert.deepEqual(infos.map((i) => i["confirmed-round"]), [12, 13, 13]);
+		assert.equal(node.statusAfterBlockCalls, 2);
+	});
+
+	it("Should return known confirmations from cache", async function () {
+		node.confirmRounds.set("A", 11);
+		await tracker.waitForConfirmation("A");
+		const calls = node.pendingInfoCalls;
+
+		const info = await tracker.waitForConfirmation("A");
+		assert.equal(info["confirmed-round"], 11);
+		assert.equal(tracker.getConfirmed("A"), info);
+		assert.equal(node.pendingInfoCalls, calls);
+	});
+
+	it("Should reject transaction rejected by the pool", async function () {
+		node.poolErrors.set("A", "overspend");
+		try {
+			await tracker.waitForConfirmation("A");
+			assert.fail("expected an error");
+		} catch (error) {
+			assert.equal((error as Error).message, "Transaction Rejected: overspend");
+		}
+	});
+
+	it("Should reject transaction not confirmed in waitRounds", async function () {
+		node.confirmRounds.set("B", 12);
+		const [result] = await Promise.allSettled([
+			tracker.waitForConfirmation("A", 3),
+			tracker.waitForConfirmation("B"),
+		]);
+
+		assert.equal(result.status, "rejected");
+		assert.equal(
+			(result as PromiseRejectedResult).reason.message,
+			"Transaction not confirmed after 3 rounds!"
+		);
+		assert.isUndefined(tracker.getConfirmed("A"));
+		assert.equal(tracker.getConfirmed("B")?.["confirmed-round"], 12);
+	});
+});
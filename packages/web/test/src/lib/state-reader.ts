@@ -0,0 +1,165 @@
+import { StateReader } from "@algo-builder/web";
+import type { modelsv2 } from "algosdk";
+import { assert } from "chai";
+
+import { StateReaderOptions } from "../../../src/lib/state-reader";
+
+const ADDR_1 = "addr-1";
+const ADDR_2 = "addr-2";
+
+function notFound(): Error {
+	return Object.assign(new Error("not found"), { response: { status: 404 } });
+}
+
+// fake node: addr-1 holds asset 1 and is opted-in to app 5
+class FakeNode {
+	round = 10;
+	statusRequests = 0;
+	requests: string[] = [];
+	active = 0;
+	maxActive = 0;
+
+	private async request<T>(name: string, fn: () => T): Promise<T> {
+		this.requests.push(name);
+		this.active++;
+		this.maxActive = Math.max(this.maxActive, this.active);
+		await new Promise((resolve) => setTimeout(resolve, 1));
+		this.active--;
+		return fn();
+	}
+
+	async status(): Promise<Record<string, number>> {
+		this.statusRequests++;
+		await new Promise((resolve) => setTimeout(resolve, 1));
+		return { "last-round": this.round };
+	}
+
+	async accountInformation(addr: string): Promise<Record<string, unknown>> {
+		return await this.request(`account:${addr}`, () => ({ amount: addr.length * 1000 }));
+	}
+
+	async accountAssetInformation(
+		addr: string,
+		assetID: number
+	): Promise<Record<string, unknown>> {
+		return await this.request(`asset:${addr}`, () => {
+			if (addr !== ADDR_1 || assetID !== 1) throw notFound();
+			return { "asset-holding": { "asset-id": 1, amount: 7 } };
+		});
+	}
+
+	async accountApplicationInformation(
+		addr: string,
+		appID: number
+	): Promise<Record<string, unknown>> {
+		return await this.request(`app:${addr}`, () => {
+			if (addr !== ADDR_1 || appID !== 5) throw notFound();
+			const key = Buffer.from("counter").toString("base64");
+			return { "app-local-state": { "key-value": [{ key, value: { type: 2, uint: 3 } }] } };
+		});
+	}
+
+	async getApplicationByID(appID: number): Promise<Record<string, unknown>> {
+		return await this.request(`global:${appID}`, () => {
+			if (appID !== 5) throw notFound();
+			const key = Buffer.from("owner").toString("base64");
+			return {
+				id: 5,
+				params: {
+					creator: ADDR_1,
+					"global-state": [{ key, value: { type: 1, bytes: "YWJj" } }],
+				},
+			};
+		});
+	}
+}
+
+describe("StateReader", function () {
+	let node: FakeNode;
+	let reader: StateReader;
+
+	function mkReader(options: StateReaderOptions): StateReader {
+		return new StateReader(
+			{
+				status: async () => await node.status(),
+				accountInformation: async (addr) => await node.accountInformation(addr),
+				accountAssetInformation: async (addr, assetID) =>
+					await node.accountAssetInformation(addr, assetID),
+				accountApplicationInformation: async (addr, appID) =>
+					await node.accountApplicationInformation(addr, appID),
+				getApplicationByID: async (appID) => await node.getApplicationByID(appID),
+			},
+			options
+		);
+	}
+
+	this.beforeEach(function () {
+		node = new FakeNode();
+		reader = mkReader({ maxConcurrency: 2 });
+	});
+
+	it("Should read asset holdings and local states of many accounts", async function () {
+		const holdings = await reader.assetHoldings([ADDR_1, ADDR_2], 1);
+		assert.deepEqual([...holdings], [
+			[ADDR_1, { "asset-id": 1, amount: 7 }],
+			[ADDR_2, undefined],
+		]);
+
+		const states = await reader.localStates([ADDR_1, ADDR_2], 5);
+		assert.deepEqual(states.get(ADDR_1), new Map([["counter", 3]]));
+		assert.isUndefined(states.get(ADDR_2));
+	});
+
+	it("Should read global state of an app", async function () {
+		assert.deepEqual(await reader.globalState(5), new Map([["owner", "YWJj"]]));
+		assert.isUndefined(await reader.globalState(5, ADDR_2));
+		assert.isUndefined(await reader.globalState(6));
+	});
+
+	it("Should limit number of concurrent requests", async function () {
+		const addresses = Array.from({ length: 10 }, (_, i) => `addr-${i}`);
+		const balances = await reader.balances(addresses);
+
+		assert.equal(balances.size, 10);
+		assert.equal(node.maxActive, 2);
+	});
+
+	it("Should cache results for the current round", async function () {
+		reader = mkReader({ roundMaxAgeMs: 0 });
+		await reader.balances([ADDR_1, ADDR_2]);
+		await reader.balances([ADDR_1]);
+		assert.equal(node.requests.length, 2);
+
+		node.round++;
+		await reader.balances([ADDR_1]);
+		assert.equal(node.requests.length, 3);
+	});
+
+	it("Should query the round once for concurrent reads and reuse it", async function () {
+		await Promise.all([reader.balances([ADDR_1]), reader.globalState(5)]);
+		assert.equal(node.statusRequests, 1);
+
+		node.round++;
+		await reader.balances([ADDR_1]);
+		assert.equal(node.statusRequests, 1);
+		assert.equal(node.requests.length, 2);
+
+		// round of a confirmed transaction drops the cached results
+		reader.observeRound(node.round);
+		await reader.balances([ADDR_1]);
+		assert.equal(node.requests.length, 3);
+	});
+
+	it("Should return copies of cached results", async function () {
+		const holdings = await reader.assetHoldings([ADDR_1], 1);
+		(holdings.get(ADDR_1) as modelsv2.AssetHolding).amount = 0;
+		const states = await reader.localStates([ADDR_1], 5);
+		states.get(ADDR_1)?.set("counter", 0);
+
+		const cachedHoldings = await reader.assetHoldings([ADDR_1], 1);
+		assert.deepEqual(cachedHoldings.get(ADDR_1), { "asset-id": 1, amount: 7 });
+		const cachedStates = await reader.localStates([ADDR_1], 5);
+		assert.deepEqual(cachedStates.get(ADDR_1), new Map([["counter", 3]]));
+		assert.equal(node.requests.length, 2);
+	});
+});
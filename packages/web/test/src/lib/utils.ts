@@ -1,6 +1,7 @@
 import {
 	betanetGenesisHash,
 	mainnetGenesisHash,
+	parsing,
 	runtimeGenesisHash,
 	testnetGenesisHash,
 	utils,
@@ -22,4 +23,32 @@ describe("Utility functions from algob/web", function () {
 			});
 		});
 	});
+
+	describe("hyphenatedKeysView()", function () {
+		const receipt = { txID: "TX1", confirmedRound: 5, innerTxns: [], logs: undefined };
+
+		it("Should expose the same keys and values as convertKeysToHyphens", function () {
+			const view = parsing.hyphenatedKeysView(receipt);
+			expect(view).to.deep.equal(parsing.convertKeysToHyphens(receipt));
+			expect(view["confirmed-round"]).to.equal(5);
+			expect(view.confirmedRound).to.equal(undefined);
+			expect("inner-txns" in view).to.equal(true);
+			expect(view.txID).to.equal("TX1");
+		});
+
+		it("Should not modify the original object", function () {
+			const view = parsing.hyphenatedKeysView(receipt);
+			view["confirmed-round"] = 6;
+			delete view.txID;
+
+			expect(view["confirmed-round"]).to.equal(6);
+			expect(Object.keys(view)).to.not.include("txID");
+			expect(receipt).to.deep.equal({
+				txID: "TX1",
+				confirmedRound: 5,
+				innerTxns: [],
+				logs: undefined,
+			});
+		});
+	});
 });